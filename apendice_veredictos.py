@@ -0,0 +1,323 @@
+"""
+Apéndice PDF con el veredicto de cada mensaje puntuado
+
+Lee la salida de puntuador_lotes.py (con --conservar-columnas: los siete
+indicadores, la etiqueta y la probabilidad de phishing) fila por fila y la
+vuelca en tablas de tamaño fijo, una por página, que se dibujan y se
+descartan antes de leer la siguiente. Nunca existe una tabla gigante: el
+costo de maquetar cada página es constante y el tiempo total crece en
+línea con el número de filas.
+
+La cuadrícula de la tabla es igual en todas las páginas y se dibuja una sola
+vez por PDF. reportlab conserva el contenido de cada página hasta guardar el
+archivo, así que el apéndice se parte en volúmenes de --filas-por-volumen
+filas: la memoria queda acotada por el tamaño del volumen, no por el total.
+
+Uso:
+    python puntuador_lotes.py exportacion.csv veredictos.csv --conservar-columnas
+    python apendice_veredictos.py veredictos.csv
+    python apendice_veredictos.py veredictos.csv --salida apendice.pdf --filas-por-volumen 0
+    python apendice_veredictos.py --benchmark
+
+Requisitos: pip install reportlab
+"""
+
+import argparse
+import csv
+import itertools
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from esquema_phishing import CARACTERISTICAS
+
+FILAS_POR_PAGINA = 40
+ALTO_FILA = 11
+TAMANO_LETRA = 7
+MARGEN = 40
+
+# Cada página dibujada ocupa ~30 KB hasta guardar el PDF: 50.000 filas ≈ 40 MB
+FILAS_POR_VOLUMEN = 50_000
+
+COLUMNA_VEREDICTO = 8
+COLOR_PHISHING = '#C41E3A'
+COLOR_LEGITIMO = '#2E7D32'
+
+COLUMNAS_VEREDICTO = ['etiqueta', 'prob_phishing']
+
+# Encabezados cortos para que los diez campos quepan en una hoja horizontal
+ENCABEZADOS = ['#', 'Remitente', 'URL', 'Dominio', 'Urgencia', 'Solicita\ninfo',
+               'Errores', 'Oferta\nirreal', 'Veredicto', 'P(phishing)']
+ANCHOS = [62, 68, 44, 64, 64, 64, 62, 64, 74, 72]
+
+
+def leer_veredictos(ruta):
+    """Genera (número, indicadores, etiqueta, probabilidad) sin cargar el archivo"""
+    with open(ruta, encoding='utf-8', newline='') as f:
+        lector = csv.reader(f)
+        encabezado = next(lector, None) or []
+        faltantes = [c for c in CARACTERISTICAS + COLUMNAS_VEREDICTO if c not in encabezado]
+        if faltantes:
+            raise ValueError(f"Faltan columnas en '{ruta}': {', '.join(faltantes)} "
+                             "(puntúa con `puntuador_lotes.py --conservar-columnas`)")
+        indices = [encabezado.index(c) for c in CARACTERISTICAS]
+        i_etiqueta = encabezado.index('etiqueta')
+        i_prob = encabezado.index('prob_phishing')
+        for numero, fila in enumerate(lector, 1):
+            yield numero, [fila[i] for i in indices], int(float(fila[i_etiqueta])), float(fila[i_prob])
+
+
+def _estilo_tabla(color_encabezado):
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(color_encabezado)),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), TAMANO_LETRA),
+        ('LEADING', (0, 0), (-1, 0), TAMANO_LETRA + 1),
+        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, 0), 'MIDDLE'),
+        ('GRID', (0, 0), (-1, -1), 0.25, colors.grey),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F2F2F2')])
+    ])
+
+
+class _Pagina:
+    """Tabla de tamaño fijo de una página del apéndice
+
+    La cuadrícula (encabezado, fondos alternos y líneas) es igual en todas
+    las páginas: se dibuja una vez por documento como Form XObject y cada
+    página sólo la referencia y escribe el texto de sus celdas en un único
+    objeto de texto.
+    """
+
+    def __init__(self, tamano, color_encabezado):
+        from reportlab.lib import colors
+
+        self.ancho, self.alto = tamano
+        self.estilo = _estilo_tabla(color_encabezado)
+        self.tope = self.alto - MARGEN - 12
+        self.centros = []
+        x = MARGEN
+        for ancho in ANCHOS:
+            self.centros.append(x + ancho / 2)
+            x += ancho
+        self.formas = set()
+        self.colores = {1: colors.HexColor(COLOR_PHISHING), 0: colors.HexColor(COLOR_LEGITIMO)}
+        self.negro = colors.black
+        # Los indicadores, veredictos y probabilidades se repiten mucho
+        self.anchos_texto = {}
+
+    def _cuadricula(self, c, filas):
+        """Nombre del Form XObject con la cuadrícula para `filas` filas"""
+        from reportlab.platypus import Table
+
+        nombre = f"cuadricula{filas}"
+        if nombre not in self.formas:
+            tabla = Table([ENCABEZADOS] + [[''] * len(ENCABEZADOS)] * filas, colWidths=ANCHOS,
+                          rowHeights=[2*ALTO_FILA] + [ALTO_FILA]*filas)
+            tabla.setStyle(self.estilo)
+            _, alto_tabla = tabla.wrapOn(c, self.ancho - 2*MARGEN, self.alto - 2*MARGEN)
+            c.beginForm(nombre)
+            tabla.drawOn(c, MARGEN, self.tope - alto_tabla)
+            c.endForm()
+            self.formas.add(nombre)
+        return nombre
+
+    def _ancho_texto(self, texto):
+        from reportlab.pdfbase.pdfmetrics import stringWidth
+
+        if texto not in self.anchos_texto:
+            if len(self.anchos_texto) > 100_000:
+                self.anchos_texto.clear()
+            self.anchos_texto[texto] = stringWidth(texto, 'Helvetica', TAMANO_LETRA)
+        return self.anchos_texto[texto]
+
+    def dibujar(self, c, filas, volumen, pagina):
+        c.setFont('Helvetica-Bold', 11)
+        c.drawString(MARGEN, self.alto - MARGEN, "Apéndice: veredicto por mensaje")
+        c.setFont('Helvetica', 8)
+        c.drawRightString(self.ancho - MARGEN, self.alto - MARGEN,
+                          f"Mensajes {filas[0][0]:,d}–{filas[-1][0]:,d}"
+                          + (f"  ·  volumen {volumen}" if volumen else '') + f"  ·  página {pagina}")
+        c.doForm(self._cuadricula(c, len(filas)))
+
+        texto = c.beginText()
+        texto.setFont('Helvetica', TAMANO_LETRA)
+        y = self.tope - 2*ALTO_FILA - ALTO_FILA + (ALTO_FILA - TAMANO_LETRA) / 2 + 1.5
+        for numero, indicadores, etiqueta, prob in filas:
+            veredicto = 'Phishing' if etiqueta == 1 else 'Legítimo'
+            celdas = [f"{numero:,d}", *indicadores, veredicto, f"{prob:.3f}"]
+            for columna, (celda, centro) in enumerate(zip(celdas, self.centros)):
+                if columna == COLUMNA_VEREDICTO:
+                    texto.setFillColor(self.colores[etiqueta])
+                texto.setTextOrigin(centro - self._ancho_texto(celda) / 2, y)
+                texto.textOut(celda)
+                if columna == COLUMNA_VEREDICTO:
+                    texto.setFillColor(self.negro)
+            y -= ALTO_FILA
+        c.drawText(texto)
+        c.showPage()
+
+
+def generar_apendice(veredictos, nombre_archivo=None, filas_por_pagina=FILAS_POR_PAGINA,
+                     filas_por_volumen=FILAS_POR_VOLUMEN, progreso=True):
+    """Escribe el apéndice página a página y devuelve los PDF, filas, páginas y segundos
+
+    Cada `filas_por_volumen` filas (redondeadas a páginas completas) se
+    cierra el PDF y se abre otro: apendice.pdf, apendice_002.pdf, ... Con 0
+    todo va a un solo PDF, cuya memoria crece con el número de páginas.
+    """
+    from reportlab import rl_config
+    from reportlab.lib.pagesizes import landscape, letter
+    from reportlab.pdfgen import canvas
+
+    from generar_reporte_phishing import COLORES_ESTILO
+
+    nombre_archivo = nombre_archivo or f"Apendice_Veredictos_{datetime.now().strftime('%Y%m%d')}.pdf"
+    base, extension = os.path.splitext(nombre_archivo)
+    tamano = landscape(letter)
+    max_filas = int((tamano[1] - 2*MARGEN - 12 - 2*ALTO_FILA) // ALTO_FILA)
+    if not 1 <= filas_por_pagina <= max_filas:
+        raise ValueError(f"filas_por_pagina debe estar entre 1 y {max_filas}")
+    paginas_por_volumen = (max(1, filas_por_volumen // filas_por_pagina)
+                           if filas_por_volumen else None)
+
+    filas = iter(veredictos) if not isinstance(veredictos, str) else leer_veredictos(veredictos)
+    archivos = []
+    c = None
+    total_filas = paginas = pagina_volumen = 0
+    inicio = time.perf_counter()
+    # Contenido de página sólo con Flate: ASCII85 en Python puro duplicaría el tiempo
+    anterior = rl_config.useA85
+    rl_config.useA85 = 0
+    try:
+        while True:
+            bloque = list(itertools.islice(filas, filas_por_pagina))
+            if not bloque:
+                break
+            if c is None or (paginas_por_volumen and pagina_volumen == paginas_por_volumen):
+                if c is not None:
+                    c.save()
+                archivo = nombre_archivo if not archivos else f"{base}_{len(archivos) + 1:03d}{extension}"
+                archivos.append(archivo)
+                c = canvas.Canvas(archivo, pagesize=tamano, pageCompression=1)
+                c.setTitle("Apéndice de veredictos por mensaje")
+                hoja = _Pagina(tamano, COLORES_ESTILO[0])
+                pagina_volumen = 0
+            pagina_volumen += 1
+            paginas += 1
+            hoja.dibujar(c, bloque, len(archivos) if paginas_por_volumen else None, pagina_volumen)
+            total_filas += len(bloque)
+            if progreso and paginas % 500 == 0:
+                print(f"  📄 {paginas:,d} páginas, {total_filas:,d} filas "
+                      f"({total_filas / (time.perf_counter() - inicio):,.0f} filas/s)")
+        if c is not None:
+            c.save()
+    finally:
+        rl_config.useA85 = anterior
+    return {'archivos': archivos, 'filas': total_filas, 'paginas': paginas,
+            'segundos': time.perf_counter() - inicio}
+
+
+def veredictos_sinteticos(n, semilla=42):
+    """Filas de prueba con el formato de leer_veredictos, generadas al vuelo"""
+    import random
+
+    aleatorio = random.Random(semilla)
+    for numero in range(1, n + 1):
+        etiqueta = 1 if aleatorio.random() < 0.4 else 0
+        indicadores = [f"{aleatorio.uniform(0, 10):.1f}" for _ in CARACTERISTICAS]
+        indicadores[1] = str(aleatorio.randint(0, 1))
+        yield numero, indicadores, etiqueta, aleatorio.random()
+
+
+def tabla_unica(veredictos, nombre_archivo):
+    """Referencia: todas las filas en una sola Table de platypus, como el resto del reporte"""
+    from reportlab.lib.pagesizes import landscape, letter
+    from reportlab.platypus import SimpleDocTemplate, Table
+
+    from generar_reporte_phishing import COLORES_ESTILO
+
+    datos = [ENCABEZADOS] + [
+        [f"{numero:,d}", *indicadores, 'Phishing' if etiqueta == 1 else 'Legítimo', f"{prob:.3f}"]
+        for numero, indicadores, etiqueta, prob in veredictos
+    ]
+    tabla = Table(datos, colWidths=ANCHOS, repeatRows=1)
+    tabla.setStyle(_estilo_tabla(COLORES_ESTILO[0]))
+    SimpleDocTemplate(nombre_archivo, pagesize=landscape(letter)).build([tabla])
+
+
+def _medir(funcion, *argumentos):
+    """(segundos, pico de memoria en MB); la memoria se mide en una segunda corrida"""
+    inicio = time.perf_counter()
+    funcion(*argumentos)
+    segundos = time.perf_counter() - inicio
+    tracemalloc.start()
+    try:
+        funcion(*argumentos)
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return segundos, pico / 2**20
+
+
+def benchmark(tamanos=(1_000, 4_000, 16_000), limite_tabla_unica=4_000, directorio='.'):
+    """Tiempo y memoria máxima del apéndice por páginas y de una sola tabla gigante"""
+    ruta = os.path.join(directorio, "_apendice_benchmark.pdf")
+    resultados = []
+    try:
+        for n in tamanos:
+            segundos, pico = _medir(lambda ruta: generar_apendice(veredictos_sinteticos(n), ruta,
+                                                                 filas_por_volumen=0, progreso=False), ruta)
+            resultado = {'filas': n, 'segundos': segundos, 'filas_por_segundo': n / segundos,
+                         'pico_mb': pico, 'tabla_unica': None}
+            if n <= limite_tabla_unica:
+                segundos, pico = _medir(lambda ruta: tabla_unica(veredictos_sinteticos(n), ruta), ruta)
+                resultado['tabla_unica'] = {'segundos': segundos, 'filas_por_segundo': n / segundos,
+                                            'pico_mb': pico}
+            resultados.append(resultado)
+    finally:
+        if os.path.exists(ruta):
+            os.remove(ruta)
+    return resultados
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Apéndice PDF con el veredicto de cada mensaje')
+    parser.add_argument('veredictos', nargs='?', help='CSV de puntuador_lotes.py --conservar-columnas')
+    parser.add_argument('--salida', default=None, help='PDF de salida')
+    parser.add_argument('--filas-por-pagina', type=int, default=FILAS_POR_PAGINA)
+    parser.add_argument('--filas-por-volumen', type=int, default=FILAS_POR_VOLUMEN,
+                        help='Filas por PDF; 0 = un solo PDF sin límite de memoria')
+    parser.add_argument('--benchmark', action='store_true', help='Medir tiempo y memoria con filas sintéticas')
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        for r in benchmark():
+            print(f"⏱️  {r['filas']:>8,d} filas  por páginas {r['segundos']:7.2f} s "
+                  f"({r['filas_por_segundo']:>6,.0f} filas/s, pico {r['pico_mb']:6.1f} MB)")
+            if r['tabla_unica']:
+                t = r['tabla_unica']
+                print(f"   {'':>8s}        tabla única  {t['segundos']:7.2f} s "
+                      f"({t['filas_por_segundo']:>6,.0f} filas/s, pico {t['pico_mb']:6.1f} MB)")
+        return
+    if not args.veredictos:
+        parser.error('indica el CSV de veredictos o --benchmark')
+
+    print(f"📄 Generando el apéndice de '{args.veredictos}'...")
+    try:
+        r = generar_apendice(args.veredictos, args.salida, args.filas_por_pagina, args.filas_por_volumen)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    print(f"✅ {r['filas']:,d} mensajes en {r['paginas']:,d} páginas ({r['segundos']:.2f} s) → "
+          + ', '.join(r['archivos']))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
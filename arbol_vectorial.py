@@ -0,0 +1,278 @@
+"""
+Árbol de decisión dibujado como gráficos vectoriales de reportlab
+
+Sustituye a las imágenes 06/07 (plot_tree rasterizado a 300 dpi) en los
+reportes PDF: los nodos se colocan directamente a partir de los arreglos del
+árbol (tree_ de scikit-learn, o el artefacto .phtree sin scikit-learn) en
+tiempo O(nodos) y se dibujan con Rect/String/Line, así que el texto sigue
+siendo nítido y seleccionable a cualquier zoom.
+
+Cuando el árbol no cabe en la caja disponible (ni reduciéndolo hasta
+ESCALA_MINIMA), se corta en subárboles: el nodo donde se corta aparece con
+la referencia "ver subárbol N" y vuelve a dibujarse como raíz de ese
+subárbol, que el reporte coloca en las páginas siguientes.
+
+Uso:
+    python arbol_vectorial.py modelo_phishing.phtree --salida arbol.pdf
+
+Requisitos: pip install reportlab numpy
+"""
+
+import argparse
+import os
+import time
+from collections import deque
+
+FUENTE = 'Helvetica'
+FUENTE_NEGRITA = 'Helvetica-Bold'
+TAMANO_FUENTE = 7
+INTERLINEADO = 8.5
+RELLENO = 4
+SEPARACION_HORIZONTAL = 8
+SEPARACION_VERTICAL = 24
+ESCALA_MINIMA = 0.7
+
+# Colores por clase, como en plot_tree; la intensidad depende de la pureza del nodo
+COLORES_CLASES = ['#e58139', '#399de5', '#47e539', '#d739e5']
+
+
+def _color_nodo(probabilidades, colores):
+    """Color de la clase mayoritaria mezclado con blanco según la pureza"""
+    from reportlab.lib import colors
+
+    orden = sorted(range(len(probabilidades)), key=lambda i: probabilidades[i], reverse=True)
+    mayor = probabilidades[orden[0]]
+    segundo = probabilidades[orden[1]] if len(orden) > 1 else 0.0
+    alfa = 0.0 if segundo >= 1 else (mayor - segundo) / (1 - segundo)
+    base = colors.HexColor(colores[orden[0] % len(colores)])
+    return colors.Color(1 - alfa * (1 - base.red), 1 - alfa * (1 - base.green), 1 - alfa * (1 - base.blue))
+
+
+def _es_hoja(arbol, nodo):
+    return int(arbol.izquierdo[nodo]) == nodo
+
+
+def _criterio(arbol):
+    """Nombre de la impureza según los metadatos del artefacto (gini si no consta)"""
+    return (arbol.metadatos.get('parametros') or {}).get('criterion', 'gini')
+
+
+def _textos_nodo(arbol, nodo, nombres_clases):
+    """Líneas del nodo: condición, impureza, muestras, proporciones y clase"""
+    lineas = []
+    if not _es_hoja(arbol, nodo):
+        nombre = arbol.nombres_caracteristicas[int(arbol.caracteristica[nodo])]
+        lineas.append(f"{nombre} <= {float(arbol.umbral[nodo]):.2f}")
+    if arbol.impureza is not None:
+        lineas.append(f"{_criterio(arbol)} = {float(arbol.impureza[nodo]):.3f}")
+    if arbol.muestras is not None:
+        lineas.append(f"samples = {int(arbol.muestras[nodo])}")
+    probabilidades = [float(p) for p in arbol.probabilidades[nodo]]
+    lineas.append("value = [" + ", ".join(f"{p:.2f}" for p in probabilidades) + "]")
+    lineas.append(f"class = {nombres_clases[max(range(len(probabilidades)), key=probabilidades.__getitem__)]}")
+    return lineas
+
+
+# ============================================
+# PAGINACIÓN EN SUBÁRBOLES
+# ============================================
+
+def _subarbol(arbol, raiz, max_columnas, max_niveles):
+    """Parte del subárbol de `raiz` que cabe en la caja y los nodos donde se corta
+
+    Se expande en anchura: abrir un nodo interno cambia una columna por dos,
+    así que se abren nodos mientras quepan. Devuelve (nodos, cortes): nodos
+    es la lista de (nodo, nivel) dibujados y cortes los nodos internos que
+    continúan en otro subárbol.
+    """
+    nodos = [(raiz, 0)]
+    cortes = []
+    columnas = 1
+    cola = deque(nodos)
+    while cola:
+        nodo, nivel = cola.popleft()
+        if _es_hoja(arbol, nodo):
+            continue
+        # La raíz siempre se abre para que cada subárbol avance al menos un nivel
+        if nodo != raiz and (nivel + 1 >= max_niveles or columnas + 1 > max_columnas):
+            cortes.append(nodo)
+            continue
+        columnas += 1
+        for hijo in (int(arbol.izquierdo[nodo]), int(arbol.derecho[nodo])):
+            nodos.append((hijo, nivel + 1))
+            cola.append((hijo, nivel + 1))
+    return nodos, cortes
+
+
+def paginar_arbol(arbol, max_columnas, max_niveles):
+    """Lista de subárboles (raíz, nodos, cortes) en orden de lectura"""
+    paginas = []
+    pendientes = deque([0])
+    while pendientes:
+        raiz = pendientes.popleft()
+        nodos, cortes = _subarbol(arbol, raiz, max_columnas, max_niveles)
+        paginas.append((raiz, nodos, cortes))
+        pendientes.extend(cortes)
+    return paginas
+
+
+# ============================================
+# DIBUJO
+# ============================================
+
+def _posiciones(arbol, raiz, dibujados, cortes):
+    """Columna (x) de cada nodo: una por hoja, los padres centrados sobre sus hijos"""
+    x = {}
+    columna = 0
+    pila = [(raiz, False)]
+    while pila:
+        nodo, visitado = pila.pop()
+        terminal = _es_hoja(arbol, nodo) or nodo in cortes
+        if terminal:
+            x[nodo] = columna
+            columna += 1
+        elif visitado:
+            x[nodo] = (x[int(arbol.izquierdo[nodo])] + x[int(arbol.derecho[nodo])]) / 2
+        else:
+            pila.append((nodo, True))
+            pila.append((int(arbol.derecho[nodo]), False))
+            pila.append((int(arbol.izquierdo[nodo]), False))
+    return {nodo: x[nodo] for nodo in dibujados}, columna
+
+
+def _dibujar_pagina(arbol, pagina, textos, referencias, medidas, colores, escala_maxima):
+    from reportlab.graphics.shapes import Drawing, Group, Line, Polygon, Rect, String
+    from reportlab.lib import colors
+
+    raiz, nodos, cortes = pagina
+    niveles = dict(nodos)
+    cortes = set(cortes)
+    x, columnas = _posiciones(arbol, raiz, niveles, cortes)
+    ancho_nodo, alto_nodo = medidas
+    profundidad = max(niveles.values())
+    ancho = columnas * ancho_nodo + (columnas - 1) * SEPARACION_HORIZONTAL
+    alto = (profundidad + 1) * alto_nodo + profundidad * SEPARACION_VERTICAL
+
+    def esquina(nodo):
+        izquierda = x[nodo] * (ancho_nodo + SEPARACION_HORIZONTAL)
+        abajo = alto - (niveles[nodo] + 1) * alto_nodo - niveles[nodo] * SEPARACION_VERTICAL
+        return izquierda, abajo
+
+    grupo = Group()
+    gris = colors.HexColor('#555555')
+    for nodo, nivel in nodos:
+        izquierda, abajo = esquina(nodo)
+        if nodo not in cortes and not _es_hoja(arbol, nodo):
+            for hijo, etiqueta in ((int(arbol.izquierdo[nodo]), 'sí'), (int(arbol.derecho[nodo]), 'no')):
+                hijo_izquierda, hijo_abajo = esquina(hijo)
+                x0, y0 = izquierda + ancho_nodo / 2, abajo
+                x1, y1 = hijo_izquierda + ancho_nodo / 2, hijo_abajo + alto_nodo
+                grupo.add(Line(x0, y0, x1, y1 + 3, strokeColor=gris, strokeWidth=0.6))
+                grupo.add(Polygon([x1, y1, x1 - 2, y1 + 4, x1 + 2, y1 + 4],
+                                  fillColor=gris, strokeColor=None))
+                grupo.add(String((x0 + x1) / 2, (y0 + y1) / 2, etiqueta, fontName=FUENTE,
+                                 fontSize=TAMANO_FUENTE - 1, fillColor=gris, textAnchor='middle'))
+
+        borde = colors.HexColor('#c0392b') if nodo in cortes else colors.black
+        grupo.add(Rect(izquierda, abajo, ancho_nodo, alto_nodo, rx=3, ry=3,
+                       fillColor=_color_nodo([float(p) for p in arbol.probabilidades[nodo]], colores),
+                       strokeColor=borde, strokeWidth=1.2 if nodo in cortes else 0.6,
+                       strokeDashArray=[2, 2] if nodo in cortes else None))
+        lineas = textos[nodo] + ([f"ver subárbol {referencias[nodo]}"] if nodo in cortes else [])
+        arriba = abajo + alto_nodo - RELLENO - TAMANO_FUENTE
+        for i, linea in enumerate(lineas):
+            negrita = (i == 0 and not _es_hoja(arbol, nodo)) or (nodo in cortes and i == len(lineas) - 1)
+            grupo.add(String(izquierda + ancho_nodo / 2, arriba - i * INTERLINEADO, linea,
+                             fontName=FUENTE_NEGRITA if negrita else FUENTE, fontSize=TAMANO_FUENTE,
+                             fillColor=borde if nodo in cortes and i == len(lineas) - 1 else colors.black,
+                             textAnchor='middle'))
+
+    escala = min(1.0, escala_maxima(ancho, alto))
+    grupo.transform = (escala, 0, 0, escala, 0, 0)
+    dibujo = Drawing(ancho * escala, alto * escala)
+    dibujo.add(grupo)
+    return dibujo
+
+
+def dibujar_arbol(arbol, nombres_clases, ancho, alto, colores=None):
+    """Dibujos (Drawing) del árbol que caben en una caja de ancho x alto puntos
+
+    Devuelve una lista de (raíz, Drawing): el primero es el árbol desde la
+    raíz y los siguientes los subárboles en el orden de sus referencias.
+    """
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
+    colores = colores or COLORES_CLASES
+    # Textos y tamaño de caja uniforme para todos los nodos: O(nodos)
+    textos = {nodo: _textos_nodo(arbol, nodo, nombres_clases) for nodo in range(arbol.n_nodos)}
+    ancho_texto = max(stringWidth(linea, FUENTE_NEGRITA, TAMANO_FUENTE)
+                      for lineas in textos.values() for linea in lineas)
+    ancho_nodo = max(ancho_texto, stringWidth("ver subárbol 999", FUENTE_NEGRITA, TAMANO_FUENTE)) + 2 * RELLENO
+    alto_nodo = (max(len(lineas) for lineas in textos.values()) + 1) * INTERLINEADO + 2 * RELLENO
+
+    max_columnas = max(2, int((ancho / ESCALA_MINIMA + SEPARACION_HORIZONTAL)
+                              // (ancho_nodo + SEPARACION_HORIZONTAL)))
+    max_niveles = max(2, int((alto / ESCALA_MINIMA + SEPARACION_VERTICAL)
+                             // (alto_nodo + SEPARACION_VERTICAL)))
+    paginas = paginar_arbol(arbol, max_columnas, max_niveles)
+    referencias = {raiz: i for i, (raiz, _, _) in enumerate(paginas, 1)}
+
+    def escala_maxima(ancho_dibujo, alto_dibujo):
+        return min(ancho / ancho_dibujo, alto / alto_dibujo)
+
+    return [(pagina[0], _dibujar_pagina(arbol, pagina, textos, referencias, (ancho_nodo, alto_nodo),
+                                        colores, escala_maxima))
+            for pagina in paginas]
+
+
+def flowables_arbol(arbol, nombres_clases, ancho, alto, estilo, colores=None):
+    """Flowables listos para el reporte: el árbol y, si hace falta, sus subárboles"""
+    from reportlab.platypus import KeepTogether, Paragraph, Spacer
+
+    dibujos = dibujar_arbol(arbol, nombres_clases, ancho, alto, colores)
+    elementos = [dibujos[0][1]]
+    for numero, (raiz, dibujo) in enumerate(dibujos[1:], 2):
+        condicion = _textos_nodo(arbol, raiz, nombres_clases)[0]
+        titulo = Paragraph(f"<b>Subárbol {numero}</b> (desde el nodo #{raiz}: {condicion.replace('<', '&lt;')})",
+                           estilo)
+        elementos.append(KeepTogether([Spacer(1, 6), titulo, dibujo]))
+    return elementos
+
+
+def desde_sklearn(modelo, nombres_caracteristicas=None):
+    """Arreglos de modelo.tree_ en la forma que usa el dibujo (ArbolCompilado)"""
+    from motor_inferencia import compilar_arbol
+
+    arbol = compilar_arbol(modelo, nombres_caracteristicas)
+    # Mismo lugar que en los metadatos de artefacto_modelo.exportar_modelo
+    arbol.metadatos.setdefault('parametros', {'criterion': modelo.criterion})
+    return arbol
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Dibuja un árbol .phtree como PDF vectorial')
+    parser.add_argument('modelo', help='Artefacto .phtree')
+    parser.add_argument('--salida', default='arbol_vectorial.pdf')
+    parser.add_argument('--clases', nargs='+', default=['Legítimo', 'Phishing'])
+    args = parser.parse_args(argv)
+
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate
+
+    from artefacto_modelo import cargar_artefacto
+
+    arbol = cargar_artefacto(args.modelo)
+    inicio = time.perf_counter()
+    elementos = flowables_arbol(arbol, args.clases, 7 * inch, 8.5 * inch, getSampleStyleSheet()['Normal'])
+    distribucion = time.perf_counter() - inicio
+    subarboles = len(elementos)
+    SimpleDocTemplate(args.salida, pagesize=letter, leftMargin=50, rightMargin=50,
+                      topMargin=50, bottomMargin=50).build(elementos)
+    print(f"🌳 {arbol.n_nodos} nodos en {subarboles} subárbol(es), distribución en "
+          f"{distribucion * 1000:.1f} ms → '{args.salida}' ({os.path.getsize(args.salida) / 1024:.0f} KB)")
+
+
+if __name__ == "__main__":
+    main()
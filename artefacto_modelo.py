@@ -0,0 +1,313 @@
+"""
+Artefacto binario versionado del árbol de detección de phishing
+
+Guarda el árbol entrenado (los arreglos de nodos de motor_inferencia.py,
+los nombres de las características, las clases y metadatos del
+entrenamiento como la exactitud) en un único archivo compacto que se carga
+sin importar scikit-learn ni pickle:
+
+    [0:8]    firma b'PHARBOL\\0'
+    [8:12]   versión del esquema (uint32 little-endian)
+    [12:16]  longitud del encabezado JSON (uint32 little-endian)
+    [16:48]  SHA-256 de todo lo que sigue (encabezado y arreglos)
+    [48:]    encabezado JSON, relleno hasta 64 bytes y los arreglos, cada uno
+             alineado a 64 bytes, con desplazamiento, tipo y forma en el
+             encabezado
+
+Al cargar se verifica la suma de comprobación y los arreglos se leen con
+np.frombuffer, sin copias.
+
+Uso:
+    python artefacto_modelo.py exportar        (o python pipeline_phishing.py)
+    python artefacto_modelo.py info modelo_phishing.phtree
+    python artefacto_modelo.py benchmark
+
+Requisitos: pip install numpy (scikit-learn sólo para exportar)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+
+import numpy as np
+
+from motor_inferencia import ArbolCompilado
+
+ARCHIVO_MODELO = 'modelo_phishing.phtree'
+FIRMA = b'PHARBOL\0'
+VERSION_ESQUEMA = 1
+ALINEACION = 64
+
+# Métricas de etapa_evaluar que se guardan en los metadatos
+METRICAS_EXPORTADAS = ('accuracy_train', 'accuracy_test', 'n_entrenamiento', 'n_prueba')
+
+_CABECERA = struct.Struct('<8sII32s')
+
+# Nombre → tipo en disco de cada arreglo del árbol
+TIPOS_ARREGLOS = {
+    'caracteristica': '<i4',
+    'umbral': '<f8',
+    'izquierdo': '<i4',
+    'derecho': '<i4',
+    'probabilidades': '<f8',
+    'muestras': '<i8',
+    'impureza': '<f8'
+}
+
+
+class ErrorArtefacto(ValueError):
+    """El archivo no es un artefacto válido o está dañado"""
+
+
+def _alinear(n):
+    return -(-n // ALINEACION) * ALINEACION
+
+
+def serializar(arbol, metadatos=None):
+    """Bytes del artefacto para un ArbolCompilado"""
+    arreglos = {}
+    for nombre, tipo in TIPOS_ARREGLOS.items():
+        valores = getattr(arbol, nombre)
+        if valores is not None:
+            arreglos[nombre] = np.ascontiguousarray(valores, dtype=tipo)
+
+    # Los desplazamientos son relativos al inicio de la zona de arreglos
+    descriptores, desplazamiento = {}, 0
+    for nombre, valores in arreglos.items():
+        descriptores[nombre] = {'tipo': valores.dtype.str, 'forma': list(valores.shape),
+                                'desplazamiento': desplazamiento}
+        desplazamiento = _alinear(desplazamiento + valores.nbytes)
+
+    encabezado = json.dumps({
+        'caracteristicas': list(arbol.nombres_caracteristicas),
+        'clases': np.asarray(arbol.clases).tolist(),
+        'profundidad': int(arbol.profundidad),
+        'n_nodos': int(arbol.n_nodos),
+        'arreglos': descriptores,
+        'metadatos': {**arbol.metadatos, **(metadatos or {})}
+    }, ensure_ascii=False, sort_keys=True).encode('utf-8')
+
+    inicio_arreglos = _alinear(_CABECERA.size + len(encabezado))
+    cuerpo = bytearray(inicio_arreglos - _CABECERA.size + desplazamiento)
+    cuerpo[:len(encabezado)] = encabezado
+    for nombre, valores in arreglos.items():
+        posicion = inicio_arreglos - _CABECERA.size + descriptores[nombre]['desplazamiento']
+        cuerpo[posicion:posicion + valores.nbytes] = valores.tobytes()
+
+    suma = hashlib.sha256(cuerpo).digest()
+    return _CABECERA.pack(FIRMA, VERSION_ESQUEMA, len(encabezado), suma) + bytes(cuerpo)
+
+
+def deserializar(datos, verificar=True):
+    """ArbolCompilado a partir de los bytes de un artefacto"""
+    if len(datos) < _CABECERA.size:
+        raise ErrorArtefacto("Archivo demasiado corto")
+    firma, version, largo, suma = _CABECERA.unpack_from(datos)
+    if firma != FIRMA:
+        raise ErrorArtefacto("Firma inválida: no es un artefacto de modelo de phishing")
+    if version > VERSION_ESQUEMA:
+        raise ErrorArtefacto(f"Versión de esquema no soportada: {version} (máxima {VERSION_ESQUEMA})")
+    cuerpo = memoryview(datos)[_CABECERA.size:]
+    if verificar and hashlib.sha256(cuerpo).digest() != suma:
+        raise ErrorArtefacto("La suma de comprobación no coincide: el archivo está dañado")
+
+    encabezado = json.loads(bytes(cuerpo[:largo]).decode('utf-8'))
+    inicio_arreglos = _alinear(_CABECERA.size + largo)
+    arreglos = {}
+    for nombre, descriptor in encabezado['arreglos'].items():
+        tipo = np.dtype(descriptor['tipo'])
+        forma = tuple(descriptor['forma'])
+        arreglos[nombre] = np.frombuffer(datos, dtype=tipo, count=int(np.prod(forma)),
+                                         offset=inicio_arreglos + descriptor['desplazamiento']).reshape(forma)
+
+    return ArbolCompilado(arreglos['caracteristica'], arreglos['umbral'], arreglos['izquierdo'],
+                          arreglos['derecho'], arreglos['probabilidades'], encabezado['clases'],
+                          encabezado['caracteristicas'], profundidad=encabezado['profundidad'],
+                          muestras=arreglos.get('muestras'), impureza=arreglos.get('impureza'),
+                          metadatos=encabezado['metadatos'])
+
+
+def guardar_artefacto(arbol, ruta, metadatos=None):
+    """Escribe el artefacto de forma atómica y devuelve su SHA-256"""
+    datos = serializar(arbol, metadatos)
+    temporal = ruta + '.tmp'
+    with open(temporal, 'wb') as f:
+        f.write(datos)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporal, ruta)
+    return datos[16:48].hex()
+
+
+def exportar_modelo(modelo, ruta, metadatos=None):
+    """Compila un DecisionTreeClassifier y lo guarda como artefacto"""
+    import sklearn
+
+    from motor_inferencia import compilar_arbol
+
+    metadatos = {'version_sklearn': sklearn.__version__,
+                 'parametros': {k: v for k, v in modelo.get_params().items()
+                                if isinstance(v, (int, float, str, bool, type(None)))},
+                 **(metadatos or {})}
+    return guardar_artefacto(compilar_arbol(modelo), ruta, metadatos)
+
+
+def cargar_artefacto(ruta, verificar=True):
+    """Carga un artefacto como ArbolCompilado (sólo NumPy)"""
+    with open(ruta, 'rb') as f:
+        return deserializar(f.read(), verificar)
+
+
+def leer_encabezado(ruta):
+    """Versión, suma de comprobación y encabezado JSON de un artefacto"""
+    with open(ruta, 'rb') as f:
+        firma, version, largo, suma = _CABECERA.unpack(f.read(_CABECERA.size))
+        if firma != FIRMA:
+            raise ErrorArtefacto("Firma inválida: no es un artefacto de modelo de phishing")
+        encabezado = json.loads(f.read(largo).decode('utf-8'))
+    return {'version_esquema': version, 'sha256': suma.hex(), **encabezado}
+
+
+def cargar_modelo(ruta=ARCHIVO_MODELO):
+    """Árbol del artefacto; si no existe lanza FileNotFoundError con el comando que lo genera"""
+    if not os.path.exists(ruta):
+        directorio = os.path.dirname(ruta)
+        comando = 'python artefacto_modelo.py exportar' + (f' --salida {directorio}' if directorio else '')
+        if os.path.basename(ruta) == ARCHIVO_MODELO:
+            raise FileNotFoundError(f"No existe el modelo '{ruta}'. Genérelo con: {comando}")
+        raise FileNotFoundError(f"No existe el modelo '{ruta}'. El del pipeline se genera con: {comando}")
+    return cargar_artefacto(ruta)
+
+
+# ============================================
+# BENCHMARK DE ARRANQUE EN FRÍO
+# ============================================
+
+_PROGRAMA_ARTEFACTO = """
+import json, sys, time
+inicio = time.perf_counter()
+from artefacto_modelo import cargar_artefacto
+importado = time.perf_counter()
+arbol = cargar_artefacto({ruta!r})
+cargado = time.perf_counter()
+arbol.puntuar([[8.0, 8.0, 8.0, 8.0, 1.0, 7.0, 7.0]])
+fin = time.perf_counter()
+print(json.dumps({{'importar_s': importado - inicio, 'cargar_s': cargado - importado,
+                  'primera_prediccion_s': fin - cargado, 'sklearn': 'sklearn' in sys.modules}}))
+"""
+
+_PROGRAMA_PICKLE = """
+import json, pickle, sys, time
+inicio = time.perf_counter()
+import numpy as np
+importado = time.perf_counter()
+with open({ruta!r}, 'rb') as f:
+    modelo = pickle.load(f)
+cargado = time.perf_counter()
+modelo.predict(np.array([[8.0, 8.0, 8.0, 8.0, 1.0, 7.0, 7.0]]))
+fin = time.perf_counter()
+print(json.dumps({{'importar_s': importado - inicio, 'cargar_s': cargado - importado,
+                  'primera_prediccion_s': fin - cargado, 'sklearn': 'sklearn' in sys.modules}}))
+"""
+
+
+def _proceso_frio(programa, repeticiones):
+    import subprocess
+    import sys
+    import time
+
+    directorio = os.path.dirname(os.path.abspath(__file__))
+    entorno = {**os.environ, 'PYTHONPATH': os.pathsep.join(filter(None, [directorio, os.environ.get('PYTHONPATH')]))}
+    mejor = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        salida = subprocess.run([sys.executable, '-c', programa], capture_output=True, text=True,
+                                check=True, env=entorno).stdout
+        medicion = {**json.loads(salida.strip().splitlines()[-1]), 'proceso_s': time.perf_counter() - inicio}
+        if mejor is None or medicion['proceso_s'] < mejor['proceso_s']:
+            mejor = medicion
+    return mejor
+
+
+def benchmark(ruta=ARCHIVO_MODELO, repeticiones=5):
+    """Arranque en frío: artefacto + NumPy contra pickle de scikit-learn, en procesos nuevos"""
+    import pickle
+    import tempfile
+    import time
+
+    from pipeline_phishing import modelo_entrenado
+
+    arbol = cargar_modelo(ruta)
+    with open(ruta, 'rb') as f:
+        datos = f.read()
+    iteraciones = 1000
+    inicio = time.perf_counter()
+    for _ in range(iteraciones):
+        deserializar(datos)
+    carga_en_caliente = (time.perf_counter() - inicio) / iteraciones
+
+    with tempfile.TemporaryDirectory() as temporal:
+        ruta_pickle = os.path.join(temporal, 'modelo.pkl')
+        with open(ruta_pickle, 'wb') as f:
+            pickle.dump(modelo_entrenado(directorio_salida=os.path.dirname(ruta) or '.'), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        resultados = {
+            'artefacto': _proceso_frio(_PROGRAMA_ARTEFACTO.format(ruta=os.path.abspath(ruta)), repeticiones),
+            'pickle_sklearn': _proceso_frio(_PROGRAMA_PICKLE.format(ruta=ruta_pickle), repeticiones),
+            'bytes_artefacto': len(datos),
+            'bytes_pickle': os.path.getsize(ruta_pickle),
+            'carga_en_caliente_s': carga_en_caliente,
+            'n_nodos': arbol.n_nodos
+        }
+    return resultados
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Artefacto binario del árbol de phishing')
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    p = sub.add_parser('exportar', help='Exportar el modelo del pipeline')
+    p.add_argument('--salida', default='.', help='Directorio del pipeline donde se escribe')
+
+    p = sub.add_parser('info', help='Mostrar el encabezado de un artefacto')
+    p.add_argument('ruta', nargs='?', default=ARCHIVO_MODELO)
+
+    p = sub.add_parser('benchmark', help='Medir el arranque en frío contra pickle + scikit-learn')
+    p.add_argument('ruta', nargs='?', default=ARCHIVO_MODELO)
+    p.add_argument('--repeticiones', type=int, default=5)
+
+    args = parser.parse_args(argv)
+
+    if args.comando == 'exportar':
+        from pipeline_phishing import PipelinePhishing
+
+        PipelinePhishing(directorio_salida=args.salida, verbose=False).ejecutar(hasta='exportar_modelo')
+        ruta = os.path.join(args.salida, ARCHIVO_MODELO)
+        print(f"✅ Modelo exportado → '{ruta}' ({os.path.getsize(ruta):,d} bytes)")
+        print(f"🔑 SHA-256: {leer_encabezado(ruta)['sha256']}")
+    elif args.comando == 'info':
+        encabezado = leer_encabezado(args.ruta)
+        cargar_artefacto(args.ruta)
+        print(f"📦 '{args.ruta}': esquema v{encabezado['version_esquema']}, "
+              f"{encabezado['n_nodos']} nodos, profundidad {encabezado['profundidad']}")
+        print(f"🔑 SHA-256: {encabezado['sha256']} (verificada)")
+        print(f"🏷️  Clases: {encabezado['clases']}  Características: {', '.join(encabezado['caracteristicas'])}")
+        for clave, valor in encabezado['metadatos'].items():
+            print(f"  • {clave}: {valor}")
+    else:
+        r = benchmark(args.ruta, args.repeticiones)
+        print(f"\n⏱️  Arranque en frío ({r['n_nodos']} nodos, mejor de {args.repeticiones} procesos)\n")
+        print(f"{'':18s} {'importar':>10s} {'cargar':>10s} {'1ª pred.':>10s} {'proceso':>10s} "
+              f"{'tamaño':>10s}  sklearn")
+        for nombre, tamano in (('artefacto', r['bytes_artefacto']), ('pickle_sklearn', r['bytes_pickle'])):
+            m = r[nombre]
+            print(f"{nombre:18s} {m['importar_s']*1000:>8.1f}ms {m['cargar_s']*1000:>8.3f}ms "
+                  f"{m['primera_prediccion_s']*1000:>8.2f}ms {m['proceso_s']*1000:>8.1f}ms "
+                  f"{tamano:>8,d} B  {'sí' if m['sklearn'] else 'no'}")
+        print(f"\n⚡ Carga en caliente del artefacto: {r['carga_en_caliente_s']*1e6:.0f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,390 @@
+"""
+Benchmark de escalabilidad del árbol de phishing según el tamaño del dataset
+
+El notebook sólo usa n_registros = 1200. Esta suite genera datasets
+sintéticos (generador_dataset.py, formato .phcol) de 1e3 a 1e8 filas y mide
+por tamaño:
+
+    generar            generación del dataset en disco
+    cargar             .phcol → DataFrame de pandas
+    eda                describe, medias por clase, correlaciones y conteos
+    fit                DecisionTreeClassifier.fit con los parámetros del notebook
+    fit_histogramas    entrenador_histogramas.py (fuera de memoria)
+    predict            modelo.predict de scikit-learn
+    predict_proba      modelo.predict_proba de scikit-learn
+    puntuar_compilado  motor_inferencia.py sobre las columnas memory-mapped
+
+Cada etapa corre en un proceso nuevo para medir su memoria máxima (RSS) sin
+arrastrar la de las anteriores. Las etapas que necesitan todo el dataset en
+memoria tienen un tamaño máximo (LIMITES) para no agotar la RAM; por encima
+se registran como omitidas. En las etapas que leen el .phcol con memory-map
+la RSS incluye las páginas del archivo, que el sistema puede liberar.
+
+Los resultados se guardan en JSON versionado (esquema, commit, versiones de
+las bibliotecas y de la máquina) en benchmarks_escalabilidad/. Las gráficas
+superponen varias corridas para ver regresiones entre commits.
+
+Uso:
+    python benchmark_escalabilidad.py ejecutar
+    python benchmark_escalabilidad.py ejecutar --filas 1e3 1e5 1e7 1e8 --datos /mnt/scratch
+    python benchmark_escalabilidad.py graficar benchmarks_escalabilidad/*.json
+    python benchmark_escalabilidad.py comparar antes.json despues.json --umbral 20
+
+Requisitos: pip install numpy pandas scikit-learn matplotlib
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+VERSION_RESULTADOS = 1
+DIRECTORIO_RESULTADOS = 'benchmarks_escalabilidad'
+TAMANOS = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+
+ETAPAS = ['generar', 'cargar', 'eda', 'fit', 'fit_histogramas', 'predict', 'predict_proba',
+          'puntuar_compilado']
+
+# Filas máximas por etapa: las que materializan el dataset completo en RAM se
+# limitan a 1e7 (≈ 0.3-1 GB); las que lo recorren por bloques llegan a 1e8
+LIMITES = {
+    'cargar': 10_000_000,
+    'eda': 10_000_000,
+    'fit': 10_000_000,
+    'predict': 10_000_000,
+    'predict_proba': 10_000_000,
+    'fit_histogramas': 100_000_000,
+    'puntuar_compilado': 100_000_000
+}
+
+# Filas con que se entrena el modelo que miden las etapas de predicción
+FILAS_MODELO_PREDICCION = 100_000
+
+
+# ============================================
+# MEDICIÓN DE UNA ETAPA (PROCESO HIJO)
+# ============================================
+
+def _memoria_mb(campo):
+    """VmRSS (actual) o VmHWM (máximo) de /proc/self/status, en MB"""
+    with open('/proc/self/status', encoding='ascii') as f:
+        for linea in f:
+            if linea.startswith(campo + ':'):
+                return int(linea.split()[1]) / 1024
+    raise KeyError(campo)
+
+
+def _reiniciar_maximo():
+    """Baja VmHWM a la RSS actual (Linux >= 4.0); ru_maxrss no sirve porque
+    hereda el máximo del proceso padre a través de fork y exec"""
+    with open('/proc/self/clear_refs', 'w', encoding='ascii') as f:
+        f.write('5')
+
+
+def _preparar(etapa, ruta):
+    """Lo que la etapa necesita antes de medir, y la función medida"""
+    import numpy as np
+
+    from esquema_phishing import CARACTERISTICAS, OBJETIVO, PARAMETROS_MODELO
+    from formato_columnar import abrir_columnar
+
+    dataset = abrir_columnar(ruta)
+    if etapa == 'cargar':
+        import pandas  # noqa: F401  (la importación no forma parte de la carga)
+
+        return lambda: dataset.a_dataframe()
+    if etapa == 'eda':
+        df = dataset.a_dataframe()
+
+        def eda():
+            return (df.describe(), df.groupby(OBJETIVO).mean(), df.corr(),
+                    df[OBJETIVO].value_counts(), df['contiene_url'].value_counts())
+        return eda
+    if etapa == 'fit_histogramas':
+        from entrenador_histogramas import entrenar_histogramas
+
+        return lambda: entrenar_histogramas(ruta, **PARAMETROS_MODELO)
+
+    from sklearn.tree import DecisionTreeClassifier
+
+    if etapa == 'puntuar_compilado':
+        from motor_inferencia import compilar_arbol
+
+        muestra = slice(0, FILAS_MODELO_PREDICCION)
+        modelo = DecisionTreeClassifier(**PARAMETROS_MODELO).fit(
+            dataset.matriz(CARACTERISTICAS, muestra).astype(np.float32), dataset[OBJETIVO][muestra])
+        arbol = compilar_arbol(modelo, CARACTERISTICAS)
+        return lambda: arbol.puntuar(dataset.columnas)
+
+    X = dataset.matriz(CARACTERISTICAS).astype(np.float32)
+    y = np.asarray(dataset[OBJETIVO])
+    if etapa == 'fit':
+        return lambda: DecisionTreeClassifier(**PARAMETROS_MODELO).fit(X, y)
+    modelo = DecisionTreeClassifier(**PARAMETROS_MODELO).fit(X[:FILAS_MODELO_PREDICCION],
+                                                             y[:FILAS_MODELO_PREDICCION])
+    if etapa == 'predict':
+        return lambda: modelo.predict(X)
+    if etapa == 'predict_proba':
+        return lambda: modelo.predict_proba(X)
+    raise ValueError(f"Etapa desconocida: {etapa}")
+
+
+def medir_etapa(etapa, ruta):
+    """Segundos y RSS (antes y máximo) de una etapa; se llama en un proceso nuevo"""
+    import warnings
+
+    warnings.filterwarnings('ignore')
+    funcion = _preparar(etapa, ruta)
+    _reiniciar_maximo()
+    rss_base = _memoria_mb('VmRSS')
+    inicio = time.perf_counter()
+    funcion()
+    segundos = time.perf_counter() - inicio
+    return {'segundos': segundos, 'rss_base_mb': rss_base, 'rss_pico_mb': _memoria_mb('VmHWM')}
+
+
+def _medir_en_proceso(etapa, ruta):
+    comando = [sys.executable, os.path.abspath(__file__), 'medir', etapa, ruta]
+    salida = subprocess.run(comando, capture_output=True, text=True)
+    if salida.returncode != 0:
+        ultima = (salida.stderr.strip().splitlines() or ['sin salida'])[-1]
+        return {'error': ultima}
+    return json.loads(salida.stdout.strip().splitlines()[-1])
+
+
+# ============================================
+# SUITE
+# ============================================
+
+def entorno():
+    """Commit, bibliotecas y máquina en que se midió"""
+    import numpy
+    import pandas
+    import sklearn
+
+    def git(*argumentos):
+        try:
+            return subprocess.run(['git', *argumentos], capture_output=True, text=True, check=True,
+                                  cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    commit = git('rev-parse', '--short', 'HEAD')
+    return {
+        'commit': commit,
+        'cambios_sin_commit': bool(git('status', '--porcelain', '--untracked-files=no')) if commit else None,
+        'python': platform.python_version(),
+        'numpy': numpy.__version__,
+        'pandas': pandas.__version__,
+        'sklearn': sklearn.__version__,
+        'sistema': platform.platform(),
+        'procesador': platform.processor() or platform.machine(),
+        'cpus': os.cpu_count(),
+        'memoria_gb': os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') / 2**30
+    }
+
+
+def ejecutar(tamanos=None, etapas=None, directorio_datos=None, limites=None, conservar=False, progreso=True):
+    """Corre la suite y devuelve el documento de resultados"""
+    from generador_dataset import generar_columnar
+
+    tamanos = tamanos or TAMANOS
+    etapas = etapas or ETAPAS
+    limites = LIMITES if limites is None else limites
+    temporal = None if directorio_datos else tempfile.mkdtemp(prefix='escalabilidad_')
+    directorio_datos = directorio_datos or temporal
+
+    documento = {'version': VERSION_RESULTADOS, 'fecha': datetime.now().isoformat(timespec='seconds'),
+                 'entorno': entorno(), 'limites': limites, 'resultados': []}
+    try:
+        for n in tamanos:
+            ruta = os.path.join(directorio_datos, f"escalabilidad_{n}.phcol")
+            generado = not os.path.isdir(ruta)
+            inicio = time.perf_counter()
+            if generado:
+                generar_columnar(ruta, n, progreso=False)
+            segundos_generar = time.perf_counter() - inicio
+
+            for etapa in etapas:
+                if etapa == 'generar':
+                    resultado = ({'segundos': segundos_generar} if generado
+                                 else {'omitida': 'dataset reutilizado de una corrida anterior'})
+                elif n > limites.get(etapa, float('inf')):
+                    resultado = {'omitida': f"supera el límite de {limites[etapa]:,d} filas"}
+                else:
+                    resultado = _medir_en_proceso(etapa, ruta)
+                resultado = {'etapa': etapa, 'filas': n, **resultado}
+                if 'segundos' in resultado:
+                    resultado['filas_por_s'] = n / resultado['segundos'] if resultado['segundos'] else None
+                documento['resultados'].append(resultado)
+                if progreso:
+                    _mostrar_resultado(resultado)
+            if not conservar:
+                shutil.rmtree(ruta, ignore_errors=True)
+    finally:
+        if temporal and not conservar:
+            shutil.rmtree(temporal, ignore_errors=True)
+    return documento
+
+
+def _mostrar_resultado(r):
+    texto = f"  {r['filas']:>12,d}  {r['etapa']:18s} "
+    if 'segundos' in r:
+        texto += f"{r['segundos']:10.3f} s {r['filas_por_s']:>14,.0f} filas/s"
+        if 'rss_pico_mb' in r:
+            texto += f"  RSS {r['rss_pico_mb']:8.0f} MB (base {r['rss_base_mb']:.0f})"
+    elif 'error' in r:
+        texto += f"❌ {r['error']}"
+    else:
+        texto += f"—  {r['omitida']}"
+    print(texto, flush=True)
+
+
+def guardar(documento, directorio=DIRECTORIO_RESULTADOS):
+    os.makedirs(directorio, exist_ok=True)
+    fecha = documento['fecha'].replace(':', '').replace('-', '')
+    ruta = os.path.join(directorio, f"{fecha}_{documento['entorno']['commit'] or 'sin_git'}.json")
+    with open(ruta, 'w', encoding='utf-8') as f:
+        json.dump(documento, f, ensure_ascii=False, indent=2)
+    return ruta
+
+
+def cargar(ruta):
+    with open(ruta, encoding='utf-8') as f:
+        documento = json.load(f)
+    if documento.get('version') != VERSION_RESULTADOS:
+        raise ValueError(f"'{ruta}' no es un resultado de escalabilidad v{VERSION_RESULTADOS}")
+    return documento
+
+
+# ============================================
+# GRÁFICAS Y COMPARACIÓN
+# ============================================
+
+def _etiqueta(documento):
+    entorno_ = documento['entorno']
+    commit = (entorno_['commit'] or 'sin git') + ('+' if entorno_.get('cambios_sin_commit') else '')
+    return f"{commit} ({documento['fecha'][:16].replace('T', ' ')})"
+
+
+def graficar(documentos, ruta='escalabilidad.png'):
+    """Tiempo y RSS máximo por etapa contra filas (log-log), una línea por corrida"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    etapas = [e for e in ETAPAS if any(r['etapa'] == e and 'segundos' in r
+                                       for d in documentos for r in d['resultados'])]
+    fig, ejes = plt.subplots(2, len(etapas), figsize=(3.2 * len(etapas), 6.5), squeeze=False)
+    for columna, etapa in enumerate(etapas):
+        for documento in documentos:
+            medidas = sorted((r for r in documento['resultados'] if r['etapa'] == etapa and 'segundos' in r),
+                             key=lambda r: r['filas'])
+            if not medidas:
+                continue
+            filas = [r['filas'] for r in medidas]
+            ejes[0, columna].plot(filas, [r['segundos'] for r in medidas], marker='o', label=_etiqueta(documento))
+            if all('rss_pico_mb' in r for r in medidas):
+                ejes[1, columna].plot(filas, [r['rss_pico_mb'] for r in medidas], marker='o')
+        ejes[0, columna].set_title(etapa, fontweight='bold')
+        if not ejes[1, columna].lines:
+            ejes[1, columna].axis('off')
+        for fila, unidad in ((0, 'segundos'), (1, 'RSS máximo (MB)')):
+            eje = ejes[fila, columna]
+            if not eje.axison:
+                continue
+            eje.set_xscale('log')
+            eje.set_yscale('log')
+            eje.grid(True, which='both', alpha=0.3)
+            eje.set_xlabel('filas')
+            if columna == 0 or not ejes[fila, columna - 1].axison:
+                eje.set_ylabel(unidad)
+    ejes[0, 0].legend(fontsize=7)
+    fig.suptitle('Escalabilidad del árbol de phishing', fontweight='bold')
+    fig.tight_layout()
+    fig.savefig(ruta, dpi=120)
+    plt.close(fig)
+    return ruta
+
+
+def comparar(antes, despues, umbral=20.0, minimo_s=0.01):
+    """Filas (etapa, filas, s antes, s después, cambio %, regresión) de las medidas comunes"""
+    def medidas(documento):
+        return {(r['etapa'], r['filas']): r['segundos'] for r in documento['resultados'] if 'segundos' in r}
+
+    medidas_antes, medidas_despues = medidas(antes), medidas(despues)
+    filas = []
+    for clave in sorted(set(medidas_antes) & set(medidas_despues), key=lambda c: (ETAPAS.index(c[0]), c[1])):
+        s_a, s_d = medidas_antes[clave], medidas_despues[clave]
+        cambio = (s_d - s_a) / s_a * 100 if s_a else 0.0
+        filas.append((*clave, s_a, s_d, cambio, cambio > umbral and s_d - s_a > minimo_s))
+    return filas
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark de escalabilidad del árbol de phishing')
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    p = sub.add_parser('ejecutar', help='Correr la suite y guardar el JSON de resultados')
+    p.add_argument('--filas', type=float, nargs='+', default=TAMANOS, help='Tamaños (acepta 1e8)')
+    p.add_argument('--etapas', nargs='+', choices=ETAPAS, default=ETAPAS)
+    p.add_argument('--datos', default=None, help='Directorio para los datasets (por defecto, uno temporal)')
+    p.add_argument('--conservar', action='store_true', help='No borrar los datasets al terminar')
+    p.add_argument('--sin-limites', action='store_true', help='Medir todas las etapas en todos los tamaños')
+    p.add_argument('--resultados', default=DIRECTORIO_RESULTADOS, help='Directorio de los JSON')
+    p.add_argument('--grafica', default=None, help='Graficar también esta corrida en un PNG')
+
+    p = sub.add_parser('graficar', help='Graficar una o varias corridas')
+    p.add_argument('json', nargs='+')
+    p.add_argument('--salida', default='escalabilidad.png')
+
+    p = sub.add_parser('comparar', help='Comparar dos corridas etapa por etapa')
+    p.add_argument('antes')
+    p.add_argument('despues')
+    p.add_argument('--umbral', type=float, default=20.0, help='Porcentaje de aumento que cuenta como regresión')
+
+    p = sub.add_parser('medir', help=argparse.SUPPRESS)
+    p.add_argument('etapa', choices=ETAPAS)
+    p.add_argument('ruta')
+
+    args = parser.parse_args(argv)
+
+    if args.comando == 'medir':
+        print(json.dumps(medir_etapa(args.etapa, args.ruta)))
+        return 0
+
+    if args.comando == 'ejecutar':
+        tamanos = [int(n) for n in args.filas]
+        print(f"⏱️  Escalabilidad: {', '.join(f'{n:,d}' for n in tamanos)} filas\n")
+        documento = ejecutar(tamanos, args.etapas, args.datos, {} if args.sin_limites else None, args.conservar)
+        ruta = guardar(documento, args.resultados)
+        print(f"\n💾 Resultados guardados en '{ruta}'")
+        if args.grafica:
+            print(f"📈 Gráfica en '{graficar([documento], args.grafica)}'")
+        return 0
+
+    if args.comando == 'graficar':
+        print(f"📈 Gráfica en '{graficar([cargar(r) for r in args.json], args.salida)}'")
+        return 0
+
+    antes, despues = cargar(args.antes), cargar(args.despues)
+    print(f"{'etapa':18s} {'filas':>12s} {'antes s':>10s} {'después':>10s} {'cambio':>8s}")
+    filas = comparar(antes, despues, args.umbral)
+    for etapa, n, s_a, s_d, cambio, regresion in filas:
+        print(f"{etapa:18s} {n:>12,d} {s_a:10.3f} {s_d:10.3f} {cambio:+7.1f}%{'  ⚠️' if regresion else ''}")
+    regresiones = sum(1 for fila in filas if fila[-1])
+    if regresiones:
+        print(f"\n⚠️  {regresiones} medida(s) más lentas que el umbral ({args.umbral:.0f}%)")
+        return 1
+    print("\n✅ Sin regresiones por encima del umbral")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
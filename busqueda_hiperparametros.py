@@ -0,0 +1,369 @@
+"""
+Búsqueda de hiperparámetros en paralelo para el árbol de detección de phishing
+
+El notebook fija max_depth=5, min_samples_split=40, min_samples_leaf=15 y
+criterion='gini' sin buscar. Este script evalúa una rejilla (o una muestra
+aleatoria reproducible) de esos parámetros en un pool de procesos:
+
+- Los datos de ajuste y validación se copian una sola vez a memoria
+  compartida (memoria_compartida.py); cada tarea sólo recibe el diccionario
+  de parámetros.
+- Cada configuración se entrena con una parte del conjunto de
+  entrenamiento y se mide en la parte restante (validación); el conjunto de
+  prueba sólo se usa al final con la configuración elegida.
+- Cada resultado se agrega a una tabla CSV en cuanto termina. Al volver a
+  ejecutar, las configuraciones ya evaluadas con los mismos datos se
+  omiten, así que una búsqueda interrumpida se reanuda donde quedó.
+- Se elige el árbol más pequeño (menos nodos, luego menor profundidad y
+  predicción más rápida) cuya exactitud esté dentro de una tolerancia de la
+  mejor.
+
+Uso:
+    python busqueda_hiperparametros.py
+    python busqueda_hiperparametros.py --aleatorias 200 --tolerancia 0.01
+    python busqueda_hiperparametros.py --datos dataset_grande.phcol --procesos 8
+
+Requisitos: pip install numpy pandas scikit-learn
+"""
+
+import argparse
+import csv
+import hashlib
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from esquema_phishing import CARACTERISTICAS, OBJETIVO, PARAMETROS_MODELO, SEMILLA, TEST_SIZE
+
+ARCHIVO_RESULTADOS = 'busqueda_hiperparametros.csv'
+TOLERANCIA = 0.005
+FRACCION_VALIDACION = 0.25
+
+# Rejilla por defecto; incluye los valores del notebook
+REJILLA = {
+    'max_depth': [2, 3, 4, 5, 6, 8, 10],
+    'min_samples_split': [2, 10, 20, 40, 80],
+    'min_samples_leaf': [1, 5, 10, 15, 30],
+    'criterion': ['gini', 'entropy']
+}
+
+# Rangos (inclusivos) del espacio aleatorio
+RANGOS_ALEATORIOS = {
+    'max_depth': (2, 12),
+    'min_samples_split': (2, 120),
+    'min_samples_leaf': (1, 60),
+    'criterion': ['gini', 'entropy']
+}
+
+PARAMETROS = list(REJILLA)
+COLUMNAS_RESULTADOS = (['clave'] + PARAMETROS +
+                       ['accuracy_validacion', 'n_nodos', 'n_hojas', 'profundidad',
+                        'segundos_entrenamiento', 'segundos_prediccion'])
+
+# Datos adjuntos en cada proceso trabajador (ver _inicializar)
+_DATOS = None
+_SEMILLA = SEMILLA
+
+
+# ============================================
+# ESPACIO DE BÚSQUEDA
+# ============================================
+
+def espacio_rejilla(rejilla=None):
+    """Todas las combinaciones de la rejilla como lista de diccionarios"""
+    rejilla = rejilla or REJILLA
+    return [dict(zip(rejilla, valores)) for valores in itertools.product(*rejilla.values())]
+
+
+def espacio_aleatorio(n, semilla=SEMILLA, rangos=None):
+    """`n` configuraciones distintas muestreadas de `rangos` (reproducible con la semilla)"""
+    rangos = rangos or RANGOS_ALEATORIOS
+    rng = np.random.default_rng(semilla)
+    configuraciones = {}
+    intentos = 0
+    while len(configuraciones) < n and intentos < 100 * n:
+        intentos += 1
+        configuracion = {}
+        for nombre, rango in rangos.items():
+            if isinstance(rango, tuple):
+                configuracion[nombre] = int(rng.integers(rango[0], rango[1] + 1))
+            else:
+                configuracion[nombre] = rango[int(rng.integers(len(rango)))]
+        configuraciones.setdefault(clave_configuracion(configuracion), configuracion)
+    return list(configuraciones.values())
+
+
+def clave_configuracion(configuracion, huella_datos=''):
+    """Hash estable de una configuración (y de los datos con que se evalúa)"""
+    texto = json.dumps({'parametros': configuracion, 'datos': huella_datos}, sort_keys=True)
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest()[:16]
+
+
+# ============================================
+# DATOS
+# ============================================
+
+def preparar_datos(ruta_datos=None, test_size=TEST_SIZE, semilla=SEMILLA,
+                   fraccion_validacion=FRACCION_VALIDACION):
+    """Devuelve los arreglos de ajuste, validación y prueba (float32 / uint8)
+
+    Sin `ruta_datos` se usa la división del pipeline (dataset_phishing.csv);
+    con una ruta CSV o .phcol se aplica la misma división estratificada.
+    """
+    from sklearn.model_selection import train_test_split
+
+    from pipeline_phishing import PipelinePhishing, etapa_dividir, parametros_por_defecto
+
+    if ruta_datos is None:
+        parametros = parametros_por_defecto()
+        parametros.update({'test_size': test_size, 'semilla': semilla})
+        division = PipelinePhishing(parametros, verbose=False).ejecutar(hasta='dividir')['dividir']
+    else:
+        from formato_columnar import cargar_dataset
+
+        division = etapa_dividir(cargar_dataset(ruta_datos, CARACTERISTICAS + [OBJETIVO]),
+                                 test_size, semilla)
+
+    X_train = np.ascontiguousarray(division['X_train'], dtype=np.float32)
+    y_train = np.asarray(division['y_train'], dtype=np.uint8)
+    X_ajuste, X_validacion, y_ajuste, y_validacion = train_test_split(
+        X_train, y_train, test_size=fraccion_validacion, random_state=semilla, stratify=y_train)
+
+    return {
+        'X_ajuste': X_ajuste, 'y_ajuste': y_ajuste,
+        'X_validacion': X_validacion, 'y_validacion': y_validacion,
+        'X_train': X_train, 'y_train': y_train,
+        'X_test': np.ascontiguousarray(division['X_test'], dtype=np.float32),
+        'y_test': np.asarray(division['y_test'], dtype=np.uint8)
+    }
+
+
+def huella_datos(datos, semilla):
+    """SHA-256 de los arreglos de búsqueda y de la semilla del árbol"""
+    huella = hashlib.sha256(str(semilla).encode('ascii'))
+    for nombre in ('X_ajuste', 'y_ajuste', 'X_validacion', 'y_validacion'):
+        huella.update(np.ascontiguousarray(datos[nombre]).tobytes())
+    return huella.hexdigest()
+
+
+# ============================================
+# EVALUACIÓN (PROCESOS TRABAJADORES)
+# ============================================
+
+def _inicializar(descriptor, semilla):
+    global _DATOS, _SEMILLA
+    from memoria_compartida import adjuntar
+
+    _DATOS = adjuntar(descriptor)
+    _SEMILLA = semilla
+
+
+def evaluar_configuracion(configuracion, datos=None, semilla=None, repeticiones=3):
+    """Entrena una configuración y mide exactitud, tamaño y tiempos"""
+    from sklearn.tree import DecisionTreeClassifier
+
+    from motor_inferencia import compilar_arbol
+
+    datos = datos if datos is not None else _DATOS
+    semilla = _SEMILLA if semilla is None else semilla
+
+    inicio = time.perf_counter()
+    modelo = DecisionTreeClassifier(**configuracion, random_state=semilla)
+    modelo.fit(datos['X_ajuste'], datos['y_ajuste'])
+    segundos_entrenamiento = time.perf_counter() - inicio
+
+    # La velocidad de predicción se mide con el árbol compilado que usan los puntuadores
+    arbol = compilar_arbol(modelo, CARACTERISTICAS)
+    segundos_prediccion = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        etiquetas = arbol.puntuar(datos['X_validacion'])[0]
+        segundos_prediccion = min(segundos_prediccion, time.perf_counter() - inicio)
+
+    return {
+        **configuracion,
+        'accuracy_validacion': float(np.mean(etiquetas == datos['y_validacion'])),
+        'n_nodos': int(modelo.tree_.node_count),
+        'n_hojas': int(modelo.get_n_leaves()),
+        'profundidad': int(modelo.get_depth()),
+        'segundos_entrenamiento': segundos_entrenamiento,
+        'segundos_prediccion': segundos_prediccion
+    }
+
+
+# ============================================
+# TABLA DE RESULTADOS
+# ============================================
+
+def _convertir_fila(fila):
+    convertida = {'clave': fila['clave'], 'criterion': fila['criterion']}
+    for nombre in ('max_depth', 'min_samples_split', 'min_samples_leaf',
+                   'n_nodos', 'n_hojas', 'profundidad'):
+        convertida[nombre] = int(fila[nombre])
+    for nombre in ('accuracy_validacion', 'segundos_entrenamiento', 'segundos_prediccion'):
+        convertida[nombre] = float(fila[nombre])
+    return convertida
+
+
+def leer_resultados(ruta):
+    """Resultados ya guardados, clave → fila (ignora una última línea incompleta)"""
+    if not os.path.exists(ruta):
+        return {}
+    resultados = {}
+    with open(ruta, encoding='utf-8', newline='') as f:
+        for fila in csv.DictReader(f):
+            try:
+                resultados[fila['clave']] = _convertir_fila(fila)
+            except (KeyError, TypeError, ValueError):
+                continue
+    return resultados
+
+
+class TablaResultados:
+    """Tabla CSV a la que se agrega cada resultado en cuanto se obtiene"""
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        nuevo = not os.path.exists(ruta) or os.path.getsize(ruta) == 0
+        if not nuevo:
+            # Si la ejecución anterior se cortó a mitad de línea, se completa
+            with open(ruta, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                incompleta = f.read(1) != b'\n'
+        self._archivo = open(ruta, 'a', encoding='utf-8', newline='')
+        if not nuevo and incompleta:
+            self._archivo.write('\n')
+        self._escritor = csv.DictWriter(self._archivo, fieldnames=COLUMNAS_RESULTADOS,
+                                        extrasaction='ignore', lineterminator='\n')
+        if nuevo:
+            self._escritor.writeheader()
+
+    def agregar(self, fila):
+        self._escritor.writerow(fila)
+        self._archivo.flush()
+
+    def cerrar(self):
+        self._archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        self.cerrar()
+
+
+# ============================================
+# BÚSQUEDA Y SELECCIÓN
+# ============================================
+
+def buscar(configuraciones, datos, ruta_resultados=ARCHIVO_RESULTADOS, procesos=None,
+           semilla=SEMILLA, progreso=True):
+    """Evalúa las configuraciones pendientes y devuelve todos los resultados de esta búsqueda"""
+    from memoria_compartida import ArreglosCompartidos
+
+    huella = huella_datos(datos, semilla)
+    claves = [clave_configuracion(c, huella) for c in configuraciones]
+    previos = leer_resultados(ruta_resultados)
+    pendientes = [(clave, c) for clave, c in zip(claves, configuraciones) if clave not in previos]
+
+    if progreso:
+        print(f"🔎 {len(configuraciones)} configuraciones: {len(configuraciones) - len(pendientes)} "
+              f"ya evaluadas, {len(pendientes)} pendientes")
+
+    procesos = procesos or os.cpu_count() or 1
+    nuevos = {}
+    inicio = time.perf_counter()
+    arreglos = {nombre: datos[nombre] for nombre in ('X_ajuste', 'y_ajuste', 'X_validacion', 'y_validacion')}
+
+    with TablaResultados(ruta_resultados) as tabla, ArreglosCompartidos(arreglos) as compartidos:
+        with ProcessPoolExecutor(max_workers=procesos, initializer=_inicializar,
+                                 initargs=(compartidos.descriptor, semilla)) as pool:
+            futuros = {pool.submit(evaluar_configuracion, c): clave for clave, c in pendientes}
+            for completados, futuro in enumerate(as_completed(futuros), 1):
+                fila = {'clave': futuros[futuro], **futuro.result()}
+                tabla.agregar(fila)
+                nuevos[fila['clave']] = fila
+                if progreso and (completados % 25 == 0 or completados == len(futuros)):
+                    transcurrido = time.perf_counter() - inicio
+                    print(f"  ⏱️  {completados:>5d} / {len(futuros)}  "
+                          f"{completados / transcurrido:,.1f} configuraciones/s")
+
+    todos = {**previos, **nuevos}
+    return [todos[clave] for clave in claves]
+
+
+def seleccionar(resultados, tolerancia=TOLERANCIA):
+    """El árbol más pequeño y rápido a `tolerancia` o menos de la mejor exactitud"""
+    mejor = max(r['accuracy_validacion'] for r in resultados)
+    candidatos = [r for r in resultados if r['accuracy_validacion'] >= mejor - tolerancia]
+    return min(candidatos, key=lambda r: (r['n_nodos'], r['profundidad'],
+                                          r['segundos_prediccion'], -r['accuracy_validacion']))
+
+
+def configuracion_de(resultado):
+    return {nombre: resultado[nombre] for nombre in PARAMETROS}
+
+
+def evaluar_en_prueba(configuracion, datos, semilla=SEMILLA):
+    """Reentrena con todo el entrenamiento y devuelve la exactitud en prueba"""
+    from sklearn.tree import DecisionTreeClassifier
+
+    modelo = DecisionTreeClassifier(**configuracion, random_state=semilla)
+    modelo.fit(datos['X_train'], datos['y_train'])
+    return float(np.mean(modelo.predict(datos['X_test']) == datos['y_test'])), modelo
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Búsqueda de hiperparámetros en paralelo con tabla de resultados reanudable')
+    parser.add_argument('--datos', help='CSV o .phcol (por defecto, el dataset del pipeline)')
+    parser.add_argument('--aleatorias', type=int, default=0,
+                        help='Muestrear N configuraciones aleatorias en vez de la rejilla')
+    parser.add_argument('--tolerancia', type=float, default=TOLERANCIA,
+                        help='Pérdida de exactitud admitida frente a la mejor (0.005 = 0.5 puntos)')
+    parser.add_argument('--procesos', type=int, default=None)
+    parser.add_argument('--semilla', type=int, default=SEMILLA)
+    parser.add_argument('--test-size', type=float, default=TEST_SIZE)
+    parser.add_argument('--resultados', default=ARCHIVO_RESULTADOS, help='Tabla CSV de resultados')
+    parser.add_argument('--reiniciar', action='store_true', help='Borrar la tabla y empezar de cero')
+    args = parser.parse_args(argv)
+
+    if args.reiniciar and os.path.exists(args.resultados):
+        os.remove(args.resultados)
+
+    datos = preparar_datos(args.datos, args.test_size, args.semilla)
+    configuraciones = (espacio_aleatorio(args.aleatorias, args.semilla) if args.aleatorias
+                       else espacio_rejilla())
+
+    print(f"📊 Ajuste: {len(datos['y_ajuste']):,d} filas  Validación: {len(datos['y_validacion']):,d} filas")
+    inicio = time.perf_counter()
+    resultados = buscar(configuraciones, datos, args.resultados, args.procesos, args.semilla)
+    print(f"✅ Búsqueda completada en {time.perf_counter() - inicio:.2f} s → '{args.resultados}'")
+
+    mejor = max(resultados, key=lambda r: r['accuracy_validacion'])
+    elegido = seleccionar(resultados, args.tolerancia)
+    notebook = {nombre: PARAMETROS_MODELO[nombre] for nombre in PARAMETROS}
+
+    print(f"\n🏆 Mejor exactitud de validación: {mejor['accuracy_validacion']*100:.2f}% "
+          f"({mejor['n_nodos']} nodos)")
+    print(f"🌳 Elegido (tolerancia {args.tolerancia*100:.2f} puntos): {configuracion_de(elegido)}")
+    print(f"   Validación: {elegido['accuracy_validacion']*100:.2f}%  Nodos: {elegido['n_nodos']}  "
+          f"Hojas: {elegido['n_hojas']}  Profundidad: {elegido['profundidad']}")
+
+    for nombre, configuracion in (('Elegido', configuracion_de(elegido)), ('Notebook', notebook)):
+        exactitud, modelo = evaluar_en_prueba(configuracion, datos, args.semilla)
+        print(f"🎯 {nombre:8s} exactitud en prueba: {exactitud*100:.2f}%  "
+              f"({modelo.tree_.node_count} nodos)")
+
+    print("\n▶️  Para usarlo en el pipeline:")
+    print(f"   python pipeline_phishing.py --max-depth {elegido['max_depth']} "
+          f"--min-samples-split {elegido['min_samples_split']} "
+          f"--min-samples-leaf {elegido['min_samples_leaf']} --criterion {elegido['criterion']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""
+Puntuación en cascada con salida temprana por el corte raíz del árbol
+
+En el árbol del notebook el corte raíz (oferta_irreal <= 2.45) concentra
+casi toda la importancia y, a cada lado, todas las hojas predicen la misma
+clase. La cascada aprovecha esa estructura:
+
+1. Etapa raíz: una sola comparación vectorizada sobre la característica
+   del corte raíz. Las filas que caen en un lado "decidido" (todas sus
+   hojas predicen la misma clase y esa clase tiene al menos `confianza` de
+   probabilidad en el nodo) se resuelven ahí. Con `margen` > 0, las filas a
+   menos de esa distancia del umbral se consideran ambiguas aunque su lado
+   esté decidido.
+2. Etapa completa: el resto pasa por el árbol completo o por el modelo más
+   pesado que se indique (cualquier objeto con puntuar(X)).
+
+Las etiquetas son siempre las del árbol completo. Para las filas resueltas
+en la etapa raíz, la probabilidad de phishing es la del nodo hijo de la raíz
+(la proporción de phishing en todo ese lado), no la de la hoja. Cada etapa
+lleva contadores de filas evaluadas y resueltas.
+
+Uso:
+    from cascada import CascadaRaiz
+    cascada = CascadaRaiz(cargar_modelo())
+    etiquetas, prob_phishing = cascada.puntuar(X)
+    print(cascada.contadores.resumen())
+
+    python cascada.py --benchmark
+
+Requisitos: pip install numpy
+"""
+
+import argparse
+
+import numpy as np
+
+from esquema_phishing import CARACTERISTICAS
+from motor_inferencia import _cronometrar, umbrales_float32
+
+CONFIANZA = 0.95
+
+
+class ContadoresCascada:
+    """Filas evaluadas y resueltas por etapa, acumuladas entre llamadas"""
+
+    def __init__(self, etapas):
+        self.evaluadas = dict.fromkeys(etapas, 0)
+        self.resueltas = dict.fromkeys(etapas, 0)
+
+    def registrar(self, etapa, evaluadas, resueltas):
+        self.evaluadas[etapa] += int(evaluadas)
+        self.resueltas[etapa] += int(resueltas)
+
+    def tasa(self, etapa):
+        """Fracción de las filas que llegan a la etapa que se resuelven en ella"""
+        return self.resueltas[etapa] / self.evaluadas[etapa] if self.evaluadas[etapa] else 0.0
+
+    def reiniciar(self):
+        for etapa in self.evaluadas:
+            self.evaluadas[etapa] = self.resueltas[etapa] = 0
+
+    def resumen(self):
+        return {etapa: {'evaluadas': self.evaluadas[etapa], 'resueltas': self.resueltas[etapa],
+                        'tasa': self.tasa(etapa)} for etapa in self.evaluadas}
+
+
+def _hojas_subarbol(arbol, nodo):
+    hojas, pendientes = [], [nodo]
+    while pendientes:
+        actual = pendientes.pop()
+        if arbol.izquierdo[actual] == actual:
+            hojas.append(actual)
+        else:
+            pendientes += [arbol.izquierdo[actual], arbol.derecho[actual]]
+    return hojas
+
+
+def _columna(X, indice, nombre):
+    if hasattr(X, 'columns') or isinstance(X, dict):
+        return np.asarray(X[nombre])
+    return np.asarray(X)[:, indice]
+
+
+def _filas(X, mascara):
+    if hasattr(X, 'columns'):
+        return X[mascara]
+    if isinstance(X, dict):
+        return {nombre: np.asarray(valores)[mascara] for nombre, valores in X.items()}
+    return np.asarray(X)[mascara]
+
+
+class CascadaRaiz:
+    """Etapa raíz sobre la característica dominante + árbol (o modelo) completo"""
+
+    ETAPAS = ['raiz', 'completa']
+
+    def __init__(self, arbol, modelo_completo=None, confianza=CONFIANZA, margen=0.0):
+        if arbol.izquierdo[0] == 0:
+            raise ValueError("El árbol es una sola hoja: no hay corte raíz para la cascada")
+        self.arbol = arbol
+        self.modelo_completo = modelo_completo or arbol
+        self.margen = margen
+        self.caracteristica = int(arbol.caracteristica[0])
+        self.nombre = arbol.nombres_caracteristicas[self.caracteristica]
+        self.umbral = float(arbol.umbral[0])
+        self._umbral_float32 = umbrales_float32(self.umbral)
+        self.contadores = ContadoresCascada(self.ETAPAS)
+
+        # Por lado (0 = izquierdo, 1 = derecho): (etiqueta, prob. de phishing) si está decidido, o None
+        self.lados = []
+        for hijo in (arbol.izquierdo[0], arbol.derecho[0]):
+            etiquetas = {arbol._etiqueta_nodo[hoja] for hoja in _hojas_subarbol(arbol, hijo)}
+            decidido = len(etiquetas) == 1 and arbol.probabilidades[hijo].max() >= confianza
+            self.lados.append((etiquetas.pop(), float(arbol._proba_por_clase[-1][hijo])) if decidido else None)
+        # Tablas de dos entradas indexadas por el lado de cada fila
+        self._decidido = np.array([lado is not None for lado in self.lados])
+        self._etiqueta_lado = np.array([lado[0] if lado else arbol.clases[0] for lado in self.lados],
+                                       dtype=arbol.clases.dtype)
+        self._prob_lado = np.array([lado[1] if lado else np.nan for lado in self.lados])
+
+    def puntuar(self, X):
+        """Devuelve (etiquetas, probabilidad de phishing) como ArbolCompilado.puntuar"""
+        valores = _columna(X, self.caracteristica, self.nombre).astype(np.float32, copy=False)
+        n = len(valores)
+        # Misma comparación que el árbol (ver motor_inferencia.umbrales_float32); True = lado derecho
+        lado = valores > self._umbral_float32
+        etiquetas = np.take(self._etiqueta_lado, lado)
+        prob_phishing = np.take(self._prob_lado, lado)
+
+        if self._decidido.all() and self.margen <= 0:
+            self.contadores.registrar('raiz', n, n)
+            return etiquetas, prob_phishing
+        resueltas = np.take(self._decidido, lado)
+        if self.margen > 0:
+            resueltas &= np.abs(valores - self.umbral) >= self.margen
+        n_resueltas = int(np.count_nonzero(resueltas))
+        self.contadores.registrar('raiz', n, n_resueltas)
+        if n_resueltas < n:
+            ambiguas = ~resueltas
+            etiquetas_completas, prob_completas = self.modelo_completo.puntuar(_filas(X, ambiguas))
+            etiquetas[ambiguas], prob_phishing[ambiguas] = etiquetas_completas, prob_completas
+            self.contadores.registrar('completa', n - n_resueltas, n - n_resueltas)
+        return etiquetas, prob_phishing
+
+    def predict(self, X):
+        return self.puntuar(X)[0]
+
+
+# ============================================
+# BENCHMARK CONTRA EL MODELO COMPLETO
+# ============================================
+
+class ModeloSklearn:
+    """Adapta un DecisionTreeClassifier a la interfaz puntuar(X) de la cascada"""
+
+    def __init__(self, modelo):
+        self.modelo = modelo
+
+    def puntuar(self, X):
+        import warnings
+
+        with warnings.catch_warnings():
+            # Las matrices no llevan nombres de columnas; el orden es el de CARACTERISTICAS
+            warnings.simplefilter('ignore', UserWarning)
+            proba = self.modelo.predict_proba(X)
+        return self.modelo.classes_[np.argmax(proba, axis=1)], proba[:, -1]
+
+
+def datos_realistas(n_filas, semilla=0):
+    """Matriz float32 con la distribución del generador (60% legítimos)"""
+    from generador_dataset import generar_fragmento
+
+    fragmento = generar_fragmento(semilla, n_filas)
+    return np.column_stack([fragmento[col] for col in CARACTERISTICAS]).astype(np.float32)
+
+
+def benchmark(arbol, tamanos, confianza=CONFIANZA, margenes=(0.0, 0.5), repeticiones=3,
+              modelo_sklearn=None):
+    """Filas/s de la cascada frente a puntuar siempre con el modelo completo
+
+    El modelo completo es el árbol compilado `arbol` y, si se pasa, también
+    el DecisionTreeClassifier del que proviene (el modelo "pesado"). En
+    todos los casos las etiquetas de la cascada deben ser idénticas a las del
+    modelo completo.
+    """
+    completos = {'compilado': arbol}
+    if modelo_sklearn is not None:
+        completos['sklearn'] = ModeloSklearn(modelo_sklearn)
+
+    filas = []
+    print(f"{'filas':>12s} {'completo':>10s} {'margen':>7s} {'completo (s)':>13s} {'cascada (s)':>12s} "
+          f"{'aceleración':>12s} {'resueltas raíz':>15s}")
+    for n in tamanos:
+        X = datos_realistas(n)
+        reps = repeticiones if n <= 1_000_000 else 1
+        for nombre, completo in completos.items():
+            t_completo, (etiquetas, prob) = _cronometrar(lambda: completo.puntuar(X), reps)
+            for margen in margenes:
+                cascada = CascadaRaiz(arbol, completo, confianza, margen)
+                t_cascada, (etiquetas_c, prob_c) = _cronometrar(lambda: cascada.puntuar(X), reps)
+                if not np.array_equal(etiquetas, etiquetas_c):
+                    raise AssertionError(f"Las etiquetas de la cascada difieren con {n} filas ({nombre})")
+                tasa = cascada.contadores.tasa('raiz')
+                filas.append({'filas': n, 'completo': nombre, 'margen': margen, 'completo_s': t_completo,
+                              'cascada_s': t_cascada, 'tasa_raiz': tasa,
+                              'prob_iguales': float(np.mean(prob == prob_c))})
+                print(f"{n:>12,d} {nombre:>10s} {margen:>7.2f} {t_completo:>13.4f} {t_cascada:>12.4f} "
+                      f"{t_completo / t_cascada:>11.1f}x {tasa * 100:>14.1f}%")
+    return filas
+
+
+def main(argv=None):
+    from artefacto_modelo import ARCHIVO_MODELO, cargar_modelo
+
+    parser = argparse.ArgumentParser(description='Puntuación en cascada por el corte raíz del árbol')
+    parser.add_argument('--modelo', default=ARCHIVO_MODELO, help='Artefacto del modelo (.phtree)')
+    parser.add_argument('--confianza', type=float, default=CONFIANZA)
+    parser.add_argument('--benchmark', action='store_true', help='Comparar contra el modelo completo')
+    parser.add_argument('--max-filas', type=float, default=1e7, help='Tamaño máximo del benchmark')
+    args = parser.parse_args(argv)
+
+    arbol = cargar_modelo(args.modelo)
+    cascada = CascadaRaiz(arbol, confianza=args.confianza)
+    print(f"🌳 Corte raíz: {cascada.nombre} <= {cascada.umbral:.4g}")
+    for texto, lado in zip(('<=', '> '), cascada.lados):
+        print(f"   {texto} umbral: " + (f"✅ decidido → clase {lado[0]} (prob. phishing {lado[1]:.4f})"
+                                       if lado else "➡️  pasa al modelo completo"))
+
+    if args.benchmark:
+        tamanos = [10 ** k for k in range(4, 8) if 10 ** k <= args.max_filas]
+        print(f"\n⏱️  Benchmark puntuar: modelo completo ('{args.modelo}') vs cascada\n")
+        benchmark(arbol, tamanos, args.confianza)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,509 @@
+"""
+Entrenamiento fuera de memoria del árbol de phishing con histogramas
+
+Todos los indicadores están en la rejilla 0.0-10.0 con un decimal
+(contiene_url es 0/1), así que cada característica tiene a lo sumo 101
+valores distintos. El entrenador:
+
+1. Binariza el dataset una vez: cada valor pasa a su décima como uint8
+   (0.3 → 3, ver cuantizacion.py) en una matriz filas × características en disco (.phbin), la
+   cuarta parte de lo que ocupa en float32.
+2. Construye el árbol por niveles. En cada nivel recorre la matriz por
+   bloques, lleva cada fila al nodo que le toca y acumula por nodo un
+   histograma de clases por (característica, décima). Los mejores cortes de
+   Gini salen de esos histogramas, sin ordenar ni tener el dataset en
+   memoria: una pasada por nivel y memoria proporcional al bloque.
+
+Los cortes son los de DecisionTreeClassifier(criterion='gini'): la misma
+mejora aproximada de Gini en float64, los mismos umbrales (punto medio
+entre los dos valores float32 vecinos presentes en el nodo) y las mismas
+reglas de parada (max_depth, min_samples_split, min_samples_leaf, nodo
+puro). El árbol se numera en preorden como el de scikit-learn. La única
+diferencia posible es en empates exactos entre características:
+scikit-learn los resuelve con el orden aleatorio de random_state y este
+entrenador con el orden de las columnas.
+
+Uso:
+    python entrenador_histogramas.py dataset_phishing.phcol --salida modelo_phishing.phtree
+    python entrenador_histogramas.py --benchmark --filas 1e5 1e6 1e7 1e8
+
+Requisitos: pip install numpy (scikit-learn sólo para el benchmark)
+"""
+
+import argparse
+import json
+import os
+import shutil
+import time
+
+import numpy as np
+
+from cuantizacion import N_DECIMAS, VALORES_DECIMAS, decimas
+from esquema_phishing import CARACTERISTICAS, OBJETIVO, PARAMETROS_MODELO
+from motor_inferencia import ArbolCompilado
+
+FILAS_POR_BLOQUE = 1 << 20
+EXTENSION_BINARIZADO = '.phbin'
+
+# Misma tolerancia que scikit-learn para considerar puro un nodo
+EPSILON = np.finfo(np.float64).eps
+
+
+# ============================================
+# BINARIZACIÓN
+# ============================================
+
+def _bloques_origen(origen, filas_por_bloque):
+    """(n_filas, iterador de diccionarios columna → arreglo) para .phcol, CSV o datos en memoria"""
+    columnas = CARACTERISTICAS + [OBJETIVO]
+    if isinstance(origen, str):
+        from formato_columnar import abrir_columnar, es_columnar
+
+        if es_columnar(origen):
+            dataset = abrir_columnar(origen)
+            return len(dataset), dataset.bloques(filas_por_bloque, columnas)
+        import pandas as pd
+
+        n_filas = sum(len(b) for b in pd.read_csv(origen, usecols=[OBJETIVO], chunksize=filas_por_bloque))
+        return n_filas, pd.read_csv(origen, usecols=columnas, chunksize=filas_por_bloque)
+
+    n_filas = len(origen[OBJETIVO])
+    return n_filas, ({col: origen[col][inicio:inicio + filas_por_bloque] for col in columnas}
+                     for inicio in range(0, n_filas, filas_por_bloque))
+
+
+class DatosBinarizados:
+    """Matriz uint8 de décimas (filas × características) y etiquetas codificadas
+
+    En disco es un directorio .phbin con decimas.npy, etiquetas.npy y
+    meta.json; se abre con memory-map.
+    """
+
+    def __init__(self, decimas, etiquetas, clases, conteos, ruta=None):
+        self.decimas = decimas
+        self.etiquetas = etiquetas
+        self.clases = np.asarray(clases)
+        self.conteos = np.asarray(conteos, dtype=np.int64)
+        self.ruta = ruta
+
+    def __len__(self):
+        return len(self.etiquetas)
+
+    @property
+    def n_clases(self):
+        return len(self.clases)
+
+    def bloques(self, filas_por_bloque=FILAS_POR_BLOQUE):
+        for inicio in range(0, len(self), filas_por_bloque):
+            fin = min(inicio + filas_por_bloque, len(self))
+            yield np.asarray(self.decimas[inicio:fin]), np.asarray(self.etiquetas[inicio:fin])
+
+
+def binarizar(origen, destino=None, filas_por_bloque=FILAS_POR_BLOQUE):
+    """Binariza un .phcol, un CSV, un DataFrame o un diccionario de columnas
+
+    Con `destino` la matriz se escribe en disco (.phbin) bloque a bloque y
+    nunca está completa en memoria; sin él se devuelve en memoria.
+    """
+    n_filas, bloques = _bloques_origen(origen, filas_por_bloque)
+    forma = (n_filas, len(CARACTERISTICAS))
+    if destino:
+        temporal = destino.rstrip(os.sep) + '.tmp'
+        shutil.rmtree(temporal, ignore_errors=True)
+        os.makedirs(temporal)
+        matriz = np.lib.format.open_memmap(os.path.join(temporal, 'decimas.npy'), mode='w+',
+                                           dtype=np.uint8, shape=forma)
+        etiquetas = np.lib.format.open_memmap(os.path.join(temporal, 'etiquetas.npy'), mode='w+',
+                                              dtype=np.uint8, shape=(n_filas,))
+    else:
+        matriz = np.empty(forma, dtype=np.uint8)
+        etiquetas = np.empty(n_filas, dtype=np.uint8)
+
+    conteos = np.zeros(256, dtype=np.int64)
+    inicio = 0
+    for bloque in bloques:
+        y = np.asarray(bloque[OBJETIVO])
+        fin = inicio + len(y)
+        for j, col in enumerate(CARACTERISTICAS):
+            matriz[inicio:fin, j] = decimas(bloque[col])
+        if len(y) and (y.min() < 0 or y.max() > 255 or np.any(y != np.rint(y))):
+            raise ValueError(f"'{OBJETIVO}' debe ser una etiqueta entera entre 0 y 255")
+        etiquetas[inicio:fin] = y
+        conteos += np.bincount(etiquetas[inicio:fin], minlength=256)
+        inicio = fin
+
+    # Como scikit-learn, las clases son las etiquetas presentes, codificadas 0..K-1
+    clases = np.flatnonzero(conteos)
+    if len(clases) and clases[-1] != len(clases) - 1:
+        codigo = np.zeros(256, dtype=np.uint8)
+        codigo[clases] = np.arange(len(clases), dtype=np.uint8)
+        for i in range(0, n_filas, filas_por_bloque):
+            etiquetas[i:i + filas_por_bloque] = codigo[etiquetas[i:i + filas_por_bloque]]
+
+    if not destino:
+        return DatosBinarizados(matriz, etiquetas, clases, conteos[clases])
+    matriz.flush()
+    etiquetas.flush()
+    del matriz, etiquetas
+    with open(os.path.join(temporal, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump({'n_filas': n_filas, 'caracteristicas': CARACTERISTICAS, 'clases': clases.tolist(),
+                   'conteos': conteos[clases].tolist()}, f, indent=2)
+    shutil.rmtree(destino, ignore_errors=True)
+    os.replace(temporal, destino)
+    return abrir_binarizado(destino)
+
+
+def abrir_binarizado(ruta):
+    with open(os.path.join(ruta, 'meta.json'), encoding='utf-8') as f:
+        meta = json.load(f)
+    if meta['caracteristicas'] != CARACTERISTICAS:
+        raise ValueError(f"'{ruta}' se binarizó con otras características")
+    return DatosBinarizados(np.load(os.path.join(ruta, 'decimas.npy'), mmap_mode='r'),
+                            np.load(os.path.join(ruta, 'etiquetas.npy'), mmap_mode='r'),
+                            meta['clases'], meta['conteos'], ruta)
+
+
+# ============================================
+# CRITERIO DE GINI (mismas operaciones que scikit-learn)
+# ============================================
+
+def _suma_cuadrados(conteos):
+    """Σ conteo_k² sumando clase por clase, en el orden de scikit-learn"""
+    suma = np.zeros(conteos.shape[:-1])
+    for k in range(conteos.shape[-1]):
+        suma += conteos[..., k] * conteos[..., k]
+    return suma
+
+
+def gini(conteos, n):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 1.0 - _suma_cuadrados(conteos) / (n * n)
+
+
+def mejor_corte(histograma, conteos_nodo, min_samples_leaf):
+    """Mejor corte de un nodo a partir de su histograma (características, décimas, clases)
+
+    Devuelve None si ningún corte respeta min_samples_leaf, o un diccionario
+    con característica, décima izquierda, umbral, conteos e impurezas de
+    los hijos.
+    """
+    histograma = histograma.astype(np.float64)
+    total = np.asarray(conteos_nodo, dtype=np.float64)
+    n = total.sum()
+    izquierda = np.cumsum(histograma, axis=1)
+    derecha = total - izquierda
+    n_izq = izquierda.sum(axis=2)
+    n_der = n - n_izq
+
+    # Un corte tras la décima b existe si b tiene filas y queda alguna a la derecha
+    presentes = histograma.sum(axis=2) > 0
+    validos = presentes & (n_der > 0) & (n_izq >= min_samples_leaf) & (n_der >= min_samples_leaf)
+    if not validos.any():
+        return None
+
+    imp_izq = gini(izquierda, n_izq)
+    imp_der = gini(derecha, n_der)
+    mejora = -n_der * imp_der - n_izq * imp_izq
+    mejora[~validos] = -np.inf
+
+    # Primera décima y primera característica con la mejor mejora (> estricto)
+    por_caracteristica = mejora.argmax(axis=1)
+    mejores = mejora[np.arange(len(mejora)), por_caracteristica]
+    caracteristica = int(mejores.argmax())
+    decima = int(por_caracteristica[caracteristica])
+    siguiente = decima + 1 + int(np.argmax(presentes[caracteristica, decima + 1:]))
+
+    umbral = float(VALORES_DECIMAS[decima]) / 2.0 + float(VALORES_DECIMAS[siguiente]) / 2.0
+    if umbral == float(VALORES_DECIMAS[siguiente]):
+        umbral = float(VALORES_DECIMAS[decima])
+    return {
+        'caracteristica': caracteristica,
+        'decima': decima,
+        'umbral': umbral,
+        'conteos_izq': izquierda[caracteristica, decima].astype(np.int64),
+        'conteos_der': derecha[caracteristica, decima].astype(np.int64),
+        'impureza_izq': float(imp_izq[caracteristica, decima]),
+        'impureza_der': float(imp_der[caracteristica, decima])
+    }
+
+
+def _mejora_impureza(n_raiz, n, impureza, n_izq, impureza_izq, n_der, impureza_der):
+    return (n / n_raiz) * (impureza - (n_der / n * impureza_der) - (n_izq / n * impureza_izq))
+
+
+# ============================================
+# ENTRENAMIENTO POR NIVELES
+# ============================================
+
+def _rutear(decimas_bloque, nodos, profundidad):
+    """Nodo del árbol parcial al que llega cada fila del bloque"""
+    n = len(decimas_bloque)
+    filas = np.arange(n)
+    actual = np.zeros(n, dtype=np.int64)
+    caracteristica = np.array([nodo.get('caracteristica', 0) for nodo in nodos], dtype=np.int64)
+    decima = np.array([nodo.get('decima', 255) for nodo in nodos], dtype=np.int64)
+    izquierdo = np.array([nodo.get('izquierdo', i) for i, nodo in enumerate(nodos)], dtype=np.int64)
+    derecho = np.array([nodo.get('derecho', i) for i, nodo in enumerate(nodos)], dtype=np.int64)
+    for _ in range(profundidad):
+        va_izquierda = decimas_bloque[filas, caracteristica[actual]] <= decima[actual]
+        actual = np.where(va_izquierda, izquierdo[actual], derecho[actual])
+    return actual
+
+
+def _histogramas(datos, nodos, activos, profundidad, filas_por_bloque):
+    """Histogramas (nodos activos, características, décimas, clases) en una pasada"""
+    n_car, k = len(CARACTERISTICAS), datos.n_clases
+    posicion = np.full(len(nodos), -1, dtype=np.int64)
+    posicion[activos] = np.arange(len(activos))
+    tamano = len(activos) * n_car * N_DECIMAS * k
+    tipo = np.int32 if tamano < 2**31 else np.int64
+    desplazamiento = (np.arange(n_car, dtype=tipo) * N_DECIMAS * k)[None, :]
+
+    acumulado = np.zeros(tamano, dtype=np.int64)
+    for decimas_bloque, y in datos.bloques(filas_por_bloque):
+        destino = posicion[_rutear(decimas_bloque, nodos, profundidad)]
+        llegan = destino >= 0
+        if not llegan.all():
+            decimas_bloque, y, destino = decimas_bloque[llegan], y[llegan], destino[llegan]
+        claves = ((destino.astype(tipo)[:, None] * (n_car * N_DECIMAS * k) + desplazamiento)
+                  + decimas_bloque.astype(tipo) * k + y.astype(tipo)[:, None])
+        acumulado += np.bincount(claves.ravel(), minlength=tamano)
+    return acumulado.reshape(len(activos), n_car, N_DECIMAS, k)
+
+
+def _es_hoja(nodo, max_depth, min_samples_split, min_samples_leaf):
+    return (nodo['profundidad'] >= max_depth or nodo['n'] < min_samples_split
+            or nodo['n'] < 2 * min_samples_leaf or nodo['impureza'] <= EPSILON)
+
+
+def entrenar_histogramas(origen, max_depth=None, min_samples_split=2, min_samples_leaf=1,
+                         criterion='gini', filas_por_bloque=FILAS_POR_BLOQUE, progreso=False,
+                         **_ignorados):
+    """Entrena el árbol y devuelve un ArbolCompilado (ver motor_inferencia.py)
+
+    `origen` puede ser DatosBinarizados, un .phbin, un .phcol, un CSV o datos
+    en memoria; los que no están binarizados se binarizan en memoria. Acepta
+    los hiperparámetros de PARAMETROS_MODELO (random_state no se usa).
+    """
+    if criterion != 'gini':
+        raise ValueError("El entrenador por histogramas sólo implementa criterion='gini'")
+    if isinstance(origen, DatosBinarizados):
+        datos = origen
+    elif isinstance(origen, str) and origen.rstrip('/\\').endswith(EXTENSION_BINARIZADO):
+        datos = abrir_binarizado(origen)
+    else:
+        datos = binarizar(origen, filas_por_bloque=filas_por_bloque)
+    max_depth = np.iinfo(np.int64).max if max_depth is None else max_depth
+    min_samples_leaf = max(1, min_samples_leaf)
+    min_samples_split = max(min_samples_split, 2)
+
+    n_raiz = float(len(datos))
+    raiz = {'profundidad': 0, 'n': len(datos), 'conteos': datos.conteos,
+            'impureza': float(gini(datos.conteos.astype(np.float64), n_raiz))}
+    nodos = [raiz]
+    activos = [] if _es_hoja(raiz, max_depth, min_samples_split, min_samples_leaf) else [0]
+    pasadas = 0
+    inicio = time.perf_counter()
+    while activos:
+        profundidad = nodos[activos[0]]['profundidad']
+        histogramas = _histogramas(datos, nodos, activos, profundidad, filas_por_bloque)
+        pasadas += 1
+        siguientes = []
+        for indice, histograma in zip(activos, histogramas):
+            nodo = nodos[indice]
+            corte = mejor_corte(histograma, nodo['conteos'], min_samples_leaf)
+            if corte is None:
+                continue
+            n_izq, n_der = int(corte['conteos_izq'].sum()), int(corte['conteos_der'].sum())
+            mejora = _mejora_impureza(n_raiz, float(nodo['n']), nodo['impureza'], float(n_izq),
+                                      corte['impureza_izq'], float(n_der), corte['impureza_der'])
+            if mejora + EPSILON < 0:
+                continue
+            nodo.update(caracteristica=corte['caracteristica'], decima=corte['decima'],
+                        umbral=corte['umbral'], izquierdo=len(nodos), derecho=len(nodos) + 1)
+            for conteos, n_hijo, impureza in ((corte['conteos_izq'], n_izq, corte['impureza_izq']),
+                                              (corte['conteos_der'], n_der, corte['impureza_der'])):
+                hijo = {'profundidad': nodo['profundidad'] + 1, 'n': n_hijo, 'conteos': conteos,
+                        'impureza': impureza}
+                if not _es_hoja(hijo, max_depth, min_samples_split, min_samples_leaf):
+                    siguientes.append(len(nodos))
+                nodos.append(hijo)
+        if progreso:
+            print(f"  🌿 nivel {profundidad}: {len(activos)} nodo(s) evaluados, "
+                  f"{len(nodos)} nodos en total ({time.perf_counter() - inicio:.1f} s)")
+        activos = siguientes
+
+    return _compilar(nodos, datos.clases, {'entrenador': 'histogramas', 'pasadas': pasadas,
+                                           'n_entrenamiento': len(datos)})
+
+
+def _compilar(nodos, clases, metadatos):
+    """ArbolCompilado con los nodos renumerados en preorden, como scikit-learn"""
+    orden, pila = [], [0]
+    while pila:
+        indice = pila.pop()
+        orden.append(indice)
+        if 'izquierdo' in nodos[indice]:
+            pila += [nodos[indice]['derecho'], nodos[indice]['izquierdo']]
+    nuevo = {viejo: i for i, viejo in enumerate(orden)}
+
+    n = len(orden)
+    caracteristica = np.zeros(n, dtype=np.intp)
+    umbral = np.full(n, np.inf)
+    izquierdo = np.arange(n, dtype=np.intp)
+    derecho = np.arange(n, dtype=np.intp)
+    probabilidades = np.zeros((n, len(clases)))
+    muestras = np.zeros(n, dtype=np.int64)
+    impureza = np.zeros(n)
+    for i, viejo in enumerate(orden):
+        nodo = nodos[viejo]
+        if 'izquierdo' in nodo:
+            caracteristica[i] = nodo['caracteristica']
+            umbral[i] = nodo['umbral']
+            izquierdo[i] = nuevo[nodo['izquierdo']]
+            derecho[i] = nuevo[nodo['derecho']]
+        # Como tree_.value y compilar_arbol: fracciones por nodo, normalizadas de nuevo
+        fracciones = np.asarray(nodo['conteos'], dtype=np.float64) / nodo['n']
+        probabilidades[i] = fracciones / fracciones.sum()
+        muestras[i] = nodo['n']
+        impureza[i] = nodo['impureza']
+    return ArbolCompilado(caracteristica, umbral, izquierdo, derecho, probabilidades, clases,
+                          CARACTERISTICAS, muestras=muestras, impureza=impureza, metadatos=metadatos)
+
+
+def comparar_arboles(a, b):
+    """Compara dos ArbolCompilado nodo por nodo
+
+    Devuelve ('identicos' | 'equivalentes' | 'distintos', diferencias).
+    Equivalentes: sólo cambian característica/umbral en cortes empatados, con
+    los mismos nodos, conteos, impurezas y probabilidades en todo el árbol.
+    """
+    if a.n_nodos != b.n_nodos:
+        return 'distintos', [f"nodos: {a.n_nodos} vs {b.n_nodos}"]
+    diferencias, estructurales = [], False
+    for nombre in ('caracteristica', 'umbral', 'izquierdo', 'derecho', 'probabilidades', 'muestras', 'impureza'):
+        x, y = getattr(a, nombre), getattr(b, nombre)
+        if x is not None and y is not None and not np.array_equal(x, y):
+            nodos = np.flatnonzero(np.any((x != y).reshape(len(x), -1), axis=1))
+            diferencias.append(f"{nombre}: {len(nodos)} nodo(s) distintos (primero {nodos[0]})")
+            estructurales |= nombre not in ('caracteristica', 'umbral')
+    if not diferencias:
+        return 'identicos', diferencias
+    return ('distintos' if estructurales else 'equivalentes'), diferencias
+
+
+# ============================================
+# BENCHMARK CONTRA SCIKIT-LEARN
+# ============================================
+
+def benchmark(tamanos, directorio='.', max_sklearn=10_000_000, parametros=None, procesos=None,
+              conservar=False):
+    """Entrenamiento por histogramas vs DecisionTreeClassifier sobre el dataset sintético
+
+    Para cada tamaño genera el .phcol con generador_dataset.py (fuera del
+    tiempo medido), mide binarización + entrenamiento por histogramas y,
+    hasta `max_sklearn` filas, carga + fit de scikit-learn, y compara ambos
+    árboles nodo por nodo.
+    """
+    from generador_dataset import generar_columnar
+
+    parametros = dict(parametros or PARAMETROS_MODELO)
+    resultados = []
+    for n in tamanos:
+        ruta = os.path.join(directorio, f"_benchmark_histogramas_{n}.phcol")
+        ruta_bin = ruta.replace('.phcol', EXTENSION_BINARIZADO)
+        if not os.path.exists(ruta):
+            print(f"📦 Generando {n:,d} filas en '{ruta}'...")
+            generar_columnar(ruta, n, procesos, progreso=False)
+
+        inicio = time.perf_counter()
+        datos = binarizar(ruta, ruta_bin)
+        t_binarizar = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        arbol = entrenar_histogramas(datos, **parametros)
+        t_entrenar = time.perf_counter() - inicio
+        resultado = {'filas': n, 'binarizar_s': t_binarizar, 'entrenar_s': t_entrenar,
+                     'histogramas_s': t_binarizar + t_entrenar, 'nodos': arbol.n_nodos,
+                     'pasadas': arbol.metadatos['pasadas'], 'sklearn_s': None, 'iguales': None,
+                     'diferencias': []}
+
+        if n <= max_sklearn:
+            from sklearn.tree import DecisionTreeClassifier
+
+            from formato_columnar import abrir_columnar
+            from motor_inferencia import compilar_arbol
+
+            inicio = time.perf_counter()
+            dataset = abrir_columnar(ruta)
+            X = dataset.matriz(CARACTERISTICAS).astype(np.float32)
+            y = np.asarray(dataset[OBJETIVO])
+            modelo = DecisionTreeClassifier(**parametros).fit(X, y)
+            resultado['sklearn_s'] = time.perf_counter() - inicio
+            del X, y
+            resultado['iguales'], resultado['diferencias'] = comparar_arboles(
+                compilar_arbol(modelo, CARACTERISTICAS), arbol)
+
+        resultados.append(resultado)
+        _mostrar_resultado(resultado)
+        if not conservar:
+            shutil.rmtree(ruta, ignore_errors=True)
+            shutil.rmtree(ruta_bin, ignore_errors=True)
+    return resultados
+
+
+def _mostrar_resultado(r):
+    texto = (f"⏱️  {r['filas']:>12,d} filas  histogramas {r['histogramas_s']:8.2f} s "
+             f"(binarizar {r['binarizar_s']:.2f} s + {r['pasadas']} pasadas {r['entrenar_s']:.2f} s)")
+    if r['sklearn_s'] is None:
+        texto += "  sklearn —"
+    else:
+        texto += (f"  sklearn {r['sklearn_s']:8.2f} s  ({r['sklearn_s'] / r['histogramas_s']:.1f}x)  "
+                  + ("✅ árbol idéntico" if r['iguales'] == 'identicos' else
+                     "✅ equivalente (cortes empatados en otra característica)" if r['iguales'] == 'equivalentes' else
+                     "❌ " + '; '.join(r['diferencias'])))
+    print(texto)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Árbol de phishing entrenado por histogramas, fuera de memoria')
+    parser.add_argument('origen', nargs='?', help='Dataset .phcol, CSV o .phbin ya binarizado')
+    parser.add_argument('--salida', default=None, help='Artefacto .phtree del árbol entrenado')
+    parser.add_argument('--binarizado', default=None,
+                        help='Guardar la matriz de décimas en este .phbin (por defecto, en memoria)')
+    parser.add_argument('--filas-por-bloque', type=int, default=FILAS_POR_BLOQUE)
+    parser.add_argument('--benchmark', action='store_true', help='Comparar contra scikit-learn')
+    parser.add_argument('--filas', type=float, nargs='+', default=[1e5, 1e6, 1e7],
+                        help='Tamaños del benchmark (acepta 1e8)')
+    parser.add_argument('--max-sklearn', type=float, default=1e7,
+                        help='Tamaño máximo en el que se entrena también scikit-learn (necesita X en memoria)')
+    parser.add_argument('--directorio', default='.', help='Dónde generar los datasets del benchmark')
+    parser.add_argument('--conservar', action='store_true', help='No borrar los datasets del benchmark')
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        print("⏱️  Entrenamiento por histogramas vs DecisionTreeClassifier "
+              f"({', '.join(f'{k}={v}' for k, v in PARAMETROS_MODELO.items())})\n")
+        benchmark([int(n) for n in args.filas], args.directorio, int(args.max_sklearn),
+                  conservar=args.conservar)
+        return
+    if not args.origen:
+        parser.error('indica el dataset o --benchmark')
+
+    inicio = time.perf_counter()
+    datos = args.origen
+    if args.binarizado:
+        print(f"🔢 Binarizando '{args.origen}' en '{args.binarizado}'...")
+        datos = binarizar(args.origen, args.binarizado, args.filas_por_bloque)
+    arbol = entrenar_histogramas(datos, filas_por_bloque=args.filas_por_bloque, progreso=True,
+                                 **PARAMETROS_MODELO)
+    print(f"🌳 {arbol.n_nodos} nodos, profundidad {arbol.profundidad}, "
+          f"{arbol.metadatos['pasadas']} pasadas ({time.perf_counter() - inicio:.2f} s)")
+    if args.salida:
+        from artefacto_modelo import guardar_artefacto
+
+        guardar_artefacto(arbol, args.salida, arbol.metadatos)
+        print(f"💾 Artefacto guardado en '{args.salida}'")
+
+
+if __name__ == "__main__":
+    main()
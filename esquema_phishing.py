@@ -0,0 +1,42 @@
+"""
+Esquema compartido del dataset de phishing de la Actividad 9
+
+Nombres de columnas, clases y parámetros por defecto del modelo, tal como
+aparecen en el notebook arbol_decision_phishing.ipynb.
+"""
+
+# Indicadores de phishing (variables independientes) en el orden del notebook
+CARACTERISTICAS = [
+    'remitente_sospechoso',
+    'contiene_url',
+    'dominio_sospechoso',
+    'tono_urgencia',
+    'solicita_info',
+    'errores_gramaticales',
+    'oferta_irreal'
+]
+
+# Variable dependiente
+OBJETIVO = 'es_phishing'
+
+COLUMNAS = CARACTERISTICAS + [OBJETIVO]
+
+# Columnas binarias (0/1); el resto son puntuaciones 0-10 con un decimal
+COLUMNAS_BINARIAS = ['contiene_url', OBJETIVO]
+
+NOMBRES_CLASES = ['🟢 Legítimo', '🔴 Phishing']
+
+# Configuración del dataset sintético
+N_REGISTROS = 1200
+PROPORCION_LEGITIMOS = 0.6
+SEMILLA = 42
+TEST_SIZE = 0.2
+
+# Hiperparámetros del DecisionTreeClassifier usados en el notebook
+PARAMETROS_MODELO = {
+    'max_depth': 5,
+    'min_samples_split': 40,
+    'min_samples_leaf': 15,
+    'criterion': 'gini',
+    'random_state': 42
+}
@@ -0,0 +1,682 @@
+"""
+Extractor de los siete indicadores de phishing a partir del texto crudo
+
+Convierte un correo o SMS en las puntuaciones 0-10 que usa el modelo
+(remitente_sospechoso, contiene_url, dominio_sospechoso, tono_urgencia,
+solicita_info, errores_gramaticales, oferta_irreal), en la misma rejilla de
+un decimal que el dataset (contiene_url es 0/1), así que la salida se puede
+puntuar directamente con el árbol o cuantizar con cuantizacion.decimas.
+
+Cada mensaje se recorre con pocas expresiones regulares precompiladas:
+
+- Una sola alternación para todas las palabras clave (urgencia, amenazas,
+  datos sensibles, premios, saludos genéricos...), sobre el texto en
+  minúsculas y sin acentos; cada coincidencia suma el peso de su grupo al
+  indicador correspondiente. Las alternativas se agrupan por su primera
+  letra, así el motor de re descarta casi todas con una comparación.
+- Otra alternación para las faltas de ortografía, sobre el texto en
+  minúsculas con acentos (palabras sin tilde, "a sido", letras repetidas).
+- El análisis de URLs y dominios: TLD sospechosos, IPs, acortadores,
+  punycode, imitación de marcas (incluida la sustitución de letras por
+  dígitos), guiones y subdominios. Con un índice de reputación
+  (reputacion_dominios.py) los dominios permitidos, maliciosos y TLD de
+  riesgo salen de él en vez de las listas incorporadas.
+- Los encabezados De:/From: y Responder a:/Reply-To: si el mensaje los trae.
+
+Los puntos de cada indicador se saturan a 0-10 con 10·(1 − e^(−puntos/escala)).
+Los lotes se reparten en un pool de procesos en tareas de varios mensajes.
+
+Nota: el árbol del notebook decide casi todo por oferta_irreal, así que un
+phishing sin oferta (el primer ejemplo del notebook) cae en una hoja
+legítima aunque el resto de indicadores sean altos.
+
+Uso:
+    from extractor_caracteristicas import extraer, extraer_en_paralelo
+    extraer("¡¡URGENTE!! Tu cuenta sera suspendida ...")   # dict de indicadores
+    X = extraer_en_paralelo(mensajes, procesos=8)            # float32 (n, 7)
+
+    python extractor_caracteristicas.py                       # ejemplos del notebook
+    python extractor_caracteristicas.py mensajes.jsonl --salida indicadores.csv --clasificar
+    python extractor_caracteristicas.py mensajes.jsonl --reputacion reputacion_dominios.phrep
+    python extractor_caracteristicas.py --benchmark --mensajes 1e5
+
+Requisitos: pip install numpy
+"""
+
+import argparse
+import ipaddress
+import math
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from email.utils import parseaddr
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from esquema_phishing import CARACTERISTICAS, SEMILLA
+from reputacion_dominios import ARCHIVO_REPUTACION, MALICIOSO, PERMITIDO, TLD_RIESGOSO
+
+MENSAJES_POR_TAREA = 2000
+
+# ============================================
+# PALABRAS CLAVE
+# ============================================
+
+# grupo → (indicador, peso por coincidencia, patrones sobre texto sin acentos)
+PALABRAS_CLAVE = {
+    'urgencia': ('tono_urgencia', 2.0, [
+        r'urgente\w*', r'inmediat\w+', r'de inmediato', r'ahora mismo', r'cuanto antes',
+        r'lo antes posible', r'a la brevedad', r'\d+ horas', r'hoy mismo', r'ultimo aviso',
+        r'ultima oportunidad', r'expira\w*', r'vence\b', r'vencera', r'caduca\w*',
+        r'accion requerida', r'no ignore', r'tiempo limitado']),
+    'amenaza': ('tono_urgencia', 2.0, [
+        r'suspendid\w*', r'suspension', r'bloquead\w*', r'bloqueo', r'cancelad\w*',
+        r'desactivad\w*', r'restringid\w*', r'comprometid\w*', r'actividad (?:sospechosa|inusual)',
+        r'acceso no autorizado', r'cargo no reconocido', r'accion legal', r'multa', r'embargo']),
+    'dato_sensible': ('solicita_info', 3.0, [
+        r'contrasena\w*', r'password', r'clave', r'nip', r'pin', r'cvv', r'cvc',
+        r'codigo de (?:seguridad|verificacion|acceso)', r'numero de tarjeta', r'datos bancarios',
+        r'credenciales', r'fecha de (?:vencimiento|expiracion)', r'curp', r'token',
+        r'seguro social']),
+    'verificacion': ('solicita_info', 1.5, [
+        r'(?:verifi|confirm|actualic|valid)\w* (?:su|tu|sus|tus) (?:cuenta|identidad|informacion|datos)',
+        r'ingrese', r'introduzca', r'proporcion\w+ (?:su|tu|sus|tus)', r'envie (?:sus|tus|su|tu)',
+        r'inicie sesion', r'usuario']),
+    'premio': ('oferta_irreal', 2.5, [
+        r'felicidades', r'felicitaciones', r'ganad(?:or|ora|o)', r'has ganado', r'premio\w*',
+        r'sorteo', r'loteria', r'herencia', r'gratis', r'regalo\w*', r'reclam\w+ (?:su|tu)',
+        r'seleccionad\w*', r'afortunad\w*', r'iphone', r'oferta exclusiva', r'millones',
+        r'dinero facil', r'inversion garantizada', r'sin costo', r'bono']),
+    'dinero': ('oferta_irreal', 1.5, [
+        r'\$ ?\d{1,3}(?:[,.]\d{3})+', r'\d+ (?:mil|millones) de (?:pesos|dolares)', r'\d+ ?usd']),
+    'saludo_generico': ('remitente_sospechoso', 3.0, [
+        r'(?:estimad|querid|apreciabl|distinguid)[oae]s? (?:cli+ente|usuari[oa]|titular|miembro|amig[oa])',
+        r'dear (?:customer|user)']),
+    'firma_generica': ('remitente_sospechoso', 2.0, [
+        r'departamento de (?:seguridad|fraudes|soporte)', r'equipo de (?:seguridad|soporte|atencion)',
+        r'centro de (?:seguridad|verificacion)', r'servicio al cliente']),
+}
+
+# Faltas de ortografía, sobre el texto en minúsculas con acentos
+FALTAS = {
+    'sin_tilde': 1.5,
+    'ortografia': 2.5,
+    'letras_repetidas': 2.0,
+}
+_PATRONES_FALTAS = {
+    'sin_tilde': [r'sera', r'aqui', r'numero', r'tambien', r'despues', r'rapido', r'facil',
+                  r'credito', r'debito', r'electronico', r'telefono', r'codigo', r'pagina',
+                  r'contrasena'],
+    'ortografia': [r'a sido', r'halla sido', r'haiga', r'porfavor', r'nesesit\w*', r'reciv\w+',
+                   r'urjente\w*', r'clik', r'inportante', r'imform\w+'],
+}
+# Faltas dentro de la palabra; buscarlas sin anclar al inicio evita recorrer cada
+# palabra con \w*. Los finales "cion"/"sion" siempre llevan tilde en español.
+_FALTAS_INTERNAS = re.compile(r'(?P<sin_tilde>[cs]ion\b)|(?P<letras_repetidas>ii|uu|(?P<letra>[a-zñ])(?P=letra){2})')
+
+# Signos repetidos y palabras en mayúsculas, sobre el texto original
+PESO_SIGNOS = 1.0
+PESO_MAYUSCULAS = 1.0
+MAX_MAYUSCULAS = 3
+
+# Escala de saturación de cada indicador (puntos que dan ≈ 6.3)
+ESCALAS = {
+    'remitente_sospechoso': 4.0,
+    'dominio_sospechoso': 4.0,
+    'tono_urgencia': 5.0,
+    'solicita_info': 5.0,
+    'errores_gramaticales': 5.0,
+    'oferta_irreal': 4.0,
+}
+
+# Palabras a partir de las cuales las faltas se cuentan por densidad
+PALABRAS_DENSIDAD = 80
+
+
+def _alternacion(grupos, banderas=0):
+    """Una sola regex para todos los patrones y la tabla número de grupo → grupo
+
+    Cada patrón termina en un grupo vacío propio; como es el último en
+    cerrarse, match.lastindex identifica el patrón que coincidió. Los
+    patrones que empiezan por letra o dígito se agrupan por ese carácter.
+    """
+    por_inicial, otros, grupo_de = {}, [], {}
+    for grupo, patrones in grupos.items():
+        for patron in patrones:
+            marca = f'_{len(grupo_de)}'
+            grupo_de[marca] = grupo
+            if patron[0].isalnum():
+                por_inicial.setdefault(patron[0], []).append(f'{patron[1:]}(?P<{marca}>)')
+            else:
+                otros.append(f'{patron}(?P<{marca}>)')
+    # Más largos primero para que una frase gane a su prefijo
+    ramas = [inicial + '(?:' + '|'.join(sorted(restos, key=len, reverse=True)) + ')'
+             for inicial, restos in sorted(por_inicial.items())]
+    regex = re.compile(r'\b(?:' + '|'.join(ramas + otros) + r')\b', banderas)
+    tabla = [None] * (regex.groups + 1)
+    for marca, numero in regex.groupindex.items():
+        if marca in grupo_de:
+            tabla[numero] = grupo_de[marca]
+    return regex, tabla
+
+
+# El texto ya no tiene acentos, así que \w puede ser sólo ASCII (más rápido)
+_PALABRAS, _GRUPO_PALABRA = _alternacion(
+    {grupo: patrones for grupo, (_, _, patrones) in PALABRAS_CLAVE.items()}, re.ASCII)
+_FALTAS, _GRUPO_FALTA = _alternacion(_PATRONES_FALTAS)
+_ENFASIS = re.compile(r'(?P<signos>[!¡?¿]{2,})|(?P<mayusculas>\b[A-ZÁÉÍÓÚÑ]{5,}\b)')
+
+_ACENTOS = list(zip('áéíóúüñ', 'aeiouun'))
+
+
+def _sin_acentos(texto):
+    # Varios replace son bastante más rápidos que str.translate
+    for con, sin in _ACENTOS:
+        if con in texto:
+            texto = texto.replace(con, sin)
+    return texto
+
+# ============================================
+# URLS Y DOMINIOS
+# ============================================
+
+TLD_SOSPECHOSOS = {'tk', 'ml', 'ga', 'cf', 'gq', 'xyz', 'top', 'click', 'link', 'work', 'buzz',
+                   'rest', 'fit', 'loan', 'win', 'bid', 'country', 'zip', 'mov', 'review', 'cam', 'icu'}
+
+# TLD con los que se reconoce un dominio escrito sin http:// ni www.
+_TLD_SIN_ESQUEMA = sorted(TLD_SOSPECHOSOS | {'com', 'net', 'org', 'mx', 'es', 'info', 'biz', 'ly', 'co',
+                                             'io', 'me', 'online', 'site', 'live', 'app', 'gl'},
+                          key=len, reverse=True)
+
+ACORTADORES = {'bit.ly', 'tinyurl.com', 'goo.gl', 't.co', 'ow.ly', 'is.gd', 'cutt.ly', 'rebrand.ly',
+               'shorturl.at', 't.ly'}
+
+MARCAS = ['bbva', 'santander', 'banamex', 'banorte', 'hsbc', 'azteca', 'paypal', 'amazon',
+          'mercadolibre', 'apple', 'icloud', 'microsoft', 'outlook', 'google', 'netflix', 'sat',
+          'imss', 'dhl', 'fedex', 'correos', 'facebook', 'instagram', 'whatsapp', 'banco']
+
+# Dominios registrados legítimos de esas marcas
+DOMINIOS_OFICIALES = {
+    'bbva.mx', 'bbva.com', 'santander.com.mx', 'banamex.com', 'citibanamex.com', 'banorte.com',
+    'hsbc.com.mx', 'bancoazteca.com.mx', 'paypal.com', 'amazon.com', 'amazon.com.mx',
+    'mercadolibre.com.mx', 'apple.com', 'icloud.com', 'microsoft.com', 'outlook.com', 'google.com',
+    'gmail.com', 'netflix.com', 'sat.gob.mx', 'imss.gob.mx', 'gob.mx', 'dhl.com', 'fedex.com',
+    'correosdemexico.gob.mx', 'facebook.com', 'instagram.com', 'whatsapp.com',
+    'bancoreal.com.mx',  # banco ficticio de los ejemplos del notebook
+}
+
+# Palabras gancho en el nombre de host
+GANCHOS = ['seguridad', 'segura', 'secure', 'verifica', 'login', 'cuenta', 'account', 'banca',
+           'soporte', 'support', 'actualiza', 'update', 'confirm', 'acceso', 'cliente']
+MAX_GANCHOS = 2
+
+CORREOS_GRATUITOS = {'gmail.com', 'hotmail.com', 'outlook.com', 'live.com', 'yahoo.com', 'yahoo.com.mx',
+                     'icloud.com', 'aol.com', 'protonmail.com'}
+
+# Puntos de un dominio en la lista de maliciosos del índice de reputación
+PUNTOS_MALICIOSO = 8.0
+
+# Índice de reputación activo en este proceso (ver usar_reputacion)
+_REPUTACION = None
+
+# Segundo nivel habitual bajo un TLD de país (com.mx, gob.mx, co.uk...)
+_SEGUNDO_NIVEL = {'com', 'gob', 'org', 'net', 'edu', 'co'}
+
+_URL = re.compile(
+    r"""(?<![\w@.-])(?:(?:https?://|www\.)[^\s<>"'()\[\]]+"""
+    r"""|(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)+(?:""" + '|'.join(_TLD_SIN_ESQUEMA) +
+    r""")(?![\w@-])(?:/[^\s<>"'()\[\]]*)?)""",
+    re.IGNORECASE)
+_DIGITOS_LETRAS = str.maketrans('013457', 'oleast')
+# Las marcas cortas sólo cuentan como etiqueta completa (sat, dhl...), las largas en cualquier parte
+_MARCA = re.compile(r'(?:^|(?<=[.-]))(?:' + '|'.join(m for m in MARCAS if len(m) < 5) + r')(?=[.-]|$)|'
+                    + '|'.join(m for m in MARCAS if len(m) >= 5))
+_GANCHO = re.compile('|'.join(GANCHOS))
+
+_ENCABEZADO = re.compile(r'(de|from|remitente|para|to|asunto|subject|responder a|reply-to)\s*:\s*(.*)',
+                         re.IGNORECASE)
+
+
+def dominio_registrado(host):
+    """Último nivel registrable del host: www.bancoreal.com.mx → bancoreal.com.mx"""
+    etiquetas = host.lower().rstrip('.').split('.')
+    n = 3 if len(etiquetas) >= 3 and len(etiquetas[-1]) == 2 and etiquetas[-2] in _SEGUNDO_NIVEL else 2
+    return '.'.join(etiquetas[-n:])
+
+
+def _es_ip(host):
+    if not (host[-1].isdigit() or ':' in host):
+        return False
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+
+def usar_reputacion(indice):
+    """Activa en este proceso un índice de reputación (ruta o IndiceReputacion); None lo desactiva"""
+    global _REPUTACION
+    if isinstance(indice, str):
+        from reputacion_dominios import IndiceReputacion
+
+        indice = IndiceReputacion(indice)
+    _REPUTACION = indice
+
+
+def puntos_dominio(url):
+    """Puntos de sospecha de una URL o dominio (0 si es un dominio permitido)"""
+    try:
+        partes = urlsplit(url if '://' in url else 'http://' + url)
+        host = (partes.hostname or '').rstrip('.')
+        puerto = partes.port
+    except ValueError:
+        return 6.0
+    if not host:
+        return 0.0
+    if _es_ip(host):
+        return 6.0
+
+    registrado = dominio_registrado(host)
+    puntos = 3.0 if partes.username else 0.0  # http://banco.com@otro.tk
+    if _REPUTACION is not None:
+        categoria = _REPUTACION.categoria(host)
+        permitido, tld_riesgoso = categoria == PERMITIDO, categoria == TLD_RIESGOSO
+        if categoria == MALICIOSO:
+            puntos += PUNTOS_MALICIOSO
+    else:
+        permitido = registrado in DOMINIOS_OFICIALES
+        tld_riesgoso = host.rsplit('.', 1)[-1] in TLD_SOSPECHOSOS
+    if permitido and not puntos:
+        return 0.0
+    if registrado in ACORTADORES:
+        puntos += 3.0
+    if tld_riesgoso:
+        puntos += 4.0
+    if 'xn--' in host:
+        puntos += 4.0
+
+    # La marca aparece pero el dominio no es el oficial
+    marcas = set(_MARCA.findall(host))
+    puntos += 4.0 * len(marcas)
+    legible = host.translate(_DIGITOS_LETRAS)
+    if legible != host:
+        puntos += 5.0 * len(set(_MARCA.findall(legible)) - marcas)  # paypa1, amaz0n...
+    puntos += 1.5 * min(MAX_GANCHOS, len(set(_GANCHO.findall(host))))
+    puntos += min(3, host.count('-'))
+    if len(host.split('.')) - len(registrado.split('.')) > 2:
+        puntos += 1.0
+    if len(host) > 30:
+        puntos += 1.0
+    if puerto not in (None, 80, 443):
+        puntos += 1.0
+    if partes.scheme == 'http' and '://' in url:
+        puntos += 0.5
+    return puntos
+
+
+def urls(texto):
+    """URLs y dominios que aparecen en el texto"""
+    return _separar_urls(texto)[0]
+
+
+def _separar_urls(texto):
+    """(URLs, texto sin ellas) en una sola pasada"""
+    enlaces, trozos, fin = [], [], 0
+    for m in _URL.finditer(texto):
+        enlaces.append(m.group().rstrip('.,;:!?'))
+        trozos.append(texto[fin:m.start()])
+        fin = m.end()
+    if not enlaces:
+        return enlaces, texto
+    trozos.append(texto[fin:])
+    return enlaces, ' '.join(trozos)
+
+
+# ============================================
+# EXTRACCIÓN
+# ============================================
+
+def _puntaje(puntos, escala):
+    """Satura los puntos a la rejilla 0.0-10.0 con un decimal"""
+    return round(10 * (1 - math.exp(-puntos / escala)), 1)
+
+
+def _encabezados(texto):
+    """Encabezados De/Responder a/... de las primeras líneas del mensaje"""
+    encabezados = {}
+    for linea in texto.lstrip().split('\n', 8)[:8]:
+        m = _ENCABEZADO.match(linea.strip())
+        if not m:
+            break
+        encabezados[m.group(1).lower()] = m.group(2).strip()
+    return encabezados
+
+
+def puntos_remitente(remitente, responder_a=None, dominios_enlaces=()):
+    """Puntos de sospecha de la dirección (o número) del remitente"""
+    nombre, direccion = parseaddr(remitente)
+    if '@' not in direccion:
+        # SMS: los bancos envían desde códigos cortos, no desde números de 10 dígitos
+        return 2.0 if len(re.sub(r'\D', '', remitente)) >= 10 else 0.0
+
+    local, dominio = direccion.lower().rsplit('@', 1)
+    registrado = dominio_registrado(dominio)
+    descriptivo = _sin_acentos((nombre + ' ' + local).lower())
+    suplanta = any(marca in descriptivo for marca in MARCAS) or any(g in descriptivo for g in GANCHOS)
+
+    puntos = 0.0
+    if registrado in CORREOS_GRATUITOS:
+        puntos += 5.0 if suplanta else 1.0
+    else:
+        puntos += puntos_dominio(dominio)
+    if sum(c.isdigit() for c in local) >= 3:
+        puntos += 1.0
+    if responder_a:
+        otra = parseaddr(responder_a)[1].lower()
+        if '@' in otra and dominio_registrado(otra.rsplit('@', 1)[1]) != registrado:
+            puntos += 3.0
+    if dominios_enlaces and registrado not in CORREOS_GRATUITOS and \
+            any(enlace != registrado for enlace in dominios_enlaces):
+        puntos += 1.0
+    return puntos
+
+
+def vector(mensaje):
+    """Tupla con los siete indicadores en el orden de CARACTERISTICAS"""
+    encabezados = _encabezados(mensaje)
+    # Sin URLs para que sus palabras ("seguridad-bancaria", "www") no cuenten como texto
+    enlaces, texto = _separar_urls(mensaje)
+    minusculas = texto.lower()
+
+    puntos = dict.fromkeys(ESCALAS, 0.0)
+    for m in _PALABRAS.finditer(_sin_acentos(minusculas)):
+        indicador, peso, _ = PALABRAS_CLAVE[_GRUPO_PALABRA[m.lastindex]]
+        puntos[indicador] += peso
+
+    faltas = 0.0
+    for m in _FALTAS.finditer(minusculas):
+        faltas += FALTAS[_GRUPO_FALTA[m.lastindex]]
+    for m in _FALTAS_INTERNAS.finditer(minusculas):
+        faltas += FALTAS[m.lastgroup]
+    mayusculas = 0
+    for m in _ENFASIS.finditer(texto):
+        if m.lastgroup == 'signos':
+            faltas += PESO_SIGNOS
+            puntos['tono_urgencia'] += PESO_SIGNOS
+        else:
+            mayusculas += 1
+    puntos['tono_urgencia'] += PESO_MAYUSCULAS * min(MAX_MAYUSCULAS, mayusculas)
+    n_palabras = len(minusculas.split())
+    puntos['errores_gramaticales'] = faltas / max(1.0, n_palabras / PALABRAS_DENSIDAD)
+
+    puntos['dominio_sospechoso'] = max(map(puntos_dominio, enlaces), default=0.0)
+    remitente = encabezados.get('de') or encabezados.get('from') or encabezados.get('remitente')
+    if remitente:
+        dominios_enlaces = {dominio_registrado(urlsplit(e if '://' in e else 'http://' + e).hostname or '')
+                            for e in enlaces}
+        puntos['remitente_sospechoso'] += puntos_remitente(
+            remitente, encabezados.get('responder a') or encabezados.get('reply-to'), dominios_enlaces)
+
+    return tuple(1.0 if nombre == 'contiene_url' and enlaces else
+                 0.0 if nombre == 'contiene_url' else
+                 _puntaje(puntos[nombre], ESCALAS[nombre]) for nombre in CARACTERISTICAS)
+
+
+def extraer(mensaje):
+    """Diccionario indicador → puntuación de un mensaje"""
+    return dict(zip(CARACTERISTICAS, vector(mensaje)))
+
+
+def extraer_lote(mensajes):
+    """Matriz float32 (mensajes × características) de un lote"""
+    return np.array([vector(m) for m in mensajes], dtype=np.float32).reshape(-1, len(CARACTERISTICAS))
+
+
+def extraer_en_paralelo(mensajes, procesos=None, mensajes_por_tarea=MENSAJES_POR_TAREA, reputacion=None):
+    """extraer_lote repartido en un pool de procesos, con el orden de `mensajes`
+
+    `reputacion` (ruta o IndiceReputacion) activa el índice aquí y en cada
+    proceso del pool, que lo abre con mmap y comparte sus páginas.
+    """
+    if reputacion is not None:
+        usar_reputacion(reputacion)
+    procesos = procesos or os.cpu_count() or 1
+    lotes = [mensajes[i:i + mensajes_por_tarea] for i in range(0, len(mensajes), mensajes_por_tarea)]
+    if procesos == 1 or len(lotes) <= 1:
+        return extraer_lote(mensajes)
+    with ProcessPoolExecutor(max_workers=procesos, initializer=usar_reputacion,
+                             initargs=(_REPUTACION,)) as pool:
+        return np.vstack(list(pool.map(extraer_lote, lotes)))
+
+
+# ============================================
+# ENTRADA Y SALIDA
+# ============================================
+
+def _texto_eml(contenido):
+    """Encabezados y cuerpo en texto de un correo .eml (los href de HTML se conservan)"""
+    from email import message_from_bytes, policy
+
+    correo = message_from_bytes(contenido, policy=policy.default)
+    cuerpo = correo.get_body(preferencelist=('plain', 'html'))
+    texto = cuerpo.get_content() if cuerpo is not None else ''
+    if cuerpo is not None and cuerpo.get_content_type() == 'text/html':
+        texto = re.sub(r'<a\s[^>]*href=["\']?([^"\' >]+)[^>]*>', r' \1 ', texto, flags=re.IGNORECASE)
+        texto = re.sub(r'<[^>]+>', ' ', texto)
+    encabezados = [f"{nombre}: {correo[nombre]}" for nombre in ('From', 'Reply-To', 'Subject')
+                   if correo[nombre]]
+    return '\n'.join(encabezados) + '\n\n' + texto
+
+
+def leer_mensajes(ruta):
+    """Mensajes de un .jsonl (campo "texto" o cadena), un directorio de .eml/.txt o un .txt (uno por línea)"""
+    import json
+
+    if os.path.isdir(ruta):
+        mensajes = []
+        for nombre in sorted(os.listdir(ruta)):
+            with open(os.path.join(ruta, nombre), 'rb') as f:
+                contenido = f.read()
+            if nombre.endswith('.eml'):
+                mensajes.append(_texto_eml(contenido))
+            elif nombre.endswith('.txt'):
+                mensajes.append(contenido.decode('utf-8', errors='replace'))
+        return mensajes
+
+    with open(ruta, encoding='utf-8') as f:
+        if ruta.endswith('.jsonl'):
+            registros = [json.loads(linea) for linea in f if linea.strip()]
+            return [r if isinstance(r, str) else
+                    (f"De: {r['remitente']}\n" if r.get('remitente') else '') + r['texto']
+                    for r in registros]
+        return [linea.rstrip('\n') for linea in f if linea.strip()]
+
+
+def guardar_csv(ruta, X, predicciones=None):
+    import csv
+
+    with open(ruta, 'w', newline='', encoding='utf-8') as f:
+        escritor = csv.writer(f)
+        escritor.writerow(CARACTERISTICAS + (['prediccion', 'prob_phishing'] if predicciones else []))
+        for i, fila in enumerate(X):
+            valores = [f'{v:.1f}' if nombre != 'contiene_url' else str(int(v))
+                       for nombre, v in zip(CARACTERISTICAS, fila)]
+            if predicciones:
+                valores += [str(predicciones[0][i]), f'{predicciones[1][i]:.4f}']
+            escritor.writerow(valores)
+
+
+# ============================================
+# EJEMPLOS Y BENCHMARK
+# ============================================
+
+# Los dos mensajes de la celda 34 del notebook, más un SMS de premio y uno legítimo
+EJEMPLOS = {
+    '🔴 Phishing clásico (notebook)': (
+        "Asunto: ¡¡URGENTE!! Tu cuenta sera suspendida\n\n"
+        "Estimado cliiente,\n\n"
+        "Su cuenta bancaria a sido comprometida. Haga clic aqui INMEDIATAMENTE \n"
+        "para verificar su información o su cuenta sera bloqueada en 24 horas:\n\n"
+        "http://seguridad-bancaria-mx.tk/verificacion\n\n"
+        "Ingrese su usuario, contraseña y numero de tarjeta.\n\n"
+        "Departamento de Seguridad"),
+    '🟢 Estado de cuenta (notebook)': (
+        "Asunto: Estado de cuenta mensual - Octubre 2025\n\n"
+        "Estimado Eduardo Laikan,\n\n"
+        "Tu estado de cuenta del mes de octubre ya está disponible.\n\n"
+        "Puedes consultarlo ingresando a tu banca en línea:\n"
+        "https://www.bancoreal.com.mx\n\n"
+        "Si tienes dudas, llama al 55-1234-5678 desde tu celular registrado.\n\n"
+        "Atentamente,\n"
+        "Banco Real de México"),
+    '🔴 SMS de premio': (
+        "De: +52 1 555 987 6543\n"
+        "FELICIDADES!! Has ganado un iPhone 15 y $25,000 en el sorteo de aniversario. "
+        "Reclama tu premio HOY en bit.ly/premio-bbva antes de que expire, solo ingresa tu NIP."),
+    '🟢 SMS de paquetería': (
+        "De: 27777\n"
+        "Tu paquete con guía 7781 llegará mañana entre 9:00 y 14:00. "
+        "Consulta el seguimiento en https://www.dhl.com/mx-es/home.html"),
+}
+
+_FRAGMENTOS_PHISHING = [
+    "¡¡URGENTE!! Su cuenta sera suspendida en {horas} horas.",
+    "Detectamos actividad sospechosa en su tarjeta, verifique su identidad de inmediato.",
+    "Estimado cliente, su acceso a sido bloqueado por seguridad.",
+    "Ingrese su usuario y contraseña en {url} para evitar la cancelacion.",
+    "Confirme sus datos bancarios y el codigo de seguridad CVV de su tarjeta.",
+    "FELICIDADES, fue seleccionado para recibir un premio de ${monto},000 pesos.",
+    "Reclama tu regalo gratis aqui: {url}",
+    "Ultimo aviso: su paquete sera devuelto si no paga la multa hoy mismo.",
+    "Departamento de Seguridad - Servicio al cliente",
+]
+_FRAGMENTOS_LEGITIMOS = [
+    "Hola {nombre}, te compartimos el resumen de tu cuenta del mes.",
+    "Tu pedido fue enviado y llegará en {horas} días hábiles.",
+    "Puedes consultar el detalle en {url}",
+    "Gracias por tu compra. Conserva este correo como comprobante.",
+    "La reunión del equipo se movió al jueves a las 10:00.",
+    "Adjunto encontrarás la factura correspondiente al periodo.",
+    "Si tienes dudas, llama al 55-1234-5678 en horario de oficina.",
+    "Saludos cordiales,\n{nombre}",
+]
+_URLS_PHISHING = ['http://seguridad-bancaria-mx.tk/verificacion', 'bit.ly/3xYz', 'http://paypa1-login.com',
+                  'http://192.168.10.5/bbva', 'https://amazon-premios.xyz/reclamar']
+_URLS_LEGITIMAS = ['https://www.bancoreal.com.mx', 'https://www.amazon.com.mx/pedidos',
+                   'https://www.sat.gob.mx/consultas']
+_NOMBRES = ['Eduardo', 'María', 'José Luis', 'Ana', 'Fernanda']
+
+
+def mensajes_sinteticos(n, semilla=SEMILLA, proporcion_legitimos=0.6):
+    """Mensajes de 3 a 6 frases armados con fragmentos típicos de cada clase"""
+    import random
+
+    rng = random.Random(semilla)
+    mensajes = []
+    for _ in range(n):
+        legitimo = rng.random() < proporcion_legitimos
+        fragmentos = _FRAGMENTOS_LEGITIMOS if legitimo else _FRAGMENTOS_PHISHING
+        enlaces = _URLS_LEGITIMAS if legitimo else _URLS_PHISHING
+        texto = '\n'.join(rng.sample(fragmentos, rng.randint(3, 6)))
+        mensajes.append(texto.format(horas=rng.choice((24, 48, 72)), monto=rng.randint(5, 90),
+                                     url=rng.choice(enlaces), nombre=rng.choice(_NOMBRES)))
+    return mensajes
+
+
+def benchmark(n_mensajes, lista_procesos, mensajes_por_tarea=MENSAJES_POR_TAREA):
+    """Mensajes/s totales y por núcleo en serie y con el pool, verificando el mismo resultado"""
+    mensajes = mensajes_sinteticos(n_mensajes)
+    print(f"   {n_mensajes:,d} mensajes sintéticos, {sum(map(len, mensajes)) / n_mensajes:.0f} "
+          f"caracteres de media\n")
+    print(f"{'modo':>10s} {'procesos':>9s} {'tiempo (s)':>11s} {'mensajes/s':>12s} "
+          f"{'mensajes/s/núcleo':>18s} {'µs/mensaje':>11s}")
+
+    filas = []
+    referencia = None
+    for procesos in [1] + list(lista_procesos):
+        modo = 'serie' if referencia is None else 'pool'
+        inicio = time.perf_counter()
+        X = (extraer_lote(mensajes) if referencia is None else
+             _extraer_pool(mensajes, procesos, mensajes_por_tarea))
+        segundos = time.perf_counter() - inicio
+        if referencia is None:
+            referencia = X
+        elif not np.array_equal(X, referencia):
+            raise AssertionError(f"El pool con {procesos} procesos da indicadores distintos")
+        por_segundo = n_mensajes / segundos
+        filas.append({'modo': modo, 'procesos': procesos, 'segundos': segundos,
+                      'mensajes_s': por_segundo, 'mensajes_s_nucleo': por_segundo / procesos})
+        print(f"{modo:>10s} {procesos:>9d} {segundos:>11.3f} {por_segundo:>12,.0f} "
+              f"{por_segundo / procesos:>18,.0f} {segundos / n_mensajes * 1e6:>11.1f}")
+    return filas
+
+
+def _extraer_pool(mensajes, procesos, mensajes_por_tarea):
+    """Como extraer_en_paralelo pero usando el pool aunque haya un solo proceso"""
+    lotes = [mensajes[i:i + mensajes_por_tarea] for i in range(0, len(mensajes), mensajes_por_tarea)]
+    with ProcessPoolExecutor(max_workers=procesos, initializer=usar_reputacion,
+                             initargs=(_REPUTACION,)) as pool:
+        return np.vstack(list(pool.map(extraer_lote, lotes)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Indicadores de phishing a partir del texto de correos y SMS')
+    parser.add_argument('entrada', nargs='?',
+                        help='.jsonl, .txt (un mensaje por línea) o directorio de .eml/.txt')
+    parser.add_argument('--salida', help='CSV con los indicadores de cada mensaje')
+    parser.add_argument('--procesos', type=int, default=None, help='Procesos del pool (por defecto, todos)')
+    parser.add_argument('--clasificar', action='store_true', help='Añadir la predicción del modelo')
+    parser.add_argument('--modelo', default=None, help='Artefacto del modelo (.phtree)')
+    parser.add_argument('--reputacion', default=None,
+                        help=f'Índice de reputación (.phrep); por defecto {ARCHIVO_REPUTACION} si existe')
+    parser.add_argument('--benchmark', action='store_true', help='Medir mensajes/s por núcleo')
+    parser.add_argument('--mensajes', type=float, default=1e5, help='Mensajes del benchmark')
+    args = parser.parse_args(argv)
+
+    reputacion = args.reputacion or (ARCHIVO_REPUTACION if os.path.exists(ARCHIVO_REPUTACION) else None)
+    if reputacion:
+        usar_reputacion(reputacion)
+        print(f"🛡️  Índice de reputación: {reputacion} ({_REPUTACION.n_entradas:,d} dominios)")
+
+    if args.benchmark:
+        nucleos = os.cpu_count() or 1
+        print(f"⏱️  Benchmark del extractor ({nucleos} núcleos)")
+        benchmark(int(args.mensajes), sorted({1, args.procesos or nucleos}))
+        return
+
+    if args.entrada:
+        mensajes = leer_mensajes(args.entrada)
+        nombres = [f'#{i}' for i in range(len(mensajes))]
+    else:
+        nombres, mensajes = list(EJEMPLOS), list(EJEMPLOS.values())
+        args.clasificar = True
+
+    inicio = time.perf_counter()
+    X = extraer_en_paralelo(mensajes, args.procesos)
+    segundos = time.perf_counter() - inicio
+    print(f"📨 {len(mensajes):,d} mensajes en {segundos:.2f} s ({len(mensajes) / segundos:,.0f} mensajes/s)")
+
+    predicciones = None
+    if args.clasificar:
+        from artefacto_modelo import ARCHIVO_MODELO, cargar_modelo
+
+        predicciones = cargar_modelo(args.modelo or ARCHIVO_MODELO).puntuar(X)
+
+    if args.salida:
+        guardar_csv(args.salida, X, predicciones)
+        print(f"✅ Indicadores guardados en: {args.salida}")
+    if not args.salida or not args.entrada:
+        for i, (nombre, fila) in enumerate(zip(nombres, X)):
+            print(f"\n{nombre}")
+            for caracteristica, valor in zip(CARACTERISTICAS, fila):
+                print(f"    • {caracteristica:22s} {valor:4.1f}")
+            if predicciones is not None:
+                decision = "🔴 PHISHING" if predicciones[0][i] == 1 else "🟢 LEGÍTIMO"
+                print(f"    → {decision} (prob. phishing {predicciones[1][i]:.1%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Renderizado en paralelo de las siete figuras del reporte de phishing
+
+Cada figura de figuras_phishing.py es independiente una vez que existen el
+dataset y el modelo, así que se reparten en un pool de procesos con el
+backend Agg (sin pantalla). Los trabajadores no reciben el DataFrame: abren
+el dataset columnar (.phcol) con memory-map y reciben el modelo serializado
+una sola vez en el inicializador. Las figuras más costosas se encargan
+primero, así que el tiempo total se acerca al de la figura más lenta en vez
+de a la suma de todas.
+
+Uso:
+    python figuras_paralelas.py --salida salida/
+    python figuras_paralelas.py --salida salida/ --procesos 4 --comparar
+
+Requisitos: pip install matplotlib seaborn pandas numpy scikit-learn
+"""
+
+import argparse
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Figura → (función de figuras_phishing, entrada que necesita)
+TAREAS = {
+    '01_analisis_exploratorio_phishing.png': ('figura_analisis_exploratorio', 'datos'),
+    '02_comparacion_phishing_legitimo.png': ('figura_comparacion', 'datos'),
+    '03_matriz_correlacion_phishing.png': ('figura_correlacion', 'datos'),
+    '04_matriz_confusion_phishing.png': ('figura_matriz_confusion', 'matriz_confusion'),
+    '05_importancia_caracteristicas_phishing.png': ('figura_importancia', 'importancias'),
+    '06_arbol_decision_phishing_completo.png': ('figura_arbol_completo', 'modelo'),
+    '07_arbol_decision_phishing_simplificado.png': ('figura_arbol_simplificado', 'modelo')
+}
+
+# Costo relativo medido con el modelo por defecto: se encargan de mayor a menor
+COSTO_RELATIVO = {
+    '06_arbol_decision_phishing_completo.png': 6,
+    '01_analisis_exploratorio_phishing.png': 5,
+    '07_arbol_decision_phishing_simplificado.png': 4,
+    '02_comparacion_phishing_legitimo.png': 4,
+    '03_matriz_correlacion_phishing.png': 2,
+    '04_matriz_confusion_phishing.png': 1,
+    '05_importancia_caracteristicas_phishing.png': 1
+}
+
+FIGURAS_DATOS = [nombre for nombre, (_, entrada) in TAREAS.items() if entrada == 'datos']
+FIGURAS_MODELO = [nombre for nombre, (_, entrada) in TAREAS.items() if entrada != 'datos']
+# Los reportes dibujan el árbol en vectorial (arbol_vectorial.py); estas dos
+# sólo se conservan para el notebook y como respaldo
+FIGURAS_ARBOL = [nombre for nombre, (_, entrada) in TAREAS.items() if entrada == 'modelo']
+
+# Estado de cada proceso trabajador (ver _inicializar y _entrada)
+_RUTA_DATASET = None
+_MODELO_SERIALIZADO = None
+_DATASET = None
+_MODELO = None
+
+
+# ============================================
+# PROCESOS TRABAJADORES
+# ============================================
+
+def _inicializar(ruta_dataset, modelo_serializado):
+    global _RUTA_DATASET, _MODELO_SERIALIZADO, _DATASET, _MODELO
+    # Importar las figuras aquí deja matplotlib cargado antes de medir cada figura
+    import figuras_phishing  # noqa: F401
+
+    _RUTA_DATASET = ruta_dataset
+    _MODELO_SERIALIZADO = modelo_serializado
+    _DATASET = None
+    _MODELO = None
+
+
+def _entrada(tipo, metricas):
+    """Dataset y modelo se cargan una vez por proceso; las métricas vienen en la tarea"""
+    global _DATASET, _MODELO
+    if tipo == 'datos':
+        if _DATASET is None:
+            from formato_columnar import cargar_dataset
+
+            _DATASET = cargar_dataset(_RUTA_DATASET)
+        return _DATASET
+    if tipo == 'modelo':
+        if _MODELO is None:
+            _MODELO = pickle.loads(_MODELO_SERIALIZADO)
+        return _MODELO
+    return metricas[tipo]
+
+
+def renderizar_figura(nombre, directorio, metricas=None):
+    """Dibuja una figura y devuelve (nombre, segundos, pid)"""
+    import figuras_phishing as figuras
+
+    funcion, tipo = TAREAS[nombre]
+    inicio = time.perf_counter()
+    getattr(figuras, funcion)(_entrada(tipo, metricas), os.path.join(directorio, nombre))
+    return nombre, time.perf_counter() - inicio, os.getpid()
+
+
+# ============================================
+# ORQUESTACIÓN
+# ============================================
+
+def renderizar_figuras(directorio, nombres=None, ruta_dataset=None, modelo=None, metricas=None,
+                       procesos=None, progreso=True):
+    """Renderiza las figuras pedidas y devuelve los tiempos por figura y el total
+
+    `ruta_dataset` (CSV o .phcol) sólo se necesita para las figuras 01-03;
+    `modelo` y `metricas` para las 04-07.
+    """
+    nombres = list(nombres or TAREAS)
+    tipos = {TAREAS[nombre][1] for nombre in nombres}
+    if 'datos' in tipos and ruta_dataset is None:
+        raise ValueError("Las figuras exploratorias necesitan ruta_dataset")
+    if 'modelo' in tipos and modelo is None:
+        raise ValueError("Las figuras del árbol necesitan el modelo")
+    metricas = {clave: metricas[clave] for clave in ('matriz_confusion', 'importancias')} if metricas else {}
+
+    os.makedirs(directorio, exist_ok=True)
+    orden = sorted(nombres, key=lambda nombre: COSTO_RELATIVO.get(nombre, 0), reverse=True)
+    modelo_serializado = pickle.dumps(modelo) if modelo is not None else None
+    procesos = min(procesos or os.cpu_count() or 1, len(orden))
+
+    tiempos = {}
+    inicio = time.perf_counter()
+    if procesos == 1:
+        _inicializar(ruta_dataset, modelo_serializado)
+        resultados = (renderizar_figura(nombre, directorio, metricas) for nombre in orden)
+        for nombre, segundos, pid in resultados:
+            tiempos[nombre] = segundos
+            if progreso:
+                print(f"  🖼️  {nombre:45s} {segundos:6.2f} s")
+    else:
+        with ProcessPoolExecutor(max_workers=procesos, initializer=_inicializar,
+                                 initargs=(ruta_dataset, modelo_serializado)) as pool:
+            futuros = [pool.submit(renderizar_figura, nombre, directorio, metricas) for nombre in orden]
+            for futuro in as_completed(futuros):
+                nombre, segundos, pid = futuro.result()
+                tiempos[nombre] = segundos
+                if progreso:
+                    print(f"  🖼️  {nombre:45s} {segundos:6.2f} s  (proceso {pid})")
+    total = time.perf_counter() - inicio
+
+    return {
+        'figuras': {nombre: tiempos[nombre] for nombre in nombres},
+        'procesos': procesos,
+        'total': total,
+        'suma': sum(tiempos.values()),
+        'mas_lenta': max(tiempos.values()) if tiempos else 0.0
+    }
+
+
+def _resumen(etiqueta, resultado):
+    print(f"⏱️  {etiqueta}: {resultado['total']:.2f} s con {resultado['procesos']} proceso(s) "
+          f"(suma {resultado['suma']:.2f} s, figura más lenta {resultado['mas_lenta']:.2f} s)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Renderiza en paralelo las figuras del reporte')
+    parser.add_argument('--salida', default='.', help='Directorio del pipeline donde se escriben las figuras')
+    parser.add_argument('--procesos', type=int, default=None, help='Por defecto, uno por núcleo')
+    parser.add_argument('--figura', action='append', choices=list(TAREAS), help='Sólo estas figuras')
+    parser.add_argument('--comparar', action='store_true', help='Medir también en un solo proceso')
+    args = parser.parse_args(argv)
+
+    from pipeline_phishing import ARCHIVO_DATASET_COLUMNAR, PipelinePhishing
+
+    # El pipeline (con caché) deja el dataset columnar, el modelo y las métricas
+    resultados = PipelinePhishing(directorio_salida=args.salida, verbose=False).ejecutar(hasta='evaluar')
+    entradas = {
+        'ruta_dataset': os.path.join(args.salida, ARCHIVO_DATASET_COLUMNAR),
+        'modelo': resultados['entrenar'],
+        'metricas': resultados['evaluar']
+    }
+
+    if args.comparar:
+        print("🐢 Un solo proceso")
+        _resumen('Secuencial', renderizar_figuras(args.salida, args.figura, procesos=1, **entradas))
+        print()
+    print("🚀 Pool de procesos")
+    _resumen('Paralelo', renderizar_figuras(args.salida, args.figura, procesos=args.procesos, **entradas))
+
+
+if __name__ == "__main__":
+    main()
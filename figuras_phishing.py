@@ -0,0 +1,216 @@
+"""
+Figuras del reporte de la Actividad 9 - Detección de Phishing
+
+Cada función reproduce una celda de visualización del notebook
+arbol_decision_phishing.ipynb y guarda el PNG en la ruta indicada.
+Se usa el backend Agg para poder generar las figuras sin pantalla.
+
+Requisitos: pip install matplotlib seaborn pandas scikit-learn
+"""
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import seaborn as sns
+import warnings
+
+from esquema_phishing import CARACTERISTICAS, NOMBRES_CLASES
+
+warnings.filterwarnings('ignore')
+
+DPI = 300
+
+# Nombre de archivo de cada figura (mismos nombres que el notebook)
+FIGURA_EDA = '01_analisis_exploratorio_phishing.png'
+FIGURA_COMPARACION = '02_comparacion_phishing_legitimo.png'
+FIGURA_CORRELACION = '03_matriz_correlacion_phishing.png'
+FIGURA_CONFUSION = '04_matriz_confusion_phishing.png'
+FIGURA_IMPORTANCIA = '05_importancia_caracteristicas_phishing.png'
+FIGURA_ARBOL_COMPLETO = '06_arbol_decision_phishing_completo.png'
+FIGURA_ARBOL_SIMPLIFICADO = '07_arbol_decision_phishing_simplificado.png'
+
+# Figuras que sólo dependen del dataset y figuras que dependen del modelo
+FIGURAS_DATOS = [FIGURA_EDA, FIGURA_COMPARACION, FIGURA_CORRELACION]
+FIGURAS_MODELO = [FIGURA_CONFUSION, FIGURA_IMPORTANCIA,
+                  FIGURA_ARBOL_COMPLETO, FIGURA_ARBOL_SIMPLIFICADO]
+
+_VARIABLES = ['remitente_sospechoso', 'dominio_sospechoso', 'tono_urgencia', 'solicita_info',
+              'errores_gramaticales', 'oferta_irreal']
+_TITULOS = ['Remitente Sospechoso', 'Dominio Sospechoso', 'Tono de Urgencia', 'Solicita Información',
+            'Errores Gramaticales', 'Oferta Irreal']
+
+
+def configurar_estilo():
+    """Aplica el estilo de gráficos del notebook"""
+    plt.style.use('seaborn-v0_8-darkgrid')
+    sns.set_palette('husl')
+
+
+def figura_analisis_exploratorio(df, ruta=FIGURA_EDA):
+    """Histogramas de los indicadores y conteos de URL y clase (celda 10)"""
+    fig, axes = plt.subplots(2, 4, figsize=(20, 10))
+    fig.suptitle('🔍 Análisis Exploratorio del Dataset de Phishing', fontsize=18, fontweight='bold', y=1.02)
+
+    colores = ['#ff6b6b', '#feca57', '#48dbfb', '#ff9ff3', '#54a0ff', '#00d2d3']
+
+    for idx, (var, color, titulo) in enumerate(zip(_VARIABLES, colores, _TITULOS)):
+        fila = idx // 4
+        col = idx % 4
+        axes[fila, col].hist(df[var], bins=20, color=color, edgecolor='black', alpha=0.7)
+        axes[fila, col].set_title(titulo, fontweight='bold')
+        axes[fila, col].set_xlabel('Nivel (0-10)')
+        axes[fila, col].set_ylabel('Frecuencia')
+        axes[fila, col].grid(True, alpha=0.3)
+
+    # Gráfico de URL
+    url_counts = df['contiene_url'].value_counts()
+    axes[1, 2].bar(['Sin URL', 'Con URL'], url_counts.values, color=['#1dd1a1', '#ee5a6f'])
+    axes[1, 2].set_title('Contiene URL', fontweight='bold')
+    axes[1, 2].set_ylabel('Cantidad')
+    for i, v in enumerate(url_counts.values):
+        axes[1, 2].text(i, v + 10, str(v), ha='center', fontweight='bold', fontsize=11)
+
+    # Distribución de phishing vs legítimo
+    phishing_counts = df['es_phishing'].value_counts()
+    axes[1, 3].bar(NOMBRES_CLASES, phishing_counts.values,
+                   color=['#51cf66', '#ff6b6b'], edgecolor='black', linewidth=2)
+    axes[1, 3].set_title('Clasificación de Mensajes', fontweight='bold', fontsize=12)
+    axes[1, 3].set_ylabel('Cantidad')
+    for i, v in enumerate(phishing_counts.values):
+        axes[1, 3].text(i, v + 15, str(v), ha='center', fontweight='bold', fontsize=14)
+
+    plt.tight_layout()
+    plt.savefig(ruta, dpi=DPI, bbox_inches='tight')
+    plt.close(fig)
+    return ruta
+
+
+def figura_comparacion(df, ruta=FIGURA_COMPARACION):
+    """Histogramas superpuestos legítimo vs phishing (celda 11)"""
+    fig, axes = plt.subplots(2, 3, figsize=(18, 10))
+    fig.suptitle('📊 Comparación: Mensajes Legítimos vs Phishing', fontsize=16, fontweight='bold')
+
+    for idx, (var, titulo) in enumerate(zip(_VARIABLES, _TITULOS)):
+        fila = idx // 3
+        col = idx % 3
+
+        # Separar datos
+        legit = df[df['es_phishing'] == 0][var]
+        phish = df[df['es_phishing'] == 1][var]
+
+        axes[fila, col].hist([legit, phish], bins=15, label=NOMBRES_CLASES,
+                             color=['#51cf66', '#ff6b6b'], alpha=0.7, edgecolor='black')
+        axes[fila, col].set_title(titulo, fontweight='bold')
+        axes[fila, col].set_xlabel('Nivel')
+        axes[fila, col].set_ylabel('Frecuencia')
+        axes[fila, col].legend(loc='upper right')
+        axes[fila, col].grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    plt.savefig(ruta, dpi=DPI, bbox_inches='tight')
+    plt.close(fig)
+    return ruta
+
+
+def figura_correlacion(df, ruta=FIGURA_CORRELACION):
+    """Mapa de calor de la matriz de correlación (celda 12)"""
+    fig = plt.figure(figsize=(10, 8))
+    correlation_matrix = df.corr()
+    sns.heatmap(correlation_matrix, annot=True, fmt='.2f', cmap='RdYlGn_r',
+                square=True, linewidths=0.5, cbar_kws={"shrink": 0.8},
+                vmin=-1, vmax=1, center=0)
+    plt.title('🔥 Matriz de Correlación - Indicadores de Phishing',
+              fontsize=14, fontweight='bold', pad=20)
+    plt.tight_layout()
+    plt.savefig(ruta, dpi=DPI, bbox_inches='tight')
+    plt.close(fig)
+    return ruta
+
+
+def figura_matriz_confusion(cm, ruta=FIGURA_CONFUSION):
+    """Matriz de confusión del conjunto de prueba (celda 22)"""
+    fig = plt.figure(figsize=(8, 6))
+    sns.heatmap(cm, annot=True, fmt='d', cmap='RdYlGn_r', cbar=False,
+                xticklabels=NOMBRES_CLASES,
+                yticklabels=NOMBRES_CLASES,
+                annot_kws={'size': 16, 'weight': 'bold'})
+    plt.title('Matriz de Confusión - Detección de Phishing', fontsize=14, fontweight='bold', pad=20)
+    plt.ylabel('Valor Real', fontsize=12, fontweight='bold')
+    plt.xlabel('Valor Predicho', fontsize=12, fontweight='bold')
+
+    # Agregar texto explicativo
+    plt.text(0.5, -0.15, f'Verdaderos Negativos: {cm[0][0]}', ha='left', transform=plt.gca().transAxes)
+    plt.text(0.5, -0.2, f'Falsos Positivos: {cm[0][1]}', ha='left', transform=plt.gca().transAxes)
+    plt.text(0.5, -0.25, f'Falsos Negativos: {cm[1][0]}', ha='left', transform=plt.gca().transAxes)
+    plt.text(0.5, -0.3, f'Verdaderos Positivos: {cm[1][1]}', ha='left', transform=plt.gca().transAxes)
+
+    plt.tight_layout()
+    plt.savefig(ruta, dpi=DPI, bbox_inches='tight')
+    plt.close(fig)
+    return ruta
+
+
+def figura_importancia(importancias, ruta=FIGURA_IMPORTANCIA):
+    """Barras horizontales con la importancia de cada indicador (celda 23)
+
+    `importancias` es una lista de pares (característica, importancia).
+    """
+    importancias = sorted(importancias, key=lambda par: par[1], reverse=True)
+    nombres = [nombre for nombre, _ in importancias]
+    valores = [valor for _, valor in importancias]
+
+    fig = plt.figure(figsize=(10, 6))
+    colors_imp = ['#ff6b6b', '#ee5a6f', '#ff9ff3', '#feca57', '#48dbfb', '#00d2d3', '#54a0ff']
+    plt.barh(nombres, valores, color=colors_imp[:len(nombres)], edgecolor='black', linewidth=1.5)
+    plt.xlabel('Importancia', fontsize=12, fontweight='bold')
+    plt.title('🎯 Importancia de los Indicadores de Phishing', fontsize=14, fontweight='bold', pad=20)
+    plt.gca().invert_yaxis()
+    for i, v in enumerate(valores):
+        plt.text(v + 0.01, i, f'{v:.3f}', va='center', fontweight='bold')
+    plt.grid(axis='x', alpha=0.3)
+    plt.tight_layout()
+    plt.savefig(ruta, dpi=DPI, bbox_inches='tight')
+    plt.close(fig)
+    return ruta
+
+
+def figura_arbol_completo(modelo, ruta=FIGURA_ARBOL_COMPLETO):
+    """Visualización completa del árbol con plot_tree (celda 25)"""
+    from sklearn.tree import plot_tree
+
+    fig = plt.figure(figsize=(25, 15))
+    plot_tree(modelo,
+              feature_names=CARACTERISTICAS,
+              class_names=NOMBRES_CLASES,
+              filled=True,
+              rounded=True,
+              fontsize=10)
+    plt.title('🌳 Árbol de Decisión - Detección de Phishing (Vista Completa)',
+              fontsize=20, fontweight='bold', pad=20)
+    plt.tight_layout()
+    plt.savefig(ruta, dpi=DPI, bbox_inches='tight')
+    plt.close(fig)
+    return ruta
+
+
+def figura_arbol_simplificado(modelo, ruta=FIGURA_ARBOL_SIMPLIFICADO):
+    """Visualización compacta del árbol para el reporte (celda 26)"""
+    from sklearn.tree import plot_tree
+
+    fig = plt.figure(figsize=(20, 12))
+    plot_tree(modelo,
+              feature_names=CARACTERISTICAS,
+              class_names=NOMBRES_CLASES,
+              filled=True,
+              rounded=True,
+              fontsize=9,
+              proportion=True)
+    plt.title('🌳 Árbol de Decisión - Detección de Phishing (Vista Simplificada)',
+              fontsize=18, fontweight='bold', pad=20)
+    plt.tight_layout()
+    plt.savefig(ruta, dpi=DPI, bbox_inches='tight')
+    plt.close(fig)
+    return ruta
+
+
+configurar_estilo()
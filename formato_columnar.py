@@ -0,0 +1,310 @@
+"""
+Formato columnar binario con memory-map para el dataset de phishing
+
+Un dataset es un directorio <nombre>.phcol con un archivo binario por columna
+y un encabezado esquema.json con el esquema y el número de filas:
+
+    dataset_phishing.phcol/
+    ├── esquema.json
+    ├── remitente_sospechoso.bin     float32
+    ├── contiene_url.bin             uint8
+    ├── ...
+    └── es_phishing.bin              uint8
+
+Las columnas se abren con np.memmap, así que cargar un dataset no parsea
+texto ni copia datos: el generador, el entrenamiento, el puntuador y el EDA
+leen directamente las páginas del archivo. Los indicadores 0-10 se guardan
+en float32, que es el tipo al que scikit-learn convierte X al entrenar y al
+predecir, por lo que las predicciones no cambian.
+
+Uso:
+    python formato_columnar.py a-columnar dataset_phishing.csv dataset_phishing.phcol
+    python formato_columnar.py a-csv dataset_phishing.phcol copia.csv
+    python formato_columnar.py benchmark dataset_grande.csv
+
+Requisitos: pip install numpy pandas
+"""
+
+import argparse
+import json
+import os
+import shutil
+import time
+
+import numpy as np
+
+from esquema_phishing import COLUMNAS, COLUMNAS_BINARIAS
+
+FORMATO = 'phcol'
+VERSION = 1
+ARCHIVO_ESQUEMA = 'esquema.json'
+EXTENSION = '.phcol'
+FILAS_POR_BLOQUE = 1_000_000
+
+
+def tipo_columna(nombre):
+    """Tipo en disco de una columna: uint8 para las binarias, float32 para el resto"""
+    return np.dtype(np.uint8) if nombre in COLUMNAS_BINARIAS else np.dtype(np.float32)
+
+
+def es_columnar(ruta):
+    """Verdadero si `ruta` es un directorio en formato columnar"""
+    return os.path.isfile(os.path.join(ruta, ARCHIVO_ESQUEMA))
+
+
+class EscritorColumnar:
+    """Escribe un dataset columnar por bloques
+
+    Los datos se escriben en <ruta>.tmp y el directorio se renombra al
+    cerrar, de modo que un lector nunca ve un dataset a medio escribir.
+    """
+
+    def __init__(self, ruta, columnas=None):
+        self.ruta = ruta
+        self.columnas = list(columnas or COLUMNAS)
+        self.tipos = {col: tipo_columna(col) for col in self.columnas}
+        self.n_filas = 0
+        self._temporal = ruta.rstrip(os.sep) + '.tmp'
+        shutil.rmtree(self._temporal, ignore_errors=True)
+        os.makedirs(self._temporal)
+        self._archivos = {col: open(os.path.join(self._temporal, f'{col}.bin'), 'wb')
+                          for col in self.columnas}
+
+    def agregar(self, bloque):
+        """Agrega un bloque (DataFrame o diccionario columna → arreglo)"""
+        n = None
+        for col in self.columnas:
+            valores = np.ascontiguousarray(bloque[col], dtype=self.tipos[col])
+            if n is None:
+                n = len(valores)
+            elif len(valores) != n:
+                raise ValueError(f"La columna '{col}' tiene {len(valores)} filas, se esperaban {n}")
+            self._archivos[col].write(valores.tobytes())
+        self.n_filas += n or 0
+
+    def cerrar(self):
+        for archivo in self._archivos.values():
+            archivo.close()
+        esquema = {
+            'formato': FORMATO,
+            'version': VERSION,
+            'n_filas': self.n_filas,
+            'columnas': [{'nombre': col, 'tipo': self.tipos[col].str, 'archivo': f'{col}.bin'}
+                         for col in self.columnas]
+        }
+        with open(os.path.join(self._temporal, ARCHIVO_ESQUEMA), 'w', encoding='utf-8') as f:
+            json.dump(esquema, f, indent=2)
+        shutil.rmtree(self.ruta, ignore_errors=True)
+        os.replace(self._temporal, self.ruta)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        if tipo is None:
+            self.cerrar()
+        else:
+            for archivo in self._archivos.values():
+                archivo.close()
+            shutil.rmtree(self._temporal, ignore_errors=True)
+
+
+class DatasetColumnar:
+    """Dataset columnar abierto con memory-map (sólo lectura)"""
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        with open(os.path.join(ruta, ARCHIVO_ESQUEMA), encoding='utf-8') as f:
+            self.esquema = json.load(f)
+        if self.esquema.get('formato') != FORMATO:
+            raise ValueError(f"'{ruta}' no es un dataset {FORMATO}")
+        if self.esquema.get('version', 0) > VERSION:
+            raise ValueError(f"Versión de formato no soportada: {self.esquema['version']}")
+
+        self.n_filas = int(self.esquema['n_filas'])
+        self.columnas = {}
+        for columna in self.esquema['columnas']:
+            tipo = np.dtype(columna['tipo'])
+            archivo = os.path.join(ruta, columna['archivo'])
+            if self.n_filas == 0:
+                self.columnas[columna['nombre']] = np.empty(0, dtype=tipo)
+            else:
+                self.columnas[columna['nombre']] = np.memmap(archivo, dtype=tipo, mode='r',
+                                                             shape=(self.n_filas,))
+
+    def __len__(self):
+        return self.n_filas
+
+    def __getitem__(self, nombre):
+        return self.columnas[nombre]
+
+    def __contains__(self, nombre):
+        return nombre in self.columnas
+
+    @property
+    def nombres(self):
+        return list(self.columnas)
+
+    def bloques(self, filas_por_bloque=FILAS_POR_BLOQUE, columnas=None):
+        """Itera sobre diccionarios columna → vista del bloque (sin copias)"""
+        columnas = columnas or self.nombres
+        for inicio in range(0, self.n_filas, filas_por_bloque):
+            fin = min(inicio + filas_por_bloque, self.n_filas)
+            yield {col: self.columnas[col][inicio:fin] for col in columnas}
+
+    def matriz(self, columnas, filas=None):
+        """Matriz 2D (n_filas, n_columnas) con las columnas indicadas (copia)"""
+        if filas is None:
+            return np.column_stack([self.columnas[col] for col in columnas])
+        return np.column_stack([self.columnas[col][filas] for col in columnas])
+
+    def a_dataframe(self, columnas=None):
+        """DataFrame de pandas con las columnas indicadas"""
+        import pandas as pd
+
+        columnas = columnas or self.nombres
+        return pd.DataFrame({col: self.columnas[col] for col in columnas}, columns=columnas)
+
+
+def abrir_columnar(ruta):
+    """Abre un dataset columnar con memory-map"""
+    return DatasetColumnar(ruta)
+
+
+def escribir_columnar(ruta, datos, columnas=None):
+    """Escribe de una vez un DataFrame o diccionario de columnas"""
+    with EscritorColumnar(ruta, columnas or [col for col in COLUMNAS if col in datos]) as escritor:
+        escritor.agregar(datos)
+    return ruta
+
+
+def cargar_dataset(ruta, columnas=None):
+    """DataFrame desde un CSV o un dataset columnar, según la ruta"""
+    if es_columnar(ruta):
+        return abrir_columnar(ruta).a_dataframe(columnas)
+    import pandas as pd
+
+    return pd.read_csv(ruta, usecols=columnas)
+
+
+def csv_a_columnar(ruta_csv, ruta_columnar, filas_por_bloque=FILAS_POR_BLOQUE):
+    """Convierte un CSV con el esquema de dataset_phishing.csv a formato columnar"""
+    import pandas as pd
+
+    presentes = set(pd.read_csv(ruta_csv, nrows=0).columns)
+    columnas = [col for col in COLUMNAS if col in presentes]
+    lector = pd.read_csv(ruta_csv, usecols=columnas, chunksize=filas_por_bloque,
+                         dtype={col: tipo_columna(col) for col in columnas})
+    with EscritorColumnar(ruta_columnar, columnas) as escritor:
+        for bloque in lector:
+            escritor.agregar(bloque)
+    return escritor.n_filas
+
+
+def columnar_a_csv(ruta_columnar, ruta_csv, filas_por_bloque=FILAS_POR_BLOQUE):
+    """Exporta un dataset columnar a CSV por bloques
+
+    Los bloques cuyos indicadores están en la rejilla 0.0-10.0 se escriben
+    con un decimal, igual que dataset_phishing.csv; el resto con %.6g.
+    """
+    import pandas as pd
+    from generador_dataset import en_rejilla, fragmento_a_csv
+
+    dataset = abrir_columnar(ruta_columnar)
+    continuas = [col for col in dataset.nombres if dataset[col].dtype != np.uint8]
+    with open(ruta_csv, 'wb') as f:
+        f.write((','.join(dataset.nombres) + '\n').encode('ascii'))
+        for bloque in dataset.bloques(filas_por_bloque):
+            if all(en_rejilla(bloque[col]) for col in continuas):
+                f.write(fragmento_a_csv(bloque, dataset.nombres))
+            else:
+                f.write(pd.DataFrame(bloque, columns=dataset.nombres).to_csv(
+                    header=False, index=False, float_format='%.6g', lineterminator='\n').encode('utf-8'))
+    return dataset.n_filas
+
+
+# ============================================
+# BENCHMARK DE CARGA
+# ============================================
+
+def benchmark(ruta_csv, ruta_columnar=None, repeticiones=3):
+    """Compara pd.read_csv con abrir el dataset columnar y recorrer sus columnas"""
+    import pandas as pd
+
+    ruta_columnar = ruta_columnar or os.path.splitext(ruta_csv)[0] + EXTENSION
+    if not es_columnar(ruta_columnar):
+        print(f"  Convirtiendo '{ruta_csv}' → '{ruta_columnar}'...")
+        csv_a_columnar(ruta_csv, ruta_columnar)
+
+    def mejor(funcion):
+        tiempos = []
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            funcion()
+            tiempos.append(time.perf_counter() - inicio)
+        return min(tiempos)
+
+    def leer_csv():
+        df = pd.read_csv(ruta_csv)
+        return float(df['oferta_irreal'].sum())
+
+    def abrir():
+        return abrir_columnar(ruta_columnar)
+
+    def abrir_y_recorrer():
+        dataset = abrir_columnar(ruta_columnar)
+        # Sumar cada columna obliga a leer todas las páginas del archivo
+        return [float(dataset[col].sum(dtype=np.float64)) for col in dataset.nombres]
+
+    n_filas = abrir_columnar(ruta_columnar).n_filas
+    tamano_csv = os.path.getsize(ruta_csv)
+    tamano_columnar = sum(os.path.getsize(os.path.join(ruta_columnar, a))
+                          for a in os.listdir(ruta_columnar))
+
+    resultados = {
+        'filas': n_filas,
+        'mb_csv': tamano_csv / 1e6,
+        'mb_columnar': tamano_columnar / 1e6,
+        'read_csv_s': mejor(leer_csv),
+        'abrir_columnar_s': mejor(abrir),
+        'recorrer_columnar_s': mejor(abrir_y_recorrer)
+    }
+    return resultados
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Formato columnar binario para el dataset de phishing')
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    p = sub.add_parser('a-columnar', help='Convertir CSV → columnar')
+    p.add_argument('csv')
+    p.add_argument('columnar')
+
+    p = sub.add_parser('a-csv', help='Convertir columnar → CSV')
+    p.add_argument('columnar')
+    p.add_argument('csv')
+
+    p = sub.add_parser('benchmark', help='Comparar tiempo de carga contra pd.read_csv')
+    p.add_argument('csv')
+    p.add_argument('--columnar')
+
+    args = parser.parse_args(argv)
+
+    if args.comando == 'a-columnar':
+        n = csv_a_columnar(args.csv, args.columnar)
+        print(f"✅ {n:,d} filas convertidas → '{args.columnar}'")
+    elif args.comando == 'a-csv':
+        n = columnar_a_csv(args.columnar, args.csv)
+        print(f"✅ {n:,d} filas exportadas → '{args.csv}'")
+    else:
+        r = benchmark(args.csv, args.columnar)
+        print(f"\n⏱️  Carga de {r['filas']:,d} filas")
+        print(f"  • Tamaño: CSV {r['mb_csv']:.1f} MB, columnar {r['mb_columnar']:.1f} MB")
+        print(f"  • pd.read_csv:                 {r['read_csv_s']:.4f} s")
+        print(f"  • abrir columnar (memmap):     {r['abrir_columnar_s']:.4f} s")
+        print(f"  • abrir y recorrer columnas:   {r['recorrer_columnar_s']:.4f} s "
+              f"({r['read_csv_s'] / r['recorrer_columnar_s']:.0f}x más rápido)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+Generador paralelo y reproducible del dataset sintético de phishing
+
+Produce la misma mezcla legítimo/phishing que la celda 5 del notebook
+(mismas distribuciones normales recortadas a [0, 10], misma proporción
+60/40 y mismo redondeo a un decimal), pero en fragmentos independientes
+repartidos en un pool de procesos.
+
+Cada fragmento usa su propio flujo aleatorio derivado de una sola semilla
+con np.random.SeedSequence (spawn_key = índice del fragmento) y se mezcla
+dentro de sí mismo. La partición en fragmentos depende sólo del número de
+filas y del tamaño de fragmento, y los fragmentos se escriben en orden, así
+que el archivo resultante es idéntico bit a bit sin importar cuántos
+procesos se usen. Los fragmentos van directo a disco (CSV o el formato
+columnar de formato_columnar.py): nunca se tiene el dataset completo en
+memoria.
+
+Nota: el flujo aleatorio no es el de np.random.seed(42) del notebook; para
+reproducir exactamente dataset_phishing.csv use pipeline_phishing.py.
+
+Uso:
+    python generador_dataset.py dataset_grande.csv --filas 1e8 --procesos 8
+    python generador_dataset.py dataset_grande.phcol --filas 1e9
+
+Requisitos: pip install numpy
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from esquema_phishing import COLUMNAS, OBJETIVO, PROPORCION_LEGITIMOS, SEMILLA
+
+FILAS_POR_FRAGMENTO = 1_000_000
+
+# (media, desviación) de cada indicador continuo, tal como en el notebook
+DISTRIBUCIONES = {
+    'legitimo': {
+        'remitente_sospechoso': (2, 1.5),
+        'dominio_sospechoso': (1.5, 1.2),
+        'tono_urgencia': (2, 1.5),
+        'solicita_info': (1, 1.2),
+        'errores_gramaticales': (1, 1),
+        'oferta_irreal': (0.5, 0.8)
+    },
+    'phishing': {
+        'remitente_sospechoso': (7, 2),
+        'dominio_sospechoso': (7.5, 1.8),
+        'tono_urgencia': (7.5, 1.5),
+        'solicita_info': (7, 2),
+        'errores_gramaticales': (6, 2),
+        'oferta_irreal': (6.5, 2)
+    }
+}
+
+# Probabilidad de contener URL en cada clase
+PROB_URL = {'legitimo': 0.6, 'phishing': 0.9}
+
+
+def particion(n_filas, filas_por_fragmento=FILAS_POR_FRAGMENTO):
+    """Lista de (índice, filas) de cada fragmento"""
+    return [(i, min(filas_por_fragmento, n_filas - inicio))
+            for i, inicio in enumerate(range(0, n_filas, filas_por_fragmento))]
+
+
+def generar_fragmento(indice, n_filas, semilla=SEMILLA, proporcion_legitimos=PROPORCION_LEGITIMOS):
+    """Genera un fragmento como diccionario columna → arreglo
+
+    Los indicadores continuos son float64 redondeados a un decimal y las
+    columnas binarias son uint8.
+    """
+    rng = np.random.default_rng(np.random.SeedSequence(semilla, spawn_key=(indice,)))
+    n_legitimos = int(n_filas * proporcion_legitimos)
+    cantidades = {'legitimo': n_legitimos, 'phishing': n_filas - n_legitimos}
+
+    partes = {col: [] for col in COLUMNAS}
+    for clase, n in cantidades.items():
+        for col, (media, desviacion) in DISTRIBUCIONES[clase].items():
+            partes[col].append(rng.normal(media, desviacion, n).clip(0, 10))
+        partes['contiene_url'].append((rng.random(n) < PROB_URL[clase]).astype(np.uint8))
+        partes[OBJETIVO].append(np.full(n, clase == 'phishing', dtype=np.uint8))
+
+    orden = rng.permutation(n_filas)
+    fragmento = {}
+    for col in COLUMNAS:
+        valores = np.concatenate(partes[col])[orden]
+        if valores.dtype != np.uint8:
+            valores = valores.round(1)
+        fragmento[col] = valores
+    return fragmento
+
+
+# Texto de cada valor de la rejilla 0.0-10.0; formatear con una tabla es
+# mucho más rápido que float_format de pandas y da el mismo resultado
+_TEXTO_DECIMAL = np.array([f'{k / 10:.1f}' for k in range(101)], dtype=object)
+_TEXTO_BINARIO = np.array(['0', '1'], dtype=object)
+
+
+def fragmento_a_csv(fragmento, columnas_csv=COLUMNAS):
+    """Texto CSV (sin encabezado) de un fragmento, con un decimal en los indicadores
+
+    Los valores continuos deben estar en la rejilla 0.0-10.0 (ver en_rejilla).
+    """
+    columnas = []
+    for col in columnas_csv:
+        valores = fragmento[col]
+        if valores.dtype == np.uint8:
+            columnas.append(_TEXTO_BINARIO[valores])
+        else:
+            columnas.append(_TEXTO_DECIMAL[np.rint(valores * 10).astype(np.intp)])
+    return ('\n'.join(map(','.join, zip(*columnas))) + '\n').encode('ascii')
+
+
+def en_rejilla(valores):
+    """Verdadero si todos los valores son múltiplos de 0.1 entre 0 y 10"""
+    valores = np.asarray(valores, dtype=np.float64)
+    decimas = np.rint(valores * 10)
+    return bool(np.all((decimas >= 0) & (decimas <= 100) & (np.abs(valores * 10 - decimas) < 1e-3)))
+
+
+def _tarea_csv(argumentos):
+    indice, n_filas, semilla, proporcion = argumentos
+    return n_filas, fragmento_a_csv(generar_fragmento(indice, n_filas, semilla, proporcion))
+
+
+def _tarea_columnar(argumentos):
+    from formato_columnar import tipo_columna
+
+    indice, n_filas, semilla, proporcion = argumentos
+    fragmento = generar_fragmento(indice, n_filas, semilla, proporcion)
+    return n_filas, {col: valores.astype(tipo_columna(col)) for col, valores in fragmento.items()}
+
+
+def generar_en_paralelo(tarea, n_filas, procesos=None, semilla=SEMILLA,
+                        proporcion_legitimos=PROPORCION_LEGITIMOS,
+                        filas_por_fragmento=FILAS_POR_FRAGMENTO):
+    """Itera en orden sobre los resultados de `tarea` para cada fragmento
+
+    Mantiene como mucho 2 × procesos fragmentos en vuelo para acotar la
+    memoria aunque el consumidor sea más lento que los productores.
+    """
+    procesos = procesos or os.cpu_count() or 1
+    trabajos = [(i, n, semilla, proporcion_legitimos)
+                for i, n in particion(n_filas, filas_por_fragmento)]
+
+    if procesos == 1:
+        for trabajo in trabajos:
+            yield tarea(trabajo)
+        return
+
+    ventana = 2 * procesos
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        pendientes = [pool.submit(tarea, t) for t in trabajos[:ventana]]
+        siguiente = len(pendientes)
+        while pendientes:
+            resultado = pendientes.pop(0).result()
+            if siguiente < len(trabajos):
+                pendientes.append(pool.submit(tarea, trabajos[siguiente]))
+                siguiente += 1
+            yield resultado
+
+
+def _progreso(escritas, n_filas, inicio):
+    transcurrido = time.perf_counter() - inicio
+    print(f"  ⏱️  {escritas:>14,d} / {n_filas:,d} filas  "
+          f"{escritas / transcurrido:>12,.0f} filas/s", file=sys.stderr, flush=True)
+
+
+def generar_csv(ruta, n_filas, procesos=None, semilla=SEMILLA,
+                proporcion_legitimos=PROPORCION_LEGITIMOS,
+                filas_por_fragmento=FILAS_POR_FRAGMENTO, progreso=True):
+    """Escribe el dataset en CSV fragmento a fragmento y devuelve su SHA-256"""
+    huella = hashlib.sha256()
+    inicio = time.perf_counter()
+    escritas = 0
+
+    with open(ruta, 'wb') as f:
+        encabezado = (','.join(COLUMNAS) + '\n').encode('ascii')
+        f.write(encabezado)
+        huella.update(encabezado)
+        for n, texto in generar_en_paralelo(_tarea_csv, n_filas, procesos, semilla,
+                                            proporcion_legitimos, filas_por_fragmento):
+            f.write(texto)
+            huella.update(texto)
+            escritas += n
+            if progreso:
+                _progreso(escritas, n_filas, inicio)
+
+    return huella.hexdigest()
+
+
+def generar_columnar(ruta, n_filas, procesos=None, semilla=SEMILLA,
+                     proporcion_legitimos=PROPORCION_LEGITIMOS,
+                     filas_por_fragmento=FILAS_POR_FRAGMENTO, progreso=True):
+    """Escribe el dataset en formato columnar y devuelve el SHA-256 de sus columnas"""
+    from formato_columnar import EscritorColumnar
+
+    huella = hashlib.sha256()
+    inicio = time.perf_counter()
+    escritas = 0
+
+    with EscritorColumnar(ruta, COLUMNAS) as escritor:
+        for n, fragmento in generar_en_paralelo(_tarea_columnar, n_filas, procesos, semilla,
+                                                proporcion_legitimos, filas_por_fragmento):
+            escritor.agregar(fragmento)
+            for col in COLUMNAS:
+                huella.update(fragmento[col].tobytes())
+            escritas += n
+            if progreso:
+                _progreso(escritas, n_filas, inicio)
+
+    return huella.hexdigest()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Genera el dataset sintético de phishing en paralelo y por fragmentos')
+    parser.add_argument('salida', help='Archivo CSV o directorio .phcol de salida')
+    parser.add_argument('--filas', type=float, default=1e6, help='Número de filas (acepta 1e8)')
+    parser.add_argument('--procesos', type=int, default=None, help='Procesos (por defecto, todos los núcleos)')
+    parser.add_argument('--semilla', type=int, default=SEMILLA)
+    parser.add_argument('--proporcion-legitimos', type=float, default=PROPORCION_LEGITIMOS)
+    parser.add_argument('--filas-por-fragmento', type=int, default=FILAS_POR_FRAGMENTO)
+    args = parser.parse_args(argv)
+
+    n_filas = int(args.filas)
+    print(f"🔍 Generando {n_filas:,d} mensajes en '{args.salida}'...")
+    inicio = time.perf_counter()
+    generar = generar_columnar if args.salida.rstrip('/\\').endswith('.phcol') else generar_csv
+    huella = generar(args.salida, n_filas, args.procesos, args.semilla,
+                     args.proporcion_legitimos, args.filas_por_fragmento)
+    total = time.perf_counter() - inicio
+    print(f"✅ {n_filas:,d} filas en {total:.2f} s ({n_filas / total:,.0f} filas/s)")
+    print(f"🔑 SHA-256: {huella}")
+
+
+if __name__ == "__main__":
+    main()
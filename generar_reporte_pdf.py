@@ -2,691 +2,531 @@
 Script para generar el reporte en PDF de la Actividad 9
 Árbol de Decisión - Aprobación de Créditos Bancarios
 
-Requisitos: pip install reportlab pillow pandas numpy scikit-learn
+El contenido se declara en PLANTILLA y lo arma plantillas_reporte.py.
+
+Requisitos: pip install reportlab pillow
 """
 
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib import colors
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT
-from reportlab.pdfgen import canvas
 from datetime import datetime
 import os
-import pandas as pd
-import numpy as np
+
+# Colores de título y subtítulo (ver recursos_reporte.estilos_reporte)
+COLORES_ESTILO = ('#1a5490', '#2c5aa0')
 
 def crear_portada(c, width, height):
-    """Crea la portada del reporte"""
+    """Crea la portada del reporte (el motor la dibuja sola en la primera página)"""
     # Fondo con color
     c.setFillColorRGB(0.2, 0.3, 0.5)
     c.rect(0, 0, width, height, fill=True)
-    
+
     # Título principal
     c.setFillColorRGB(1, 1, 1)
     c.setFont("Helvetica-Bold", 32)
     c.drawCentredString(width/2, height-150, "ACTIVIDAD 9")
-    
+
     c.setFont("Helvetica-Bold", 24)
     c.drawCentredString(width/2, height-200, "Árbol de Decisión")
-    
+
     c.setFont("Helvetica", 20)
     c.drawCentredString(width/2, height-250, "Predicción de Aprobación de Créditos")
     c.drawCentredString(width/2, height-280, "Bancarios")
-    
+
     # Línea decorativa
     c.setStrokeColorRGB(1, 1, 1)
     c.setLineWidth(2)
     c.line(100, height-320, width-100, height-320)
-    
+
     # Información del estudiante
     c.setFont("Helvetica", 14)
     c.drawCentredString(width/2, height-380, "Inteligencia Artificial")
     c.drawCentredString(width/2, height-405, "Semestre 10")
-    
+
     # Fecha
     c.setFont("Helvetica", 12)
     fecha_actual = datetime.now().strftime("%d de %B de %Y")
     c.drawCentredString(width/2, height-480, f"Fecha: {fecha_actual}")
-    
+
     # Institución
     c.setFont("Helvetica-Bold", 14)
     c.drawCentredString(width/2, 80, "Instituto Tecnológico de Morelia")
-    
-    c.showPage()
 
-def generar_reporte():
-    """Genera el reporte completo en PDF"""
-    
-    # Configurar el documento
-    nombre_archivo = f"Reporte_Actividad9_ArbolDecision_{datetime.now().strftime('%Y%m%d')}.pdf"
-    doc = SimpleDocTemplate(nombre_archivo, pagesize=letter,
-                           rightMargin=50, leftMargin=50,
-                           topMargin=50, bottomMargin=50)
-    
-    # Crear lista de elementos
-    elementos = []
-    
-    # Estilos
-    estilos = getSampleStyleSheet()
-    
-    # Estilo personalizado para títulos
-    estilo_titulo = ParagraphStyle(
-        'CustomTitle',
-        parent=estilos['Heading1'],
-        fontSize=18,
-        textColor=colors.HexColor('#1a5490'),
-        spaceAfter=20,
-        alignment=TA_LEFT,
-        fontName='Helvetica-Bold'
-    )
-    
-    estilo_subtitulo = ParagraphStyle(
-        'CustomSubtitle',
-        parent=estilos['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor('#2c5aa0'),
-        spaceAfter=12,
-        spaceBefore=12,
-        fontName='Helvetica-Bold'
-    )
-    
-    estilo_normal = ParagraphStyle(
-        'CustomNormal',
-        parent=estilos['Normal'],
-        fontSize=11,
-        alignment=TA_JUSTIFY,
-        spaceAfter=10
-    )
-    
-    # PÁGINA 1: ÍNDICE
-    elementos.append(Paragraph("ÍNDICE", estilo_titulo))
-    elementos.append(Spacer(1, 0.2*inch))
-    
-    contenido_indice = [
-        "1. Introducción y Objetivos",
-        "2. Dataset y Variables",
-        "3. Análisis Exploratorio de Datos",
-        "4. Desarrollo del Modelo",
-        "5. Visualización del Árbol de Decisión",
-        "6. Interpretación y Explicación del Árbol",
-        "7. Evaluación del Modelo",
-        "8. Ejemplos de Predicción",
-        "9. Conclusiones y Hallazgos",
-        "10. Referencias"
-    ]
-    
-    for i, item in enumerate(contenido_indice, 1):
-        elementos.append(Paragraph(f"<b>{item}</b>", estilo_normal))
-        elementos.append(Spacer(1, 0.1*inch))
-    
-    elementos.append(PageBreak())
-    
-    # PÁGINA 2: INTRODUCCIÓN
-    elementos.append(Paragraph("1. INTRODUCCIÓN Y OBJETIVOS", estilo_titulo))
-    elementos.append(Spacer(1, 0.2*inch))
-    
-    intro_text = """
-    Este reporte presenta el desarrollo completo de un modelo de <b>Árbol de Decisión</b> para 
-    la predicción de aprobación de créditos bancarios, utilizando técnicas de <b>Aprendizaje 
-    Supervisado (Machine Learning)</b>.
-    """
-    elementos.append(Paragraph(intro_text, estilo_normal))
-    elementos.append(Spacer(1, 0.15*inch))
-    
-    elementos.append(Paragraph("1.1 Objetivos Específicos", estilo_subtitulo))
-    
-    objetivos = [
-        "Generar un dataset sintético de más de 1000 registros sobre aprobación de créditos",
-        "Utilizar al menos 3 variables independientes para la predicción",
-        "Definir claramente la variable objetivo (dependiente)",
-        "Crear, entrenar y visualizar un modelo de árbol de decisión",
-        "Interpretar y explicar el árbol generado",
-        "Evaluar el rendimiento del modelo con métricas apropiadas"
-    ]
-    
-    for objetivo in objetivos:
-        elementos.append(Paragraph(f"• {objetivo}", estilo_normal))
-    
-    elementos.append(PageBreak())
-    
-    # PÁGINA 3: DATASET Y VARIABLES
-    elementos.append(Paragraph("2. DATASET Y VARIABLES", estilo_titulo))
-    elementos.append(Spacer(1, 0.2*inch))
-    
-    elementos.append(Paragraph("2.1 Descripción del Problema", estilo_subtitulo))
-    problema_text = """
-    El problema abordado consiste en predecir si un cliente será <b>aprobado o rechazado</b> 
-    para un crédito bancario, basándose en sus características financieras y personales. 
-    Este es un problema de <b>clasificación binaria</b> típico en el sector financiero.
-    """
-    elementos.append(Paragraph(problema_text, estilo_normal))
-    elementos.append(Spacer(1, 0.15*inch))
-    
-    elementos.append(Paragraph("2.2 Variables del Modelo", estilo_subtitulo))
-    
-    # Tabla de variables independientes
-    elementos.append(Paragraph("<b>Variables Independientes (Predictoras):</b>", estilo_normal))
-    elementos.append(Spacer(1, 0.1*inch))
-    
-    data_variables = [
-        ['Variable', 'Descripción', 'Tipo', 'Rango'],
-        ['Ingreso Mensual', 'Ingreso mensual del solicitante', 'Numérica continua', '$5,000 - $150,000'],
-        ['Puntuación Crediticia', 'Score crediticio del cliente', 'Numérica continua', '300 - 850'],
-        ['Años de Empleo', 'Antigüedad en empleo actual', 'Numérica continua', '0 - 40 años'],
-        ['Deuda Actual', 'Monto total de deuda', 'Numérica continua', '$0 - $500,000'],
-        ['Edad', 'Edad del solicitante', 'Numérica continua', '18 - 75 años']
-    ]
-    
-    tabla_variables = Table(data_variables, colWidths=[1.5*inch, 2*inch, 1.3*inch, 1.5*inch])
-    tabla_variables.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a5490')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey])
-    ]))
-    
-    elementos.append(tabla_variables)
-    elementos.append(Spacer(1, 0.2*inch))
-    
-    # Variable dependiente
-    elementos.append(Paragraph("<b>Variable Dependiente (Objetivo):</b>", estilo_normal))
-    elementos.append(Spacer(1, 0.1*inch))
-    
-    data_objetivo = [
-        ['Variable', 'Descripción', 'Tipo', 'Valores'],
-        ['Aprobado', 'Decisión de aprobación del crédito', 'Categórica binaria', '0 = Rechazado\\n1 = Aprobado']
-    ]
-    
-    tabla_objetivo = Table(data_objetivo, colWidths=[1.5*inch, 2.5*inch, 1.5*inch, 1.8*inch])
-    tabla_objetivo.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a5490')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightgreen),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('FONTSIZE', (0, 1), (-1, -1), 9)
-    ]))
-    
-    elementos.append(tabla_objetivo)
-    elementos.append(Spacer(1, 0.15*inch))
-    
-    # Información del dataset
-    elementos.append(Paragraph("2.3 Características del Dataset", estilo_subtitulo))
-    dataset_info = f"""
-    El dataset generado contiene <b>1,200 registros</b> sintéticos que simulan solicitudes 
-    reales de crédito bancario. Los datos fueron generados utilizando distribuciones 
-    estadísticas apropiadas para cada variable, asegurando realismo y variabilidad.
-    
-    La <b>función objetivo</b> que determina la aprobación considera múltiples factores 
-    ponderados: puntuación crediticia (35%), relación deuda/ingreso (30%), años de 
-    empleo (20%), y edad (15%). Se agregó un 5% de ruido aleatorio para simular la 
-    variabilidad del mundo real.
-    """
-    elementos.append(Paragraph(dataset_info, estilo_normal))
-    
-    elementos.append(PageBreak())
-    
-    # PÁGINA 4: ANÁLISIS EXPLORATORIO
-    elementos.append(Paragraph("3. ANÁLISIS EXPLORATORIO DE DATOS", estilo_titulo))
-    elementos.append(Spacer(1, 0.2*inch))
-    
-    eda_text = """
-    El análisis exploratorio de datos (EDA) es fundamental para comprender la distribución 
-    y relaciones entre las variables antes de construir el modelo.
-    """
-    elementos.append(Paragraph(eda_text, estilo_normal))
-    elementos.append(Spacer(1, 0.15*inch))
-    
-    # Verificar si existe la imagen
-    if os.path.exists('01_analisis_exploratorio.png'):
-        elementos.append(Paragraph("3.1 Distribuciones de las Variables", estilo_subtitulo))
-        img = Image('01_analisis_exploratorio.png', width=6.5*inch, height=4*inch)
-        elementos.append(img)
-        elementos.append(Spacer(1, 0.1*inch))
-        
-        eda_desc = """
-        <b>Observaciones clave:</b><br/>
-        • El ingreso mensual muestra una distribución aproximadamente normal con media alrededor de $25,000<br/>
-        • La puntuación crediticia se concentra entre 600-700 puntos<br/>
-        • Los años de empleo siguen una distribución exponencial, con muchos empleados nuevos<br/>
-        • La deuda actual es muy variable, reflejando diferentes situaciones financieras<br/>
-        • La edad se distribuye normalmente alrededor de los 38 años<br/>
-        • La distribución de aprobación está relativamente balanceada
-        """
-        elementos.append(Paragraph(eda_desc, estilo_normal))
-    
-    elementos.append(PageBreak())
-    
-    # PÁGINA 5: MATRIZ DE CORRELACIÓN
-    if os.path.exists('02_matriz_correlacion.png'):
-        elementos.append(Paragraph("3.2 Matriz de Correlación", estilo_subtitulo))
-        elementos.append(Spacer(1, 0.1*inch))
-        
-        img = Image('02_matriz_correlacion.png', width=5.5*inch, height=4.5*inch)
-        elementos.append(img)
-        elementos.append(Spacer(1, 0.1*inch))
-        
-        corr_desc = """
-        La matriz de correlación muestra las relaciones lineales entre las variables. 
-        Las correlaciones más relevantes con la variable objetivo (aprobado) son:
-        
-        • <b>Puntuación crediticia</b>: Correlación positiva fuerte - A mayor score, mayor probabilidad de aprobación<br/>
-        • <b>Deuda actual</b>: Correlación negativa - A mayor deuda, menor probabilidad de aprobación<br/>
-        • <b>Ingreso mensual</b>: Correlación positiva moderada<br/>
-        • <b>Años de empleo</b>: Correlación positiva leve - La estabilidad laboral ayuda
-        """
-        elementos.append(Paragraph(corr_desc, estilo_normal))
-    
-    elementos.append(PageBreak())
-    
-    # PÁGINA 6: DESARROLLO DEL MODELO
-    elementos.append(Paragraph("4. DESARROLLO DEL MODELO", estilo_titulo))
-    elementos.append(Spacer(1, 0.2*inch))
-    
-    elementos.append(Paragraph("4.1 Algoritmo Seleccionado", estilo_subtitulo))
-    algoritmo_text = """
-    Se utilizó el algoritmo de <b>Árbol de Decisión (Decision Tree Classifier)</b>, 
-    que es una técnica de aprendizaje supervisado ideal para problemas de clasificación.
-    
-    <b>Ventajas del Árbol de Decisión:</b><br/>
-    • Fácil de entender e interpretar (modelo de caja blanca)<br/>
-    • No requiere normalización de datos<br/>
-    • Puede manejar variables numéricas y categóricas<br/>
-    • Captura relaciones no lineales<br/>
-    • Permite identificar las variables más importantes<br/>
-    • Las decisiones pueden explicarse mediante reglas lógicas
-    """
-    elementos.append(Paragraph(algoritmo_text, estilo_normal))
-    elementos.append(Spacer(1, 0.15*inch))
-    
-    elementos.append(Paragraph("4.2 Configuración del Modelo", estilo_subtitulo))
-    config_text = """
-    <b>Hiperparámetros utilizados:</b><br/>
-    • <b>max_depth = 5</b>: Profundidad máxima del árbol (evita sobreajuste)<br/>
-    • <b>min_samples_split = 50</b>: Mínimo de muestras requeridas para dividir un nodo<br/>
-    • <b>min_samples_leaf = 20</b>: Mínimo de muestras en cada nodo hoja<br/>
-    • <b>criterion = 'gini'</b>: Índice de Gini para medir la calidad de las divisiones<br/>
-    • <b>random_state = 42</b>: Semilla para reproducibilidad
-    """
-    elementos.append(Paragraph(config_text, estilo_normal))
-    elementos.append(Spacer(1, 0.15*inch))
-    
-    elementos.append(Paragraph("4.3 División de Datos", estilo_subtitulo))
-    division_text = """
-    El dataset se dividió en dos conjuntos:<br/>
-    • <b>Conjunto de entrenamiento (80%)</b>: 960 registros para entrenar el modelo<br/>
-    • <b>Conjunto de prueba (20%)</b>: 240 registros para evaluar el rendimiento<br/>
-    
-    Se utilizó estratificación para mantener la misma proporción de clases en ambos conjuntos.
-    """
-    elementos.append(Paragraph(division_text, estilo_normal))
-    
-    elementos.append(PageBreak())
-    
-    # PÁGINA 7: VISUALIZACIÓN DEL ÁRBOL
-    elementos.append(Paragraph("5. VISUALIZACIÓN DEL ÁRBOL DE DECISIÓN", estilo_titulo))
-    elementos.append(Spacer(1, 0.2*inch))
-    
-    vis_intro = """
-    El árbol de decisión generado proporciona una representación visual clara del proceso 
-    de toma de decisiones del modelo.
-    """
-    elementos.append(Paragraph(vis_intro, estilo_normal))
-    elementos.append(Spacer(1, 0.15*inch))
-    
-    if os.path.exists('06_arbol_decision_simplificado.png'):
-        elementos.append(Paragraph("5.1 Estructura del Árbol", estilo_subtitulo))
-        elementos.append(Spacer(1, 0.1*inch))
-        
-        img = Image('06_arbol_decision_simplificado.png', width=7*inch, height=5*inch)
-        elementos.append(img)
-        elementos.append(Spacer(1, 0.1*inch))
-        
-        arbol_desc = """
-        <b>Interpretación de los nodos:</b><br/>
-        • <b>Nodo superior</b>: Contiene la condición de división<br/>
-        • <b>gini</b>: Índice de impureza (0 = puro, 0.5 = máxima mezcla)<br/>
-        • <b>samples</b>: Cantidad de registros en ese nodo<br/>
-        • <b>value</b>: [rechazados, aprobados]<br/>
-        • <b>class</b>: Decisión mayoritaria<br/>
-        • <b>Color</b>: Azul (rechazado) u Naranja (aprobado), intensidad según pureza
-        """
-        elementos.append(Paragraph(arbol_desc, estilo_normal))
-    
-    elementos.append(PageBreak())
-    
-    # PÁGINA 8: IMPORTANCIA DE CARACTERÍSTICAS
-    if os.path.exists('04_importancia_caracteristicas.png'):
-        elementos.append(Paragraph("5.2 Importancia de las Características", estilo_subtitulo))
-        elementos.append(Spacer(1, 0.1*inch))
-        
-        img = Image('04_importancia_caracteristicas.png', width=6*inch, height=3.5*inch)
-        elementos.append(img)
-        elementos.append(Spacer(1, 0.1*inch))
-        
-        imp_desc = """
-        El gráfico muestra la <b>importancia relativa</b> de cada variable en las decisiones del modelo. 
-        Los valores más altos indican mayor influencia en la predicción.
-        
-        <b>Análisis:</b><br/>
-        La <b>puntuación crediticia</b> es el factor más determinante, seguida de la relación entre 
-        deuda e ingreso. Los años de empleo y la edad tienen menor peso pero siguen siendo relevantes 
-        para casos específicos.
-        """
-        elementos.append(Paragraph(imp_desc, estilo_normal))
-    
-    elementos.append(PageBreak())
-    
-    # PÁGINA 9: INTERPRETACIÓN
-    elementos.append(Paragraph("6. INTERPRETACIÓN Y EXPLICACIÓN DEL ÁRBOL", estilo_titulo))
-    elementos.append(Spacer(1, 0.2*inch))
-    
-    elementos.append(Paragraph("6.1 Lógica de Decisión", estilo_subtitulo))
-    logica_text = """
-    El árbol de decisión funciona mediante una serie de <b>decisiones consecutivas</b> que 
-    dividen los datos en grupos cada vez más puros (homogéneos). Cada división se realiza 
-    en la característica y umbral que mejor separa las clases.
-    
-    <b>Proceso de clasificación:</b><br/>
-    1. Se evalúa la primera condición en el nodo raíz<br/>
-    2. Según el resultado, se sigue por la rama izquierda (≤) o derecha (>)<br/>
-    3. Se repite el proceso en cada nodo hasta llegar a una hoja<br/>
-    4. La hoja determina la clasificación final (Aprobado o Rechazado)
-    """
-    elementos.append(Paragraph(logica_text, estilo_normal))
-    elementos.append(Spacer(1, 0.15*inch))
-    
-    elementos.append(Paragraph("6.2 Reglas Principales Identificadas", estilo_subtitulo))
-    reglas_text = """
-    <b>Regla 1 - Alta probabilidad de aprobación:</b><br/>
-    SI puntuacion_crediticia > 700 Y deuda_actual < 50000 Y años_empleo > 5<br/>
-    ENTONCES → APROBADO (alta confianza)
-    
-    <b>Regla 2 - Alta probabilidad de rechazo:</b><br/>
-    SI puntuacion_crediticia < 550 O (deuda_actual > 200000 Y ingreso_mensual < 20000)<br/>
-    ENTONCES → RECHAZADO (alta confianza)
-    
-    <b>Regla 3 - Caso intermedio:</b><br/>
-    SI 550 < puntuacion_crediticia < 700 Y relación_deuda_ingreso < 0.5<br/>
-    ENTONCES → Depende de años_empleo y edad
-    """
-    elementos.append(Paragraph(reglas_text, estilo_normal))
-    elementos.append(Spacer(1, 0.15*inch))
-    
-    elementos.append(Paragraph("6.3 Patrones Descubiertos", estilo_subtitulo))
-    patrones_text = """
-    El modelo identificó los siguientes patrones clave en la aprobación de créditos:
-    
-    <b>Factores positivos (aumentan probabilidad de aprobación):</b><br/>
-    • Score crediticio superior a 700<br/>
-    • Relación deuda/ingreso menor al 30%<br/>
-    • Más de 5 años de antigüedad laboral<br/>
-    • Edad entre 25-55 años<br/>
-    • Ingreso mensual superior a $30,000
-    
-    <b>Factores negativos (disminuyen probabilidad de aprobación):</b><br/>
-    • Score crediticio inferior a 550<br/>
-    • Deuda que supera 2 veces el ingreso anual<br/>
-    • Menos de 1 año de antigüedad laboral<br/>
-    • Ingresos bajos con deuda alta
-    """
-    elementos.append(Paragraph(patrones_text, estilo_normal))
-    
-    elementos.append(PageBreak())
-    
-    # PÁGINA 10: EVALUACIÓN
-    elementos.append(Paragraph("7. EVALUACIÓN DEL MODELO", estilo_titulo))
-    elementos.append(Spacer(1, 0.2*inch))
-    
-    elementos.append(Paragraph("7.1 Métricas de Rendimiento", estilo_subtitulo))
-    
-    # Nota: Estos valores son aproximados, se calcularán realmente al ejecutar el notebook
-    metricas_text = """
-    El modelo fue evaluado utilizando múltiples métricas estándar de clasificación:
-    
-    <b>Exactitud (Accuracy):</b><br/>
-    • Entrenamiento: ~88%<br/>
-    • Prueba: ~85%<br/>
-    • Interpretación: El modelo acierta en aproximadamente 85 de cada 100 predicciones
-    
-    <b>Precisión (Precision):</b><br/>
-    • Mide qué porcentaje de los aprobados realmente deberían serlo<br/>
-    • Alta precisión reduce préstamos a clientes riesgosos
-    
-    <b>Recall (Sensibilidad):</b><br/>
-    • Mide qué porcentaje de los buenos clientes son identificados<br/>
-    • Alto recall asegura no perder buenos clientes
-    
-    <b>F1-Score:</b><br/>
-    • Balance entre precisión y recall<br/>
-    • Útil cuando las clases están desbalanceadas
-    """
-    elementos.append(Paragraph(metricas_text, estilo_normal))
-    elementos.append(Spacer(1, 0.15*inch))
-    
-    if os.path.exists('03_matriz_confusion.png'):
-        elementos.append(Paragraph("7.2 Matriz de Confusión", estilo_subtitulo))
-        elementos.append(Spacer(1, 0.1*inch))
-        
-        img = Image('03_matriz_confusion.png', width=4.5*inch, height=3.5*inch)
-        elementos.append(img)
-        elementos.append(Spacer(1, 0.1*inch))
-        
-        mc_desc = """
-        La matriz de confusión muestra el desglose de predicciones correctas e incorrectas:
-        
-        • <b>Verdaderos Negativos (TN)</b>: Rechazados correctamente<br/>
-        • <b>Verdaderos Positivos (TP)</b>: Aprobados correctamente<br/>
-        • <b>Falsos Positivos (FP)</b>: Rechazados predichos como aprobados (Error Tipo I)<br/>
-        • <b>Falsos Negativos (FN)</b>: Aprobados predichos como rechazados (Error Tipo II)
-        """
-        elementos.append(Paragraph(mc_desc, estilo_normal))
-    
-    elementos.append(PageBreak())
-    
-    # PÁGINA 11: EJEMPLOS DE PREDICCIÓN
-    elementos.append(Paragraph("8. EJEMPLOS DE PREDICCIÓN", estilo_titulo))
-    elementos.append(Spacer(1, 0.2*inch))
-    
-    ejemplos_intro = """
-    Para demostrar el funcionamiento del modelo, se presentan tres casos de ejemplo con 
-    diferentes perfiles de clientes:
-    """
-    elementos.append(Paragraph(ejemplos_intro, estilo_normal))
-    elementos.append(Spacer(1, 0.15*inch))
-    
-    # Caso 1
-    elementos.append(Paragraph("8.1 Cliente 1 - Perfil Excelente", estilo_subtitulo))
-    caso1 = """
-    <b>Características:</b><br/>
-    • Ingreso mensual: $45,000<br/>
-    • Puntuación crediticia: 750<br/>
-    • Años de empleo: 8 años<br/>
-    • Deuda actual: $30,000<br/>
-    • Edad: 35 años
-    
-    <b>Predicción del modelo:</b> <font color="green"><b>APROBADO ✓</b></font><br/>
-    <b>Probabilidad de aprobación:</b> 92%<br/>
-    <b>Razón:</b> Excelente score crediticio, ingresos altos, baja relación deuda/ingreso (6.7%), 
-    y estabilidad laboral comprobada.
-    """
-    elementos.append(Paragraph(caso1, estilo_normal))
-    elementos.append(Spacer(1, 0.15*inch))
-    
-    # Caso 2
-    elementos.append(Paragraph("8.2 Cliente 2 - Perfil Regular", estilo_subtitulo))
-    caso2 = """
-    <b>Características:</b><br/>
-    • Ingreso mensual: $18,000<br/>
-    • Puntuación crediticia: 620<br/>
-    • Años de empleo: 3.5 años<br/>
-    • Deuda actual: $80,000<br/>
-    • Edad: 28 años
-    
-    <b>Predicción del modelo:</b> <font color="orange"><b>APROBADO (Condicional)</b></font><br/>
-    <b>Probabilidad de aprobación:</b> 58%<br/>
-    <b>Razón:</b> Score crediticio aceptable, pero alta relación deuda/ingreso (37%). 
-    La aprobación sería con condiciones especiales.
-    """
-    elementos.append(Paragraph(caso2, estilo_normal))
-    elementos.append(Spacer(1, 0.15*inch))
-    
-    # Caso 3
-    elementos.append(Paragraph("8.3 Cliente 3 - Perfil Riesgoso", estilo_subtitulo))
-    caso3 = """
-    <b>Características:</b><br/>
-    • Ingreso mensual: $12,000<br/>
-    • Puntuación crediticia: 480<br/>
-    • Años de empleo: 0.5 años<br/>
-    • Deuda actual: $150,000<br/>
-    • Edad: 22 años
-    
-    <b>Predicción del modelo:</b> <font color="red"><b>RECHAZADO ✗</b></font><br/>
-    <b>Probabilidad de aprobación:</b> 18%<br/>
-    <b>Razón:</b> Score crediticio bajo, relación deuda/ingreso muy alta (104%), 
-    poca estabilidad laboral y edad joven sin historial establecido.
-    """
-    elementos.append(Paragraph(caso3, estilo_normal))
-    
-    elementos.append(PageBreak())
-    
-    # PÁGINA 12: CONCLUSIONES
-    elementos.append(Paragraph("9. CONCLUSIONES Y HALLAZGOS", estilo_titulo))
-    elementos.append(Spacer(1, 0.2*inch))
-    
-    elementos.append(Paragraph("9.1 Principales Hallazgos", estilo_subtitulo))
-    hallazgos_text = """
-    <b>1. Factores Determinantes:</b><br/>
-    El modelo identificó que la <b>puntuación crediticia</b> es el factor más importante 
-    (aproximadamente 40% de influencia), seguido de la <b>relación deuda/ingreso</b> (30%) 
-    y los <b>años de empleo</b> (20%).
-    
-    <b>2. Patrones de Aprobación:</b><br/>
-    Clientes con score superior a 700, deuda menor al 30% de sus ingresos anuales, y más 
-    de 5 años de empleo tienen una probabilidad superior al 90% de aprobación.
-    
-    <b>3. Rendimiento del Modelo:</b><br/>
-    El árbol de decisión alcanzó una <b>exactitud del 85%</b> en el conjunto de prueba, 
-    demostrando capacidad de generalización adecuada sin sobreajuste significativo.
-    
-    <b>4. Interpretabilidad:</b><br/>
-    Una ventaja clave del modelo es su <b>transparencia total</b>. Cada decisión puede 
-    rastrearse a través del árbol, permitiendo explicar a los clientes exactamente por 
-    qué fueron aprobados o rechazados.
-    
-    <b>5. Aplicabilidad Práctica:</b><br/>
-    El modelo puede integrarse en sistemas de decisión automática para pre-aprobaciones 
-    rápidas, reservando la evaluación humana para casos ambiguos (probabilidades 40-60%).
-    """
-    elementos.append(Paragraph(hallazgos_text, estilo_normal))
-    elementos.append(Spacer(1, 0.15*inch))
-    
-    elementos.append(Paragraph("9.2 Ventajas del Enfoque Utilizado", estilo_subtitulo))
-    ventajas_text = """
-    • <b>Transparencia:</b> Las decisiones son explicables y auditables<br/>
-    • <b>Eficiencia:</b> Predicciones instantáneas<br/>
-    • <b>Objetividad:</b> Elimina sesgos humanos<br/>
-    • <b>Escalabilidad:</b> Puede procesar miles de solicitudes<br/>
-    • <b>Consistencia:</b> Mismos criterios para todos los clientes
-    """
-    elementos.append(Paragraph(ventajas_text, estilo_normal))
-    elementos.append(Spacer(1, 0.15*inch))
-    
-    elementos.append(Paragraph("9.3 Limitaciones y Mejoras Futuras", estilo_subtitulo))
-    limitaciones_text = """
-    <b>Limitaciones:</b><br/>
-    • El modelo se basa en datos sintéticos; requiere validación con datos reales<br/>
-    • No considera factores cualitativos (entrevistas, referencias)<br/>
-    • Puede ser sensible a cambios en las condiciones económicas
-    
-    <b>Mejoras propuestas:</b><br/>
-    • Incorporar más variables (historial de pagos, tipo de empleo, educación)<br/>
-    • Experimentar con Random Forest para mejorar la exactitud<br/>
-    • Implementar validación cruzada para evaluar robustez<br/>
-    • Añadir ajuste de hiperparámetros mediante Grid Search
-    """
-    elementos.append(Paragraph(limitaciones_text, estilo_normal))
-    elementos.append(Spacer(1, 0.15*inch))
-    
-    elementos.append(Paragraph("9.4 Conclusión Final", estilo_subtitulo))
-    conclusion_final = """
-    El desarrollo de este modelo de árbol de decisión para la predicción de aprobación de 
-    créditos bancarios demuestra la efectividad del <b>aprendizaje supervisado</b> en 
-    problemas de clasificación del mundo real.
-    
-    El modelo cumple satisfactoriamente con todos los objetivos planteados: utiliza múltiples 
-    variables predictoras, genera decisiones interpretables, y alcanza un nivel de precisión 
-    adecuado para aplicaciones prácticas.
-    
-    La capacidad de <b>explicar cada decisión</b> hace que este enfoque sea particularmente 
-    valioso en el sector financiero, donde la transparencia y la responsabilidad son 
-    fundamentales. Los clientes pueden comprender por qué fueron aprobados o rechazados, 
-    y qué necesitan mejorar para futuras solicitudes.
-    """
-    elementos.append(Paragraph(conclusion_final, estilo_normal))
-    
-    elementos.append(PageBreak())
-    
-    # PÁGINA 13: REFERENCIAS
-    elementos.append(Paragraph("10. REFERENCIAS", estilo_titulo))
-    elementos.append(Spacer(1, 0.2*inch))
-    
-    referencias = [
-        "Scikit-learn Documentation. (2024). Decision Trees. Retrieved from https://scikit-learn.org/stable/modules/tree.html",
-        "Breiman, L., Friedman, J., Stone, C. J., & Olshen, R. A. (1984). Classification and Regression Trees. CRC press.",
-        "James, G., Witten, D., Hastie, T., & Tibshirani, R. (2021). An Introduction to Statistical Learning. Springer.",
-        "Géron, A. (2022). Hands-On Machine Learning with Scikit-Learn, Keras, and TensorFlow. O'Reilly Media.",
-        "Pedregosa, F., et al. (2011). Scikit-learn: Machine Learning in Python. JMLR 12, pp. 2825-2830.",
-        "Quinlan, J. R. (1986). Induction of decision trees. Machine Learning, 1(1), 81-106."
+PLANTILLA = {
+    'nombre': 'credito',
+    'colores': COLORES_ESTILO,
+    'portada': crear_portada,
+    'secciones': [
+        # PÁGINA 1: ÍNDICE
+        {'nombre': 'indice', 'bloques': [
+            ('titulo', "ÍNDICE"),
+            ('indice', [
+                "1. Introducción y Objetivos",
+                "2. Dataset y Variables",
+                "3. Análisis Exploratorio de Datos",
+                "4. Desarrollo del Modelo",
+                "5. Visualización del Árbol de Decisión",
+                "6. Interpretación y Explicación del Árbol",
+                "7. Evaluación del Modelo",
+                "8. Ejemplos de Predicción",
+                "9. Conclusiones y Hallazgos",
+                "10. Referencias"
+            ]),
+            ('salto',)
+        ]},
+
+        # PÁGINA 2: INTRODUCCIÓN
+        {'nombre': 'introduccion', 'bloques': [
+            ('titulo', "1. INTRODUCCIÓN Y OBJETIVOS"),
+            ('parrafo', """
+            Este reporte presenta el desarrollo completo de un modelo de <b>Árbol de Decisión</b> para
+            la predicción de aprobación de créditos bancarios, utilizando técnicas de <b>Aprendizaje
+            Supervisado (Machine Learning)</b>.
+            """),
+            ('espacio', 0.15),
+            ('subtitulo', "1.1 Objetivos Específicos"),
+            ('vinetas', [
+                "Generar un dataset sintético de más de 1000 registros sobre aprobación de créditos",
+                "Utilizar al menos 3 variables independientes para la predicción",
+                "Definir claramente la variable objetivo (dependiente)",
+                "Crear, entrenar y visualizar un modelo de árbol de decisión",
+                "Interpretar y explicar el árbol generado",
+                "Evaluar el rendimiento del modelo con métricas apropiadas"
+            ]),
+            ('salto',)
+        ]},
+
+        # PÁGINA 3: DATASET Y VARIABLES
+        {'nombre': 'dataset', 'bloques': [
+            ('titulo', "2. DATASET Y VARIABLES"),
+            ('subtitulo', "2.1 Descripción del Problema"),
+            ('parrafo', """
+            El problema abordado consiste en predecir si un cliente será <b>aprobado o rechazado</b>
+            para un crédito bancario, basándose en sus características financieras y personales.
+            Este es un problema de <b>clasificación binaria</b> típico en el sector financiero.
+            """),
+            ('espacio', 0.15),
+            ('subtitulo', "2.2 Variables del Modelo"),
+            ('parrafo', "<b>Variables Independientes (Predictoras):</b>"),
+            ('espacio', 0.1),
+            ('tabla', [
+                ['Variable', 'Descripción', 'Tipo', 'Rango'],
+                ['Ingreso Mensual', 'Ingreso mensual del solicitante', 'Numérica continua', '$5,000 - $150,000'],
+                ['Puntuación Crediticia', 'Score crediticio del cliente', 'Numérica continua', '300 - 850'],
+                ['Años de Empleo', 'Antigüedad en empleo actual', 'Numérica continua', '0 - 40 años'],
+                ['Deuda Actual', 'Monto total de deuda', 'Numérica continua', '$0 - $500,000'],
+                ['Edad', 'Edad del solicitante', 'Numérica continua', '18 - 75 años']
+            ], [1.5, 2, 1.3, 1.5], {'fondo': 'beige', 'filas_alternas': True}),
+            ('espacio', 0.2),
+            ('parrafo', "<b>Variable Dependiente (Objetivo):</b>"),
+            ('espacio', 0.1),
+            ('tabla', [
+                ['Variable', 'Descripción', 'Tipo', 'Valores'],
+                ['Aprobado', 'Decisión de aprobación del crédito', 'Categórica binaria', '0 = Rechazado\\n1 = Aprobado']
+            ], [1.5, 2.5, 1.5, 1.8], {'fondo': 'lightgreen'}),
+            ('espacio', 0.15),
+            ('subtitulo', "2.3 Características del Dataset"),
+            ('parrafo', """
+            El dataset generado contiene <b>1,200 registros</b> sintéticos que simulan solicitudes
+            reales de crédito bancario. Los datos fueron generados utilizando distribuciones
+            estadísticas apropiadas para cada variable, asegurando realismo y variabilidad.
+
+            La <b>función objetivo</b> que determina la aprobación considera múltiples factores
+            ponderados: puntuación crediticia (35%), relación deuda/ingreso (30%), años de
+            empleo (20%), y edad (15%). Se agregó un 5% de ruido aleatorio para simular la
+            variabilidad del mundo real.
+            """),
+            ('salto',)
+        ]},
+
+        # PÁGINAS 4 Y 5: ANÁLISIS EXPLORATORIO Y CORRELACIÓN
+        {'nombre': 'exploratorio', 'bloques': [
+            ('titulo', "3. ANÁLISIS EXPLORATORIO DE DATOS"),
+            ('parrafo', """
+            El análisis exploratorio de datos (EDA) es fundamental para comprender la distribución
+            y relaciones entre las variables antes de construir el modelo.
+            """),
+            ('espacio', 0.15),
+            ('si_existe', ['01_analisis_exploratorio.png'], [
+                ('subtitulo', "3.1 Distribuciones de las Variables"),
+                ('imagen', '01_analisis_exploratorio.png', 6.5, 4),
+                ('espacio', 0.1),
+                ('parrafo', """
+                <b>Observaciones clave:</b><br/>
+                • El ingreso mensual muestra una distribución aproximadamente normal con media alrededor de $25,000<br/>
+                • La puntuación crediticia se concentra entre 600-700 puntos<br/>
+                • Los años de empleo siguen una distribución exponencial, con muchos empleados nuevos<br/>
+                • La deuda actual es muy variable, reflejando diferentes situaciones financieras<br/>
+                • La edad se distribuye normalmente alrededor de los 38 años<br/>
+                • La distribución de aprobación está relativamente balanceada
+                """)
+            ]),
+            ('salto',),
+            ('si_existe', ['02_matriz_correlacion.png'], [
+                ('subtitulo', "3.2 Matriz de Correlación"),
+                ('espacio', 0.1),
+                ('imagen', '02_matriz_correlacion.png', 5.5, 4.5),
+                ('espacio', 0.1),
+                ('parrafo', """
+                La matriz de correlación muestra las relaciones lineales entre las variables.
+                Las correlaciones más relevantes con la variable objetivo (aprobado) son:
+
+                • <b>Puntuación crediticia</b>: Correlación positiva fuerte - A mayor score, mayor probabilidad de aprobación<br/>
+                • <b>Deuda actual</b>: Correlación negativa - A mayor deuda, menor probabilidad de aprobación<br/>
+                • <b>Ingreso mensual</b>: Correlación positiva moderada<br/>
+                • <b>Años de empleo</b>: Correlación positiva leve - La estabilidad laboral ayuda
+                """)
+            ]),
+            ('salto',)
+        ]},
+
+        # PÁGINA 6: DESARROLLO DEL MODELO
+        {'nombre': 'modelo', 'bloques': [
+            ('titulo', "4. DESARROLLO DEL MODELO"),
+            ('subtitulo', "4.1 Algoritmo Seleccionado"),
+            ('parrafo', """
+            Se utilizó el algoritmo de <b>Árbol de Decisión (Decision Tree Classifier)</b>,
+            que es una técnica de aprendizaje supervisado ideal para problemas de clasificación.
+
+            <b>Ventajas del Árbol de Decisión:</b><br/>
+            • Fácil de entender e interpretar (modelo de caja blanca)<br/>
+            • No requiere normalización de datos<br/>
+            • Puede manejar variables numéricas y categóricas<br/>
+            • Captura relaciones no lineales<br/>
+            • Permite identificar las variables más importantes<br/>
+            • Las decisiones pueden explicarse mediante reglas lógicas
+            """),
+            ('espacio', 0.15),
+            ('subtitulo', "4.2 Configuración del Modelo"),
+            ('parrafo', """
+            <b>Hiperparámetros utilizados:</b><br/>
+            • <b>max_depth = 5</b>: Profundidad máxima del árbol (evita sobreajuste)<br/>
+            • <b>min_samples_split = 50</b>: Mínimo de muestras requeridas para dividir un nodo<br/>
+            • <b>min_samples_leaf = 20</b>: Mínimo de muestras en cada nodo hoja<br/>
+            • <b>criterion = 'gini'</b>: Índice de Gini para medir la calidad de las divisiones<br/>
+            • <b>random_state = 42</b>: Semilla para reproducibilidad
+            """),
+            ('espacio', 0.15),
+            ('subtitulo', "4.3 División de Datos"),
+            ('parrafo', """
+            El dataset se dividió en dos conjuntos:<br/>
+            • <b>Conjunto de entrenamiento (80%)</b>: 960 registros para entrenar el modelo<br/>
+            • <b>Conjunto de prueba (20%)</b>: 240 registros para evaluar el rendimiento<br/>
+
+            Se utilizó estratificación para mantener la misma proporción de clases en ambos conjuntos.
+            """),
+            ('salto',)
+        ]},
+
+        # PÁGINAS 7 Y 8: VISUALIZACIÓN DEL ÁRBOL E IMPORTANCIA
+        {'nombre': 'visualizacion', 'bloques': [
+            ('titulo', "5. VISUALIZACIÓN DEL ÁRBOL DE DECISIÓN"),
+            ('parrafo', """
+            El árbol de decisión generado proporciona una representación visual clara del proceso
+            de toma de decisiones del modelo.
+            """),
+            ('espacio', 0.15),
+            # Árbol vectorial exportado desde el notebook con artefacto_modelo.exportar_modelo
+            ('si_existe', ['modelo_credito.phtree', '06_arbol_decision_simplificado.png'], [
+                ('subtitulo', "5.1 Estructura del Árbol"),
+                ('espacio', 0.1),
+                ('arbol', 'modelo_credito.phtree', '06_arbol_decision_simplificado.png',
+                 ['Rechazado', 'Aprobado'], 7, 5),
+                ('espacio', 0.1),
+                ('parrafo', """
+                <b>Interpretación de los nodos:</b><br/>
+                • <b>Nodo superior</b>: Contiene la condición de división<br/>
+                • <b>gini</b>: Índice de impureza (0 = puro, 0.5 = máxima mezcla)<br/>
+                • <b>samples</b>: Cantidad de registros en ese nodo<br/>
+                • <b>value</b>: [rechazados, aprobados]<br/>
+                • <b>class</b>: Decisión mayoritaria<br/>
+                • <b>Color</b>: Naranja (rechazado) o Azul (aprobado), intensidad según pureza
+                """)
+            ]),
+            ('salto',),
+            ('si_existe', ['04_importancia_caracteristicas.png'], [
+                ('subtitulo', "5.2 Importancia de las Características"),
+                ('espacio', 0.1),
+                ('imagen', '04_importancia_caracteristicas.png', 6, 3.5),
+                ('espacio', 0.1),
+                ('parrafo', """
+                El gráfico muestra la <b>importancia relativa</b> de cada variable en las decisiones del modelo.
+                Los valores más altos indican mayor influencia en la predicción.
+
+                <b>Análisis:</b><br/>
+                La <b>puntuación crediticia</b> es el factor más determinante, seguida de la relación entre
+                deuda e ingreso. Los años de empleo y la edad tienen menor peso pero siguen siendo relevantes
+                para casos específicos.
+                """)
+            ]),
+            ('salto',)
+        ]},
+
+        # PÁGINA 9: INTERPRETACIÓN
+        {'nombre': 'interpretacion', 'bloques': [
+            ('titulo', "6. INTERPRETACIÓN Y EXPLICACIÓN DEL ÁRBOL"),
+            ('subtitulo', "6.1 Lógica de Decisión"),
+            ('parrafo', """
+            El árbol de decisión funciona mediante una serie de <b>decisiones consecutivas</b> que
+            dividen los datos en grupos cada vez más puros (homogéneos). Cada división se realiza
+            en la característica y umbral que mejor separa las clases.
+
+            <b>Proceso de clasificación:</b><br/>
+            1. Se evalúa la primera condición en el nodo raíz<br/>
+            2. Según el resultado, se sigue por la rama izquierda (≤) o derecha (>)<br/>
+            3. Se repite el proceso en cada nodo hasta llegar a una hoja<br/>
+            4. La hoja determina la clasificación final (Aprobado o Rechazado)
+            """),
+            ('espacio', 0.15),
+            ('subtitulo', "6.2 Reglas Principales Identificadas"),
+            ('parrafo', """
+            <b>Regla 1 - Alta probabilidad de aprobación:</b><br/>
+            SI puntuacion_crediticia > 700 Y deuda_actual < 50000 Y años_empleo > 5<br/>
+            ENTONCES → APROBADO (alta confianza)
+
+            <b>Regla 2 - Alta probabilidad de rechazo:</b><br/>
+            SI puntuacion_crediticia < 550 O (deuda_actual > 200000 Y ingreso_mensual < 20000)<br/>
+            ENTONCES → RECHAZADO (alta confianza)
+
+            <b>Regla 3 - Caso intermedio:</b><br/>
+            SI 550 < puntuacion_crediticia < 700 Y relación_deuda_ingreso < 0.5<br/>
+            ENTONCES → Depende de años_empleo y edad
+            """),
+            ('espacio', 0.15),
+            ('subtitulo', "6.3 Patrones Descubiertos"),
+            ('parrafo', """
+            El modelo identificó los siguientes patrones clave en la aprobación de créditos:
+
+            <b>Factores positivos (aumentan probabilidad de aprobación):</b><br/>
+            • Score crediticio superior a 700<br/>
+            • Relación deuda/ingreso menor al 30%<br/>
+            • Más de 5 años de antigüedad laboral<br/>
+            • Edad entre 25-55 años<br/>
+            • Ingreso mensual superior a $30,000
+
+            <b>Factores negativos (disminuyen probabilidad de aprobación):</b><br/>
+            • Score crediticio inferior a 550<br/>
+            • Deuda que supera 2 veces el ingreso anual<br/>
+            • Menos de 1 año de antigüedad laboral<br/>
+            • Ingresos bajos con deuda alta
+            """),
+            ('salto',)
+        ]},
+
+        # PÁGINA 10: EVALUACIÓN
+        {'nombre': 'evaluacion', 'bloques': [
+            ('titulo', "7. EVALUACIÓN DEL MODELO"),
+            ('subtitulo', "7.1 Métricas de Rendimiento"),
+            # Nota: Estos valores son aproximados, se calcularán realmente al ejecutar el notebook
+            ('parrafo', """
+            El modelo fue evaluado utilizando múltiples métricas estándar de clasificación:
+
+            <b>Exactitud (Accuracy):</b><br/>
+            • Entrenamiento: ~88%<br/>
+            • Prueba: ~85%<br/>
+            • Interpretación: El modelo acierta en aproximadamente 85 de cada 100 predicciones
+
+            <b>Precisión (Precision):</b><br/>
+            • Mide qué porcentaje de los aprobados realmente deberían serlo<br/>
+            • Alta precisión reduce préstamos a clientes riesgosos
+
+            <b>Recall (Sensibilidad):</b><br/>
+            • Mide qué porcentaje de los buenos clientes son identificados<br/>
+            • Alto recall asegura no perder buenos clientes
+
+            <b>F1-Score:</b><br/>
+            • Balance entre precisión y recall<br/>
+            • Útil cuando las clases están desbalanceadas
+            """),
+            ('espacio', 0.15),
+            ('si_existe', ['03_matriz_confusion.png'], [
+                ('subtitulo', "7.2 Matriz de Confusión"),
+                ('espacio', 0.1),
+                ('imagen', '03_matriz_confusion.png', 4.5, 3.5),
+                ('espacio', 0.1),
+                ('parrafo', """
+                La matriz de confusión muestra el desglose de predicciones correctas e incorrectas:
+
+                • <b>Verdaderos Negativos (TN)</b>: Rechazados correctamente<br/>
+                • <b>Verdaderos Positivos (TP)</b>: Aprobados correctamente<br/>
+                • <b>Falsos Positivos (FP)</b>: Rechazados predichos como aprobados (Error Tipo I)<br/>
+                • <b>Falsos Negativos (FN)</b>: Aprobados predichos como rechazados (Error Tipo II)
+                """)
+            ]),
+            ('salto',)
+        ]},
+
+        # PÁGINA 11: EJEMPLOS DE PREDICCIÓN
+        {'nombre': 'ejemplos', 'bloques': [
+            ('titulo', "8. EJEMPLOS DE PREDICCIÓN"),
+            ('parrafo', """
+            Para demostrar el funcionamiento del modelo, se presentan tres casos de ejemplo con
+            diferentes perfiles de clientes:
+            """),
+            ('espacio', 0.15),
+            ('subtitulo', "8.1 Cliente 1 - Perfil Excelente"),
+            ('parrafo', """
+            <b>Características:</b><br/>
+            • Ingreso mensual: $45,000<br/>
+            • Puntuación crediticia: 750<br/>
+            • Años de empleo: 8 años<br/>
+            • Deuda actual: $30,000<br/>
+            • Edad: 35 años
+
+            <b>Predicción del modelo:</b> <font color="green"><b>APROBADO ✓</b></font><br/>
+            <b>Probabilidad de aprobación:</b> 92%<br/>
+            <b>Razón:</b> Excelente score crediticio, ingresos altos, baja relación deuda/ingreso (6.7%),
+            y estabilidad laboral comprobada.
+            """),
+            ('espacio', 0.15),
+            ('subtitulo', "8.2 Cliente 2 - Perfil Regular"),
+            ('parrafo', """
+            <b>Características:</b><br/>
+            • Ingreso mensual: $18,000<br/>
+            • Puntuación crediticia: 620<br/>
+            • Años de empleo: 3.5 años<br/>
+            • Deuda actual: $80,000<br/>
+            • Edad: 28 años
+
+            <b>Predicción del modelo:</b> <font color="orange"><b>APROBADO (Condicional)</b></font><br/>
+            <b>Probabilidad de aprobación:</b> 58%<br/>
+            <b>Razón:</b> Score crediticio aceptable, pero alta relación deuda/ingreso (37%).
+            La aprobación sería con condiciones especiales.
+            """),
+            ('espacio', 0.15),
+            ('subtitulo', "8.3 Cliente 3 - Perfil Riesgoso"),
+            ('parrafo', """
+            <b>Características:</b><br/>
+            • Ingreso mensual: $12,000<br/>
+            • Puntuación crediticia: 480<br/>
+            • Años de empleo: 0.5 años<br/>
+            • Deuda actual: $150,000<br/>
+            • Edad: 22 años
+
+            <b>Predicción del modelo:</b> <font color="red"><b>RECHAZADO ✗</b></font><br/>
+            <b>Probabilidad de aprobación:</b> 18%<br/>
+            <b>Razón:</b> Score crediticio bajo, relación deuda/ingreso muy alta (104%),
+            poca estabilidad laboral y edad joven sin historial establecido.
+            """),
+            ('salto',)
+        ]},
+
+        # PÁGINA 12: CONCLUSIONES
+        {'nombre': 'conclusiones', 'bloques': [
+            ('titulo', "9. CONCLUSIONES Y HALLAZGOS"),
+            ('subtitulo', "9.1 Principales Hallazgos"),
+            ('parrafo', """
+            <b>1. Factores Determinantes:</b><br/>
+            El modelo identificó que la <b>puntuación crediticia</b> es el factor más importante
+            (aproximadamente 40% de influencia), seguido de la <b>relación deuda/ingreso</b> (30%)
+            y los <b>años de empleo</b> (20%).
+
+            <b>2. Patrones de Aprobación:</b><br/>
+            Clientes con score superior a 700, deuda menor al 30% de sus ingresos anuales, y más
+            de 5 años de empleo tienen una probabilidad superior al 90% de aprobación.
+
+            <b>3. Rendimiento del Modelo:</b><br/>
+            El árbol de decisión alcanzó una <b>exactitud del 85%</b> en el conjunto de prueba,
+            demostrando capacidad de generalización adecuada sin sobreajuste significativo.
+
+            <b>4. Interpretabilidad:</b><br/>
+            Una ventaja clave del modelo es su <b>transparencia total</b>. Cada decisión puede
+            rastrearse a través del árbol, permitiendo explicar a los clientes exactamente por
+            qué fueron aprobados o rechazados.
+
+            <b>5. Aplicabilidad Práctica:</b><br/>
+            El modelo puede integrarse en sistemas de decisión automática para pre-aprobaciones
+            rápidas, reservando la evaluación humana para casos ambiguos (probabilidades 40-60%).
+            """),
+            ('espacio', 0.15),
+            ('subtitulo', "9.2 Ventajas del Enfoque Utilizado"),
+            ('parrafo', """
+            • <b>Transparencia:</b> Las decisiones son explicables y auditables<br/>
+            • <b>Eficiencia:</b> Predicciones instantáneas<br/>
+            • <b>Objetividad:</b> Elimina sesgos humanos<br/>
+            • <b>Escalabilidad:</b> Puede procesar miles de solicitudes<br/>
+            • <b>Consistencia:</b> Mismos criterios para todos los clientes
+            """),
+            ('espacio', 0.15),
+            ('subtitulo', "9.3 Limitaciones y Mejoras Futuras"),
+            ('parrafo', """
+            <b>Limitaciones:</b><br/>
+            • El modelo se basa en datos sintéticos; requiere validación con datos reales<br/>
+            • No considera factores cualitativos (entrevistas, referencias)<br/>
+            • Puede ser sensible a cambios en las condiciones económicas
+
+            <b>Mejoras propuestas:</b><br/>
+            • Incorporar más variables (historial de pagos, tipo de empleo, educación)<br/>
+            • Experimentar con Random Forest para mejorar la exactitud<br/>
+            • Implementar validación cruzada para evaluar robustez<br/>
+            • Añadir ajuste de hiperparámetros mediante Grid Search
+            """),
+            ('espacio', 0.15),
+            ('subtitulo', "9.4 Conclusión Final"),
+            ('parrafo', """
+            El desarrollo de este modelo de árbol de decisión para la predicción de aprobación de
+            créditos bancarios demuestra la efectividad del <b>aprendizaje supervisado</b> en
+            problemas de clasificación del mundo real.
+
+            El modelo cumple satisfactoriamente con todos los objetivos planteados: utiliza múltiples
+            variables predictoras, genera decisiones interpretables, y alcanza un nivel de precisión
+            adecuado para aplicaciones prácticas.
+
+            La capacidad de <b>explicar cada decisión</b> hace que este enfoque sea particularmente
+            valioso en el sector financiero, donde la transparencia y la responsabilidad son
+            fundamentales. Los clientes pueden comprender por qué fueron aprobados o rechazados,
+            y qué necesitan mejorar para futuras solicitudes.
+            """),
+            ('salto',)
+        ]},
+
+        # PÁGINA 13: REFERENCIAS
+        {'nombre': 'referencias', 'bloques': [
+            ('titulo', "10. REFERENCIAS"),
+            ('referencias', [
+                "Scikit-learn Documentation. (2024). Decision Trees. Retrieved from https://scikit-learn.org/stable/modules/tree.html",
+                "Breiman, L., Friedman, J., Stone, C. J., & Olshen, R. A. (1984). Classification and Regression Trees. CRC press.",
+                "James, G., Witten, D., Hastie, T., & Tibshirani, R. (2021). An Introduction to Statistical Learning. Springer.",
+                "Géron, A. (2022). Hands-On Machine Learning with Scikit-Learn, Keras, and TensorFlow. O'Reilly Media.",
+                "Pedregosa, F., et al. (2011). Scikit-learn: Machine Learning in Python. JMLR 12, pp. 2825-2830.",
+                "Quinlan, J. R. (1986). Induction of decision trees. Machine Learning, 1(1), 81-106."
+            ]),
+            ('espacio', 0.3),
+            # Pie de página final
+            ('parrafo', "─" * 80),
+            ('espacio', 0.1),
+            ('parrafo', """
+            <b>Nota técnica:</b> Este reporte fue generado automáticamente como parte de la Actividad 9
+            del curso de Inteligencia Artificial. Todos los datos utilizados son sintéticos y
+            con fines educativos. El código fuente completo está disponible en el notebook Jupyter
+            adjunto: <i>arbol_decision_credito.ipynb</i>
+            """)
+        ]}
     ]
-    
-    for i, ref in enumerate(referencias, 1):
-        elementos.append(Paragraph(f"[{i}] {ref}", estilo_normal))
-        elementos.append(Spacer(1, 0.08*inch))
-    
-    elementos.append(Spacer(1, 0.3*inch))
-    
-    # Pie de página final
-    elementos.append(Paragraph("─" * 80, estilo_normal))
-    elementos.append(Spacer(1, 0.1*inch))
-    final_note = """
-    <b>Nota técnica:</b> Este reporte fue generado automáticamente como parte de la Actividad 9 
-    del curso de Inteligencia Artificial. Todos los datos utilizados son sintéticos y 
-    con fines educativos. El código fuente completo está disponible en el notebook Jupyter 
-    adjunto: <i>arbol_decision_credito.ipynb</i>
+}
+
+def generar_reporte(forzar=False):
+    """Genera el reporte completo en PDF
+
+    No guarda huellas de sus entradas: siempre se reconstruye (`forzar` se
+    acepta por compatibilidad con generar_reporte_phishing.py).
     """
-    elementos.append(Paragraph(final_note, estilo_normal))
-    
-    # Construir el PDF
-    def agregar_portada(canvas, doc):
-        canvas.saveState()
-        crear_portada(canvas, letter[0], letter[1])
-        canvas.restoreState()
-    
+    # reportlab se importa dentro del motor: importar el módulo o pedir --help no lo carga
+    from plantillas_reporte import construir
+
+    nombre_archivo = f"Reporte_Actividad9_ArbolDecision_{datetime.now().strftime('%Y%m%d')}.pdf"
+
     # Construir PDF con portada
     print("📄 Generando reporte en PDF...")
-    doc.build(elementos, onFirstPage=agregar_portada)
+    construir(PLANTILLA, {}, nombre_archivo)
     print(f"✅ Reporte generado exitosamente: {nombre_archivo}")
-    
+
     return nombre_archivo
 
-if __name__ == "__main__":
+def main():
     print("\n" + "="*80)
     print("GENERADOR DE REPORTE PDF - ACTIVIDAD 9")
     print("Árbol de Decisión - Aprobación de Créditos")
     print("="*80 + "\n")
-    
+
     try:
         archivo_generado = generar_reporte()
         print(f"\n✓ El archivo '{archivo_generado}' ha sido creado exitosamente.")
@@ -699,3 +539,6 @@ if __name__ == "__main__":
         print("  1. Hayas instalado reportlab: pip install reportlab pillow")
         print("  2. Hayas ejecutado el notebook para generar las imágenes")
         print("  3. Los archivos de imágenes estén en el directorio actual")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+Manifiesto de métricas y reglas para el reporte de phishing
+
+La etapa `manifiesto` del pipeline escribe manifiesto_phishing.json con todo
+lo que el reporte PDF necesita del entrenamiento: tamaño y composición del
+dataset, división, hiperparámetros, métricas, matriz de confusión,
+importancias, reglas del árbol y la predicción de los mensajes de ejemplo.
+generar_reporte_phishing.py sólo lee este archivo, así que después de
+reentrenar basta con volver a generar el PDF.
+
+También calcula las huellas (SHA-256) de las entradas del reporte para que
+el generador pueda omitir doc.build cuando nada cambió.
+
+Uso:
+    python manifiesto_reporte.py                 (genera el manifiesto con el pipeline)
+    python manifiesto_reporte.py --mostrar
+
+Requisitos: pip install numpy pandas scikit-learn (sólo para construirlo)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+
+from esquema_phishing import CARACTERISTICAS, OBJETIVO
+
+ARCHIVO_MANIFIESTO = 'manifiesto_phishing.json'
+VERSION_MANIFIESTO = 1
+
+# Indicadores de los ejemplos de la sección 8 del reporte
+EJEMPLOS = {
+    'phishing_clasico': {'remitente_sospechoso': 8, 'contiene_url': 1, 'dominio_sospechoso': 9,
+                         'tono_urgencia': 10, 'solicita_info': 10, 'errores_gramaticales': 8,
+                         'oferta_irreal': 7},
+    'legitimo': {'remitente_sospechoso': 1, 'contiene_url': 1, 'dominio_sospechoso': 0,
+                 'tono_urgencia': 1, 'solicita_info': 0, 'errores_gramaticales': 0,
+                 'oferta_irreal': 0}
+}
+
+
+def extraer_reglas(arbol):
+    """Una regla por hoja (de izquierda a derecha) con sus condiciones, clase y confianza"""
+    reglas = []
+    pendientes = [(0, [])]
+    while pendientes:
+        nodo, condiciones = pendientes.pop()
+        izquierdo, derecho = int(arbol.izquierdo[nodo]), int(arbol.derecho[nodo])
+        if izquierdo == nodo:
+            probabilidades = arbol.probabilidades[nodo]
+            indice = int(probabilidades.argmax())
+            reglas.append({
+                'condiciones': condiciones,
+                'clase': arbol.clases[indice].item(),
+                'confianza': float(probabilidades[indice]),
+                'muestras': None if arbol.muestras is None else int(arbol.muestras[nodo])
+            })
+            continue
+        nombre = arbol.nombres_caracteristicas[int(arbol.caracteristica[nodo])]
+        umbral = float(arbol.umbral[nodo])
+        # Se apila primero la derecha para recorrer la izquierda antes
+        pendientes.append((derecho, condiciones + [[nombre, '>', umbral]]))
+        pendientes.append((izquierdo, condiciones + [[nombre, '<=', umbral]]))
+    return reglas
+
+
+def describir_nodos(arbol):
+    """Condición, hijos, muestras y probabilidad de phishing de cada nodo (preorden)"""
+    nodos = []
+    for nodo in range(arbol.n_nodos):
+        hoja = int(arbol.izquierdo[nodo]) == nodo
+        nodos.append({
+            'caracteristica': None if hoja else arbol.nombres_caracteristicas[int(arbol.caracteristica[nodo])],
+            'umbral': None if hoja else float(arbol.umbral[nodo]),
+            'izquierdo': None if hoja else int(arbol.izquierdo[nodo]),
+            'derecho': None if hoja else int(arbol.derecho[nodo]),
+            'muestras': None if arbol.muestras is None else int(arbol.muestras[nodo]),
+            'prob_phishing': float(arbol.probabilidades[nodo, -1])
+        })
+    return nodos
+
+
+def construir_manifiesto(df, division, modelo, metricas, parametros):
+    """Diccionario serializable con los resultados que muestra el reporte"""
+    import numpy as np
+
+    from motor_inferencia import compilar_arbol
+
+    arbol = compilar_arbol(modelo, CARACTERISTICAS)
+    y = df[OBJETIVO].to_numpy()
+    correlaciones = df[CARACTERISTICAS + [OBJETIVO]].corr()[OBJETIVO]
+    (vn, fp), (fn, vp) = metricas['matriz_confusion']
+    # Precisión, recall y F1 de la clase phishing, que es la que describe el reporte
+    phishing = metricas['reporte_clasificacion'][str(arbol.clases[-1])]
+
+    ejemplos = {}
+    for nombre, indicadores in EJEMPLOS.items():
+        etiquetas, prob_phishing = arbol.puntuar({k: np.array([v], dtype=np.float32)
+                                                  for k, v in indicadores.items()})
+        ejemplos[nombre] = {'indicadores': indicadores, 'etiqueta': etiquetas[0].item(),
+                            'prob_phishing': float(prob_phishing[0])}
+
+    return {
+        'version': VERSION_MANIFIESTO,
+        'dataset': {
+            'n_registros': int(len(df)),
+            'n_legitimos': int((y == 0).sum()),
+            'n_phishing': int((y == 1).sum()),
+            'semilla': parametros['semilla'],
+            'url_phishing': float(df.loc[y == 1, 'contiene_url'].mean()),
+            'url_legitimo': float(df.loc[y == 0, 'contiene_url'].mean()),
+            'correlaciones': {col: float(correlaciones[col]) for col in CARACTERISTICAS}
+        },
+        'division': {
+            'test_size': parametros['test_size'],
+            'n_entrenamiento': metricas['n_entrenamiento'],
+            'n_prueba': metricas['n_prueba']
+        },
+        'modelo': {
+            'parametros': parametros['modelo'],
+            'n_nodos': metricas['n_nodos'],
+            'n_hojas': metricas['n_hojas'],
+            'profundidad': metricas['profundidad']
+        },
+        'metricas': {
+            'accuracy_train': metricas['accuracy_train'],
+            'accuracy_test': metricas['accuracy_test'],
+            'precision': float(phishing['precision']),
+            'recall': float(phishing['recall']),
+            'f1': float(phishing['f1-score']),
+            'matriz_confusion': {'vn': int(vn), 'fp': int(fp), 'fn': int(fn), 'vp': int(vp)}
+        },
+        'importancias': sorted(([n, float(v)] for n, v in metricas['importancias']),
+                               key=lambda par: par[1], reverse=True),
+        'nodos': describir_nodos(arbol),
+        'reglas': extraer_reglas(arbol),
+        'ejemplos': ejemplos
+    }
+
+
+def escribir_manifiesto(manifiesto, ruta=ARCHIVO_MANIFIESTO):
+    temporal = ruta + '.tmp'
+    with open(temporal, 'w', encoding='utf-8') as f:
+        json.dump(manifiesto, f, indent=2, ensure_ascii=False)
+    os.replace(temporal, ruta)
+    return ruta
+
+
+def generar_manifiesto(directorio='.'):
+    """Ejecuta el pipeline hasta la etapa `manifiesto` en `directorio`"""
+    from pipeline_phishing import PipelinePhishing
+
+    PipelinePhishing(directorio_salida=directorio, verbose=False).ejecutar(hasta='manifiesto')
+    return os.path.join(directorio, ARCHIVO_MANIFIESTO)
+
+
+def cargar_manifiesto(ruta=ARCHIVO_MANIFIESTO):
+    """Lee el manifiesto; si no existe lanza FileNotFoundError con el comando que lo genera"""
+    if not os.path.exists(ruta):
+        directorio = os.path.dirname(ruta)
+        comando = 'python pipeline_phishing.py --hasta manifiesto' + (f' --salida {directorio}' if directorio else '')
+        raise FileNotFoundError(f"No existe el manifiesto '{ruta}'. Genérelo con: {comando}")
+    with open(ruta, encoding='utf-8') as f:
+        manifiesto = json.load(f)
+    if manifiesto.get('version', 0) > VERSION_MANIFIESTO:
+        raise ValueError(f"Versión de manifiesto no soportada: {manifiesto['version']}")
+    return manifiesto
+
+
+# ============================================
+# HUELLAS DE LAS ENTRADAS DEL REPORTE
+# ============================================
+
+def huella_archivo(ruta):
+    """SHA-256 del contenido de un archivo, o None si no existe"""
+    if not os.path.exists(ruta):
+        return None
+    huella = hashlib.sha256()
+    with open(ruta, 'rb') as f:
+        for bloque in iter(lambda: f.read(1 << 20), b''):
+            huella.update(bloque)
+    return huella.hexdigest()
+
+
+def huellas_entradas(rutas):
+    """Nombre de archivo → SHA-256 (None si falta) para cada entrada"""
+    return {ruta: huella_archivo(ruta) for ruta in rutas}
+
+
+def leer_huellas(ruta):
+    if not os.path.exists(ruta):
+        return None
+    with open(ruta, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def escribir_huellas(ruta, pdf, huellas):
+    temporal = ruta + '.tmp'
+    with open(temporal, 'w', encoding='utf-8') as f:
+        json.dump({'pdf': pdf, 'entradas': huellas}, f, indent=2, sort_keys=True)
+    os.replace(temporal, ruta)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Manifiesto de métricas y reglas del reporte de phishing')
+    parser.add_argument('--ruta', default=ARCHIVO_MANIFIESTO)
+    parser.add_argument('--mostrar', action='store_true', help='Imprimir el manifiesto')
+    args = parser.parse_args(argv)
+
+    if not args.mostrar:
+        generar_manifiesto(os.path.dirname(args.ruta) or '.')
+    manifiesto = cargar_manifiesto(args.ruta)
+    if args.mostrar:
+        print(json.dumps(manifiesto, indent=2, ensure_ascii=False))
+    else:
+        metricas = manifiesto['metricas']
+        print(f"✅ '{args.ruta}': exactitud en prueba {metricas['accuracy_test']*100:.2f}%, "
+              f"{len(manifiesto['reglas'])} reglas")
+
+
+if __name__ == "__main__":
+    main()
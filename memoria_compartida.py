@@ -0,0 +1,84 @@
+"""
+Arreglos de NumPy en memoria compartida para pools de procesos
+
+El proceso principal copia cada arreglo una sola vez a un segmento de
+multiprocessing.shared_memory y reparte sólo un descriptor pequeño
+(nombre del segmento, forma y tipo). Los procesos trabajadores se adjuntan
+a los segmentos en su inicializador y ven los mismos datos sin que se
+serialicen en cada tarea.
+
+Uso:
+    with ArreglosCompartidos({'X': X, 'y': y}) as compartidos:
+        with ProcessPoolExecutor(initializer=inicializar,
+                                 initargs=(compartidos.descriptor,)) as pool:
+            ...
+
+    def inicializar(descriptor):
+        global DATOS
+        DATOS = adjuntar(descriptor)
+
+Requisitos: pip install numpy
+"""
+
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Segmentos adjuntos en este proceso; se guardan para que no se liberen
+# mientras existan vistas de NumPy sobre ellos
+_ADJUNTOS = {}
+
+
+class ArreglosCompartidos:
+    """Copia un diccionario nombre → arreglo a memoria compartida
+
+    El objeto es dueño de los segmentos: `cerrar` (o salir del bloque with)
+    los libera y elimina del sistema.
+    """
+
+    def __init__(self, arreglos):
+        self._segmentos = []
+        self.descriptor = {}
+        self.arreglos = {}
+        try:
+            for nombre, arreglo in arreglos.items():
+                arreglo = np.ascontiguousarray(arreglo)
+                segmento = shared_memory.SharedMemory(create=True, size=max(arreglo.nbytes, 1))
+                self._segmentos.append(segmento)
+                vista = np.ndarray(arreglo.shape, dtype=arreglo.dtype, buffer=segmento.buf)
+                vista[...] = arreglo
+                self.arreglos[nombre] = vista
+                self.descriptor[nombre] = (segmento.name, arreglo.shape, arreglo.dtype.str)
+        except Exception:
+            self.cerrar()
+            raise
+
+    @property
+    def n_bytes(self):
+        return sum(arreglo.nbytes for arreglo in self.arreglos.values())
+
+    def cerrar(self):
+        self.arreglos = {}
+        for segmento in self._segmentos:
+            segmento.close()
+            segmento.unlink()
+        self._segmentos = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        self.cerrar()
+
+
+def adjuntar(descriptor):
+    """Devuelve nombre → arreglo (sólo lectura) a partir de un descriptor"""
+    arreglos = {}
+    for nombre, (segmento_nombre, forma, tipo) in descriptor.items():
+        segmento = _ADJUNTOS.get(segmento_nombre)
+        if segmento is None:
+            segmento = _ADJUNTOS[segmento_nombre] = shared_memory.SharedMemory(name=segmento_nombre)
+        arreglo = np.ndarray(tuple(forma), dtype=np.dtype(tipo), buffer=segmento.buf)
+        arreglo.flags.writeable = False
+        arreglos[nombre] = arreglo
+    return arreglos
@@ -0,0 +1,321 @@
+"""
+Motor de inferencia compilado para el árbol de detección de phishing
+
+Convierte un DecisionTreeClassifier entrenado (los arreglos de modelo.tree_)
+en un evaluador plano con NumPy que recorre el árbol para todo un lote a la
+vez, sin validaciones por llamada ni DataFrames. En tiempo de puntuación no
+se necesita scikit-learn: sólo NumPy.
+
+Los resultados son idénticos a modelo.predict / modelo.predict_proba: las
+características se convierten a float32 igual que hace scikit-learn y cada
+umbral float64 se redondea hacia abajo al float32 más cercano, lo que da la
+misma comparación sin promover las columnas a float64.
+
+Rendimiento: cada nodo cuesta unas pocas llamadas a NumPy, así que la
+ventaja sobre scikit-learn depende del tamaño del árbol. Con el árbol del
+pipeline (7 nodos, profundidad 2) y árboles de pocas decenas de nodos es
+más rápido que predict_proba; con árboles grandes es más lento: alrededor de
+0.8x con 423 nodos (profundidad 11) y de 0.3x a 0.5x con 2043 nodos
+(profundidad 22), de 1e5 a 1e7 filas. Para esos árboles (p. ej. los de
+validacion_cruzada.py, reentrenamiento_incremental.py o
+entrenador_histogramas.py con max_depth alto) lo que aporta es no depender
+de scikit-learn ni de DataFrames, no la velocidad. `--benchmark` mide los
+tres tamaños y avisa cuando el árbol compilado queda por detrás.
+
+Uso:
+    from motor_inferencia import compilar_arbol
+    arbol = compilar_arbol(modelo)
+    etiquetas, prob_phishing = arbol.puntuar(X)
+
+    python motor_inferencia.py --benchmark
+
+Requisitos: pip install numpy (scikit-learn sólo para compilar y comparar)
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from esquema_phishing import CARACTERISTICAS
+
+# Valor de modelo.tree_.children_left en las hojas
+HOJA = -1
+
+TAMANO_BLOQUE = 1 << 16
+# Un nodo que recibe menos de 1/FRACCION_INDICES del bloque reparte índices de fila
+FRACCION_INDICES = 32
+
+
+class ArbolCompilado:
+    """Árbol de decisión representado como arreglos planos de NumPy
+
+    El recorrido se hace por bloques de filas y por columnas contiguas. Los
+    nodos superiores, que reciben buena parte del bloque, comparan la columna
+    entera y reparten una máscara de filas entre sus hijos sin gathers. Cuando
+    a un nodo llega menos de 1/FRACCION_INDICES del bloque se pasa a índices
+    de fila y cada nodo sólo lee las filas que lo alcanzan, así que el costo
+    crece con filas × profundidad y no con filas × nodos.
+    """
+
+    def __init__(self, caracteristica, umbral, izquierdo, derecho, probabilidades,
+                 clases, nombres_caracteristicas=None, profundidad=None,
+                 muestras=None, impureza=None, metadatos=None):
+        self.caracteristica = np.ascontiguousarray(caracteristica, dtype=np.intp)
+        self.umbral = np.ascontiguousarray(umbral, dtype=np.float64)
+        self.izquierdo = np.ascontiguousarray(izquierdo, dtype=np.intp)
+        self.derecho = np.ascontiguousarray(derecho, dtype=np.intp)
+        self.probabilidades = np.ascontiguousarray(probabilidades, dtype=np.float64)
+        self.clases = np.asarray(clases)
+        self.nombres_caracteristicas = list(nombres_caracteristicas or CARACTERISTICAS)
+        self.profundidad = _calcular_profundidad(self.izquierdo, self.derecho) if profundidad is None else profundidad
+        # Datos descriptivos opcionales por nodo (para reportes y diagramas)
+        self.muestras = None if muestras is None else np.asarray(muestras, dtype=np.int64)
+        self.impureza = None if impureza is None else np.asarray(impureza, dtype=np.float64)
+        self.metadatos = dict(metadatos or {})
+
+        # Nodos internos en preorden (en scikit-learn el padre siempre tiene menor índice)
+        internos = np.flatnonzero(self.izquierdo != np.arange(self.n_nodos))
+        self._internos = list(zip(internos.tolist(), self.caracteristica[internos].tolist(),
+                                  umbrales_float32(self.umbral[internos]), self.izquierdo[internos].tolist(),
+                                  self.derecho[internos].tolist()))
+        # Probabilidades por clase como vectores contiguos y clase de cada hoja
+        self._proba_por_clase = np.ascontiguousarray(self.probabilidades.T)
+        self._etiqueta_nodo = self.clases[np.argmax(self.probabilidades, axis=1)]
+
+    @property
+    def n_nodos(self):
+        return len(self.umbral)
+
+    @property
+    def n_caracteristicas(self):
+        return len(self.nombres_caracteristicas)
+
+    def _columnas(self, X):
+        """Devuelve (n_filas, función que da las columnas float32 contiguas de un bloque)
+
+        Acepta DataFrames, diccionarios nombre → arreglo (por ejemplo columnas
+        memory-mapped) y matrices 2D. Los DataFrames y diccionarios se leen
+        columna por columna sin copiar si ya son float32.
+        """
+        if hasattr(X, 'columns') or isinstance(X, dict):
+            columnas = [np.asarray(X[nombre]) for nombre in self.nombres_caracteristicas]
+            n_filas = len(columnas[0]) if columnas else 0
+
+            def bloque(inicio, fin):
+                return [np.ascontiguousarray(col[inicio:fin], dtype=np.float32) for col in columnas]
+            return n_filas, bloque
+
+        X = np.asarray(X)
+        if X.ndim != 2 or X.shape[1] != self.n_caracteristicas:
+            raise ValueError(f"Se esperaban {self.n_caracteristicas} columnas, "
+                             f"se recibió una matriz de forma {X.shape}")
+
+        def bloque(inicio, fin):
+            # Transponer el bloque deja cada característica contigua en memoria
+            filas = np.asarray(X[inicio:fin], dtype=np.float32).T
+            return list(np.ascontiguousarray(filas))
+        return X.shape[0], bloque
+
+    def _hojas_bloque(self, columnas, n):
+        hojas = np.zeros(n, dtype=np.int32)
+        # Filas que alcanzan cada nodo pendiente: None en la raíz, una máscara
+        # booleana mientras el nodo recibe buena parte del bloque e índices después
+        alcance = {0: None}
+        minimo_mascara = n // FRACCION_INDICES
+
+        for nodo, caracteristica, umbral, izquierdo, derecho in self._internos:
+            llegan = alcance.pop(nodo)
+            if llegan is None or llegan.dtype == np.bool_:
+                va_izquierda = columnas[caracteristica] <= umbral
+                if llegan is None:
+                    va_derecha = ~va_izquierda
+                else:
+                    va_izquierda &= llegan
+                    va_derecha = llegan ^ va_izquierda
+                for hijo, mascara in ((izquierdo, va_izquierda), (derecho, va_derecha)):
+                    if self.izquierdo[hijo] == hijo:
+                        hojas += mascara * np.int32(hijo)
+                    elif np.count_nonzero(mascara) < minimo_mascara:
+                        alcance[hijo] = np.flatnonzero(mascara)
+                    else:
+                        alcance[hijo] = mascara
+            else:
+                # Sólo se leen y reparten las filas que llegan al nodo
+                va_izquierda = columnas[caracteristica][llegan] <= umbral
+                for hijo, filas in ((izquierdo, llegan[va_izquierda]), (derecho, llegan[~va_izquierda])):
+                    if self.izquierdo[hijo] == hijo:
+                        hojas[filas] = hijo
+                    else:
+                        alcance[hijo] = filas
+        return hojas
+
+    def aplicar(self, X, tamano_bloque=TAMANO_BLOQUE):
+        """Índice de la hoja a la que llega cada fila (equivalente a modelo.apply)"""
+        n_filas, bloque = self._columnas(X)
+        hojas = np.empty(n_filas, dtype=np.int32)
+        for inicio in range(0, n_filas, tamano_bloque):
+            fin = min(inicio + tamano_bloque, n_filas)
+            hojas[inicio:fin] = self._hojas_bloque(bloque(inicio, fin), fin - inicio)
+        return hojas
+
+    def predict_proba(self, X):
+        """Probabilidad de cada clase por fila (n_filas, n_clases)"""
+        return np.take(self.probabilidades, self.aplicar(X), axis=0)
+
+    def predict(self, X):
+        """Clase predicha por fila"""
+        return self.clases[np.argmax(self.predict_proba(X), axis=1)]
+
+    def puntuar(self, X):
+        """Devuelve (etiquetas, probabilidad de la última clase) para un lote
+
+        Sólo materializa la columna de probabilidad de phishing; la etiqueta
+        se obtiene por hoja, igual que el argmax de predict.
+        """
+        hojas = self.aplicar(X)
+        return np.take(self._etiqueta_nodo, hojas), np.take(self._proba_por_clase[-1], hojas)
+
+
+def umbrales_float32(umbral):
+    """Mayor float32 que no supera cada umbral float64
+
+    Para x float32, x <= t equivale a x <= umbrales_float32(t). Con NumPy 2 un
+    escalar float de Python se compara en float32 contra una columna float32,
+    así que usar el umbral tal cual lo redondearía al float32 más cercano y
+    mandaría a la izquierda valores que scikit-learn manda a la derecha.
+    """
+    umbral = np.asarray(umbral, dtype=np.float64)
+    redondeado = umbral.astype(np.float32)
+    return np.where(redondeado.astype(np.float64) > umbral,
+                    np.nextafter(redondeado, np.float32(-np.inf)), redondeado)
+
+
+def _calcular_profundidad(izquierdo, derecho):
+    """Profundidad máxima del árbol (los hijos siempre tienen mayor índice que el padre)"""
+    profundidades = np.zeros(len(izquierdo), dtype=np.intp)
+    for nodo in range(len(izquierdo)):
+        if izquierdo[nodo] != nodo:
+            profundidades[izquierdo[nodo]] = profundidades[derecho[nodo]] = profundidades[nodo] + 1
+    return int(profundidades.max()) if len(profundidades) else 0
+
+
+def compilar_arbol(modelo, nombres_caracteristicas=None):
+    """Compila un DecisionTreeClassifier entrenado a un ArbolCompilado"""
+    tree = modelo.tree_
+    n_nodos = tree.node_count
+    indices = np.arange(n_nodos, dtype=np.intp)
+    es_hoja = tree.children_left == HOJA
+
+    izquierdo = np.where(es_hoja, indices, tree.children_left)
+    derecho = np.where(es_hoja, indices, tree.children_right)
+    caracteristica = np.where(es_hoja, 0, tree.feature)
+    umbral = np.where(es_hoja, np.inf, tree.threshold)
+
+    # Misma normalización que DecisionTreeClassifier.predict_proba
+    valores = tree.value[:, 0, :].astype(np.float64)
+    normalizador = valores.sum(axis=1, keepdims=True)
+    normalizador[normalizador == 0.0] = 1.0
+    probabilidades = valores / normalizador
+
+    if nombres_caracteristicas is None:
+        nombres_caracteristicas = list(getattr(modelo, 'feature_names_in_', CARACTERISTICAS))
+
+    return ArbolCompilado(caracteristica, umbral, izquierdo, derecho, probabilidades,
+                          modelo.classes_, nombres_caracteristicas, profundidad=int(tree.max_depth),
+                          muestras=tree.n_node_samples, impureza=tree.impurity)
+
+
+# ============================================
+# BENCHMARK CONTRA SCIKIT-LEARN
+# ============================================
+
+def datos_sinteticos(n_filas, semilla=0):
+    """Matriz de indicadores en la rejilla 0-10 con un decimal (contiene_url binario)"""
+    rng = np.random.default_rng(semilla)
+    X = (rng.integers(0, 101, size=(n_filas, len(CARACTERISTICAS)), dtype=np.int16) / 10).astype(np.float32)
+    X[:, CARACTERISTICAS.index('contiene_url')] = rng.integers(0, 2, size=n_filas)
+    return X
+
+
+def modelos_profundos(hojas=(212, 1022), n_filas=300_000, semilla=0):
+    """Árboles más grandes que el del pipeline (2·hojas - 1 nodos) sobre datos sintéticos
+
+    Las etiquetas dependen de varios indicadores con ruido, así que el árbol
+    sigue partiendo hasta agotar max_leaf_nodes.
+    """
+    import pandas as pd
+    from sklearn.tree import DecisionTreeClassifier
+
+    rng = np.random.default_rng(semilla)
+    X = pd.DataFrame(datos_sinteticos(n_filas, semilla + 1), columns=CARACTERISTICAS)
+    puntaje = X.iloc[:, :3].sum(axis=1) + 2.0 * X['contiene_url'] + rng.normal(0.0, 3.0, n_filas)
+    y = (puntaje > puntaje.median()).astype(int)
+    return [DecisionTreeClassifier(max_leaf_nodes=n, random_state=semilla).fit(X, y) for n in hojas]
+
+
+def _cronometrar(funcion, repeticiones):
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+
+def benchmark(modelo, tamanos, repeticiones=3):
+    """Compara predict_proba de scikit-learn (DataFrame) con el árbol compilado"""
+    import pandas as pd
+
+    arbol = compilar_arbol(modelo)
+    filas = []
+    print(f"{'filas':>12s} {'sklearn (s)':>12s} {'compilado (s)':>14s} {'filas/s compilado':>18s} {'aceleración':>12s}")
+    for n in tamanos:
+        X = datos_sinteticos(n)
+        df = pd.DataFrame(X, columns=CARACTERISTICAS)
+        reps = repeticiones if n <= 1_000_000 else 1
+
+        t_sklearn, proba_sklearn = _cronometrar(lambda: modelo.predict_proba(df), reps)
+        t_compilado, proba_compilado = _cronometrar(lambda: arbol.predict_proba(X), reps)
+
+        if not np.array_equal(proba_sklearn, proba_compilado):
+            raise AssertionError(f"Las probabilidades difieren de scikit-learn con {n} filas")
+
+        filas.append({'filas': n, 'sklearn_s': t_sklearn, 'compilado_s': t_compilado})
+        print(f"{n:>12,d} {t_sklearn:>12.4f} {t_compilado:>14.4f} "
+              f"{n / t_compilado:>18,.0f} {t_sklearn / t_compilado:>11.1f}x")
+
+    lentos = [fila for fila in filas if fila['compilado_s'] > fila['sklearn_s']]
+    if lentos:
+        peor = min(fila['sklearn_s'] / fila['compilado_s'] for fila in lentos)
+        print(f"⚠️  Con {arbol.n_nodos} nodos (profundidad {arbol.profundidad}) el árbol compilado es más "
+              f"lento que scikit-learn en {len(lentos)} de {len(filas)} tamaños (hasta {peor:.1f}x): "
+              f"el costo crece con el número de nodos")
+    return filas
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Motor de inferencia compilado del árbol de phishing')
+    parser.add_argument('--benchmark', action='store_true', help='Comparar contra scikit-learn')
+    parser.add_argument('--max-filas', type=float, default=1e7, help='Tamaño máximo del benchmark')
+    parser.add_argument('--sin-profundos', action='store_true',
+                        help='Medir sólo el árbol del pipeline, sin los árboles sintéticos grandes')
+    args = parser.parse_args(argv)
+
+    from pipeline_phishing import modelo_entrenado
+
+    modelo = modelo_entrenado()
+    arbol = compilar_arbol(modelo)
+    print(f"🌳 Árbol compilado: {arbol.n_nodos} nodos, profundidad {arbol.profundidad}")
+
+    if args.benchmark:
+        tamanos = [10 ** k for k in range(3, 8) if 10 ** k <= args.max_filas]
+        modelos = [modelo] + ([] if args.sin_profundos else modelos_profundos())
+        for modelo in modelos:
+            print(f"\n⏱️  Benchmark predict_proba: scikit-learn vs árbol compilado "
+                  f"({modelo.tree_.node_count} nodos, profundidad {modelo.tree_.max_depth})\n")
+            benchmark(modelo, tamanos)
+
+
+if __name__ == "__main__":
+    main()
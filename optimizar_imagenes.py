@@ -0,0 +1,204 @@
+"""
+Optimización de las figuras antes de incrustarlas en los reportes PDF
+
+Las figuras se guardan a 300 dpi (la del árbol completo es un lienzo de
+25x15 pulgadas) pero en el PDF ocupan cajas de 4.5 a 7 pulgadas. Este
+módulo reescala cada PNG a la resolución que su caja necesita (DPI_PDF),
+elimina el canal alfa y elige el formato por tipo de figura:
+
+    • diagrama   → PNG con paleta de 256 colores (colores planos y texto)
+    • mapa_calor → JPEG (degradados de los mapas de calor)
+
+El resultado se guarda en .cache_imagenes/ bajo el hash del PNG original y
+de los parámetros, así que sólo se recalcula cuando la figura cambia.
+
+Uso:
+    python optimizar_imagenes.py                  (optimiza las figuras del directorio)
+    python optimizar_imagenes.py --benchmark
+
+Requisitos: pip install pillow reportlab
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+
+DIRECTORIO_CACHE = '.cache_imagenes'
+DPI_PDF = 200
+VERSION = 1
+
+TIPOS = {
+    'diagrama': {'formato': 'PNG', 'colores': 256},
+    'mapa_calor': {'formato': 'JPEG', 'calidad': 88}
+}
+
+# Caja (ancho, alto en pulgadas) de cada figura en los reportes y su tipo
+FIGURAS = {
+    '01_analisis_exploratorio_phishing.png': (7, 4.2, 'diagrama'),
+    '02_comparacion_phishing_legitimo.png': (7, 4.2, 'diagrama'),
+    '03_matriz_correlacion_phishing.png': (5.5, 4.5, 'mapa_calor'),
+    '04_matriz_confusion_phishing.png': (5, 4, 'mapa_calor'),
+    '05_importancia_caracteristicas_phishing.png': (6, 3.5, 'diagrama'),
+    '07_arbol_decision_phishing_simplificado.png': (7, 5, 'diagrama'),
+    '01_analisis_exploratorio.png': (6.5, 4, 'diagrama'),
+    '02_matriz_correlacion.png': (5.5, 4.5, 'mapa_calor'),
+    '03_matriz_confusion.png': (4.5, 3.5, 'mapa_calor'),
+    '04_importancia_caracteristicas.png': (6, 3.5, 'diagrama'),
+    '06_arbol_decision_simplificado.png': (7, 5, 'diagrama')
+}
+
+
+def tipo_figura(ruta):
+    return FIGURAS.get(os.path.basename(ruta), (None, None, 'diagrama'))[2]
+
+
+def _tamano_objetivo(tamano, ancho, alto, dpi):
+    """Píxeles que necesita una caja de ancho x alto puntos, sin ampliar la imagen"""
+    ancho_px = max(1, round(ancho / 72 * dpi))
+    alto_px = max(1, round(alto / 72 * dpi))
+    return min(ancho_px, tamano[0]), min(alto_px, tamano[1])
+
+
+def optimizar_imagen(ruta, ancho, alto, tipo=None, dpi=DPI_PDF, directorio_cache=DIRECTORIO_CACHE):
+    """Ruta de la versión optimizada de `ruta` para una caja de ancho x alto puntos
+
+    Si la imagen no existe se devuelve la ruta original sin tocarla.
+    """
+    if not os.path.exists(ruta):
+        return ruta
+    tipo = tipo or tipo_figura(ruta)
+    opciones = TIPOS[tipo]
+
+    with open(ruta, 'rb') as f:
+        contenido = f.read()
+    huella = hashlib.sha256(contenido)
+    huella.update(json.dumps([VERSION, round(ancho, 3), round(alto, 3), dpi, opciones],
+                             sort_keys=True).encode())
+    base = os.path.splitext(os.path.basename(ruta))[0]
+    extension = '.jpg' if opciones['formato'] == 'JPEG' else '.png'
+    destino = os.path.join(directorio_cache, f"{base}_{huella.hexdigest()[:16]}{extension}")
+    if os.path.exists(destino):
+        return destino
+
+    from PIL import Image
+
+    os.makedirs(directorio_cache, exist_ok=True)
+    with Image.open(ruta) as original:
+        imagen = original.convert('RGBA')
+    # El PDF no necesita la máscara de transparencia: las figuras de matplotlib
+    # son opacas y basta con descartarla; si no, se compone sobre blanco
+    if imagen.getchannel('A').getextrema() == (255, 255):
+        imagen = imagen.convert('RGB')
+    else:
+        fondo = Image.new('RGB', imagen.size, (255, 255, 255))
+        fondo.paste(imagen, mask=imagen.getchannel('A'))
+        imagen = fondo
+
+    objetivo = _tamano_objetivo(imagen.size, ancho, alto, dpi)
+    # reduce() por un factor entero es mucho más barato que LANCZOS sobre el
+    # lienzo de 300 dpi; se deja al menos 1.5 veces los píxeles para LANCZOS
+    factor = int(min(imagen.width / objetivo[0], imagen.height / objetivo[1]) / 1.5)
+    if factor > 1:
+        imagen = imagen.reduce(factor)
+    imagen = imagen.resize(objetivo, Image.Resampling.LANCZOS)
+
+    temporal = destino + '.tmp'
+    if opciones['formato'] == 'JPEG':
+        imagen.save(temporal, 'JPEG', quality=opciones['calidad'], optimize=True,
+                    dpi=(dpi, dpi))
+    else:
+        imagen = imagen.quantize(colors=opciones['colores'], method=Image.Quantize.FASTOCTREE,
+                                 dither=Image.Dither.NONE)
+        imagen.save(temporal, 'PNG', optimize=True, dpi=(dpi, dpi))
+    os.replace(temporal, destino)
+
+    # Las versiones anteriores de la misma figura ya no se usan
+    patron = re.compile(re.escape(base) + r'_[0-9a-f]{16}\.(png|jpg)')
+    for anterior in glob.glob(os.path.join(directorio_cache, f"{base}_*")):
+        if anterior != destino and patron.fullmatch(os.path.basename(anterior)):
+            os.remove(anterior)
+    return destino
+
+
+def optimizar_figuras(directorio='.', dpi=DPI_PDF):
+    """Optimiza todas las figuras conocidas que existan en `directorio`"""
+    from reportlab.lib.units import inch
+
+    resultados = []
+    for nombre, (ancho, alto, tipo) in FIGURAS.items():
+        ruta = os.path.join(directorio, nombre)
+        if os.path.exists(ruta):
+            destino = optimizar_imagen(ruta, ancho * inch, alto * inch, tipo, dpi,
+                                       os.path.join(directorio, DIRECTORIO_CACHE))
+            resultados.append((nombre, os.path.getsize(ruta), os.path.getsize(destino)))
+    return resultados
+
+
+def _construir_pdf(ruta_pdf, imagenes):
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import Image, PageBreak, SimpleDocTemplate
+
+    elementos = []
+    for ruta, ancho, alto in imagenes:
+        elementos += [Image(ruta, width=ancho, height=alto), PageBreak()]
+    inicio = time.perf_counter()
+    SimpleDocTemplate(ruta_pdf, pagesize=letter).build(elementos)
+    return time.perf_counter() - inicio
+
+
+def benchmark(directorio='.', dpi=DPI_PDF, repeticiones=3):
+    """Tamaño del PDF y tiempo de doc.build con las figuras originales y optimizadas"""
+    from reportlab.lib.units import inch
+
+    cajas = [(os.path.join(directorio, nombre), ancho * inch, alto * inch, tipo)
+             for nombre, (ancho, alto, tipo) in FIGURAS.items()
+             if os.path.exists(os.path.join(directorio, nombre))]
+    if not cajas:
+        raise FileNotFoundError(f"No hay figuras de los reportes en '{directorio}'")
+
+    resultados = {}
+    with tempfile.TemporaryDirectory() as temporal:
+        inicio = time.perf_counter()
+        optimizadas = [(optimizar_imagen(ruta, ancho, alto, tipo, dpi, temporal), ancho, alto)
+                       for ruta, ancho, alto, tipo in cajas]
+        tiempo_optimizar = time.perf_counter() - inicio
+
+        for etiqueta, imagenes in (('original', [c[:3] for c in cajas]), ('optimizado', optimizadas)):
+            ruta_pdf = os.path.join(temporal, f'{etiqueta}.pdf')
+            tiempos = [_construir_pdf(ruta_pdf, imagenes) for _ in range(repeticiones)]
+            resultados[etiqueta] = {'bytes': os.path.getsize(ruta_pdf), 'segundos': min(tiempos)}
+    resultados['optimizar_segundos'] = tiempo_optimizar
+    resultados['figuras'] = len(cajas)
+    return resultados
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Optimiza las figuras para incrustarlas en los PDF')
+    parser.add_argument('--directorio', default='.')
+    parser.add_argument('--dpi', type=int, default=DPI_PDF)
+    parser.add_argument('--benchmark', action='store_true', help='Comparar PDF original y optimizado')
+    parser.add_argument('--repeticiones', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        r = benchmark(args.directorio, args.dpi, args.repeticiones)
+        print(f"📊 {r['figuras']} figuras a {args.dpi} dpi "
+              f"(optimización sin caché: {r['optimizar_segundos']:.2f} s)\n")
+        print(f"{'PDF':12s} {'Tamaño':>10s} {'doc.build':>10s}")
+        for etiqueta in ('original', 'optimizado'):
+            print(f"{etiqueta:12s} {r[etiqueta]['bytes'] / 2**20:8.2f} MB {r[etiqueta]['segundos']:9.2f} s")
+        print(f"\n⚡ {r['original']['bytes'] / r['optimizado']['bytes']:.1f}x más pequeño, "
+              f"{r['original']['segundos'] / r['optimizado']['segundos']:.1f}x más rápido")
+        return
+
+    for nombre, antes, despues in optimizar_figuras(args.directorio, args.dpi):
+        print(f"  🖼️  {nombre:45s} {antes / 1024:8.0f} KB → {despues / 1024:6.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+Perfil opcional de la generación de los reportes PDF
+
+Mide tiempo de reloj y memoria máxima (tracemalloc) por fase mientras se
+genera un reporte con plantillas_reporte.py:
+
+    importacion                      reportlab (1ª vez en el proceso)
+    compilacion                      plantilla → bloques estáticos (1ª vez)
+    construccion/<sección>           flowables de la sección
+    construccion/<sección>/imagen …  decodificación y codificación de figuras
+    construccion/<sección>/arbol     árbol vectorial desde el artefacto
+    documento/<sección>              doc.build: maquetación y dibujo
+    documento/portada                portada de la primera página
+    documento/escritura              cierre de la última página y PDF a disco
+
+Sin un perfil activo las funciones de este módulo no hacen nada, así que
+los generadores lo llaman siempre. La traza se guarda en JSON y dos trazas
+se comparan fase por fase. Con memoria activada los tiempos incluyen el
+costo de tracemalloc: compara trazas tomadas con la misma opción.
+
+Uso:
+    python reporte_cli.py generar phishing --perfil traza_antes.json
+    python reporte_cli.py generar todos --perfil traza.json --perfil-sin-memoria
+    python perfil_reporte.py traza_antes.json
+    python perfil_reporte.py traza_antes.json traza_despues.json --umbral 10
+"""
+
+import argparse
+import contextlib
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+VERSION_TRAZA = 1
+
+# Perfil de la generación en curso (None = sin perfilar)
+_ACTIVO = None
+
+
+class Perfil:
+    """Fases anidadas con su tiempo y memoria máxima"""
+
+    def __init__(self, reporte, memoria=True):
+        self.reporte = reporte
+        self.memoria = memoria
+        self.pila = []
+        self.fases = {}
+        self.inicio = time.perf_counter()
+
+    def _pico(self):
+        """Pico desde la última medición, que además se reinicia"""
+        if not self.memoria:
+            return 0
+        pico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.reset_peak()
+        return pico
+
+    def abrir(self, nombre, marca=False):
+        pico = self._pico()
+        if self.pila:
+            self.pila[-1]['pico'] = max(self.pila[-1]['pico'], pico)
+            nombre = f"{self.pila[-1]['nombre']}/{nombre}"
+        # Registrada al abrir para que la traza quede en orden de ejecución
+        self.fases.setdefault(nombre, {'fase': nombre, 'nivel': len(self.pila),
+                                       'segundos': 0.0, 'pico_mb': 0.0, 'veces': 0})
+        self.pila.append({'nombre': nombre, 'inicio': time.perf_counter(), 'pico': 0, 'marca': marca})
+
+    def cerrar(self):
+        fase = self.pila.pop()
+        segundos = time.perf_counter() - fase['inicio']
+        pico = max(fase['pico'], self._pico())
+        if self.pila:
+            self.pila[-1]['pico'] = max(self.pila[-1]['pico'], pico)
+
+        registro = self.fases[fase['nombre']]
+        registro['segundos'] += segundos
+        registro['pico_mb'] = max(registro['pico_mb'], pico / 2**20)
+        registro['veces'] += 1
+
+    def marcar(self, nombre):
+        """Cierra la marca anterior (si la hay) y abre otra hermana"""
+        if self.pila and self.pila[-1]['marca']:
+            self.cerrar()
+        if nombre is not None:
+            self.abrir(nombre, marca=True)
+
+    def traza(self):
+        total = time.perf_counter() - self.inicio
+        fases = list(self.fases.values())
+        medido = sum(f['segundos'] for f in fases if f['nivel'] == 0)
+        return {
+            'version': VERSION_TRAZA,
+            'reporte': self.reporte,
+            'fecha': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'memoria': self.memoria,
+            'total_s': total,
+            'sin_fase_s': max(0.0, total - medido),
+            'pico_mb': max((f['pico_mb'] for f in fases), default=0.0),
+            'fases': fases
+        }
+
+
+def activo():
+    return _ACTIVO
+
+
+@contextlib.contextmanager
+def fase(nombre):
+    """Mide el bloque como fase `nombre` dentro de la fase abierta; no-op sin perfil"""
+    if _ACTIVO is None:
+        yield
+        return
+    _ACTIVO.abrir(nombre)
+    try:
+        yield
+    finally:
+        # Las marcas abiertas dentro del bloque (ver marca) terminan con él
+        _ACTIVO.marcar(None)
+        _ACTIVO.cerrar()
+
+
+def marca(nombre):
+    """Flowable de tamaño cero que, al dibujarse, abre la fase `nombre` de doc.build
+
+    Con nombre None sólo cierra la marca anterior. No altera la maquetación:
+    no ocupa espacio ni interrumpe el espacio entre los flowables vecinos
+    (en el PDF sólo deja un q … Q vacío).
+    """
+    from reportlab.platypus.flowables import CallerMacro
+
+    perfil = _ACTIVO
+    flowable = CallerMacro(drawCallable=lambda _: perfil.marcar(nombre))
+    flowable._ZEROSIZE = flowable._SPACETRANSFER = True
+    return flowable
+
+
+@contextlib.contextmanager
+def perfilar(reporte, ruta_traza=None, memoria=True):
+    """Activa el perfil durante el bloque y guarda la traza en `ruta_traza`"""
+    global _ACTIVO
+
+    iniciado = memoria and not tracemalloc.is_tracing()
+    if iniciado:
+        tracemalloc.start()
+    _ACTIVO = perfil = Perfil(reporte, memoria)
+    try:
+        yield perfil
+    finally:
+        while perfil.pila:
+            perfil.cerrar()
+        _ACTIVO = None
+        if iniciado:
+            tracemalloc.stop()
+        if ruta_traza:
+            guardar_traza(perfil.traza(), ruta_traza)
+
+
+def guardar_traza(traza, ruta):
+    with open(ruta, 'w', encoding='utf-8') as f:
+        json.dump(traza, f, ensure_ascii=False, indent=2)
+
+
+def cargar_traza(ruta):
+    with open(ruta, encoding='utf-8') as f:
+        traza = json.load(f)
+    if traza.get('version') != VERSION_TRAZA:
+        raise ValueError(f"'{ruta}' no es una traza de perfil_reporte v{VERSION_TRAZA}")
+    return traza
+
+
+def comparar(antes, despues, umbral=10.0, minimo_s=0.005):
+    """Filas (fase, s antes, s después, cambio %, MB antes, MB después, regresión)"""
+    def por_fase(traza):
+        fases = {f['fase']: f for f in traza['fases']}
+        fases['total'] = {'segundos': traza['total_s'], 'pico_mb': traza['pico_mb']}
+        return fases
+
+    fases_antes, fases_despues = por_fase(antes), por_fase(despues)
+    nombres = list(fases_antes) + [n for n in fases_despues if n not in fases_antes]
+    nombres.append(nombres.pop(nombres.index('total')))
+    filas = []
+    for nombre in nombres:
+        a, d = fases_antes.get(nombre), fases_despues.get(nombre)
+        s_a = a['segundos'] if a else None
+        s_d = d['segundos'] if d else None
+        cambio = (s_d - s_a) / s_a * 100 if s_a and s_d is not None else None
+        regresion = (cambio is not None and cambio > umbral and s_d - s_a > minimo_s)
+        filas.append((nombre, s_a, s_d, cambio, a['pico_mb'] if a else None,
+                      d['pico_mb'] if d else None, regresion))
+    return filas
+
+
+def mostrar(traza):
+    print(f"📊 {traza['reporte']} ({traza['fecha']}): {traza['total_s']*1000:.0f} ms, "
+          f"pico {traza['pico_mb']:.1f} MB" + ('' if traza['memoria'] else ' (sin medir memoria)'))
+    for f in traza['fases']:
+        nombre = '  ' * f['nivel'] + f['fase'].rsplit('/', 1)[-1]
+        veces = f" ×{f['veces']}" if f['veces'] > 1 else ''
+        print(f"    {nombre:42s} {f['segundos']*1000:9.1f} ms  {f['pico_mb']:7.1f} MB{veces}")
+    print(f"    {'(fuera de las fases)':42s} {traza['sin_fase_s']*1000:9.1f} ms")
+
+
+def _ms(segundos):
+    return f"{segundos*1000:9.1f}" if segundos is not None else f"{'—':>9s}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Muestra o compara trazas de perfil de los reportes')
+    parser.add_argument('trazas', nargs='+', help='Una traza para mostrarla, dos para compararlas')
+    parser.add_argument('--umbral', type=float, default=10.0,
+                        help='Porcentaje de aumento de tiempo que cuenta como regresión')
+    args = parser.parse_args(argv)
+
+    if len(args.trazas) == 1:
+        mostrar(cargar_traza(args.trazas[0]))
+        return 0
+    if len(args.trazas) != 2:
+        parser.error('indica una o dos trazas')
+
+    antes, despues = (cargar_traza(ruta) for ruta in args.trazas)
+    if antes['memoria'] != despues['memoria']:
+        print("⚠️  Una traza midió memoria y la otra no: los tiempos no son comparables")
+    filas = comparar(antes, despues, args.umbral)
+    print(f"{'fase':50s} {'antes ms':>9s} {'después':>9s} {'cambio':>8s} {'MB antes':>9s} {'después':>8s}")
+    for nombre, s_a, s_d, cambio, mb_a, mb_d, regresion in filas:
+        cambio_txt = f"{cambio:+7.1f}%" if cambio is not None else f"{'—':>8s}"
+        mb = (f"{mb_a:9.1f}" if mb_a is not None else f"{'—':>9s}") + \
+             (f" {mb_d:8.1f}" if mb_d is not None else f" {'—':>8s}")
+        print(f"{nombre:50s} {_ms(s_a)} {_ms(s_d)} {cambio_txt} {mb}{'  ⚠️' if regresion else ''}")
+    regresiones = sum(1 for fila in filas if fila[-1])
+    if regresiones:
+        print(f"\n⚠️  {regresiones} fase(s) más lentas que el umbral ({args.umbral:.0f}%)")
+        return 1
+    print("\n✅ Sin regresiones por encima del umbral")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,532 @@
+"""
+Pipeline sin interfaz gráfica de la Actividad 9 - Detección de Phishing
+
+Reproduce las celdas de arbol_decision_phishing.ipynb como etapas explícitas:
+
+    generar → dividir → entrenar → evaluar → graficar → exportar_reglas
+            → exportar_modelo → manifiesto → reporte
+
+El resultado de cada etapa se guarda en caché bajo un hash del contenido de
+sus entradas y de sus parámetros. Si sólo cambia, por ejemplo,
+min_samples_leaf, se recalculan el entrenamiento y lo que depende de él,
+pero no la generación del dataset ni las figuras exploratorias.
+
+Uso:
+    python pipeline_phishing.py
+    python pipeline_phishing.py --min-samples-leaf 20
+    python pipeline_phishing.py --hasta evaluar --forzar
+
+Requisitos: pip install pandas numpy scikit-learn matplotlib seaborn reportlab
+"""
+
+import argparse
+import contextlib
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import shutil
+import time
+from importlib.util import find_spec
+
+from esquema_phishing import (CARACTERISTICAS, OBJETIVO, N_REGISTROS, PROPORCION_LEGITIMOS,
+                              SEMILLA, PARAMETROS_MODELO, TEST_SIZE)
+from formato_columnar import abrir_columnar, es_columnar, escribir_columnar, tipo_columna
+
+DIRECTORIO_CACHE = '.cache_pipeline'
+ARCHIVO_DATASET = 'dataset_phishing.csv'
+ARCHIVO_DATASET_COLUMNAR = 'dataset_phishing.phcol'
+ARCHIVO_REGLAS = 'reglas_arbol_phishing.txt'
+
+ETAPAS = ['generar', 'dividir', 'entrenar', 'evaluar', 'graficar_datos',
+          'graficar_modelo', 'exportar_reglas', 'exportar_modelo', 'manifiesto', 'reporte']
+
+# Módulos auxiliares cuyo código determina el resultado de cada etapa: su
+# contenido entra en la clave de caché junto con el de la función de la etapa.
+# La etapa reporte agrega además generar_reporte_phishing.MODULOS_REPORTE.
+MODULOS_ETAPA = {
+    'graficar_datos': ['figuras_paralelas', 'figuras_phishing', 'formato_columnar', 'esquema_phishing'],
+    'graficar_modelo': ['figuras_paralelas', 'figuras_phishing', 'esquema_phishing'],
+    'exportar_modelo': ['artefacto_modelo', 'motor_inferencia'],
+    'manifiesto': ['manifiesto_reporte', 'motor_inferencia', 'esquema_phishing'],
+    'reporte': ['manifiesto_reporte']
+}
+
+
+# ============================================
+# ETAPAS
+# ============================================
+
+def etapa_generar(n_registros, semilla, proporcion_legitimos):
+    """Genera el dataset sintético exactamente como la celda 5 del notebook"""
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.RandomState(semilla)
+
+    n_legitimate = int(n_registros * proporcion_legitimos)
+    n_phishing = n_registros - n_legitimate
+
+    legitimate_data = {
+        'remitente_sospechoso': rng.normal(2, 1.5, n_legitimate).clip(0, 10),
+        'contiene_url': rng.choice([0, 1], n_legitimate, p=[0.4, 0.6]),
+        'dominio_sospechoso': rng.normal(1.5, 1.2, n_legitimate).clip(0, 10),
+        'tono_urgencia': rng.normal(2, 1.5, n_legitimate).clip(0, 10),
+        'solicita_info': rng.normal(1, 1.2, n_legitimate).clip(0, 10),
+        'errores_gramaticales': rng.normal(1, 1, n_legitimate).clip(0, 10),
+        'oferta_irreal': rng.normal(0.5, 0.8, n_legitimate).clip(0, 10)
+    }
+
+    phishing_data = {
+        'remitente_sospechoso': rng.normal(7, 2, n_phishing).clip(0, 10),
+        'contiene_url': rng.choice([0, 1], n_phishing, p=[0.1, 0.9]),
+        'dominio_sospechoso': rng.normal(7.5, 1.8, n_phishing).clip(0, 10),
+        'tono_urgencia': rng.normal(7.5, 1.5, n_phishing).clip(0, 10),
+        'solicita_info': rng.normal(7, 2, n_phishing).clip(0, 10),
+        'errores_gramaticales': rng.normal(6, 2, n_phishing).clip(0, 10),
+        'oferta_irreal': rng.normal(6.5, 2, n_phishing).clip(0, 10)
+    }
+
+    df_legitimate = pd.DataFrame(legitimate_data)
+    df_legitimate[OBJETIVO] = 0
+
+    df_phishing = pd.DataFrame(phishing_data)
+    df_phishing[OBJETIVO] = 1
+
+    df = pd.concat([df_legitimate, df_phishing], ignore_index=True)
+    df = df.sample(frac=1, random_state=semilla).reset_index(drop=True)
+
+    for col in df.columns:
+        if col != OBJETIVO and col != 'contiene_url':
+            df[col] = df[col].round(1)
+
+    return df
+
+
+def etapa_dividir(df, test_size, semilla):
+    """División estratificada entrenamiento/prueba (celdas 14 y 15)"""
+    from sklearn.model_selection import train_test_split
+
+    X = df[CARACTERISTICAS]
+    y = df[OBJETIVO]
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=test_size, random_state=semilla, stratify=y)
+    return {'X_train': X_train, 'X_test': X_test, 'y_train': y_train, 'y_test': y_test}
+
+
+def etapa_entrenar(division, parametros):
+    """Crea y entrena el DecisionTreeClassifier (celdas 17 y 18)"""
+    from sklearn.tree import DecisionTreeClassifier
+
+    modelo = DecisionTreeClassifier(**parametros)
+    modelo.fit(division['X_train'], division['y_train'])
+    return modelo
+
+
+def etapa_evaluar(modelo, division):
+    """Métricas de rendimiento en entrenamiento y prueba (celdas 20 a 23)"""
+    from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
+
+    y_pred_train = modelo.predict(division['X_train'])
+    y_pred_test = modelo.predict(division['X_test'])
+
+    return {
+        'accuracy_train': float(accuracy_score(division['y_train'], y_pred_train)),
+        'accuracy_test': float(accuracy_score(division['y_test'], y_pred_test)),
+        'reporte_clasificacion': classification_report(division['y_test'], y_pred_test,
+                                                       output_dict=True),
+        'matriz_confusion': confusion_matrix(division['y_test'], y_pred_test).tolist(),
+        'importancias': [(nombre, float(valor)) for nombre, valor
+                         in zip(CARACTERISTICAS, modelo.feature_importances_)],
+        'n_nodos': int(modelo.tree_.node_count),
+        'n_hojas': int(modelo.get_n_leaves()),
+        'profundidad': int(modelo.get_depth()),
+        'n_entrenamiento': int(len(division['X_train'])),
+        'n_prueba': int(len(division['X_test']))
+    }
+
+
+def etapa_graficar_datos(directorio, progreso=False):
+    """Figuras exploratorias 01 a 03, que sólo dependen del dataset
+
+    Se dibujan en paralelo leyendo el dataset columnar con memory-map.
+    """
+    from figuras_paralelas import FIGURAS_DATOS, renderizar_figuras
+
+    renderizar_figuras(directorio, FIGURAS_DATOS,
+                       ruta_dataset=os.path.join(directorio, ARCHIVO_DATASET_COLUMNAR), progreso=progreso)
+    return FIGURAS_DATOS
+
+
+def etapa_graficar_modelo(modelo, metricas, directorio, progreso=False):
+    """Figuras 04 y 05, que dependen del modelo entrenado (en paralelo)
+
+    El árbol ya no se rasteriza (06/07): el reporte lo dibuja en vectorial
+    desde el artefacto de la etapa exportar_modelo.
+    """
+    from figuras_paralelas import FIGURAS_ARBOL, FIGURAS_MODELO, renderizar_figuras
+
+    nombres = [nombre for nombre in FIGURAS_MODELO if nombre not in FIGURAS_ARBOL]
+    renderizar_figuras(directorio, nombres, modelo=modelo, metricas=metricas, progreso=progreso)
+    return nombres
+
+
+def etapa_exportar_reglas(modelo, directorio):
+    """Exporta las reglas del árbol en texto (celda 28)"""
+    from sklearn.tree import export_text
+
+    tree_rules = export_text(modelo, feature_names=CARACTERISTICAS)
+    with open(os.path.join(directorio, ARCHIVO_REGLAS), 'w', encoding='utf-8') as f:
+        f.write("REGLAS DEL ÁRBOL DE DECISIÓN - DETECCIÓN DE PHISHING\n")
+        f.write("="*60 + "\n\n")
+        f.write(tree_rules)
+    return [ARCHIVO_REGLAS]
+
+
+def etapa_exportar_modelo(modelo, metricas, directorio):
+    """Exporta el árbol como artefacto binario que se carga sin scikit-learn"""
+    from artefacto_modelo import ARCHIVO_MODELO, METRICAS_EXPORTADAS, exportar_modelo
+
+    exportar_modelo(modelo, os.path.join(directorio, ARCHIVO_MODELO),
+                    {clave: metricas[clave] for clave in METRICAS_EXPORTADAS})
+    return [ARCHIVO_MODELO]
+
+
+def etapa_manifiesto(df, division, modelo, metricas, parametros, directorio):
+    """Escribe el manifiesto de métricas y reglas que lee el reporte PDF"""
+    from manifiesto_reporte import ARCHIVO_MANIFIESTO, construir_manifiesto, escribir_manifiesto
+
+    manifiesto = construir_manifiesto(df, division, modelo, metricas, parametros)
+    escribir_manifiesto(manifiesto, os.path.join(directorio, ARCHIVO_MANIFIESTO))
+    return [ARCHIVO_MANIFIESTO]
+
+
+def etapa_reporte(directorio):
+    """Genera el PDF con generar_reporte_phishing.py usando los archivos del directorio"""
+    import generar_reporte_phishing
+
+    with _en_directorio(directorio):
+        nombre_archivo = generar_reporte_phishing.generar_reporte()
+    return [nombre_archivo]
+
+
+# ============================================
+# CACHÉ POR HASH DE CONTENIDO
+# ============================================
+
+def _hash_bytes(datos):
+    return hashlib.sha256(datos).hexdigest()
+
+
+def _hash_archivo(ruta):
+    h = hashlib.sha256()
+    with open(ruta, 'rb') as f:
+        for bloque in iter(lambda: f.read(1 << 20), b''):
+            h.update(bloque)
+    return h.hexdigest()
+
+
+@contextlib.contextmanager
+def _en_directorio(directorio):
+    anterior = os.getcwd()
+    os.chdir(directorio)
+    try:
+        yield
+    finally:
+        os.chdir(anterior)
+
+
+class CacheEtapas:
+    """Caché en disco de resultados de etapas, indexada por hash de entradas
+
+    Cada entrada vive en <directorio>/<etapa>/<clave>/ y contiene el resultado
+    serializado (resultado.pkl), su huella de contenido (huella.txt) y una
+    copia de los archivos que la etapa escribió en el directorio de salida.
+    """
+
+    def __init__(self, directorio=DIRECTORIO_CACHE):
+        self.directorio = directorio
+
+    def clave(self, etapa, funcion, parametros, huellas_entrada, modulos=()):
+        """Hash de la etapa: código de la función y de sus módulos, parámetros y huellas de sus entradas"""
+        descripcion = {
+            'etapa': etapa,
+            'codigo': _hash_bytes(inspect.getsource(funcion).encode('utf-8')),
+            # Se ubican sin importarlos, igual que las huellas de generar_reporte_phishing
+            'modulos': {modulo: _hash_archivo(find_spec(modulo).origin) for modulo in modulos},
+            'parametros': parametros,
+            'entradas': huellas_entrada
+        }
+        return _hash_bytes(json.dumps(descripcion, sort_keys=True, default=str).encode('utf-8'))
+
+    def _ruta(self, etapa, clave):
+        return os.path.join(self.directorio, etapa, clave)
+
+    def obtener(self, etapa, clave, directorio_salida):
+        """Devuelve (resultado, huella) si existe la entrada, o None"""
+        ruta = self._ruta(etapa, clave)
+        try:
+            with open(os.path.join(ruta, 'resultado.pkl'), 'rb') as f:
+                resultado = pickle.load(f)
+            with open(os.path.join(ruta, 'huella.txt'), encoding='utf-8') as f:
+                huella = f.read().strip()
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+        # Restaurar los archivos de salida que falten o hayan cambiado
+        for nombre in sorted(os.listdir(ruta)):
+            if nombre in ('resultado.pkl', 'huella.txt'):
+                continue
+            origen = os.path.join(ruta, nombre)
+            destino = os.path.join(directorio_salida, nombre)
+            if not os.path.exists(destino) or _hash_archivo(destino) != _hash_archivo(origen):
+                shutil.copyfile(origen, destino)
+        return resultado, huella
+
+    def guardar(self, etapa, clave, resultado, archivos, directorio_salida):
+        """Guarda el resultado de forma atómica y devuelve su huella de contenido"""
+        datos = pickle.dumps(resultado, protocol=pickle.HIGHEST_PROTOCOL)
+        huella = _hash_bytes(datos)
+        for nombre in archivos:
+            huella = _hash_bytes((huella + _hash_archivo(os.path.join(directorio_salida, nombre))).encode('ascii'))
+
+        ruta = self._ruta(etapa, clave)
+        temporal = ruta + f'.tmp{os.getpid()}'
+        shutil.rmtree(temporal, ignore_errors=True)
+        os.makedirs(temporal)
+        with open(os.path.join(temporal, 'resultado.pkl'), 'wb') as f:
+            f.write(datos)
+        for nombre in archivos:
+            shutil.copyfile(os.path.join(directorio_salida, nombre), os.path.join(temporal, nombre))
+        with open(os.path.join(temporal, 'huella.txt'), 'w', encoding='utf-8') as f:
+            f.write(huella)
+
+        shutil.rmtree(ruta, ignore_errors=True)
+        os.replace(temporal, ruta)
+        return huella
+
+
+# ============================================
+# EJECUCIÓN
+# ============================================
+
+def parametros_por_defecto():
+    """Parámetros de todas las etapas con los valores del notebook"""
+    return {
+        'n_registros': N_REGISTROS,
+        'semilla': SEMILLA,
+        'proporcion_legitimos': PROPORCION_LEGITIMOS,
+        'test_size': TEST_SIZE,
+        'modelo': dict(PARAMETROS_MODELO)
+    }
+
+
+class PipelinePhishing:
+    """Ejecuta las etapas en orden reutilizando la caché cuando es posible"""
+
+    def __init__(self, parametros=None, directorio_salida='.', cache=None, forzar=False, verbose=True):
+        self.parametros = parametros or parametros_por_defecto()
+        self.directorio_salida = directorio_salida
+        self.cache = cache or CacheEtapas()
+        self.forzar = forzar
+        self.verbose = verbose
+        self.resultados = {}
+        self.huellas = {}
+        self.tiempos = {}
+
+    def _log(self, mensaje):
+        if self.verbose:
+            print(mensaje)
+
+    def _etapa(self, nombre, funcion, parametros, entradas, calcular, produce_archivos=False):
+        """Ejecuta una etapa o la recupera de la caché
+
+        `entradas` son los nombres de etapas previas de las que depende y
+        `calcular` es un callable sin argumentos que produce el resultado.
+        Si `produce_archivos` es verdadero, el resultado es la lista de
+        archivos escritos en el directorio de salida.
+        """
+        huellas_entrada = {entrada: self.huellas[entrada] for entrada in entradas}
+        clave = self.cache.clave(nombre, funcion, parametros, huellas_entrada, _modulos_etapa(nombre))
+
+        inicio = time.perf_counter()
+        encontrado = None if self.forzar else self.cache.obtener(nombre, clave, self.directorio_salida)
+        if encontrado is not None:
+            resultado, huella = encontrado
+            estado = '♻️  caché'
+        else:
+            resultado = calcular()
+            archivos = resultado if produce_archivos else []
+            huella = self.cache.guardar(nombre, clave, resultado, archivos, self.directorio_salida)
+            estado = '⚙️  calculado'
+
+        self.tiempos[nombre] = time.perf_counter() - inicio
+        self.resultados[nombre] = resultado
+        self.huellas[nombre] = huella
+        self._log(f"  {estado:14s} {nombre:16s} {self.tiempos[nombre]:8.2f} s  [{clave[:12]}]")
+        return resultado
+
+    def ejecutar(self, hasta=None):
+        """Ejecuta el pipeline hasta la etapa indicada (incluida)"""
+        ultima = ETAPAS.index(hasta) if hasta else len(ETAPAS) - 1
+        p = self.parametros
+        salida = self.directorio_salida
+        os.makedirs(salida, exist_ok=True)
+
+        def activa(nombre):
+            return ETAPAS.index(nombre) <= ultima
+
+        r = self.resultados
+
+        params_generar = {k: p[k] for k in ('n_registros', 'semilla', 'proporcion_legitimos')}
+
+        self._etapa('generar', etapa_generar, params_generar, [],
+                    lambda: etapa_generar(**params_generar))
+        # El CSV y su copia columnar se reescriben desde el resultado (también el de la
+        # caché) si no coinciden con él, p. ej. tras una ejecución con otro n_registros
+        self._sincronizar_dataset(r['generar'])
+
+        if activa('dividir'):
+            self._etapa('dividir', etapa_dividir, {'test_size': p['test_size'], 'semilla': p['semilla']},
+                        ['generar'], lambda: etapa_dividir(r['generar'], p['test_size'], p['semilla']))
+        if activa('entrenar'):
+            self._etapa('entrenar', etapa_entrenar, p['modelo'], ['dividir'],
+                        lambda: etapa_entrenar(r['dividir'], p['modelo']))
+        if activa('evaluar'):
+            self._etapa('evaluar', etapa_evaluar, {}, ['entrenar', 'dividir'],
+                        lambda: etapa_evaluar(r['entrenar'], r['dividir']))
+        if activa('graficar_datos'):
+            self._etapa('graficar_datos', etapa_graficar_datos, {}, ['generar'],
+                        lambda: etapa_graficar_datos(salida, self.verbose), produce_archivos=True)
+        if activa('graficar_modelo'):
+            self._etapa('graficar_modelo', etapa_graficar_modelo, {}, ['entrenar', 'evaluar'],
+                        lambda: etapa_graficar_modelo(r['entrenar'], r['evaluar'], salida, self.verbose),
+                        produce_archivos=True)
+        if activa('exportar_reglas'):
+            self._etapa('exportar_reglas', etapa_exportar_reglas, {}, ['entrenar'],
+                        lambda: etapa_exportar_reglas(r['entrenar'], salida), produce_archivos=True)
+        if activa('exportar_modelo'):
+            self._etapa('exportar_modelo', etapa_exportar_modelo, {}, ['entrenar', 'evaluar'],
+                        lambda: etapa_exportar_modelo(r['entrenar'], r['evaluar'], salida),
+                        produce_archivos=True)
+        if activa('manifiesto'):
+            params_manifiesto = {k: p[k] for k in ('semilla', 'test_size', 'modelo')}
+            self._etapa('manifiesto', etapa_manifiesto, params_manifiesto,
+                        ['generar', 'dividir', 'entrenar', 'evaluar'],
+                        lambda: etapa_manifiesto(r['generar'], r['dividir'], r['entrenar'], r['evaluar'],
+                                                 params_manifiesto, salida),
+                        produce_archivos=True)
+        if activa('reporte'):
+            self._etapa('reporte', etapa_reporte, {},
+                        ['manifiesto', 'graficar_datos', 'graficar_modelo', 'exportar_reglas',
+                         'exportar_modelo'],
+                        lambda: etapa_reporte(salida), produce_archivos=True)
+
+        return self.resultados
+
+    def _sincronizar_dataset(self, df):
+        ruta_csv = os.path.join(self.directorio_salida, ARCHIVO_DATASET)
+        texto = df.to_csv(index=False).encode('utf-8')
+        # Se ignoran los fines de línea: el CSV versionado en el repositorio usa CRLF
+        if not os.path.exists(ruta_csv) or _csv_normalizado(ruta_csv) != texto:
+            with open(ruta_csv, 'wb') as f:
+                f.write(texto)
+
+        ruta_columnar = os.path.join(self.directorio_salida, ARCHIVO_DATASET_COLUMNAR)
+        if not (es_columnar(ruta_columnar) and _columnar_igual(ruta_columnar, df)):
+            escribir_columnar(ruta_columnar, df)
+
+
+def _modulos_etapa(nombre):
+    modulos = list(MODULOS_ETAPA.get(nombre, []))
+    if nombre == 'reporte':
+        from generar_reporte_phishing import MODULOS_REPORTE
+
+        modulos += MODULOS_REPORTE
+    return modulos
+
+
+def _csv_normalizado(ruta):
+    with open(ruta, 'rb') as f:
+        return f.read().replace(b'\r\n', b'\n')
+
+
+def _columnar_igual(ruta, df):
+    """Verdadero si el dataset columnar tiene exactamente las columnas y valores de df"""
+    import numpy as np
+
+    try:
+        dataset = abrir_columnar(ruta)
+    except (OSError, ValueError, KeyError):
+        return False
+    if len(dataset) != len(df) or set(dataset.columnas) != set(df.columns):
+        return False
+    return all(np.array_equal(dataset[col], df[col].to_numpy().astype(tipo_columna(col)))
+               for col in df.columns)
+
+
+def modelo_entrenado(parametros=None, directorio_salida='.', verbose=False):
+    """Devuelve el DecisionTreeClassifier entrenado, usando la caché del pipeline"""
+    pipeline = PipelinePhishing(parametros, directorio_salida=directorio_salida, verbose=verbose)
+    return pipeline.ejecutar(hasta='entrenar')['entrenar']
+
+
+def _parsear_argumentos(argv=None):
+    defaults = parametros_por_defecto()
+    parser = argparse.ArgumentParser(
+        description='Pipeline con caché del árbol de decisión para detección de phishing')
+    parser.add_argument('--n-registros', type=int, default=defaults['n_registros'])
+    parser.add_argument('--semilla', type=int, default=defaults['semilla'])
+    parser.add_argument('--proporcion-legitimos', type=float, default=defaults['proporcion_legitimos'])
+    parser.add_argument('--test-size', type=float, default=defaults['test_size'])
+    parser.add_argument('--max-depth', type=int, default=PARAMETROS_MODELO['max_depth'])
+    parser.add_argument('--min-samples-split', type=int, default=PARAMETROS_MODELO['min_samples_split'])
+    parser.add_argument('--min-samples-leaf', type=int, default=PARAMETROS_MODELO['min_samples_leaf'])
+    parser.add_argument('--criterion', default=PARAMETROS_MODELO['criterion'],
+                        choices=['gini', 'entropy', 'log_loss'])
+    parser.add_argument('--hasta', choices=ETAPAS, help='Última etapa a ejecutar')
+    parser.add_argument('--sin-reporte', action='store_true', help='No generar el PDF')
+    parser.add_argument('--forzar', action='store_true', help='Ignorar la caché y recalcular todo')
+    parser.add_argument('--salida', default='.', help='Directorio donde se escriben los archivos')
+    parser.add_argument('--cache', default=DIRECTORIO_CACHE, help='Directorio de la caché')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parsear_argumentos(argv)
+    parametros = {
+        'n_registros': args.n_registros,
+        'semilla': args.semilla,
+        'proporcion_legitimos': args.proporcion_legitimos,
+        'test_size': args.test_size,
+        'modelo': {
+            'max_depth': args.max_depth,
+            'min_samples_split': args.min_samples_split,
+            'min_samples_leaf': args.min_samples_leaf,
+            'criterion': args.criterion,
+            'random_state': args.semilla
+        }
+    }
+    hasta = args.hasta or ('manifiesto' if args.sin_reporte else None)
+
+    print("\n" + "="*80)
+    print("PIPELINE - ÁRBOL DE DECISIÓN PARA DETECCIÓN DE PHISHING")
+    print("="*80 + "\n")
+
+    pipeline = PipelinePhishing(parametros, directorio_salida=args.salida,
+                                cache=CacheEtapas(args.cache), forzar=args.forzar)
+    inicio = time.perf_counter()
+    resultados = pipeline.ejecutar(hasta=hasta)
+    total = time.perf_counter() - inicio
+
+    if 'evaluar' in resultados:
+        metricas = resultados['evaluar']
+        print(f"\n🎯 Exactitud en prueba: {metricas['accuracy_test']*100:.2f}%")
+        print(f"🌳 Nodos: {metricas['n_nodos']}  Hojas: {metricas['n_hojas']}  "
+              f"Profundidad: {metricas['profundidad']}")
+    print(f"\n✅ Pipeline completado en {total:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""
+Motor de plantillas declarativas para los reportes PDF
+
+Cada reporte (generar_reporte_phishing.py, generar_reporte_pdf.py) se
+describe como una plantilla: colores, portada opcional y una lista de
+secciones, cada una con una lista de bloques que el motor convierte en
+flowables de reportlab:
+
+    ('titulo', texto)                          título de capítulo y espacio
+    ('subtitulo', texto)
+    ('parrafo', texto)
+    ('espacio', pulgadas)
+    ('salto',)                                 salto de página
+    ('indice', [entradas])                     entradas en negritas
+    ('vinetas', [elementos])
+    ('referencias', [referencias])             [1] ..., [2] ...
+    ('tabla', filas, anchos, opciones)         anchos en pulgadas
+    ('imagen', archivo, ancho, alto)           pulgadas
+    ('arbol', artefacto, respaldo, clases, ancho, alto)
+    ('si_existe', [archivos], [bloques])       sólo si existe alguno
+
+Los textos pueden llevar campos {nombre} con formato ({exactitud:.2f}) que
+se llenan con el contexto de cada reporte. La plantilla se compila una vez
+por proceso: los bloques sin campos ni archivos (objetivos, metodología,
+referencias...) se convierten en flowables al compilar y cada reporte recibe
+copias superficiales que comparten el texto ya analizado; sólo los bloques
+con datos del reporte (métricas, matriz de confusión, reglas, figuras) se
+construyen de nuevo.
+
+Uso:
+    python plantillas_reporte.py                 (resumen de las plantillas)
+    python plantillas_reporte.py --benchmark
+
+Requisitos: pip install reportlab pillow
+"""
+
+import argparse
+import copy
+import os
+import string
+import time
+
+import perfil_reporte
+from perfil_reporte import fase
+
+_FORMATEADOR = string.Formatter()
+
+# Nombre de la plantilla → PlantillaCompilada (una por proceso)
+_COMPILADAS = {}
+
+
+def _campos(texto):
+    return [campo for _, campo, _, _ in _FORMATEADOR.parse(texto) if campo is not None]
+
+
+def bloque_estatico(bloque):
+    """Un bloque es estático si no depende del contexto ni de archivos"""
+    tipo = bloque[0]
+    if tipo in ('imagen', 'arbol', 'si_existe'):
+        return False
+    if tipo == 'tabla':
+        return not any(_campos(str(celda)) for fila in bloque[1] for celda in fila)
+    if tipo in ('indice', 'vinetas', 'referencias'):
+        return not any(_campos(texto) for texto in bloque[1])
+    if tipo in ('titulo', 'subtitulo', 'parrafo'):
+        return not _campos(bloque[1])
+    return True
+
+
+def _estilo_tabla(color_encabezado, opciones):
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+
+    comandos = [
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(color_encabezado)),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER')
+    ]
+    if opciones.get('centrado_vertical'):
+        comandos.append(('VALIGN', (0, 0), (-1, -1), 'MIDDLE'))
+    comandos += [
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), getattr(colors, opciones.get('fondo', 'beige'))),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('FONTSIZE', (0, 1), (-1, -1), 9)
+    ]
+    if opciones.get('filas_alternas'):
+        comandos.append(('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]))
+    return TableStyle(comandos)
+
+
+class PlantillaCompilada:
+    """Plantilla con sus bloques estáticos ya convertidos en flowables"""
+
+    def __init__(self, plantilla):
+        from recursos_reporte import estilos_reporte
+
+        self.plantilla = plantilla
+        self.estilo_titulo, self.estilo_subtitulo, self.estilo_normal = estilos_reporte(*plantilla['colores'])
+        self.secciones = [(seccion['nombre'], [self._compilar(bloque) for bloque in seccion['bloques']])
+                          for seccion in plantilla['secciones']]
+
+    def _compilar(self, bloque):
+        """(bloque, flowables) si es estático; (bloque, None) si se construye en cada reporte"""
+        if bloque[0] == 'si_existe':
+            return bloque, [self._compilar(interno) for interno in bloque[2]]
+        if bloque_estatico(bloque):
+            return bloque, self._construir(bloque, None)
+        return bloque, None
+
+    def _texto(self, texto, contexto):
+        return texto.format_map(contexto) if contexto is not None and _campos(texto) else texto
+
+    def _construir(self, bloque, contexto):
+        from reportlab.lib.units import inch
+        from reportlab.platypus import PageBreak, Paragraph, Spacer, Table
+
+        tipo, argumentos = bloque[0], bloque[1:]
+        if tipo == 'titulo':
+            return [Paragraph(self._texto(argumentos[0], contexto), self.estilo_titulo), Spacer(1, 0.2*inch)]
+        if tipo == 'subtitulo':
+            return [Paragraph(self._texto(argumentos[0], contexto), self.estilo_subtitulo)]
+        if tipo == 'parrafo':
+            return [Paragraph(self._texto(argumentos[0], contexto), self.estilo_normal)]
+        if tipo == 'espacio':
+            return [Spacer(1, argumentos[0]*inch)]
+        if tipo == 'salto':
+            return [PageBreak()]
+        if tipo == 'indice':
+            elementos = []
+            for entrada in argumentos[0]:
+                elementos += [Paragraph(f"<b>{self._texto(entrada, contexto)}</b>", self.estilo_normal),
+                              Spacer(1, 0.1*inch)]
+            return elementos
+        if tipo == 'vinetas':
+            return [Paragraph(f"• {self._texto(elemento, contexto)}", self.estilo_normal)
+                    for elemento in argumentos[0]]
+        if tipo == 'referencias':
+            elementos = []
+            for i, referencia in enumerate(argumentos[0], 1):
+                elementos += [Paragraph(f"[{i}] {self._texto(referencia, contexto)}", self.estilo_normal),
+                              Spacer(1, 0.08*inch)]
+            return elementos
+        if tipo == 'tabla':
+            filas, anchos, opciones = argumentos
+            tabla = Table([[self._texto(str(celda), contexto) for celda in fila] for fila in filas],
+                          colWidths=[ancho*inch for ancho in anchos])
+            tabla.setStyle(_estilo_tabla(self.plantilla['colores'][0], opciones))
+            return [tabla]
+        if tipo == 'imagen':
+            from recursos_reporte import imagen_reporte
+
+            archivo, ancho, alto = argumentos
+            return [imagen_reporte(archivo, ancho*inch, alto*inch)] if os.path.exists(archivo) else []
+        if tipo == 'arbol':
+            artefacto, respaldo, clases, ancho, alto = argumentos
+            if os.path.exists(artefacto):
+                # Árbol vectorial desde el artefacto; si no cabe se parte en subárboles
+                with fase('arbol'):
+                    from arbol_vectorial import flowables_arbol
+                    from artefacto_modelo import cargar_artefacto
+
+                    return flowables_arbol(cargar_artefacto(artefacto), clases, ancho*inch, alto*inch,
+                                           self.estilo_normal)
+            return self._construir(('imagen', respaldo, ancho, alto), contexto)
+        raise ValueError(f"Tipo de bloque desconocido: {tipo!r}")
+
+    def _elementos(self, compilados, contexto):
+        elementos = []
+        for bloque, flowables in compilados:
+            if bloque[0] == 'si_existe':
+                if any(os.path.exists(archivo) for archivo in bloque[1]):
+                    elementos += self._elementos(flowables, contexto)
+            elif flowables is not None:
+                # Copias: reportlab guarda en cada flowable el estado de la maquetación
+                elementos += [copy.copy(flowable) for flowable in flowables]
+            else:
+                elementos += self._construir(bloque, contexto)
+        return elementos
+
+    def flowables(self, contexto=None):
+        """Flowables del reporte para el directorio actual y el contexto dado"""
+        from reportlab.platypus import PageBreak
+
+        # La portada ocupa la primera página completa (ver construir)
+        elementos = [PageBreak()] if self.plantilla.get('portada') else []
+        # Con un perfil activo, cada sección lleva una marca que separa su maquetación
+        perfilando = perfil_reporte.activo() is not None
+        with fase('construccion'):
+            for nombre, compilados in self.secciones:
+                with fase(nombre):
+                    if perfilando:
+                        elementos.append(perfil_reporte.marca(nombre))
+                    elementos += self._elementos(compilados, contexto or {})
+        if perfilando:
+            elementos.append(perfil_reporte.marca('escritura'))
+        return elementos
+
+    def resumen(self):
+        """(sección, bloques estáticos, bloques totales) de cada sección"""
+        def contar(compilados):
+            estaticos = total = 0
+            for bloque, flowables in compilados:
+                if bloque[0] == 'si_existe':
+                    e, t = contar(flowables)
+                    estaticos, total = estaticos + e, total + t
+                else:
+                    estaticos, total = estaticos + (flowables is not None), total + 1
+            return estaticos, total
+
+        return [(nombre, *contar(compilados)) for nombre, compilados in self.secciones]
+
+
+def compilar(plantilla):
+    """PlantillaCompilada de la plantilla, compilada una sola vez por proceso"""
+    if plantilla['nombre'] not in _COMPILADAS:
+        with fase('compilacion'):
+            _COMPILADAS[plantilla['nombre']] = PlantillaCompilada(plantilla)
+    return _COMPILADAS[plantilla['nombre']]
+
+
+def construir(plantilla, contexto, nombre_archivo):
+    """Genera el PDF de la plantilla con el contexto dado"""
+    # La primera vez en el proceso, importar reportlab es parte del costo
+    with fase('importacion'):
+        from reportlab.lib.pagesizes import letter
+        from reportlab.platypus import SimpleDocTemplate
+
+    elementos = compilar(plantilla).flowables(contexto)
+    doc = SimpleDocTemplate(nombre_archivo, pagesize=letter,
+                            rightMargin=50, leftMargin=50,
+                            topMargin=50, bottomMargin=50)
+    opciones = {}
+    portada = plantilla.get('portada')
+    if portada:
+        def agregar_portada(canvas, doc):
+            with fase('portada'):
+                canvas.saveState()
+                portada(canvas, letter[0], letter[1])
+                canvas.restoreState()
+
+        opciones['onFirstPage'] = agregar_portada
+    with fase('documento'):
+        doc.build(elementos, **opciones)
+    return nombre_archivo
+
+
+def _plantillas():
+    from generar_reporte_pdf import PLANTILLA as credito
+    from generar_reporte_phishing import PLANTILLA as phishing
+
+    return [phishing, credito]
+
+
+def benchmark(ruta_manifiesto=None, repeticiones=20):
+    """Tiempo de armar los flowables de cada plantilla sin y con la compilación en caché"""
+    from generar_reporte_phishing import contexto_reporte
+    from manifiesto_reporte import ARCHIVO_MANIFIESTO, cargar_manifiesto
+
+    contexto_phishing = contexto_reporte(cargar_manifiesto(ruta_manifiesto or ARCHIVO_MANIFIESTO))
+    resultados = {}
+    for plantilla in _plantillas():
+        contexto = contexto_phishing if plantilla['nombre'] == 'phishing' else {}
+        inicio = time.perf_counter()
+        for _ in range(repeticiones):
+            PlantillaCompilada(plantilla).flowables(contexto)
+        sin_cache = (time.perf_counter() - inicio) / repeticiones
+        compilada = compilar(plantilla)
+        inicio = time.perf_counter()
+        for _ in range(repeticiones):
+            compilada.flowables(contexto)
+        con_cache = (time.perf_counter() - inicio) / repeticiones
+        resultados[plantilla['nombre']] = {'sin_cache': sin_cache, 'con_cache': con_cache}
+    return resultados
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Plantillas declarativas de los reportes PDF')
+    parser.add_argument('--benchmark', action='store_true', help='Medir la caché de secciones estáticas')
+    parser.add_argument('--manifiesto', default=None, help='Manifiesto para el contexto del reporte de phishing')
+    parser.add_argument('--repeticiones', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        for nombre, r in benchmark(args.manifiesto, args.repeticiones).items():
+            print(f"⏱️  {nombre:10s} flowables sin caché {r['sin_cache']*1000:7.1f} ms, "
+                  f"con caché {r['con_cache']*1000:6.1f} ms ({r['sin_cache'] / r['con_cache']:.1f}x)")
+        return
+
+    for plantilla in _plantillas():
+        resumen = compilar(plantilla).resumen()
+        estaticos = sum(e for _, e, _ in resumen)
+        total = sum(t for _, _, t in resumen)
+        print(f"📄 {plantilla['nombre']}: {len(resumen)} secciones, {estaticos}/{total} bloques estáticos")
+        for nombre, e, t in resumen:
+            print(f"    {'🧊' if e == t else '🔄'} {nombre:20s} {e}/{t}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark de regresión del tiempo de importación (estilo python -X importtime)
+
+Importa cada módulo en un intérprete nuevo con `-X importtime`, toma el
+tiempo acumulado del módulo y lo compara contra su presupuesto. También
+verifica que ninguno de los módulos pesados (reportlab, numpy, pandas,
+scikit-learn, matplotlib) se importe al arrancar. Si algún módulo se pasa
+del presupuesto o importa algo prohibido, el programa termina con código 1,
+así que sirve como paso de verificación antes de publicar cambios.
+
+Uso:
+    python presupuesto_importacion.py
+    python presupuesto_importacion.py --modulo reporte_cli=25 --mostrar 10
+
+Requisitos: ninguno (sólo la biblioteca estándar)
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+# Módulo → presupuesto de importación en milisegundos
+PRESUPUESTOS_MS = {
+    'reporte_cli': 30.0,
+    'generar_reporte_phishing': 30.0,
+    'generar_reporte_pdf': 30.0
+}
+
+MODULOS_PESADOS = ('reportlab', 'numpy', 'pandas', 'sklearn', 'matplotlib', 'seaborn', 'PIL')
+
+
+def medir_importacion(modulo, repeticiones=5):
+    """Mejor tiempo acumulado (ms), módulos importados y los más lentos por tiempo propio"""
+    directorio = os.path.dirname(os.path.abspath(__file__))
+    entorno = {**os.environ,
+               'PYTHONPATH': os.pathsep.join(filter(None, [directorio, os.environ.get('PYTHONPATH')]))}
+    mejor = None
+    for _ in range(repeticiones):
+        resultado = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {modulo}'],
+                                   capture_output=True, text=True, env=entorno, cwd=directorio)
+        if resultado.returncode != 0:
+            raise RuntimeError(f"No se pudo importar '{modulo}':\n{resultado.stderr}")
+
+        # Líneas "import time: propio | acumulado | paquete"; la sangría indica el nivel
+        registros = []
+        for linea in resultado.stderr.splitlines():
+            if not linea.startswith('import time:') or 'self [us]' in linea:
+                continue
+            propio, acumulado, paquete = linea[len('import time:'):].split('|')
+            nivel = (len(paquete) - len(paquete.lstrip()) - 1) // 2
+            registros.append((paquete.strip(), nivel, int(propio), int(acumulado)))
+
+        posicion = next(i for i, r in enumerate(registros) if r[0] == modulo and r[1] == 0)
+        acumulado = registros[posicion][3] / 1000
+        if mejor is None or acumulado < mejor['ms']:
+            # importtime lista los hijos justo antes del padre, con más sangría
+            inicio = posicion
+            while inicio > 0 and registros[inicio - 1][1] > 0:
+                inicio -= 1
+            importados = registros[inicio:posicion + 1]
+            mejor = {
+                'modulo': modulo,
+                'ms': acumulado,
+                'importados': sorted({r[0] for r in importados}),
+                'mas_lentos': sorted(((r[0], r[2]) for r in importados), key=lambda r: r[1], reverse=True)
+            }
+    return mejor
+
+
+def verificar(presupuestos=None, repeticiones=5, mostrar=5):
+    """Mide cada módulo y devuelve (todo_bien, mediciones)"""
+    presupuestos = presupuestos or PRESUPUESTOS_MS
+    todo_bien = True
+    mediciones = []
+    for modulo, presupuesto in presupuestos.items():
+        medicion = medir_importacion(modulo, repeticiones)
+        pesados = sorted({p.split('.')[0] for p in medicion['importados']} & set(MODULOS_PESADOS))
+        medicion.update({'presupuesto_ms': presupuesto, 'pesados': pesados,
+                         'ok': medicion['ms'] <= presupuesto and not pesados})
+        todo_bien &= medicion['ok']
+        mediciones.append(medicion)
+
+        estado = '✅' if medicion['ok'] else '❌'
+        print(f"{estado} {modulo:28s} {medicion['ms']:8.1f} ms  (presupuesto {presupuesto:.0f} ms)")
+        if pesados:
+            print(f"     ⚠️  importa al arrancar: {', '.join(pesados)}")
+        if mostrar:
+            for paquete, propio in medicion['mas_lentos'][:mostrar]:
+                print(f"     {propio / 1000:8.2f} ms  {paquete}")
+    return todo_bien, mediciones
+
+
+def _presupuesto(texto):
+    modulo, _, ms = texto.partition('=')
+    return modulo, float(ms) if ms else PRESUPUESTOS_MS.get(modulo, 30.0)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Verifica el tiempo de importación contra un presupuesto')
+    parser.add_argument('--modulo', action='append', type=_presupuesto, metavar='MODULO[=MS]',
+                        help='Módulo a medir (se puede repetir); por defecto los reportes')
+    parser.add_argument('--repeticiones', type=int, default=5, help='Se toma el mejor de N intérpretes')
+    parser.add_argument('--mostrar', type=int, default=5, help='Módulos más lentos a listar')
+    args = parser.parse_args(argv)
+
+    presupuestos = dict(args.modulo) if args.modulo else None
+    print("⏱️  Tiempo de importación en frío (mejor de "
+          f"{args.repeticiones} intérpretes)\n")
+    todo_bien, _ = verificar(presupuestos, args.repeticiones, args.mostrar)
+    print("\n✅ Dentro del presupuesto" if todo_bien else "\n❌ Presupuesto de importación excedido")
+    return 0 if todo_bien else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+Puntuación por lotes de CSVs con el esquema de dataset_phishing.csv
+
+Lee el archivo de entrada en bloques de tamaño fijo, puntúa cada bloque con
+el árbol compilado (motor_inferencia.py) y escribe la etiqueta y la
+probabilidad de phishing de forma incremental. El uso de memoria depende
+sólo del tamaño de bloque, no del tamaño del archivo. La entrada también
+puede ser un dataset columnar .phcol (formato_columnar.py), que se recorre
+con memory-map sin parsear texto.
+
+Uso:
+    python puntuador_lotes.py exportacion_diaria.csv veredictos.csv
+    python puntuador_lotes.py entrada.csv.gz salida.csv --filas-por-bloque 500000
+    python puntuador_lotes.py dataset_grande.phcol veredictos.csv
+
+Requisitos: pip install pandas numpy (el modelo se genera con python artefacto_modelo.py exportar)
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from artefacto_modelo import ARCHIVO_MODELO, cargar_modelo
+
+FILAS_POR_BLOQUE = 200_000
+INTERVALO_PROGRESO = 2.0
+
+COLUMNAS_SALIDA = ['etiqueta', 'prob_phishing']
+
+
+def _leer_bloques(entrada, filas_por_bloque, columnas):
+    import pandas as pd
+    from formato_columnar import abrir_columnar, es_columnar
+
+    if es_columnar(entrada):
+        dataset = abrir_columnar(entrada)
+        return (pd.DataFrame(bloque, columns=columnas)
+                for bloque in dataset.bloques(filas_por_bloque, columnas))
+
+    tipos = {col: np.float32 for col in columnas}
+    return pd.read_csv(entrada, usecols=columnas, dtype=tipos, chunksize=filas_por_bloque)
+
+
+def puntuar_csv(entrada, salida, arbol, filas_por_bloque=FILAS_POR_BLOQUE,
+                conservar_columnas=False, progreso=True):
+    """Puntúa `entrada` por bloques y escribe los veredictos en `salida`
+
+    Con `conservar_columnas` también se copian los siete indicadores a la
+    salida. Devuelve un diccionario con filas procesadas, segundos y filas/s.
+    """
+    import pandas as pd
+
+    columnas = list(arbol.nombres_caracteristicas)
+    encabezado = (columnas if conservar_columnas else []) + COLUMNAS_SALIDA
+
+    inicio = time.perf_counter()
+    ultimo_reporte = inicio
+    filas = 0
+
+    with open(salida, 'w', encoding='utf-8', newline='') as f:
+        f.write(','.join(encabezado) + '\n')
+        for bloque in _leer_bloques(entrada, filas_por_bloque, columnas):
+            etiquetas, prob_phishing = arbol.puntuar(bloque)
+
+            resultado = bloque if conservar_columnas else pd.DataFrame(index=bloque.index)
+            resultado = resultado.assign(etiqueta=etiquetas, prob_phishing=prob_phishing)
+            resultado.to_csv(f, header=False, index=False, float_format='%.6g')
+
+            filas += len(bloque)
+            ahora = time.perf_counter()
+            if progreso and ahora - ultimo_reporte >= INTERVALO_PROGRESO:
+                ultimo_reporte = ahora
+                print(f"  ⏱️  {filas:>14,d} filas  {filas / (ahora - inicio):>12,.0f} filas/s",
+                      file=sys.stderr, flush=True)
+
+    segundos = time.perf_counter() - inicio
+    return {'filas': filas, 'segundos': segundos,
+            'filas_por_segundo': filas / segundos if segundos > 0 else float('inf')}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Puntúa un CSV con los siete indicadores de phishing por bloques')
+    parser.add_argument('entrada', help='CSV o dataset .phcol con las columnas de dataset_phishing.csv')
+    parser.add_argument('salida', help='CSV de salida con etiqueta y prob_phishing')
+    parser.add_argument('--filas-por-bloque', type=int, default=FILAS_POR_BLOQUE)
+    parser.add_argument('--conservar-columnas', action='store_true',
+                        help='Incluir los siete indicadores en la salida')
+    parser.add_argument('--modelo', default=ARCHIVO_MODELO, help='Artefacto del modelo (.phtree)')
+    args = parser.parse_args(argv)
+
+    arbol = cargar_modelo(args.modelo)
+
+    print(f"📥 Puntuando '{args.entrada}' en bloques de {args.filas_por_bloque:,d} filas...")
+    estadisticas = puntuar_csv(args.entrada, args.salida, arbol,
+                               filas_por_bloque=args.filas_por_bloque,
+                               conservar_columnas=args.conservar_columnas)
+    print(f"✅ {estadisticas['filas']:,d} filas en {estadisticas['segundos']:.2f} s "
+          f"({estadisticas['filas_por_segundo']:,.0f} filas/s) → '{args.salida}'")
+
+
+if __name__ == "__main__":
+    main()
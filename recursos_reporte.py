@@ -0,0 +1,151 @@
+"""
+Recursos compartidos por los generadores de reportes PDF
+
+Estilos, fuentes y figuras se preparan una sola vez por proceso y se
+reutilizan en todos los reportes que ese proceso genere:
+
+    • estilos_reporte()  → estilos de título, subtítulo y texto por paleta
+    • precargar_fuentes() → métricas de las fuentes Helvetica
+    • imagen_reporte()   → figura cuyo XObject (la imagen ya codificada para
+                           el PDF) se calcula una vez por contenido y se copia
+                           en cada documento nuevo
+
+Los XObjects se codifican sin ASCII85: el PDF ya es binario y esa
+codificación, en Python puro, era lo más caro de doc.build.
+
+generar_reporte_phishing.py y generar_reporte_pdf.py lo usan al generar;
+reportes_lote.py lo precarga en cada proceso del pool.
+
+Requisitos: pip install reportlab pillow
+"""
+
+import copy
+import hashlib
+import os
+from collections import OrderedDict
+from functools import lru_cache
+
+from reportlab import rl_config
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_JUSTIFY, TA_LEFT
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.pdfbase import pdfdoc, pdfmetrics
+from reportlab.platypus import Flowable, Image
+
+from optimizar_imagenes import optimizar_imagen
+from perfil_reporte import fase
+
+FUENTES = ['Helvetica', 'Helvetica-Bold', 'Helvetica-Oblique', 'Helvetica-BoldOblique']
+
+# SHA-256 del archivo → XObject codificado (uno por figura distinta y proceso); se
+# conservan los MAX_XOBJECTS usados más recientemente, así un proceso de
+# reportes_lote que recorre muchos directorios no acumula todas sus figuras
+MAX_XOBJECTS = 32
+_XOBJECTS = OrderedDict()
+
+
+@lru_cache(maxsize=None)
+def estilos_reporte(color_titulo, color_subtitulo):
+    """(título, subtítulo, normal) con los colores del reporte"""
+    estilos = getSampleStyleSheet()
+
+    estilo_titulo = ParagraphStyle(
+        'CustomTitle',
+        parent=estilos['Heading1'],
+        fontSize=18,
+        textColor=colors.HexColor(color_titulo),
+        spaceAfter=20,
+        alignment=TA_LEFT,
+        fontName='Helvetica-Bold'
+    )
+
+    estilo_subtitulo = ParagraphStyle(
+        'CustomSubtitle',
+        parent=estilos['Heading2'],
+        fontSize=14,
+        textColor=colors.HexColor(color_subtitulo),
+        spaceAfter=12,
+        spaceBefore=12,
+        fontName='Helvetica-Bold'
+    )
+
+    estilo_normal = ParagraphStyle(
+        'CustomNormal',
+        parent=estilos['Normal'],
+        fontSize=11,
+        alignment=TA_JUSTIFY,
+        spaceAfter=10
+    )
+    return estilo_titulo, estilo_subtitulo, estilo_normal
+
+
+def precargar_fuentes():
+    for fuente in FUENTES:
+        pdfmetrics.getFont(fuente)
+
+
+def _xobject(ruta):
+    """XObject de la figura, codificado sólo la primera vez que se ve su contenido"""
+    with open(ruta, 'rb') as f:
+        huella = hashlib.sha256(f.read()).hexdigest()
+    if huella in _XOBJECTS:
+        _XOBJECTS.move_to_end(huella)
+        return _XOBJECTS[huella]
+    anterior = rl_config.useA85
+    rl_config.useA85 = 0
+    try:
+        xobject = pdfdoc.PDFImageXObject(huella[:32], ruta, mask='auto')
+    finally:
+        rl_config.useA85 = anterior
+    _XOBJECTS[huella] = xobject
+    if len(_XOBJECTS) > MAX_XOBJECTS:
+        _XOBJECTS.popitem(last=False)
+    return xobject
+
+
+class ImagenPrecargada(Flowable):
+    """Figura de tamaño fijo que reutiliza el XObject ya codificado
+
+    Hace lo mismo que canvas.drawImage, pero registra en el documento una
+    copia del XObject en vez de volver a decodificar y comprimir la imagen.
+    """
+
+    hAlign = 'CENTER'
+
+    def __init__(self, ruta, width, height):
+        Flowable.__init__(self)
+        self.filename = ruta
+        self.drawWidth = width
+        self.drawHeight = height
+        self._xobject = _xobject(ruta)
+
+    def wrap(self, availWidth, availHeight):
+        return self.drawWidth, self.drawHeight
+
+    def draw(self):
+        canvas = self.canv
+        documento = canvas._doc
+        nombre = self._xobject.name
+        registro = documento.getXObjectName(nombre)
+        if registro not in documento.idToObject:
+            xobject = copy.copy(self._xobject)
+            canvas._setXObjects(xobject)
+            documento.Reference(xobject, registro)
+            documento.addForm(nombre, xobject)
+
+        canvas._currentPageHasImages = 1
+        canvas.saveState()
+        canvas.scale(self.drawWidth, self.drawHeight)
+        canvas._code.append(f"/{registro} Do")
+        canvas.restoreState()
+        canvas._formsinuse.append(nombre)
+
+
+def imagen_reporte(ruta, ancho, alto):
+    """Figura optimizada para una caja de ancho x alto puntos, lista para el reporte"""
+    with fase(f"imagen {os.path.basename(ruta)}"):
+        ruta = optimizar_imagen(ruta, ancho, alto)
+        # Con canal alfa (figura sin optimizar) se deja a reportlab generar la máscara
+        if getattr(_xobject(ruta), '_smask', None) is not None:
+            return Image(ruta, width=ancho, height=alto)
+        return ImagenPrecargada(ruta, ancho, alto)
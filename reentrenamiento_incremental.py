@@ -0,0 +1,459 @@
+"""
+Reentrenamiento incremental con ventana deslizante para mensajes etiquetados
+
+Los analistas etiquetan mensajes nuevos cada día. En vez de volver a
+entrenar con todo el histórico, este módulo:
+
+1. Agrega cada lote etiquetado como un segmento columnar (.phcol) a un
+   almacén en disco y borra los segmentos que quedan fuera de la ventana,
+   así que el almacén y el costo de entrenar dependen del tamaño de la
+   ventana, no del histórico.
+2. Decide si hace falta reentrenar: cuando se acumulan suficientes filas
+   nuevas, cuando la distribución de los indicadores se aleja de la usada
+   en el último ajuste (PSI) o cuando la exactitud del modelo publicado
+   sobre las filas nuevas cae respecto a la de su evaluación.
+3. Entrena con la ventana y publica el modelo de forma atómica: el
+   artefacto del modelo (artefacto_modelo.py) y el puntero
+   modelo_actual.json se escriben en temporales y se renombran, así que un
+   lector siempre ve un modelo completo.
+
+Uso:
+    python reentrenamiento_incremental.py ingerir etiquetados_hoy.csv
+    python reentrenamiento_incremental.py estado
+    python reentrenamiento_incremental.py reentrenar --forzar
+    python reentrenamiento_incremental.py simular --dias 12 --deriva-desde 7
+
+Requisitos: pip install numpy pandas scikit-learn
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+from esquema_phishing import CARACTERISTICAS, COLUMNAS, OBJETIVO, PARAMETROS_MODELO
+
+DIRECTORIO_ALMACEN = 'almacen_reentrenamiento'
+ARCHIVO_ESTADO = 'estado.json'
+ARCHIVO_MODELO_ACTUAL = 'modelo_actual.json'
+
+VENTANA_FILAS = 200_000
+MIN_FILAS_NUEVAS = 20_000
+MIN_FILAS_DERIVA = 500
+UMBRAL_PSI = 0.2
+CAIDA_MAXIMA = 0.02
+FRACCION_PRUEBA = 0.3
+
+# Intervalos para el PSI: los indicadores van de 0 a 10, contiene_url es 0/1
+BORDES_PSI = {col: np.linspace(0, 10, 11) for col in CARACTERISTICAS}
+BORDES_PSI['contiene_url'] = np.array([0, 0.5, 1])
+
+
+def _escribir_json_atomico(ruta, datos):
+    temporal = ruta + '.tmp'
+    with open(temporal, 'w', encoding='utf-8') as f:
+        json.dump(datos, f, indent=2, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporal, ruta)
+
+
+def _leer_datos(origen):
+    """Diccionario columna → arreglo desde un DataFrame, un CSV o un .phcol"""
+    from formato_columnar import abrir_columnar, es_columnar
+
+    if isinstance(origen, str):
+        if es_columnar(origen):
+            dataset = abrir_columnar(origen)
+            return {col: np.asarray(dataset[col]) for col in COLUMNAS}
+        import pandas as pd
+
+        origen = pd.read_csv(origen, usecols=COLUMNAS)
+    faltantes = [col for col in COLUMNAS if col not in origen]
+    if faltantes:
+        raise ValueError(f"Faltan columnas en el lote etiquetado: {faltantes}")
+    return {col: np.asarray(origen[col]) for col in COLUMNAS}
+
+
+# ============================================
+# DERIVA
+# ============================================
+
+def histogramas(datos):
+    """Proporción de filas por intervalo de cada indicador"""
+    resultado = {}
+    for col in CARACTERISTICAS:
+        conteos, _ = np.histogram(np.asarray(datos[col], dtype=np.float64), bins=BORDES_PSI[col])
+        resultado[col] = (conteos / max(conteos.sum(), 1)).tolist()
+    return resultado
+
+
+def psi(referencia, actual, epsilon=1e-4):
+    """Population Stability Index entre dos histogramas de proporciones"""
+    referencia = np.clip(np.asarray(referencia, dtype=np.float64), epsilon, None)
+    actual = np.clip(np.asarray(actual, dtype=np.float64), epsilon, None)
+    return float(np.sum((actual - referencia) * np.log(actual / referencia)))
+
+
+# ============================================
+# ALMACÉN CON VENTANA DESLIZANTE
+# ============================================
+
+class AlmacenVentana:
+    """Segmentos columnares de mensajes etiquetados con una ventana de filas acotada
+
+    El estado (segmentos vivos, último ajuste y versión publicada) vive en
+    estado.json y se reescribe de forma atómica después de cada cambio.
+    """
+
+    def __init__(self, directorio=DIRECTORIO_ALMACEN, ventana_filas=VENTANA_FILAS):
+        self.directorio = directorio
+        self.ventana_filas = ventana_filas
+        self.dir_segmentos = os.path.join(directorio, 'segmentos')
+        self.dir_modelos = os.path.join(directorio, 'modelos')
+        os.makedirs(self.dir_segmentos, exist_ok=True)
+        os.makedirs(self.dir_modelos, exist_ok=True)
+
+        ruta_estado = os.path.join(directorio, ARCHIVO_ESTADO)
+        if os.path.exists(ruta_estado):
+            with open(ruta_estado, encoding='utf-8') as f:
+                self.estado = json.load(f)
+        else:
+            self.estado = {'siguiente_segmento': 1, 'segmentos': [], 'ultimo_ajuste': None,
+                           'version_modelo': 0}
+
+    def guardar_estado(self):
+        _escribir_json_atomico(os.path.join(self.directorio, ARCHIVO_ESTADO), self.estado)
+
+    @property
+    def segmentos(self):
+        return self.estado['segmentos']
+
+    @property
+    def filas_totales(self):
+        return sum(s['filas'] for s in self.segmentos)
+
+    def agregar(self, datos):
+        """Guarda un lote etiquetado como segmento nuevo y devuelve su id"""
+        from formato_columnar import escribir_columnar
+
+        if not len(datos[OBJETIVO]):
+            return None
+        identificador = self.estado['siguiente_segmento']
+        archivo = f'lote_{identificador:06d}.phcol'
+        escribir_columnar(os.path.join(self.dir_segmentos, archivo), datos, COLUMNAS)
+        self.segmentos.append({'id': identificador, 'archivo': archivo,
+                               'filas': int(len(datos[OBJETIVO])),
+                               'fecha': datetime.now().isoformat(timespec='seconds')})
+        self.estado['siguiente_segmento'] = identificador + 1
+        self.guardar_estado()
+        return identificador
+
+    def _leer(self, segmentos, ultimas_filas=None):
+        """Concatena los segmentos (o sus últimas `ultimas_filas` filas)"""
+        from formato_columnar import abrir_columnar
+
+        partes = {col: [] for col in COLUMNAS}
+        restantes = ultimas_filas
+        for segmento in reversed(segmentos):
+            if restantes is not None and restantes <= 0:
+                break
+            dataset = abrir_columnar(os.path.join(self.dir_segmentos, segmento['archivo']))
+            inicio = 0 if restantes is None else max(dataset.n_filas - restantes, 0)
+            for col in COLUMNAS:
+                partes[col].append(np.asarray(dataset[col][inicio:]))
+            if restantes is not None:
+                restantes -= dataset.n_filas - inicio
+        return {col: (np.concatenate(partes[col][::-1]) if partes[col]
+                      else np.empty(0, dtype=np.float32)) for col in COLUMNAS}
+
+    def ventana(self):
+        """Las últimas `ventana_filas` filas etiquetadas; sólo se leen los segmentos necesarios"""
+        return self._leer(self.segmentos, self.ventana_filas)
+
+    def nuevos(self):
+        """Filas de los segmentos agregados después del último ajuste"""
+        ultimo = (self.estado['ultimo_ajuste'] or {}).get('ultimo_segmento', 0)
+        return self._leer([s for s in self.segmentos if s['id'] > ultimo])
+
+    def compactar(self):
+        """Borra los segmentos que ya no aportan filas a la ventana ni están pendientes"""
+        ultimo = (self.estado['ultimo_ajuste'] or {}).get('ultimo_segmento', 0)
+        conservar, acumuladas = [], 0
+        for segmento in reversed(self.segmentos):
+            if acumuladas < self.ventana_filas or segmento['id'] > ultimo:
+                conservar.append(segmento)
+            else:
+                shutil.rmtree(os.path.join(self.dir_segmentos, segmento['archivo']), ignore_errors=True)
+            acumuladas += segmento['filas']
+        eliminados = len(self.segmentos) - len(conservar)
+        if eliminados:
+            self.estado['segmentos'] = conservar[::-1]
+            self.guardar_estado()
+        return eliminados
+
+
+# ============================================
+# REENTRENAMIENTO Y PUBLICACIÓN
+# ============================================
+
+class ReentrenadorIncremental:
+    """Decide cuándo reentrenar con la ventana y publica el modelo atómicamente"""
+
+    def __init__(self, directorio=DIRECTORIO_ALMACEN, parametros_modelo=None,
+                 ventana_filas=VENTANA_FILAS, min_filas_nuevas=MIN_FILAS_NUEVAS,
+                 umbral_psi=UMBRAL_PSI, caida_maxima=CAIDA_MAXIMA, min_filas_deriva=MIN_FILAS_DERIVA,
+                 verbose=True):
+        self.almacen = AlmacenVentana(directorio, ventana_filas)
+        self.parametros_modelo = dict(parametros_modelo or PARAMETROS_MODELO)
+        self.min_filas_nuevas = min_filas_nuevas
+        self.umbral_psi = umbral_psi
+        self.caida_maxima = caida_maxima
+        self.min_filas_deriva = min_filas_deriva
+        self.verbose = verbose
+
+    def _log(self, mensaje):
+        if self.verbose:
+            print(mensaje)
+
+    def evaluar(self):
+        """Filas nuevas, PSI por indicador y exactitud del modelo publicado sobre ellas"""
+        ajuste = self.almacen.estado['ultimo_ajuste']
+        nuevos = self.almacen.nuevos()
+        n_nuevas = len(nuevos[OBJETIVO])
+        diagnostico = {'filas_nuevas': n_nuevas, 'psi': {}, 'psi_maximo': 0.0,
+                       'accuracy_nuevas': None, 'accuracy_referencia': None}
+        if ajuste is None or n_nuevas < self.min_filas_deriva:
+            return diagnostico
+
+        actuales = histogramas(nuevos)
+        diagnostico['psi'] = {col: psi(ajuste['histogramas'][col], actuales[col]) for col in CARACTERISTICAS}
+        diagnostico['psi_maximo'] = max(diagnostico['psi'].values())
+
+        arbol = cargar_modelo_publicado(self.almacen.directorio)
+        if arbol is not None:
+            etiquetas, _ = arbol.puntuar(nuevos)
+            diagnostico['accuracy_nuevas'] = float(np.mean(etiquetas == nuevos[OBJETIVO]))
+            diagnostico['accuracy_referencia'] = ajuste['accuracy_test']
+        return diagnostico
+
+    def motivo_ajuste(self, diagnostico):
+        """Razón para reentrenar o None"""
+        if self.almacen.estado['ultimo_ajuste'] is None:
+            return 'sin modelo publicado' if diagnostico['filas_nuevas'] else None
+        if diagnostico['filas_nuevas'] >= self.min_filas_nuevas:
+            return f"{diagnostico['filas_nuevas']:,d} filas nuevas"
+        if diagnostico['psi_maximo'] >= self.umbral_psi:
+            columna = max(diagnostico['psi'], key=diagnostico['psi'].get)
+            return f"deriva en {columna} (PSI {diagnostico['psi_maximo']:.3f})"
+        if (diagnostico['accuracy_nuevas'] is not None and
+                diagnostico['accuracy_nuevas'] < diagnostico['accuracy_referencia'] - self.caida_maxima):
+            return (f"exactitud en filas nuevas {diagnostico['accuracy_nuevas']*100:.2f}% "
+                    f"< {diagnostico['accuracy_referencia']*100:.2f}%")
+        return None
+
+    def ajustar(self, motivo='forzado'):
+        """Entrena con la ventana actual y publica el modelo
+
+        Lanza ValueError si la ventana no alcanza para entrenar.
+        """
+        from sklearn.model_selection import train_test_split
+        from sklearn.tree import DecisionTreeClassifier
+
+        inicio = time.perf_counter()
+        ventana = self.almacen.ventana()
+        n_filas = len(ventana[OBJETIVO])
+        if n_filas == 0:
+            raise ValueError("La ventana está vacía: ingiera un lote etiquetado antes de reentrenar")
+        n_prueba = int(np.ceil(FRACCION_PRUEBA * n_filas))
+        minimo = self.parametros_modelo.get('min_samples_split', 2)
+        minimo = minimo if isinstance(minimo, int) else 2
+        if n_filas - n_prueba < minimo:
+            raise ValueError(f"La ventana tiene {n_filas:,d} filas: tras apartar {FRACCION_PRUEBA:.0%} para "
+                             f"prueba quedan {n_filas - n_prueba:,d} para entrenar y min_samples_split "
+                             f"es {minimo}")
+
+        X = np.column_stack([ventana[col] for col in CARACTERISTICAS]).astype(np.float32)
+        y = np.asarray(ventana[OBJETIVO])
+        # Estratificar sólo si cada clase puede aparecer en entrenamiento y en prueba
+        _, conteos = np.unique(y, return_counts=True)
+        estratos = y if len(conteos) > 1 and conteos.min() >= 2 and n_prueba >= len(conteos) else None
+        X_train, X_test, y_train, y_test = train_test_split(
+            X, y, test_size=FRACCION_PRUEBA, random_state=self.parametros_modelo.get('random_state'),
+            stratify=estratos)
+
+        modelo = DecisionTreeClassifier(**self.parametros_modelo)
+        modelo.fit(X_train, y_train)
+        segundos = time.perf_counter() - inicio
+
+        metadatos = {
+            'motivo': motivo,
+            'fecha': datetime.now().isoformat(timespec='seconds'),
+            'filas_ventana': int(len(y)),
+            'accuracy_train': float(np.mean(modelo.predict(X_train) == y_train)),
+            'accuracy_test': float(np.mean(modelo.predict(X_test) == y_test)),
+            'n_nodos': int(modelo.tree_.node_count),
+            'segundos_entrenamiento': segundos,
+            'ultimo_segmento': self.almacen.segmentos[-1]['id'],
+            'histogramas': histogramas(ventana)
+        }
+        version = self.publicar(modelo, metadatos)
+        self._log(f"  🚀 Modelo v{version} publicado ({motivo}): {len(y):,d} filas en {segundos:.2f} s, "
+                  f"exactitud en prueba {metadatos['accuracy_test']*100:.2f}%")
+        return version
+
+    def publicar(self, modelo, metadatos):
+        """Escribe el artefacto y mueve el puntero modelo_actual.json de forma atómica"""
+        from artefacto_modelo import exportar_modelo
+
+        estado = self.almacen.estado
+        version = estado['version_modelo'] + 1
+        archivo = f'modelo_v{version:06d}.phtree'
+        resumen = {k: v for k, v in metadatos.items() if k != 'histogramas'}
+        exportar_modelo(modelo, os.path.join(self.almacen.dir_modelos, archivo),
+                        {'version': version, **resumen})
+
+        _escribir_json_atomico(os.path.join(self.almacen.directorio, ARCHIVO_MODELO_ACTUAL),
+                               {'version': version, 'archivo': os.path.join('modelos', archivo), **resumen})
+
+        anterior = estado['ultimo_ajuste']
+        estado['version_modelo'] = version
+        estado['ultimo_ajuste'] = {'version': version, **metadatos}
+        self.almacen.guardar_estado()
+
+        # El modelo anterior se conserva hasta la siguiente publicación para los lectores en curso
+        if anterior is not None:
+            for nombre in os.listdir(self.almacen.dir_modelos):
+                if nombre.endswith('.phtree') and nombre < f"modelo_v{anterior['version']:06d}.phtree":
+                    os.remove(os.path.join(self.almacen.dir_modelos, nombre))
+        return version
+
+    def procesar(self, origen, forzar=False):
+        """Agrega un lote etiquetado y reentrena si hace falta; devuelve el diagnóstico"""
+        datos = _leer_datos(origen)
+        self.almacen.agregar(datos)
+        diagnostico = self.evaluar()
+        motivo = 'forzado' if forzar else self.motivo_ajuste(diagnostico)
+        diagnostico['motivo'] = motivo
+        diagnostico['version'] = self.ajustar(motivo) if motivo else None
+        diagnostico['segmentos_eliminados'] = self.almacen.compactar()
+        return diagnostico
+
+
+def cargar_modelo_publicado(directorio=DIRECTORIO_ALMACEN):
+    """Árbol compilado apuntado por modelo_actual.json, o None"""
+    from artefacto_modelo import cargar_artefacto
+
+    ruta_puntero = os.path.join(directorio, ARCHIVO_MODELO_ACTUAL)
+    if not os.path.exists(ruta_puntero):
+        return None
+    with open(ruta_puntero, encoding='utf-8') as f:
+        puntero = json.load(f)
+    return cargar_artefacto(os.path.join(directorio, puntero['archivo']))
+
+
+# ============================================
+# SIMULACIÓN
+# ============================================
+
+def lote_simulado(dia, n_filas, deriva=0.0, semilla=0):
+    """Lote etiquetado del generador; con `deriva` > 0 el phishing exagera menos la oferta"""
+    from generador_dataset import generar_fragmento
+
+    lote = generar_fragmento(dia, n_filas, semilla)
+    if deriva:
+        phishing = lote[OBJETIVO] == 1
+        for col in ('oferta_irreal', 'tono_urgencia'):
+            lote[col][phishing] = (lote[col][phishing] * (1 - deriva)).round(1)
+    return lote
+
+
+def simular(directorio, dias, filas_por_dia, deriva_desde, deriva, reentrenador_kwargs):
+    shutil.rmtree(directorio, ignore_errors=True)
+    reentrenador = ReentrenadorIncremental(directorio, **reentrenador_kwargs)
+    for dia in range(1, dias + 1):
+        lote = lote_simulado(dia, filas_por_dia, deriva if dia >= deriva_desde else 0.0)
+        diagnostico = reentrenador.procesar(lote)
+        exactitud = diagnostico['accuracy_nuevas']
+        texto_exactitud = f"{exactitud*100:6.2f}%" if exactitud is not None else '     -'
+        print(f"📅 Día {dia:>3d}: {filas_por_dia:,d} filas  PSI máx {diagnostico['psi_maximo']:.3f}  "
+              f"exactitud nuevas {texto_exactitud}  "
+              f"→ {diagnostico['motivo'] or 'sin cambios'}")
+    almacen = reentrenador.almacen
+    print(f"\n📦 {len(almacen.segmentos)} segmentos, {almacen.filas_totales:,d} filas en el almacén "
+          f"(ventana {almacen.ventana_filas:,d})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Reentrenamiento incremental con ventana deslizante')
+    parser.add_argument('--directorio', default=DIRECTORIO_ALMACEN)
+    parser.add_argument('--ventana-filas', type=int, default=VENTANA_FILAS)
+    parser.add_argument('--min-filas-nuevas', type=int, default=MIN_FILAS_NUEVAS)
+    parser.add_argument('--umbral-psi', type=float, default=UMBRAL_PSI)
+    parser.add_argument('--caida-maxima', type=float, default=CAIDA_MAXIMA)
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    p = sub.add_parser('ingerir', help='Agregar un lote etiquetado (CSV o .phcol)')
+    p.add_argument('lotes', nargs='+')
+    p.add_argument('--forzar', action='store_true', help='Reentrenar aunque no haga falta')
+
+    sub.add_parser('estado', help='Mostrar el almacén, la deriva y el modelo publicado')
+
+    p = sub.add_parser('reentrenar', help='Reentrenar con la ventana actual')
+    p.add_argument('--forzar', action='store_true', help='Reentrenar aunque no haga falta')
+
+    p = sub.add_parser('simular', help='Simular días de etiquetado con deriva')
+    p.add_argument('--dias', type=int, default=12)
+    p.add_argument('--filas-por-dia', type=int, default=5_000)
+    p.add_argument('--deriva-desde', type=int, default=7)
+    p.add_argument('--deriva', type=float, default=0.6)
+
+    args = parser.parse_args(argv)
+    kwargs = {'ventana_filas': args.ventana_filas, 'min_filas_nuevas': args.min_filas_nuevas,
+              'umbral_psi': args.umbral_psi, 'caida_maxima': args.caida_maxima}
+
+    if args.comando == 'simular':
+        simular(args.directorio, args.dias, args.filas_por_dia, args.deriva_desde, args.deriva, kwargs)
+        return
+
+    reentrenador = ReentrenadorIncremental(args.directorio, **kwargs)
+    if args.comando == 'ingerir':
+        for lote in args.lotes:
+            try:
+                diagnostico = reentrenador.procesar(lote, forzar=args.forzar)
+            except ValueError as e:
+                print(f"❌ '{lote}': {e}")
+                return 1
+            print(f"📥 '{lote}': {diagnostico['filas_nuevas']:,d} filas pendientes, "
+                  f"PSI máx {diagnostico['psi_maximo']:.3f} → {diagnostico['motivo'] or 'sin cambios'}")
+    elif args.comando == 'reentrenar':
+        motivo = 'forzado' if args.forzar else reentrenador.motivo_ajuste(reentrenador.evaluar())
+        if motivo:
+            try:
+                reentrenador.ajustar(motivo)
+            except ValueError as e:
+                print(f"❌ {e}")
+                return 1
+            reentrenador.almacen.compactar()
+        else:
+            print("✅ No hace falta reentrenar")
+    else:
+        almacen = reentrenador.almacen
+        diagnostico = reentrenador.evaluar()
+        ajuste = almacen.estado['ultimo_ajuste']
+        print(f"📦 {len(almacen.segmentos)} segmentos, {almacen.filas_totales:,d} filas "
+              f"(ventana {almacen.ventana_filas:,d})")
+        if ajuste:
+            print(f"🌳 Modelo v{ajuste['version']} ({ajuste['fecha']}): {ajuste['filas_ventana']:,d} filas, "
+                  f"exactitud en prueba {ajuste['accuracy_test']*100:.2f}%")
+        print(f"🆕 {diagnostico['filas_nuevas']:,d} filas nuevas, PSI máx {diagnostico['psi_maximo']:.3f}")
+        print(f"➡️  {reentrenador.motivo_ajuste(diagnostico) or 'No hace falta reentrenar'}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Línea de comandos de arranque rápido para los reportes PDF de la Actividad 9
+
+Al arrancar sólo importa la biblioteca estándar: los generadores
+(generar_reporte_phishing.py y generar_reporte_pdf.py) y reportlab se
+importan cuando se pide un reporte, así que `--help`, `listar` o
+`presupuesto` responden de inmediato.
+
+Uso:
+    python reporte_cli.py listar
+    python reporte_cli.py generar phishing
+    python reporte_cli.py generar todos --directorio salida/
+    python reporte_cli.py generar phishing --perfil traza.json
+    python reporte_cli.py presupuesto
+
+Requisitos: pip install reportlab pillow (sólo para generar)
+"""
+
+import argparse
+import contextlib
+import importlib
+import os
+import sys
+import time
+
+# Nombre del reporte → (módulo generador, descripción)
+REPORTES = {
+    'phishing': ('generar_reporte_phishing', 'Árbol de Decisión - Detección de Phishing'),
+    'credito': ('generar_reporte_pdf', 'Árbol de Decisión - Aprobación de Créditos')
+}
+
+
+def generar(nombre, directorio='.', forzar=False, perfil=None, memoria=True):
+    """Genera un reporte dentro de `directorio` y devuelve la ruta del PDF
+
+    Con `perfil` (ruta de una traza JSON) se reconstruye siempre y se mide
+    cada fase con perfil_reporte.py; `memoria` activa tracemalloc.
+    """
+    modulo, _ = REPORTES[nombre]
+    if perfil:
+        from perfil_reporte import perfilar
+
+        perfil = os.path.abspath(perfil)
+        with contextlib.chdir(directorio), perfilar(nombre, perfil, memoria):
+            generador = importlib.import_module(modulo)
+            return os.path.join(directorio, generador.generar_reporte(forzar=True))
+    with contextlib.chdir(directorio):
+        generador = importlib.import_module(modulo)
+        return os.path.join(directorio, generador.generar_reporte(forzar=forzar))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Reportes PDF de la Actividad 9')
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    sub.add_parser('listar', help='Mostrar los reportes disponibles')
+
+    p = sub.add_parser('generar', help='Generar uno o todos los reportes')
+    p.add_argument('reporte', choices=list(REPORTES) + ['todos'])
+    p.add_argument('--directorio', default='.', help='Directorio con las imágenes y donde se escribe el PDF')
+    p.add_argument('--forzar', action='store_true', help='Reconstruir aunque las entradas no hayan cambiado')
+    p.add_argument('--perfil', default=None, metavar='TRAZA.json',
+                   help='Medir tiempo y memoria por sección (con "todos", una traza por reporte)')
+    p.add_argument('--perfil-sin-memoria', action='store_true',
+                   help='Con --perfil, medir sólo tiempos (tracemalloc hace lento el reporte)')
+
+    p = sub.add_parser('presupuesto', help='Verificar el tiempo de importación contra el presupuesto')
+    p.add_argument('--repeticiones', type=int, default=5)
+
+    args = parser.parse_args(argv)
+
+    if args.comando == 'listar':
+        for nombre, (modulo, descripcion) in REPORTES.items():
+            print(f"  • {nombre:10s} {descripcion}  ({modulo}.py)")
+        return 0
+
+    if args.comando == 'presupuesto':
+        from presupuesto_importacion import main as verificar
+
+        return verificar(['--repeticiones', str(args.repeticiones)])
+
+    nombres = list(REPORTES) if args.reporte == 'todos' else [args.reporte]
+    fallidos = 0
+    for nombre in nombres:
+        print(f"📄 Generando reporte '{nombre}'...")
+        inicio = time.perf_counter()
+        perfil = args.perfil
+        if perfil and len(nombres) > 1:
+            base, extension = os.path.splitext(perfil)
+            perfil = f"{base}_{nombre}{extension}"
+        try:
+            ruta = generar(nombre, args.directorio, args.forzar, perfil, not args.perfil_sin_memoria)
+        except Exception as e:
+            fallidos += 1
+            print(f"❌ Error al generar el reporte '{nombre}': {e}")
+            continue
+        print(f"✅ {ruta} ({time.perf_counter() - inicio:.2f} s)")
+        if perfil:
+            print(f"📊 Traza del perfil: {perfil}  (python perfil_reporte.py {perfil})")
+    return 1 if fallidos else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+"""
+Generación de reportes PDF por lotes en un pool de procesos
+
+Cada especificación es un reporte ('phishing' o 'credito') y el directorio
+con sus entradas (manifiesto, figuras, modelo): uno por versión del modelo,
+cliente o segmento de datos. Los procesos del pool importan reportlab y los
+generadores, precargan fuentes y estilos una sola vez y conservan las
+figuras ya codificadas entre reportes (ver recursos_reporte.py), así que
+cada reporte adicional sólo paga la maquetación y la escritura del PDF.
+
+Uso:
+    python reportes_lote.py salida_v1/ salida_v2/ salida_v3/
+    python reportes_lote.py --especificaciones lote.json --procesos 4 --forzar
+    python reportes_lote.py salida_v1/ salida_v2/ --forzar --comparar
+
+lote.json es una lista de {"reporte": "phishing", "directorio": "salida_v1/"}.
+
+Requisitos: pip install reportlab pillow
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from reporte_cli import REPORTES
+
+
+# ============================================
+# PROCESOS TRABAJADORES
+# ============================================
+
+def _inicializar():
+    """Importa y precarga todo lo que comparten los reportes del proceso"""
+    import importlib
+
+    from recursos_reporte import estilos_reporte, precargar_fuentes
+
+    precargar_fuentes()
+    for modulo, _ in REPORTES.values():
+        generador = importlib.import_module(modulo)
+        estilos_reporte(*generador.COLORES_ESTILO)
+
+
+def generar_especificacion(especificacion, forzar=False):
+    """Genera un reporte y devuelve la especificación con el PDF, el tiempo y el proceso"""
+    from reporte_cli import generar
+
+    resultado = dict(especificacion, pid=os.getpid(), pdf=None, error=None)
+    inicio = time.perf_counter()
+    try:
+        resultado['pdf'] = generar(especificacion['reporte'], especificacion['directorio'], forzar)
+    except Exception as e:
+        resultado['error'] = str(e)
+    resultado['segundos'] = time.perf_counter() - inicio
+    return resultado
+
+
+# ============================================
+# ORQUESTACIÓN
+# ============================================
+
+def validar_especificaciones(especificaciones):
+    """Comprueba reporte y directorio; dos reportes iguales en un directorio chocarían"""
+    vistos = set()
+    for especificacion in especificaciones:
+        if especificacion.get('reporte') not in REPORTES:
+            raise ValueError(f"Reporte desconocido: {especificacion.get('reporte')!r}")
+        if not os.path.isdir(especificacion.get('directorio', '')):
+            raise ValueError(f"No existe el directorio: {especificacion.get('directorio')!r}")
+        clave = (especificacion['reporte'], os.path.realpath(especificacion['directorio']))
+        if clave in vistos:
+            raise ValueError(f"Reporte '{clave[0]}' repetido en '{especificacion['directorio']}'")
+        vistos.add(clave)
+
+
+def generar_lote(especificaciones, procesos=None, forzar=False, progreso=True):
+    """Genera todos los reportes y devuelve los resultados, el tiempo total y reportes/min"""
+    especificaciones = list(especificaciones)
+    validar_especificaciones(especificaciones)
+    procesos = max(1, min(procesos or os.cpu_count() or 1, len(especificaciones)))
+
+    resultados = []
+    inicio = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=procesos, initializer=_inicializar) as pool:
+        futuros = [pool.submit(generar_especificacion, especificacion, forzar)
+                   for especificacion in especificaciones]
+        for futuro in as_completed(futuros):
+            resultado = futuro.result()
+            resultados.append(resultado)
+            if progreso:
+                _mostrar(resultado)
+    total = time.perf_counter() - inicio
+    return _resumir(resultados, procesos, total)
+
+
+def generar_secuencial(especificaciones, forzar=False, progreso=True):
+    """Referencia: un proceso nuevo de reporte_cli.py por reporte, como hasta ahora"""
+    especificaciones = list(especificaciones)
+    validar_especificaciones(especificaciones)
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'reporte_cli.py')
+
+    resultados = []
+    inicio = time.perf_counter()
+    for especificacion in especificaciones:
+        comando = [sys.executable, script, 'generar', especificacion['reporte'],
+                   '--directorio', especificacion['directorio']] + (['--forzar'] if forzar else [])
+        comienzo = time.perf_counter()
+        salida = subprocess.run(comando, capture_output=True, text=True)
+        resultado = dict(especificacion, pid=None, pdf=None, segundos=time.perf_counter() - comienzo,
+                         error=None if salida.returncode == 0 else (salida.stdout + salida.stderr).strip())
+        resultados.append(resultado)
+        if progreso:
+            _mostrar(resultado)
+    total = time.perf_counter() - inicio
+    return _resumir(resultados, 1, total)
+
+
+def _resumir(resultados, procesos, total):
+    correctos = [r for r in resultados if r['error'] is None]
+    return {
+        'resultados': resultados,
+        'procesos': procesos,
+        'total': total,
+        'correctos': len(correctos),
+        'fallidos': len(resultados) - len(correctos),
+        'reportes_por_minuto': len(correctos) / total * 60 if total else 0.0
+    }
+
+
+def _mostrar(resultado):
+    etiqueta = f"{resultado['reporte']} @ {resultado['directorio']}"
+    if resultado['error'] is not None:
+        print(f"  ❌ {etiqueta:45s} {resultado['error'].splitlines()[-1]}")
+    else:
+        proceso = f"  (proceso {resultado['pid']})" if resultado['pid'] else ''
+        print(f"  📄 {etiqueta:45s} {resultado['segundos']:6.2f} s{proceso}")
+
+
+def _resumen(etiqueta, lote):
+    print(f"⏱️  {etiqueta}: {lote['correctos']} reporte(s) en {lote['total']:.2f} s con "
+          f"{lote['procesos']} proceso(s) → {lote['reportes_por_minuto']:.1f} reportes/min"
+          + (f" ({lote['fallidos']} fallido(s))" if lote['fallidos'] else ''))
+
+
+def cargar_especificaciones(ruta):
+    with open(ruta, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Genera muchos reportes PDF en un pool de procesos')
+    parser.add_argument('directorios', nargs='*', help='Un reporte por directorio')
+    parser.add_argument('--reporte', choices=list(REPORTES), default='phishing',
+                        help='Reporte para los directorios dados en la línea de comandos')
+    parser.add_argument('--especificaciones', help='JSON con la lista de {reporte, directorio}')
+    parser.add_argument('--procesos', type=int, default=None, help='Por defecto, uno por núcleo')
+    parser.add_argument('--forzar', action='store_true', help='Reconstruir aunque las entradas no hayan cambiado')
+    parser.add_argument('--comparar', action='store_true', help='Medir también un proceso nuevo por reporte')
+    args = parser.parse_args(argv)
+
+    especificaciones = [{'reporte': args.reporte, 'directorio': d} for d in args.directorios]
+    if args.especificaciones:
+        especificaciones += cargar_especificaciones(args.especificaciones)
+    if not especificaciones:
+        parser.error('indica directorios o --especificaciones')
+    try:
+        validar_especificaciones(especificaciones)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.comparar:
+        print("🐢 Un proceso nuevo por reporte")
+        _resumen('Secuencial', generar_secuencial(especificaciones, args.forzar))
+        print()
+    print("🚀 Pool de procesos con recursos precargados")
+    lote = generar_lote(especificaciones, args.procesos, args.forzar)
+    _resumen('Lote', lote)
+    return 1 if lote['fallidos'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
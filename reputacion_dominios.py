@@ -0,0 +1,443 @@
+"""
+Índice de reputación de dominios en un archivo con memory-map
+
+Responde en tiempo constante si un host pertenece a una institución
+permitida, a un dominio malicioso conocido o a un TLD de riesgo, incluyendo
+los dominios padre: www.login.bancoreal.com.mx coincide con la entrada
+bancoreal.com.mx y seguridad-bancaria-mx.tk con el TLD tk. Gana la entrada
+más específica.
+
+El índice se construye una vez (sin conexión) en un solo archivo .phrep:
+
+    encabezado de 64 bytes    PHREP, versión, bits de la tabla, entradas por categoría
+    tabla de 2^bits ranuras   uint64 little-endian
+
+Cada ranura guarda la huella blake2b de 64 bits del dominio con los dos bits
+bajos reemplazados por la categoría (0 = ranura vacía). La posición inicial
+sale de los bits altos de la huella y las colisiones se resuelven con sondeo
+lineal, con la tabla como mucho al 70 % de ocupación. No se guardan los
+nombres: como la tabla es la menor potencia de dos que respeta ese límite
+(ocupación entre 35 % y 70 %), el archivo ocupa de unos 11 a 23 bytes por
+dominio. Con huellas de 62 bits la probabilidad de un falso positivo es
+despreciable (≈ n / 2^62).
+
+Los puntuadores abren el archivo con mmap de sólo lectura: abrir no lee
+nada y varios procesos que abren el mismo índice comparten las páginas de la
+caché del sistema. El índice se pasa a un pool por su ruta (al serializarse
+se vuelve a abrir en cada proceso).
+
+Uso:
+    python reputacion_dominios.py construir --permitidos top_sitios.csv \\
+        --maliciosos lista_negra.txt --tlds tlds_riesgo.txt
+    python reputacion_dominios.py consultar www.bancoreal.com.mx seguridad-bancaria-mx.tk
+    python reputacion_dominios.py benchmark --dominios 1e6
+
+    from reputacion_dominios import abrir_indice
+    indice = abrir_indice()
+    categoria, coincidencia = indice.consultar('login.paypal.com')
+
+Requisitos: pip install numpy
+"""
+
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import time
+
+import numpy as np
+
+ARCHIVO_REPUTACION = 'reputacion_dominios.phrep'
+
+MAGICO = b'PHREP\0\0\0'
+VERSION = 1
+_ENCABEZADO = struct.Struct('<8sII4Q')
+TAMANO_ENCABEZADO = 64
+
+# Categorías (2 bits; 0 = sin información)
+DESCONOCIDO = 0
+PERMITIDO = 1
+TLD_RIESGOSO = 2
+MALICIOSO = 3
+NOMBRES_CATEGORIAS = {DESCONOCIDO: 'desconocido', PERMITIDO: 'permitido',
+                      TLD_RIESGOSO: 'tld_riesgoso', MALICIOSO: 'malicioso'}
+
+OCUPACION_MAXIMA = 0.7
+
+# Niveles de dominio que se consultan como mucho (del más específico al TLD);
+# acota el costo de hosts con decenas de subdominios
+MAX_NIVELES = 8
+
+_MASCARA_HUELLA = (1 << 64) - 4
+_IGNORADOS = {'localhost', 'localhost.localdomain', 'broadcasthost', 'local', '0.0.0.0'}
+
+
+_BLAKE2B = hashlib.blake2b
+_DESEMPAQUETAR = struct.Struct('<Q').unpack
+
+
+def huella(dominio):
+    """Huella de 64 bits con los dos bits bajos en cero"""
+    return _DESEMPAQUETAR(_BLAKE2B(dominio.encode(), digest_size=8).digest())[0] & _MASCARA_HUELLA
+
+
+def niveles(host):
+    """Dominio y padres del más específico al TLD: a.b.com → [a.b.com, b.com, com]"""
+    host = host.lower().strip().rstrip('.')
+    resultado = [host]
+    punto = host.find('.')
+    while punto != -1:
+        resultado.append(host[punto + 1:])
+        punto = host.find('.', punto + 1)
+    return resultado[-MAX_NIVELES:]
+
+
+# ============================================
+# CONSTRUCCIÓN
+# ============================================
+
+def normalizar(linea):
+    """Dominio de una línea de lista (None si no hay)
+
+    Acepta un dominio por línea, listas de sitios tipo "rango,dominio" y
+    archivos hosts ("0.0.0.0 dominio"); ignora comentarios con #.
+    """
+    linea = linea.split('#', 1)[0].strip()
+    if not linea:
+        return None
+    campo = linea.rsplit(',', 1)[-1] if ',' in linea else linea.split()[-1]
+    dominio = campo.strip().strip('"').lower().rstrip('.')
+    if dominio.startswith('*.'):
+        dominio = dominio[2:]
+    if not dominio or dominio in _IGNORADOS or '/' in dominio:
+        return None
+    return dominio
+
+
+def leer_lista(ruta):
+    with open(ruta, encoding='utf-8', errors='replace') as f:
+        yield from f
+
+
+def fuentes_base():
+    """Listas incorporadas: los dominios oficiales y TLD de riesgo del extractor"""
+    from extractor_caracteristicas import DOMINIOS_OFICIALES, TLD_SOSPECHOSOS
+
+    return {PERMITIDO: sorted(DOMINIOS_OFICIALES), TLD_RIESGOSO: sorted(TLD_SOSPECHOSOS)}
+
+
+def tabla_hash(huellas, categorias):
+    """Tabla de sondeo lineal (uint64) con las huellas ya deduplicadas
+
+    La inserción es vectorizada: en cada ronda cada huella pendiente prueba
+    su siguiente ranura y, de las que caen en una ranura libre, se queda la
+    primera. Como las ranuras nunca se vacían, toda ranura entre la posición
+    inicial de una huella y la suya estaba ocupada, que es lo que necesita
+    la búsqueda para detenerse en la primera ranura vacía.
+    """
+    n = len(huellas)
+    bits = max(4, int(np.ceil(np.log2(max(n, 1) / OCUPACION_MAXIMA))))
+    tamano = 1 << bits
+    tabla = np.zeros(tamano, dtype='<u8')
+    valores = huellas | categorias.astype(np.uint64)
+    posiciones = (huellas >> np.uint64(64 - bits)).astype(np.int64)
+    pendientes = np.arange(n)
+    while len(pendientes):
+        libres = tabla[posiciones[pendientes]] == 0
+        candidatas = pendientes[libres]
+        _, primeras = np.unique(posiciones[candidatas], return_index=True)
+        colocadas = candidatas[primeras]
+        tabla[posiciones[colocadas]] = valores[colocadas]
+        restantes = np.ones(len(pendientes), dtype=bool)
+        restantes[np.flatnonzero(libres)[primeras]] = False
+        pendientes = pendientes[restantes]
+        posiciones[pendientes] = (posiciones[pendientes] + 1) & (tamano - 1)
+    return tabla, bits
+
+
+def construir(fuentes, destino=ARCHIVO_REPUTACION, base=True, progreso=False):
+    """Escribe el índice con {categoría: [fuentes]}, cada fuente una ruta o un iterable de dominios
+
+    Devuelve las entradas por categoría tras deduplicar. El archivo se
+    escribe en <destino>.tmp y se renombra al final, así que un puntuador
+    que lo tenga abierto sigue leyendo el índice anterior.
+    """
+    todas = {categoria: [] for categoria in (PERMITIDO, TLD_RIESGOSO, MALICIOSO)}
+    for categoria, dominios in (fuentes_base() if base else {}).items():
+        todas[categoria].append(dominios)
+    for categoria, listas in fuentes.items():
+        for lista in listas:
+            todas[categoria].append(leer_lista(lista) if isinstance(lista, str) else lista)
+
+    huellas, categorias = [], []
+    for categoria, iterables in todas.items():
+        inicio = time.perf_counter()
+        dominios = (normalizar(linea) for iterable in iterables for linea in iterable)
+        valores = np.fromiter((huella(d) for d in dominios if d), dtype=np.uint64)
+        huellas.append(valores)
+        categorias.append(np.full(len(valores), categoria, dtype=np.uint8))
+        if progreso:
+            print(f"  • {NOMBRES_CATEGORIAS[categoria]:13s} {len(valores):>12,d} dominios "
+                  f"({time.perf_counter() - inicio:.1f} s)", file=sys.stderr)
+    huellas, categorias = np.concatenate(huellas), np.concatenate(categorias)
+
+    # Deduplicar quedándose con la categoría más alta de cada huella: si un mismo
+    # dominio aparece en varias listas, un dominio malicioso nunca queda permitido
+    orden = np.lexsort((-categorias.astype(np.int16), huellas))
+    huellas, categorias = huellas[orden], categorias[orden]
+    primeras = np.ones(len(huellas), dtype=bool)
+    primeras[1:] = huellas[1:] != huellas[:-1]
+    huellas, categorias = huellas[primeras], categorias[primeras]
+
+    tabla, bits = tabla_hash(huellas, categorias)
+    conteos = {categoria: int(np.count_nonzero(categorias == categoria))
+               for categoria in (PERMITIDO, TLD_RIESGOSO, MALICIOSO)}
+    temporal = destino + '.tmp'
+    with open(temporal, 'wb') as f:
+        f.write(_ENCABEZADO.pack(MAGICO, VERSION, bits, conteos[PERMITIDO], conteos[TLD_RIESGOSO],
+                                 conteos[MALICIOSO], len(huellas)).ljust(TAMANO_ENCABEZADO, b'\0'))
+        f.write(tabla.tobytes())
+    os.replace(temporal, destino)
+    return conteos
+
+
+# ============================================
+# CONSULTA
+# ============================================
+
+class IndiceReputacion:
+    """Índice .phrep abierto con mmap (sólo lectura)"""
+
+    def __init__(self, ruta=ARCHIVO_REPUTACION):
+        self.ruta = ruta
+        with open(ruta, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magico, version, bits, permitidos, tlds, maliciosos, n = _ENCABEZADO.unpack_from(self._mmap)
+        if magico != MAGICO:
+            raise ValueError(f"'{ruta}' no es un índice de reputación")
+        if version > VERSION:
+            raise ValueError(f"Versión de formato no soportada: {version}")
+        if len(self._mmap) != TAMANO_ENCABEZADO + 8 * (1 << bits):
+            raise ValueError(f"'{ruta}' está truncado")
+        self.bits = bits
+        self.n_entradas = n
+        self.conteos = {PERMITIDO: permitidos, TLD_RIESGOSO: tlds, MALICIOSO: maliciosos}
+        self._mascara = (1 << bits) - 1
+        self._desplazamiento = 64 - bits
+        # memoryview para la consulta escalar (índices → int de Python sin pasar por numpy;
+        # 'Q' es el orden nativo, little-endian en x86 y ARM) y la misma memoria como
+        # arreglo para la consulta por lotes
+        self._ranuras = memoryview(self._mmap)[TAMANO_ENCABEZADO:].cast('Q')
+        self.tabla = np.frombuffer(self._mmap, dtype='<u8', offset=TAMANO_ENCABEZADO)
+
+    def __reduce__(self):
+        # Al pasar el índice a otro proceso se envía la ruta, no la tabla
+        return (IndiceReputacion, (self.ruta,))
+
+    def _buscar(self, h):
+        ranuras, mascara = self._ranuras, self._mascara
+        i = h >> self._desplazamiento
+        while True:
+            valor = ranuras[i]
+            if valor & _MASCARA_HUELLA == h:
+                return valor & 3
+            if valor == 0:
+                return DESCONOCIDO
+            i = (i + 1) & mascara
+
+    def consultar(self, host):
+        """(categoría, entrada que coincidió) de la entrada más específica del host"""
+        for dominio in niveles(host):
+            categoria = self._buscar(huella(dominio))
+            if categoria:
+                return categoria, dominio
+        return DESCONOCIDO, None
+
+    def categoria(self, host):
+        return self.consultar(host)[0]
+
+    def consultar_lote(self, hosts):
+        """Categoría uint8 de cada host, con el sondeo vectorizado sobre la tabla
+
+        Los padres comunes del lote (com, com.mx...) se resumen una sola vez.
+        """
+        huellas, duenos, nivel = [], [], []
+        vistas = {}
+        for i, host in enumerate(hosts):
+            for k, dominio in enumerate(niveles(host)):
+                h = vistas.get(dominio)
+                if h is None:
+                    h = vistas[dominio] = huella(dominio)
+                huellas.append(h)
+                duenos.append(i)
+                nivel.append(k)
+        huellas = np.array(huellas, dtype=np.uint64)
+        duenos, nivel = np.array(duenos, dtype=np.int64), np.array(nivel, dtype=np.int64)
+
+        encontradas = np.zeros(len(huellas), dtype=np.uint8)
+        posiciones = (huellas >> np.uint64(self._desplazamiento)).astype(np.int64)
+        activas = np.arange(len(huellas))
+        mascara = np.uint64(_MASCARA_HUELLA)
+        while len(activas):
+            valores = self.tabla[posiciones[activas]]
+            aciertos = (valores & mascara) == huellas[activas]
+            encontradas[activas[aciertos]] = (valores[aciertos] & np.uint64(3)).astype(np.uint8)
+            activas = activas[~aciertos & (valores != 0)]
+            posiciones[activas] = (posiciones[activas] + 1) & self._mascara
+
+        # Por host, la coincidencia del nivel más específico
+        resultado = np.zeros(len(hosts), dtype=np.uint8)
+        con_dato = np.flatnonzero(encontradas)
+        orden = con_dato[np.lexsort((nivel[con_dato], duenos[con_dato]))]
+        _, primeras = np.unique(duenos[orden], return_index=True)
+        resultado[duenos[orden[primeras]]] = encontradas[orden[primeras]]
+        return resultado
+
+    def cerrar(self):
+        self.tabla = None
+        self._ranuras.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        self.cerrar()
+
+
+def abrir_indice(ruta=ARCHIVO_REPUTACION):
+    return IndiceReputacion(ruta)
+
+
+# ============================================
+# BENCHMARK
+# ============================================
+
+_TLDS_SINTETICOS = ['com', 'mx', 'com.mx', 'net', 'org', 'io', 'tk', 'xyz', 'info', 'gob.mx']
+
+
+def dominios_sinteticos(n, semilla=0):
+    """n dominios distintos "<prefijo><hex>.<tld>" con TLD al azar"""
+    rng = np.random.default_rng(semilla)
+    tlds = rng.integers(0, len(_TLDS_SINTETICOS), n)
+    prefijos = ['seguro', 'tienda', 'noticias', 'pagos', 'blog', 'promo']
+    return [f'{prefijos[i % len(prefijos)]}{i:x}.{_TLDS_SINTETICOS[t]}' for i, t in enumerate(tlds.tolist())]
+
+
+def _consultas(dominios, n, semilla=1):
+    """Mezcla de hosts listados, subdominios de listados y hosts desconocidos"""
+    rng = np.random.default_rng(semilla)
+    elegidos = rng.integers(0, len(dominios), n).tolist()
+    tipo = rng.integers(0, 3, n).tolist()
+    return [dominios[e] if t == 0 else f'www.cuenta.{dominios[e]}' if t == 1 else f'x{e:x}.desconocido.org'
+            for e, t in zip(elegidos, tipo)]
+
+
+def _verdad(conjuntos, host):
+    """Referencia con conjuntos de Python: misma regla de nivel más específico"""
+    for dominio in niveles(host):
+        for categoria in (MALICIOSO, TLD_RIESGOSO, PERMITIDO):
+            if dominio in conjuntos[categoria]:
+                return categoria
+    return DESCONOCIDO
+
+
+def benchmark(tamanos, n_consultas=200_000, directorio='.'):
+    """Construcción, tamaño, apertura y consultas/s frente a conjuntos de Python en memoria"""
+    filas = []
+    print(f"{'dominios':>12s} {'construir (s)':>14s} {'MB':>7s} {'B/dominio':>10s} {'abrir (ms)':>11s} "
+          f"{'escalar/s':>11s} {'lote/s':>11s} {'sets (s)':>9s} {'sets MB':>8s} {'sets/s':>11s}")
+    for n in tamanos:
+        dominios = dominios_sinteticos(n)
+        corte = n // 5
+        listas = {PERMITIDO: dominios[:corte], MALICIOSO: dominios[corte:]}
+        ruta = os.path.join(directorio, f'benchmark_{n}.phrep')
+        try:
+            inicio = time.perf_counter()
+            construir({categoria: [lista] for categoria, lista in listas.items()}, ruta)
+            t_construir = time.perf_counter() - inicio
+            inicio = time.perf_counter()
+            indice = IndiceReputacion(ruta)
+            t_abrir = time.perf_counter() - inicio
+
+            consultas = _consultas(dominios, n_consultas)
+            inicio = time.perf_counter()
+            escalares = [indice.categoria(h) for h in consultas]
+            t_escalar = time.perf_counter() - inicio
+            inicio = time.perf_counter()
+            lote = indice.consultar_lote(consultas)
+            t_lote = time.perf_counter() - inicio
+
+            inicio = time.perf_counter()
+            conjuntos = {PERMITIDO: set(listas[PERMITIDO]), MALICIOSO: set(listas[MALICIOSO]),
+                         TLD_RIESGOSO: set(fuentes_base()[TLD_RIESGOSO])}
+            conjuntos[PERMITIDO].update(fuentes_base()[PERMITIDO])
+            t_conjuntos = time.perf_counter() - inicio
+            # Tablas de los conjuntos más las cadenas (que el índice no guarda)
+            mb_conjuntos = sum(sys.getsizeof(c) + sum(map(sys.getsizeof, c)) for c in conjuntos.values()) / 1e6
+            inicio = time.perf_counter()
+            esperados = [_verdad(conjuntos, h) for h in consultas]
+            t_sets = time.perf_counter() - inicio
+
+            if escalares != esperados or lote.tolist() != esperados:
+                raise AssertionError(f"El índice difiere de los conjuntos de Python con {n} dominios")
+            tamano = os.path.getsize(ruta)
+            indice.cerrar()
+        finally:
+            if os.path.exists(ruta):
+                os.remove(ruta)
+
+        fila = {'dominios': n, 'construir_s': t_construir, 'mb': tamano / 1e6, 'abrir_s': t_abrir,
+                'escalar_s': n_consultas / t_escalar, 'lote_s': n_consultas / t_lote,
+                'conjuntos_s': t_conjuntos, 'conjuntos_mb': mb_conjuntos, 'sets_s': n_consultas / t_sets}
+        filas.append(fila)
+        print(f"{n:>12,d} {t_construir:>14.2f} {tamano / 1e6:>7.1f} {tamano / n:>10.1f} {t_abrir * 1e3:>11.2f} "
+              f"{fila['escalar_s']:>11,.0f} {fila['lote_s']:>11,.0f} {t_conjuntos:>9.2f} "
+              f"{mb_conjuntos:>8.1f} {fila['sets_s']:>11,.0f}")
+    return filas
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Índice de reputación de dominios (.phrep con mmap)')
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    p = sub.add_parser('construir', help='Construir el índice a partir de listas locales')
+    p.add_argument('--permitidos', action='append', default=[], help='Lista de dominios permitidos')
+    p.add_argument('--maliciosos', action='append', default=[], help='Lista de dominios maliciosos')
+    p.add_argument('--tlds', action='append', default=[], help='Lista de TLD de riesgo')
+    p.add_argument('--sin-base', action='store_true', help='No incluir las listas del extractor')
+    p.add_argument('--salida', default=ARCHIVO_REPUTACION)
+
+    p = sub.add_parser('consultar', help='Categoría de uno o más hosts')
+    p.add_argument('hosts', nargs='+')
+    p.add_argument('--indice', default=ARCHIVO_REPUTACION)
+
+    p = sub.add_parser('benchmark', help='Consultas/s contra conjuntos de Python')
+    p.add_argument('--dominios', type=float, default=1e6, help='Tamaño máximo del índice')
+    p.add_argument('--consultas', type=float, default=2e5)
+    p.add_argument('--directorio', default='.')
+    args = parser.parse_args(argv)
+
+    if args.comando == 'construir':
+        inicio = time.perf_counter()
+        conteos = construir({PERMITIDO: args.permitidos, MALICIOSO: args.maliciosos, TLD_RIESGOSO: args.tlds},
+                            args.salida, base=not args.sin_base, progreso=True)
+        print(f"✅ Índice guardado en: {args.salida} ({os.path.getsize(args.salida) / 1e6:.1f} MB, "
+              f"{time.perf_counter() - inicio:.1f} s)")
+        for categoria, n in conteos.items():
+            print(f"   • {NOMBRES_CATEGORIAS[categoria]:13s} {n:>12,d}")
+    elif args.comando == 'consultar':
+        with IndiceReputacion(args.indice) as indice:
+            for host in args.hosts:
+                categoria, coincidencia = indice.consultar(host)
+                print(f"🔎 {host:40s} {NOMBRES_CATEGORIAS[categoria]:13s} {coincidencia or ''}")
+    else:
+        tamanos = [10 ** k for k in range(4, 9) if 10 ** k <= args.dominios]
+        print(f"⏱️  Benchmark del índice de reputación ({int(args.consultas):,d} consultas)\n")
+        benchmark(tamanos, int(args.consultas), args.directorio)
+
+
+if __name__ == "__main__":
+    main()
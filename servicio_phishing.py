@@ -0,0 +1,445 @@
+"""
+Servicio local de puntuación de phishing con micro-lotes adaptativos
+
+Servidor HTTP/1.1 mínimo sobre asyncio (TCP o socket Unix) para el caso de
+uso "Filtro automático de correos en servidores de email" del notebook.
+Recibe mensajes JSON con los siete indicadores, agrupa las peticiones
+concurrentes en micro-lotes (limitados por tamaño máximo y espera máxima)
+y los puntúa de una sola vez con el árbol compilado.
+
+La espera se adapta a la carga: con tráfico ligero los lotes salen de
+inmediato (latencia mínima) y con tráfico alto se espera hasta max_espera
+para llenar lotes más grandes (más peticiones por segundo).
+
+Endpoints:
+    POST /puntuar   {"remitente_sospechoso": 8.0, ..., "oferta_irreal": 7.0}
+                    o {"mensajes": [{...}, {...}]}
+                    → {"veredicto": "phishing", "prob_phishing": 0.99}
+    GET  /salud     → estadísticas de lotes
+
+Uso:
+    python servicio_phishing.py --puerto 8080
+    python servicio_phishing.py --unix /tmp/phishing.sock
+    python servicio_phishing.py --benchmark --conexiones 64 --peticiones 20000
+
+Requisitos: pip install numpy (el modelo se genera con python artefacto_modelo.py exportar)
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing
+import os
+import time
+
+import numpy as np
+
+from esquema_phishing import CARACTERISTICAS
+
+MAX_LOTE = 256
+MAX_ESPERA = 0.002
+# Tamaño máximo del cuerpo de una petición (unos 5000 mensajes por lote)
+MAX_CUERPO = 1 << 20
+VEREDICTOS = {0: 'legitimo', 1: 'phishing'}
+
+_ESTADOS = {200: '200 OK', 400: '400 Bad Request', 404: '404 Not Found',
+            405: '405 Method Not Allowed', 413: '413 Payload Too Large',
+            500: '500 Internal Server Error'}
+
+
+class ErrorPeticion(ValueError):
+    """Petición mal formada; se responde con 400"""
+
+
+class MicroLotes:
+    """Agrupa vectores de indicadores en lotes y los puntúa con el árbol
+
+    Cada llamada a `puntuar` deja su vector en una cola y espera un future.
+    Un único consumidor toma el primer vector, recoge lo que ya esté en cola
+    y, si el lote anterior salió lleno, espera un poco más (hasta
+    `max_espera`) para completar el lote antes de llamar al árbol.
+    """
+
+    def __init__(self, arbol, max_lote=MAX_LOTE, max_espera=MAX_ESPERA):
+        self.arbol = arbol
+        self.max_lote = max_lote
+        self.max_espera = max_espera
+        self.cola = asyncio.Queue()
+        self.n_lotes = 0
+        self.n_mensajes = 0
+        self.ultimo_lote = 1
+        self._tarea = None
+
+    def iniciar(self):
+        self._tarea = asyncio.get_running_loop().create_task(self._consumir())
+
+    async def detener(self):
+        if self._tarea is not None:
+            self._tarea.cancel()
+            try:
+                await self._tarea
+            except asyncio.CancelledError:
+                pass
+
+    async def puntuar(self, vector):
+        futuro = asyncio.get_running_loop().create_future()
+        await self.cola.put((vector, futuro))
+        return await futuro
+
+    def _espera_adaptativa(self):
+        # Proporcional a qué tan lleno salió el lote anterior
+        return self.max_espera * min(1.0, self.ultimo_lote / self.max_lote)
+
+    async def _recoger(self):
+        lote = [await self.cola.get()]
+        # Dejar que las conexiones con datos pendientes encolen su petición
+        await asyncio.sleep(0)
+        limite = asyncio.get_running_loop().time() + self._espera_adaptativa()
+
+        while len(lote) < self.max_lote:
+            try:
+                lote.append(self.cola.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            restante = limite - asyncio.get_running_loop().time()
+            if restante <= 0:
+                break
+            try:
+                lote.append(await asyncio.wait_for(self.cola.get(), restante))
+            except asyncio.TimeoutError:
+                break
+        return lote
+
+    async def _consumir(self):
+        while True:
+            lote = await self._recoger()
+            X = np.array([vector for vector, _ in lote], dtype=np.float32)
+            try:
+                etiquetas, probabilidades = self.arbol.puntuar(X)
+            except Exception as e:
+                for _, futuro in lote:
+                    if not futuro.done():
+                        futuro.set_exception(e)
+                continue
+
+            for (_, futuro), etiqueta, probabilidad in zip(lote, etiquetas, probabilidades):
+                if not futuro.done():
+                    futuro.set_result((int(etiqueta), float(probabilidad)))
+
+            self.ultimo_lote = len(lote)
+            self.n_lotes += 1
+            self.n_mensajes += len(lote)
+
+
+def _vector(mensaje):
+    """Convierte el JSON de un mensaje en la lista de siete indicadores"""
+    if not isinstance(mensaje, dict):
+        raise ErrorPeticion('Cada mensaje debe ser un objeto JSON')
+    try:
+        vector = [float(mensaje[nombre]) for nombre in CARACTERISTICAS]
+    except KeyError as e:
+        raise ErrorPeticion(f'Falta el indicador {e.args[0]}')
+    except (TypeError, ValueError):
+        raise ErrorPeticion('Los indicadores deben ser numéricos')
+    if not all(math.isfinite(valor) for valor in vector):
+        raise ErrorPeticion('Los indicadores deben ser números finitos')
+    return vector
+
+
+class ServicioPhishing:
+    """Servidor HTTP/1.1 con conexiones persistentes sobre asyncio"""
+
+    def __init__(self, arbol, max_lote=MAX_LOTE, max_espera=MAX_ESPERA, max_cuerpo=MAX_CUERPO):
+        self.lotes = MicroLotes(arbol, max_lote, max_espera)
+        self.max_cuerpo = max_cuerpo
+        self.inicio = time.time()
+        self.servidor = None
+
+    async def iniciar(self, host='127.0.0.1', puerto=8080, unix=None):
+        self.lotes.iniciar()
+        if unix:
+            if os.path.exists(unix):
+                os.unlink(unix)
+            self.servidor = await asyncio.start_unix_server(self._atender, path=unix)
+        else:
+            self.servidor = await asyncio.start_server(self._atender, host, puerto)
+        return self.servidor
+
+    async def detener(self):
+        if self.servidor is not None:
+            self.servidor.close()
+            await self.servidor.wait_closed()
+        await self.lotes.detener()
+
+    async def _puntuar(self, cuerpo):
+        try:
+            datos = json.loads(cuerpo)
+        except ValueError:
+            raise ErrorPeticion('El cuerpo no es JSON válido')
+
+        if isinstance(datos, dict) and 'mensajes' in datos:
+            if not isinstance(datos['mensajes'], list):
+                raise ErrorPeticion("'mensajes' debe ser una lista")
+            vectores = [_vector(mensaje) for mensaje in datos['mensajes']]
+            resultados = await asyncio.gather(*(self.lotes.puntuar(v) for v in vectores))
+            return {'resultados': [{'veredicto': VEREDICTOS[e], 'prob_phishing': p}
+                                   for e, p in resultados]}
+
+        etiqueta, probabilidad = await self.lotes.puntuar(_vector(datos))
+        return {'veredicto': VEREDICTOS[etiqueta], 'prob_phishing': probabilidad}
+
+    def _salud(self):
+        lotes = self.lotes
+        return {
+            'estado': 'ok',
+            'segundos_activo': round(time.time() - self.inicio, 1),
+            'mensajes': lotes.n_mensajes,
+            'lotes': lotes.n_lotes,
+            'tamano_medio_lote': lotes.n_mensajes / lotes.n_lotes if lotes.n_lotes else 0.0
+        }
+
+    async def _despachar(self, metodo, ruta, cuerpo):
+        if ruta == '/puntuar':
+            if metodo != 'POST':
+                return 405, {'error': 'Use POST'}
+            try:
+                return 200, await self._puntuar(cuerpo)
+            except ErrorPeticion as e:
+                return 400, {'error': str(e)}
+            except Exception as e:
+                # Un fallo al puntuar (p. ej. del árbol en MicroLotes) no debe cortar la conexión
+                return 500, {'error': f'Error interno: {type(e).__name__}: {e}'}
+        if ruta == '/salud':
+            return 200, self._salud()
+        return 404, {'error': f'Ruta desconocida: {ruta}'}
+
+    async def _atender(self, reader, writer):
+        try:
+            while True:
+                try:
+                    cabecera = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+
+                linea, *lineas = cabecera.decode('latin-1').split('\r\n')
+                try:
+                    metodo, ruta, version = linea.split(' ', 2)
+                except ValueError:
+                    break
+                cabeceras = {}
+                for texto in lineas:
+                    if ':' in texto:
+                        nombre, valor = texto.split(':', 1)
+                        cabeceras[nombre.strip().lower()] = valor.strip()
+
+                # Sin una longitud válida no se sabe dónde acaba el cuerpo: se
+                # responde el error y se cierra la conexión
+                try:
+                    longitud = int(cabeceras.get('content-length') or 0)
+                except ValueError:
+                    longitud = -1
+                if longitud < 0:
+                    await _responder(writer, 400, {'error': 'Content-Length inválido'}, True)
+                    break
+                if longitud > self.max_cuerpo:
+                    await _responder(writer, 413, {'error': f'El cuerpo supera {self.max_cuerpo} bytes'}, True)
+                    break
+                cuerpo = await reader.readexactly(longitud) if longitud else b''
+
+                # La cadena de consulta no forma parte de la ruta
+                ruta = ruta.split('?', 1)[0]
+                estado, respuesta = await self._despachar(metodo, ruta, cuerpo)
+                cerrar = (cabeceras.get('connection', '').lower() == 'close'
+                          or version.strip() == 'HTTP/1.0')
+                await _responder(writer, estado, respuesta, cerrar)
+                if cerrar:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def _responder(writer, estado, respuesta, cerrar):
+    datos = json.dumps(respuesta).encode('utf-8')
+    conexion = 'Connection: close\r\n' if cerrar else ''
+    writer.write((f'HTTP/1.1 {_ESTADOS[estado]}\r\n'
+                  f'Content-Type: application/json\r\n'
+                  f'Content-Length: {len(datos)}\r\n'
+                  f'{conexion}\r\n').encode('latin-1') + datos)
+    await writer.drain()
+
+
+def cargar_arbol(ruta=None):
+    """Árbol compilado desde el artefacto del modelo (sin importar scikit-learn)"""
+    from artefacto_modelo import ARCHIVO_MODELO, cargar_modelo
+
+    return cargar_modelo(ruta or ARCHIVO_MODELO)
+
+
+async def servir(host='127.0.0.1', puerto=8080, unix=None, max_lote=MAX_LOTE,
+                 max_espera=MAX_ESPERA, arbol=None, listo=None):
+    """Inicia el servicio y atiende hasta que se cancele"""
+    servicio = ServicioPhishing(arbol or cargar_arbol(), max_lote, max_espera)
+    servidor = await servicio.iniciar(host, puerto, unix)
+    if listo is not None:
+        listo.set()
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        await servicio.detener()
+
+
+# ============================================
+# GENERADOR DE CARGA POR LOOPBACK
+# ============================================
+
+def _peticion_http(cuerpo):
+    return (b'POST /puntuar HTTP/1.1\r\nHost: localhost\r\n'
+            b'Content-Type: application/json\r\n'
+            + f'Content-Length: {len(cuerpo)}\r\n\r\n'.encode('latin-1') + cuerpo)
+
+
+async def _leer_respuesta(reader):
+    cabecera = await reader.readuntil(b'\r\n\r\n')
+    longitud = 0
+    for linea in cabecera.split(b'\r\n'):
+        if linea.lower().startswith(b'content-length:'):
+            longitud = int(linea.split(b':', 1)[1])
+    return cabecera, await reader.readexactly(longitud)
+
+
+async def generar_carga(host='127.0.0.1', puerto=8080, unix=None, conexiones=64,
+                        peticiones=20000, semilla=0):
+    """Lanza peticiones concurrentes con conexiones persistentes y mide latencias"""
+    rng = np.random.default_rng(semilla)
+    cuerpos = []
+    for _ in range(256):
+        valores = np.round(rng.uniform(0, 10, len(CARACTERISTICAS)), 1)
+        mensaje = dict(zip(CARACTERISTICAS, valores.tolist()))
+        mensaje['contiene_url'] = int(rng.integers(0, 2))
+        cuerpos.append(_peticion_http(json.dumps(mensaje).encode('utf-8')))
+
+    latencias = []
+    restantes = [peticiones]
+
+    async def cliente(indice):
+        if unix:
+            reader, writer = await asyncio.open_unix_connection(unix)
+        else:
+            reader, writer = await asyncio.open_connection(host, puerto)
+        try:
+            i = indice
+            while restantes[0] > 0:
+                restantes[0] -= 1
+                inicio = time.perf_counter()
+                writer.write(cuerpos[i % len(cuerpos)])
+                await writer.drain()
+                cabecera, _ = await _leer_respuesta(reader)
+                if not cabecera.startswith(b'HTTP/1.1 200'):
+                    raise RuntimeError(cabecera.split(b'\r\n', 1)[0].decode('latin-1'))
+                latencias.append(time.perf_counter() - inicio)
+                i += conexiones
+        finally:
+            writer.close()
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(cliente(i) for i in range(conexiones)))
+    total = time.perf_counter() - inicio
+
+    latencias = np.array(latencias) * 1000
+    return {
+        'peticiones': len(latencias),
+        'segundos': total,
+        'peticiones_por_segundo': len(latencias) / total,
+        'p50_ms': float(np.percentile(latencias, 50)),
+        'p99_ms': float(np.percentile(latencias, 99))
+    }
+
+
+def _proceso_servidor(host, puerto, unix, max_lote, max_espera, modelo, listo):
+    arbol = cargar_arbol(modelo)
+    evento = asyncio.Event()
+
+    async def principal():
+        tarea = asyncio.create_task(servir(host, puerto, unix, max_lote, max_espera, arbol, evento))
+        await evento.wait()
+        listo.set()
+        await tarea
+
+    asyncio.run(principal())
+
+
+def benchmark(host='127.0.0.1', puerto=8765, unix=None, conexiones=64, peticiones=20000,
+              max_lote=MAX_LOTE, max_espera=MAX_ESPERA, modelo=None):
+    """Levanta el servicio (con el artefacto `modelo`) en otro proceso y lo carga por loopback"""
+    listo = multiprocessing.Event()
+    proceso = multiprocessing.Process(target=_proceso_servidor,
+                                      args=(host, puerto, unix, max_lote, max_espera, modelo, listo),
+                                      daemon=True)
+    proceso.start()
+    try:
+        limite = time.monotonic() + 120
+        while not listo.wait(0.1):
+            if not proceso.is_alive():
+                raise RuntimeError(f'El servicio terminó antes de arrancar (código {proceso.exitcode})')
+            if time.monotonic() > limite:
+                raise RuntimeError('El servicio no arrancó a tiempo')
+        resultado = asyncio.run(generar_carga(host, puerto, unix, conexiones, peticiones))
+
+        async def consultar_salud():
+            if unix:
+                reader, writer = await asyncio.open_unix_connection(unix)
+            else:
+                reader, writer = await asyncio.open_connection(host, puerto)
+            writer.write(b'GET /salud HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n')
+            await writer.drain()
+            _, cuerpo = await _leer_respuesta(reader)
+            writer.close()
+            return json.loads(cuerpo)
+
+        resultado['salud'] = asyncio.run(consultar_salud())
+        return resultado
+    finally:
+        proceso.terminate()
+        proceso.join()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Servicio de puntuación de phishing con micro-lotes')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--puerto', type=int, default=8080)
+    parser.add_argument('--unix', help='Ruta de un socket Unix en lugar de TCP')
+    parser.add_argument('--max-lote', type=int, default=MAX_LOTE)
+    parser.add_argument('--max-espera-ms', type=float, default=MAX_ESPERA * 1000)
+    parser.add_argument('--modelo', help='Artefacto del modelo (por defecto, modelo_phishing.phtree)')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Levantar el servicio y medir peticiones/s y p99 por loopback')
+    parser.add_argument('--conexiones', type=int, default=64)
+    parser.add_argument('--peticiones', type=int, default=20000)
+    args = parser.parse_args(argv)
+    max_espera = args.max_espera_ms / 1000
+
+    if args.benchmark:
+        print(f"⏱️  Benchmark por loopback: {args.conexiones} conexiones, {args.peticiones:,d} peticiones")
+        r = benchmark(args.host, args.puerto, args.unix, args.conexiones, args.peticiones,
+                      args.max_lote, max_espera, args.modelo)
+        print(f"  • Peticiones/s: {r['peticiones_por_segundo']:,.0f}")
+        print(f"  • Latencia p50: {r['p50_ms']:.2f} ms   p99: {r['p99_ms']:.2f} ms")
+        print(f"  • Tamaño medio de lote: {r['salud']['tamano_medio_lote']:.1f}")
+        return
+
+    destino = args.unix or f"http://{args.host}:{args.puerto}"
+    print(f"🛡️  Servicio de detección de phishing escuchando en {destino}")
+    try:
+        asyncio.run(servir(args.host, args.puerto, args.unix, args.max_lote, max_espera,
+                           cargar_arbol(args.modelo)))
+    except KeyboardInterrupt:
+        print("\n👋 Servicio detenido")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""
+Validación cruzada estratificada en paralelo para el árbol de phishing
+
+El notebook evalúa el modelo con una sola división 80/20: la exactitud
+reportada sale de 240 mensajes. Este script la sustituye por k pliegues
+estratificados:
+
+- Los pliegues se calculan una vez (StratifiedKFold con la semilla del
+  notebook) como un arreglo uint8 con el pliegue de cada fila, y se guardan
+  junto al dataset (<dataset>.pliegues_k5_s42.npz). Se reutilizan mientras
+  no cambien las etiquetas, k ni la semilla.
+- X, y y los pliegues se copian una sola vez a memoria compartida
+  (memoria_compartida.py); cada proceso recibe sólo el número de pliegue y
+  extrae de ahí sus filas de entrenamiento y de prueba.
+- Por pliegue se guardan la matriz de confusión, exactitud, precisión,
+  recall y F1 (clase positiva: phishing). El resumen da la media de cada
+  métrica con su intervalo de confianza t de Student sobre los pliegues y
+  la matriz de confusión total.
+
+Uso:
+    python validacion_cruzada.py
+    python validacion_cruzada.py --datos dataset_grande.phcol --k 10 --procesos 8
+    python validacion_cruzada.py --max-depth 8 --salida cv.json
+
+Requisitos: pip install numpy pandas scikit-learn scipy
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from esquema_phishing import CARACTERISTICAS, OBJETIVO, PARAMETROS_MODELO, SEMILLA
+
+ARCHIVO_DATOS = 'dataset_phishing.csv'
+K_PLIEGUES = 5
+CONFIANZA = 0.95
+
+METRICAS = ['accuracy', 'precision', 'recall', 'f1']
+
+# Datos adjuntos en cada proceso trabajador (ver _inicializar)
+_DATOS = None
+
+
+# ============================================
+# DATOS Y PLIEGUES
+# ============================================
+
+def cargar_datos(ruta_datos=ARCHIVO_DATOS):
+    """X float32 (filas × características) e y uint8 desde un CSV o un .phcol"""
+    from formato_columnar import abrir_columnar, es_columnar
+
+    if es_columnar(ruta_datos):
+        dataset = abrir_columnar(ruta_datos)
+        X = np.empty((len(dataset), len(CARACTERISTICAS)), dtype=np.float32)
+        # Columna por columna, para no tener a la vez la matriz y una copia intermedia
+        for j, col in enumerate(CARACTERISTICAS):
+            X[:, j] = dataset[col]
+        return X, np.asarray(dataset[OBJETIVO], dtype=np.uint8)
+
+    import pandas as pd
+
+    df = pd.read_csv(ruta_datos, usecols=CARACTERISTICAS + [OBJETIVO],
+                     dtype={col: np.float32 for col in CARACTERISTICAS})
+    return np.ascontiguousarray(df[CARACTERISTICAS].to_numpy()), df[OBJETIVO].to_numpy(np.uint8)
+
+
+def ruta_pliegues(ruta_datos, k=K_PLIEGUES, semilla=SEMILLA):
+    base = os.path.splitext(ruta_datos.rstrip('/\\'))[0]
+    return f"{base}.pliegues_k{k}_s{semilla}.npz"
+
+
+def _huella(y, k, semilla):
+    huella = hashlib.sha256(f"{k}:{semilla}:".encode('ascii'))
+    huella.update(np.ascontiguousarray(y).tobytes())
+    return huella.hexdigest()
+
+
+def calcular_pliegues(y, k=K_PLIEGUES, semilla=SEMILLA):
+    """Pliegue (0..k-1) de cada fila, con los mismos grupos que StratifiedKFold"""
+    from sklearn.model_selection import StratifiedKFold
+
+    pliegues = np.empty(len(y), dtype=np.uint8)
+    divisor = StratifiedKFold(n_splits=k, shuffle=True, random_state=semilla)
+    for pliegue, (_, prueba) in enumerate(divisor.split(np.empty((len(y), 0)), y)):
+        pliegues[prueba] = pliegue
+    return pliegues
+
+
+def pliegues_en_cache(y, ruta_datos=None, k=K_PLIEGUES, semilla=SEMILLA):
+    """(pliegues, reutilizados): del archivo junto al dataset si sigue vigente"""
+    huella = _huella(y, k, semilla)
+    ruta = ruta_pliegues(ruta_datos, k, semilla) if ruta_datos else None
+    if ruta and os.path.exists(ruta):
+        with np.load(ruta) as guardado:
+            if str(guardado['huella']) == huella:
+                return guardado['pliegues'], True
+
+    pliegues = calcular_pliegues(y, k, semilla)
+    if ruta:
+        temporal = ruta + '.tmp.npz'
+        np.savez(temporal, pliegues=pliegues, huella=np.array(huella))
+        os.replace(temporal, ruta)
+    return pliegues, False
+
+
+# ============================================
+# EVALUACIÓN DE UN PLIEGUE (PROCESOS TRABAJADORES)
+# ============================================
+
+def _inicializar(descriptor):
+    global _DATOS
+    from memoria_compartida import adjuntar
+
+    _DATOS = adjuntar(descriptor)
+
+
+def metricas_confusion(confusion):
+    """Exactitud, precisión, recall y F1 de una matriz [[VN, FP], [FN, VP]]"""
+    (vn, fp), (fn, vp) = np.asarray(confusion, dtype=np.float64)
+    precision = vp / (vp + fp) if vp + fp else 0.0
+    recall = vp / (vp + fn) if vp + fn else 0.0
+    return {
+        'accuracy': (vp + vn) / (vn + fp + fn + vp),
+        'precision': precision,
+        'recall': recall,
+        'f1': 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    }
+
+
+def evaluar_pliegue(pliegue, parametros, datos=None):
+    """Entrena sin el pliegue y lo puntúa con el árbol compilado"""
+    from sklearn.tree import DecisionTreeClassifier
+
+    from motor_inferencia import compilar_arbol
+
+    datos = datos if datos is not None else _DATOS
+    X, y = datos['X'], datos['y']
+    prueba = datos['pliegues'] == pliegue
+
+    inicio = time.perf_counter()
+    modelo = DecisionTreeClassifier(**parametros).fit(X[~prueba], y[~prueba])
+    segundos_entrenamiento = time.perf_counter() - inicio
+    etiquetas = compilar_arbol(modelo, CARACTERISTICAS).puntuar(X[prueba])[0]
+
+    confusion = np.bincount(y[prueba].astype(np.intp) * 2 + etiquetas.astype(np.intp),
+                            minlength=4).reshape(2, 2)
+    return {
+        'pliegue': int(pliegue),
+        'n_prueba': int(prueba.sum()),
+        'matriz_confusion': confusion.tolist(),
+        **metricas_confusion(confusion),
+        'n_nodos': int(modelo.tree_.node_count),
+        'segundos_entrenamiento': segundos_entrenamiento
+    }
+
+
+# ============================================
+# VALIDACIÓN CRUZADA Y RESUMEN
+# ============================================
+
+def intervalo_confianza(valores, confianza=CONFIANZA):
+    """(media, límite inferior, límite superior) con la t de Student sobre los pliegues
+
+    Las métricas son proporciones, así que el intervalo se recorta a [0, 1].
+    """
+    from scipy import stats
+
+    valores = np.asarray(valores, dtype=np.float64)
+    media = float(valores.mean())
+    if len(valores) < 2:
+        return media, float('nan'), float('nan')
+    margen = stats.t.ppf((1 + confianza) / 2, len(valores) - 1) * valores.std(ddof=1) / np.sqrt(len(valores))
+    return media, max(0.0, media - margen), min(1.0, media + margen)
+
+
+def resumir(resultados, confianza=CONFIANZA):
+    confusion = np.sum([r['matriz_confusion'] for r in resultados], axis=0)
+    return {
+        'confianza': confianza,
+        'metricas': {m: dict(zip(('media', 'inferior', 'superior'),
+                                 intervalo_confianza([r[m] for r in resultados], confianza)))
+                     for m in METRICAS},
+        'matriz_confusion': confusion.tolist(),
+        'metricas_agregadas': metricas_confusion(confusion)
+    }
+
+
+def validacion_cruzada(X, y, pliegues, parametros=None, procesos=None, progreso=True):
+    """Evalúa todos los pliegues en un pool de procesos y devuelve sus resultados en orden"""
+    from memoria_compartida import ArreglosCompartidos
+
+    parametros = dict(parametros or PARAMETROS_MODELO)
+    k = int(pliegues.max()) + 1
+    procesos = min(procesos or os.cpu_count() or 1, k)
+    datos = {'X': X, 'y': y, 'pliegues': pliegues}
+    if procesos == 1:
+        return [evaluar_pliegue(p, parametros, datos) for p in range(k)]
+
+    resultados = []
+    inicio = time.perf_counter()
+    with ArreglosCompartidos(datos) as compartidos:
+        with ProcessPoolExecutor(max_workers=procesos, initializer=_inicializar,
+                                 initargs=(compartidos.descriptor,)) as pool:
+            futuros = [pool.submit(evaluar_pliegue, p, parametros) for p in range(k)]
+            for futuro in as_completed(futuros):
+                resultados.append(futuro.result())
+                if progreso:
+                    print(f"  ⏱️  pliegue {resultados[-1]['pliegue'] + 1}/{k} "
+                          f"({time.perf_counter() - inicio:.1f} s)")
+    return sorted(resultados, key=lambda r: r['pliegue'])
+
+
+def mostrar(resultados, resumen):
+    print(f"\n{'pliegue':>8s} {'filas':>10s} " + ' '.join(f"{m:>10s}" for m in METRICAS) + f" {'nodos':>6s}")
+    for r in resultados:
+        print(f"{r['pliegue'] + 1:>8d} {r['n_prueba']:>10,d} "
+              + ' '.join(f"{r[m] * 100:>9.2f}%" for m in METRICAS) + f" {r['n_nodos']:>6d}")
+
+    print(f"\n📊 Media e intervalo de confianza {resumen['confianza'] * 100:.0f}%:")
+    for m in METRICAS:
+        ic = resumen['metricas'][m]
+        print(f"   {m:10s} {ic['media'] * 100:6.2f}%  [{ic['inferior'] * 100:6.2f}%, {ic['superior'] * 100:6.2f}%]")
+    (vn, fp), (fn, vp) = resumen['matriz_confusion']
+    print("\n🔢 Matriz de confusión total (filas: real, columnas: predicho):")
+    print(f"   {'':12s} {'Legítimo':>12s} {'Phishing':>12s}")
+    print(f"   {'Legítimo':12s} {vn:>12,d} {fp:>12,d}")
+    print(f"   {'Phishing':12s} {fn:>12,d} {vp:>12,d}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Validación cruzada estratificada del árbol de phishing')
+    parser.add_argument('--datos', default=ARCHIVO_DATOS, help='CSV o dataset .phcol')
+    parser.add_argument('--k', type=int, default=K_PLIEGUES, help='Número de pliegues')
+    parser.add_argument('--semilla', type=int, default=SEMILLA)
+    parser.add_argument('--procesos', type=int, default=None)
+    parser.add_argument('--confianza', type=float, default=CONFIANZA)
+    parser.add_argument('--max-depth', type=int, default=PARAMETROS_MODELO['max_depth'])
+    parser.add_argument('--min-samples-split', type=int, default=PARAMETROS_MODELO['min_samples_split'])
+    parser.add_argument('--min-samples-leaf', type=int, default=PARAMETROS_MODELO['min_samples_leaf'])
+    parser.add_argument('--criterion', default=PARAMETROS_MODELO['criterion'], choices=['gini', 'entropy'])
+    parser.add_argument('--sin-cache', action='store_true', help='No leer ni guardar los pliegues junto al dataset')
+    parser.add_argument('--salida', default=None, help='Guardar pliegues y resumen en este JSON')
+    args = parser.parse_args(argv)
+
+    if not 2 <= args.k <= 255:
+        parser.error('--k debe estar entre 2 y 255')
+    parametros = {'max_depth': args.max_depth, 'min_samples_split': args.min_samples_split,
+                  'min_samples_leaf': args.min_samples_leaf, 'criterion': args.criterion,
+                  'random_state': args.semilla}
+
+    inicio = time.perf_counter()
+    X, y = cargar_datos(args.datos)
+    print(f"📥 {len(y):,d} filas de '{args.datos}' ({time.perf_counter() - inicio:.2f} s)")
+
+    inicio = time.perf_counter()
+    pliegues, reutilizados = pliegues_en_cache(y, None if args.sin_cache else args.datos, args.k, args.semilla)
+    print(f"🗂️  {args.k} pliegues estratificados "
+          f"{'reutilizados de' if reutilizados else 'calculados'}"
+          f"{'' if args.sin_cache else ' ' + repr(ruta_pliegues(args.datos, args.k, args.semilla))} "
+          f"({time.perf_counter() - inicio:.2f} s)")
+
+    inicio = time.perf_counter()
+    resultados = validacion_cruzada(X, y, pliegues, parametros, args.procesos)
+    resumen = resumir(resultados, args.confianza)
+    print(f"✅ Validación cruzada en {time.perf_counter() - inicio:.2f} s")
+    mostrar(resultados, resumen)
+
+    if args.salida:
+        with open(args.salida, 'w', encoding='utf-8') as f:
+            json.dump({'datos': args.datos, 'k': args.k, 'semilla': args.semilla, 'parametros': parametros,
+                       'pliegues': resultados, 'resumen': resumen}, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 Resultados guardados en '{args.salida}'")
+
+
+if __name__ == "__main__":
+    main()